@@ -19,6 +19,7 @@ limitations under the License.
 #include <utility>
 
 #include "tensorflow/core/platform/env.h"
+#include "tensorflow/core/platform/errors.h"
 #include "tensorflow/core/platform/status.h"
 #include "tensorflow/core/platform/stringpiece.h"
 #include "tensorflow/core/platform/types.h"
@@ -106,6 +107,24 @@ void CheckpointReader::GetTensor(
   }
 }
 
+void CheckpointReader::GetTensorLocation(const string& name,
+                                         string* out_filename,
+                                         int64_t* out_offset,
+                                         int64_t* out_size,
+                                         TF_Status* out_status) const {
+  Status status;
+  if (reader_ != nullptr) {
+    status = errors::Unimplemented(
+        "Memory-mapped reads are not supported for V1 checkpoints.");
+  } else {
+    status = v2_reader_->LookupTensorLocation(name, out_filename, out_offset,
+                                              out_size);
+  }
+  if (!status.ok()) {
+    Set_TF_Status_from_Status(out_status, status);
+  }
+}
+
 std::pair<std::unique_ptr<TensorSliceReader::VarToShapeMap>,
           std::unique_ptr<TensorSliceReader::VarToDataTypeMap>>
 CheckpointReader::BuildV2VarMaps() {
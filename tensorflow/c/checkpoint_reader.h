@@ -58,6 +58,14 @@ class CheckpointReader {
                  std::unique_ptr<tensorflow::Tensor>* out_tensor,
                  TF_Status* out_status) const;
 
+  // Looks up the data file holding the contents of the tensor named "name",
+  // and their offset and size in bytes in that file, so that the caller can
+  // read them in place. Only supported for V2 checkpoints, see
+  // BundleReader::LookupTensorLocation().
+  void GetTensorLocation(const string& name, string* out_filename,
+                         int64_t* out_offset, int64_t* out_size,
+                         TF_Status* out_status) const;
+
  private:
   // Uses "v2_reader_" to build "var name -> shape" and "var name -> data type"
   // maps; both owned by caller.
@@ -73,6 +73,16 @@ auto* checkpoint_read_durations = monitoring::Sampler<1>::New(
     // Scale of 1000, growth factor of 1.5 with upper bound of ~184 minutes.
     monitoring::Buckets::Exponential(1000, 1.5, 41));
 
+// Distribution of the throughput of parallel checkpoint restores.
+auto* checkpoint_read_throughput = monitoring::Sampler<0>::New(
+    {
+        "/tensorflow/core/checkpoint/read/read_throughput",  // Metric name.
+        "Distribution of the throughput in bytes per second of parallel "
+        "checkpoint restores."  // Metric description.
+    },
+    // Scale of 1 MB/s, growth factor of 2 with upper bound of ~512 GB/s.
+    monitoring::Buckets::Exponential(1 << 20, 2, 20));
+
 // Counter that accumulates total time elapsed between module import time and
 // the last successful Checkpoint write prior to job pre-emption or completion.
 auto* checkpoint_training_time_saved = monitoring::Counter<1>::New(
@@ -113,6 +123,10 @@ monitoring::SamplerCell& CheckpointReadDuration(absl::string_view api_label) {
   return *checkpoint_read_durations->GetCell(std::string(api_label));
 }
 
+monitoring::SamplerCell& CheckpointReadThroughput() {
+  return *checkpoint_read_throughput->GetCell();
+}
+
 monitoring::SamplerCell& CheckpointWriteDuration(absl::string_view api_label) {
   return *checkpoint_write_durations->GetCell(std::string(api_label));
 }
@@ -54,6 +54,10 @@ monitoring::CounterCell& SavedModelReadApi(absl::string_view api_label);
 // field `api_label`.
 monitoring::SamplerCell& CheckpointReadDuration(absl::string_view api_label);
 
+// Returns the "/tensorflow/core/checkpoint/read/read_throughput" cell, which
+// holds the throughput in bytes per second of parallel checkpoint restores.
+monitoring::SamplerCell& CheckpointReadThroughput();
+
 // Returns "/tensorflow/core/checkpoint/write/write_durations" cell belonging to
 // field `api_label`.
 monitoring::SamplerCell& CheckpointWriteDuration(absl::string_view api_label);
@@ -49,6 +49,12 @@ TEST(MetricsTest, TestCheckpointRead) {
   EXPECT_EQ(CheckpointReadDuration("foo").value().num(), 1);
 }
 
+TEST(MetricsTest, TestCheckpointReadThroughput) {
+  EXPECT_EQ(CheckpointReadThroughput().value().num(), 0);
+  CheckpointReadThroughput().Add(1 << 30);
+  EXPECT_EQ(CheckpointReadThroughput().value().num(), 1);
+}
+
 TEST(MetricsTest, TestCheckpointWrite) {
   EXPECT_EQ(CheckpointWriteDuration("foo").value().num(), 0);
   CheckpointWriteDuration("foo").Add(100);
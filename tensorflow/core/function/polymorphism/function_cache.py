@@ -15,9 +15,11 @@
 """Cache to manage concrete functions and their signatures."""
 
 import collections
-from typing import Optional, Sequence, Any, NamedTuple
+import time
+from typing import Any, Callable, Hashable, List, NamedTuple, Optional, Sequence
 
 from tensorflow.core.function import trace_type
+from tensorflow.core.function.trace_type import default_types
 from tensorflow.core.function.polymorphism import type_dispatch
 from tensorflow.python.types import trace
 
@@ -72,6 +74,12 @@ class FunctionCacheKey(trace.TraceType):
     """Value used for tracing a function signature with this TraceType."""
     return self.function_signature._placeholder_value()  # pylint: disable=protected-access
 
+  def _dispatch_bucket(self) -> Optional[Hashable]:
+    signature_bucket = default_types.dispatch_bucket(self.function_signature)
+    if signature_bucket is None:
+      return None
+    return (self.call_context, signature_bucket)
+
   def __hash__(self) -> int:
     return hash((self.call_context, self.function_signature))
 
@@ -91,16 +99,77 @@ class FunctionCacheKey(trace.TraceType):
         f" call_context={repr(self.call_context)})")
 
 
+class CacheEntryInfo(NamedTuple):
+  """Usage information of a FunctionCache entry.
+
+  Attributes:
+    key: The FunctionCacheKey of the entry.
+    size_bytes: The estimated size of the concrete function, or None if the
+      cache has no size function.
+    hit_count: The number of lookups served by the entry.
+    last_used_time: The time (as `time.time()`) the entry was last added or
+      looked up.
+  """
+  key: FunctionCacheKey
+  size_bytes: Optional[int]
+  hit_count: int
+  last_used_time: float
+
+
+class _EntryStats:
+  """Mutable usage statistics of a FunctionCache entry."""
+
+  __slots__ = ["size_bytes", "hit_count", "last_used_time"]
+
+  def __init__(self, size_bytes: Optional[int]):
+    self.size_bytes = size_bytes
+    self.hit_count = 0
+    self.last_used_time = time.time()
+
+
 # TODO(fmuham): Rename to FunctionLibrary.
 class FunctionCache:
-  """A container for managing concrete functions."""
+  """A container for managing concrete functions.
+
+  The cache can be bounded by a number of entries and by the estimated total
+  size of its concrete functions. Once a bound is exceeded, the least recently
+  used entries are evicted.
+  """
 
   __slots__ = [
-      "_primary", "_dispatch_table", "_garbage_collectors"
+      "_primary", "_dispatch_table", "_garbage_collectors", "_stats",
+      "_max_entries", "_max_size_bytes", "_size_fn", "_size_bytes"
   ]
 
-  def __init__(self):
+  def __init__(self,
+               max_entries: Optional[int] = None,
+               max_size_bytes: Optional[int] = None,
+               size_fn: Optional[Callable[[Any], int]] = None):
+    """Creates a FunctionCache.
+
+    Args:
+      max_entries: Maximum number of concrete functions to hold, or None for no
+        limit.
+      max_size_bytes: Maximum estimated total size of the concrete functions,
+        or None for no limit. Requires `size_fn`.
+      size_fn: Returns the estimated size in bytes of a concrete function.
+
+    Raises:
+      ValueError: If a bound is not positive or `max_size_bytes` is set without
+        a `size_fn`.
+    """
+    if max_entries is not None and max_entries <= 0:
+      raise ValueError(
+          f"max_entries must be positive or None, got {max_entries}.")
+    if max_size_bytes is not None:
+      if max_size_bytes <= 0:
+        raise ValueError(
+            f"max_size_bytes must be positive or None, got {max_size_bytes}.")
+      if size_fn is None:
+        raise ValueError("max_size_bytes requires a size_fn.")
+
     # The primary cache, mapping FunctionCacheKey to a concrete function.
+    # Ordered from the least to the most recently used entry.
     self._primary = collections.OrderedDict()
 
     # Maps a FunctionCacheKey K to a FunctionCacheKey V such that it is safe
@@ -108,19 +177,31 @@ class FunctionCache:
     # Used to lookup posible concrete functions when K is not in _primary.
     self._dispatch_table = type_dispatch.TypeDispatchTable()
 
+    # Maps the keys of _primary to their _EntryStats.
+    self._stats = {}
+    self._max_entries = max_entries
+    self._max_size_bytes = max_size_bytes
+    self._size_fn = size_fn
+    self._size_bytes = 0
+
   # Note: Instead of returning any viable function, we can return the most
   # specfic one by maintaining trees of traces where children are more specific
   # traces of their parents.
   def lookup(self, key: FunctionCacheKey, use_function_subtyping: bool):
     """Looks up a concrete function based on the key."""
     if not use_function_subtyping:
-      return self._primary.get(key, None)
+      target_key = key if key in self._primary else None
+    else:
+      target_key = self._dispatch_table.dispatch(key)
 
-    dispatch_key = self._dispatch_table.dispatch(key)
-    if dispatch_key is not None:
-      return self._primary[dispatch_key]
+    if target_key is None:
+      return None
 
-    return None
+    self._primary.move_to_end(target_key)
+    stats = self._stats[target_key]
+    stats.hit_count += 1
+    stats.last_used_time = time.time()
+    return self._primary[target_key]
 
   def delete(self, key: FunctionCacheKey):
     """Deletes a concrete function given the key it was added with."""
@@ -129,6 +210,9 @@ class FunctionCache:
 
     del self._primary[key]
     self._dispatch_table.delete(key)
+    stats = self._stats.pop(key)
+    if stats.size_bytes is not None and self._max_size_bytes is not None:
+      self._size_bytes -= stats.size_bytes
 
     return True
 
@@ -137,16 +221,43 @@ class FunctionCache:
           concrete):
     """Adds a new concrete function alongside its key.
 
+    Evicts the least recently used concrete functions if the cache exceeds its
+    bounds. The newly added function itself is never evicted.
+
     Args:
       key: A FunctionCacheKey object corresponding to the provided `concrete`.
       deletion_observer: A WeakrefDeletionObserver object for the `key`.
       concrete: The concrete function to be added to the cache.
     """
+    self.delete(key)
     self._primary[key] = concrete
     self._dispatch_table.add_target(key)
     deletion_observer.add_listener(
         lambda: self.delete(key) if DELETE_WITH_WEAKREF else None)
 
+    size_bytes = None
+    if self._max_size_bytes is not None:
+      size_bytes = self._size_fn(concrete)
+      self._size_bytes += size_bytes
+    self._stats[key] = _EntryStats(size_bytes)
+    self._evict(keep=key)
+
+  def _evict(self, keep: FunctionCacheKey):
+    """Deletes least recently used entries other than `keep` until in bounds."""
+    while len(self._primary) > 1:
+      over_entries = (
+          self._max_entries is not None and
+          len(self._primary) > self._max_entries)
+      over_size = (
+          self._max_size_bytes is not None and
+          self._size_bytes > self._max_size_bytes)
+      if not (over_entries or over_size):
+        return
+      oldest = next(iter(self._primary))
+      if oldest == keep:
+        return
+      self.delete(oldest)
+
   def generalize(self, key: FunctionCacheKey) -> FunctionCacheKey:
     return self._dispatch_table.try_generalizing_trace_type(key)  # pylint: disable=protected-access
 
@@ -155,7 +266,32 @@ class FunctionCache:
     """Removes all concrete functions from the cache."""
     self._primary.clear()
     self._dispatch_table.clear()
+    self._stats.clear()
+    self._size_bytes = 0
 
   def values(self):
     """Returns a list of all `ConcreteFunction` instances held by this cache."""
     return list(self._primary.values())
+
+  def entries(self) -> List[CacheEntryInfo]:
+    """Returns usage information of the entries, least recently used first."""
+    result = []
+    for key, concrete in self._primary.items():
+      stats = self._stats[key]
+      size_bytes = stats.size_bytes
+      if size_bytes is None and self._size_fn is not None:
+        size_bytes = stats.size_bytes = self._size_fn(concrete)
+      result.append(
+          CacheEntryInfo(key, size_bytes, stats.hit_count,
+                         stats.last_used_time))
+    return result
+
+  @property
+  def size_bytes(self) -> Optional[int]:
+    """The estimated total size of the cached functions, if it is tracked."""
+    if self._max_size_bytes is None:
+      return None
+    return self._size_bytes
+
+  def __len__(self) -> int:
+    return len(self._primary)
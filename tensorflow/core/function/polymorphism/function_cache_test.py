@@ -253,6 +253,96 @@ class FunctionCacheTest(test.TestCase):
               function_cache.FunctionCacheKey(MockShape(2, 2, 2), ctx), True),
           "d")
 
+  def testLeastRecentlyUsedEntryIsEvicted(self):
+    ctx = function_cache.FunctionContext(0)
+    cache = function_cache.FunctionCache(max_entries=2)
+    key_1 = function_cache.FunctionCacheKey(MockGenericType(1), ctx)
+    key_2 = function_cache.FunctionCacheKey(MockGenericType(2), ctx)
+    key_3 = function_cache.FunctionCacheKey(MockGenericType(3), ctx)
+
+    cache.add(key_1, trace_type.WeakrefDeletionObserver(), "a")
+    cache.add(key_2, trace_type.WeakrefDeletionObserver(), "b")
+    self.assertEqual(cache.lookup(key_1, False), "a")
+    cache.add(key_3, trace_type.WeakrefDeletionObserver(), "c")
+
+    self.assertLen(cache, 2)
+    self.assertEqual(cache.lookup(key_1, True), "a")
+    self.assertIsNone(cache.lookup(key_2, True))
+    self.assertEqual(cache.lookup(key_3, True), "c")
+
+  def testEvictionBySize(self):
+    ctx = function_cache.FunctionContext(0)
+    cache = function_cache.FunctionCache(max_size_bytes=10, size_fn=len)
+    key_1 = function_cache.FunctionCacheKey(MockGenericType(1), ctx)
+    key_2 = function_cache.FunctionCacheKey(MockGenericType(2), ctx)
+    key_3 = function_cache.FunctionCacheKey(MockGenericType(3), ctx)
+
+    cache.add(key_1, trace_type.WeakrefDeletionObserver(), "aaaa")
+    cache.add(key_2, trace_type.WeakrefDeletionObserver(), "bbbb")
+    self.assertEqual(cache.size_bytes, 8)
+    cache.add(key_3, trace_type.WeakrefDeletionObserver(), "cccc")
+
+    self.assertEqual(cache.size_bytes, 8)
+    self.assertIsNone(cache.lookup(key_1, False))
+    self.assertEqual(cache.lookup(key_2, False), "bbbb")
+
+  def testNewEntryLargerThanCapacityIsKept(self):
+    ctx = function_cache.FunctionContext(0)
+    cache = function_cache.FunctionCache(max_size_bytes=2, size_fn=len)
+    key_1 = function_cache.FunctionCacheKey(MockGenericType(1), ctx)
+    key_2 = function_cache.FunctionCacheKey(MockGenericType(2), ctx)
+
+    cache.add(key_1, trace_type.WeakrefDeletionObserver(), "a")
+    cache.add(key_2, trace_type.WeakrefDeletionObserver(), "bbbb")
+
+    self.assertIsNone(cache.lookup(key_1, False))
+    self.assertEqual(cache.lookup(key_2, False), "bbbb")
+    self.assertEqual(cache.size_bytes, 4)
+
+  def testSubtypeLookupUpdatesRecency(self):
+    ctx = function_cache.FunctionContext(0)
+    cache = function_cache.FunctionCache(max_entries=2)
+    general = function_cache.FunctionCacheKey(MockShape(1, None), ctx)
+    specific = function_cache.FunctionCacheKey(MockShape(2, 2), ctx)
+    cache.add(general, trace_type.WeakrefDeletionObserver(), "a")
+    cache.add(specific, trace_type.WeakrefDeletionObserver(), "b")
+
+    self.assertEqual(
+        cache.lookup(function_cache.FunctionCacheKey(MockShape(1, 3), ctx),
+                     True), "a")
+    cache.add(
+        function_cache.FunctionCacheKey(MockShape(3, 3), ctx),
+        trace_type.WeakrefDeletionObserver(), "c")
+
+    self.assertIsNone(cache.lookup(specific, False))
+    self.assertEqual(cache.lookup(general, False), "a")
+
+  def testEntriesReportUsage(self):
+    ctx = function_cache.FunctionContext(0)
+    cache = function_cache.FunctionCache(size_fn=len)
+    key_1 = function_cache.FunctionCacheKey(MockGenericType(1), ctx)
+    key_2 = function_cache.FunctionCacheKey(MockGenericType(2), ctx)
+    cache.add(key_1, trace_type.WeakrefDeletionObserver(), "aa")
+    cache.add(key_2, trace_type.WeakrefDeletionObserver(), "bbb")
+    cache.lookup(key_1, False)
+    cache.lookup(key_1, True)
+
+    entry_2, entry_1 = cache.entries()
+    self.assertEqual(entry_1.key, key_1)
+    self.assertEqual(entry_1.size_bytes, 2)
+    self.assertEqual(entry_1.hit_count, 2)
+    self.assertEqual(entry_2.key, key_2)
+    self.assertEqual(entry_2.size_bytes, 3)
+    self.assertEqual(entry_2.hit_count, 0)
+    self.assertGreaterEqual(entry_1.last_used_time, entry_2.last_used_time)
+    self.assertIsNone(cache.size_bytes)
+
+  def testInvalidCapacity(self):
+    with self.assertRaisesRegex(ValueError, "max_entries"):
+      function_cache.FunctionCache(max_entries=0)
+    with self.assertRaisesRegex(ValueError, "size_fn"):
+      function_cache.FunctionCache(max_size_bytes=10)
+
   def testWeakRefDeletionAlsoDeletesConcreteFunction(self):
     if not function_cache.DELETE_WITH_WEAKREF:
       self.skipTest("Weakref-Based Deletion is disabled")
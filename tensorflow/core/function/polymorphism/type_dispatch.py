@@ -15,8 +15,11 @@
 """Polymorphic Type Dispatch."""
 
 import collections
-from typing import Optional, Iterable
+import heapq
+import itertools
+from typing import Iterable, Optional
 
+from tensorflow.core.function.trace_type import default_types
 from tensorflow.python.types import trace
 
 # The maximum number of dispatch lookups to cache.
@@ -33,13 +36,24 @@ class TypeDispatchTable:
        subtype of T (in other words, T is the closest to R, within list L).
     3. If the above two rules are satisfied by multiple targets, the earliest
        inserted one is chosen.
+
+  Targets are indexed by their dispatch bucket (see
+  `default_types.dispatch_bucket`) so that a request is only compared against
+  the targets sharing its bucket and the targets without a bucket.
   """
 
   def __init__(self):
     """Creates a TypeDispatchTable object."""
-    # Holds all inserted types as keys mapping to None.
+    # Holds all inserted types as keys mapping to their insertion order.
     # (Using OrderedDict as a set for determinism)
     self._dispatch_table = collections.OrderedDict()
+    self._insertion_counter = itertools.count()
+
+    # Maps buckets to OrderedDicts holding their targets (as in
+    # _dispatch_table). Targets without a bucket are in _unbucketed.
+    self._buckets = {}
+    self._unbucketed = collections.OrderedDict()
+    self._target_buckets = {}
 
     # LRU cache for dispatch results.
     # Maps request types to target types (see class description).
@@ -48,9 +62,22 @@ class TypeDispatchTable:
 
   def add_target(self, target: trace.TraceType) -> None:
     """Adds a new target type."""
-    self._dispatch_table[target] = None
+    if target in self._dispatch_table:
+      return
+
+    order = next(self._insertion_counter)
+    self._dispatch_table[target] = order
+    bucket = default_types.dispatch_bucket(target)
+    self._target_buckets[target] = bucket
+    if bucket is None:
+      self._unbucketed[target] = order
+    else:
+      self._buckets.setdefault(bucket,
+                               collections.OrderedDict())[target] = order
+
     for request in self._dispatch_cache:
-      if target.is_subtype_of(self._dispatch_cache[request]):
+      if (request.is_subtype_of(target) and
+          target.is_subtype_of(self._dispatch_cache[request])):
         self._dispatch_cache[request] = target
 
   @property
@@ -62,6 +89,13 @@ class TypeDispatchTable:
     """Deletes a target in the table if it exists."""
     if target in self._dispatch_table:
       del self._dispatch_table[target]
+      bucket = self._target_buckets.pop(target)
+      if bucket is None:
+        del self._unbucketed[target]
+      else:
+        del self._buckets[bucket][target]
+        if not self._buckets[bucket]:
+          del self._buckets[bucket]
       for request in list(self._dispatch_cache.keys()):
         if self._dispatch_cache[request] == target:
           del self._dispatch_cache[request]
@@ -70,8 +104,26 @@ class TypeDispatchTable:
   def clear(self) -> None:
     """Deletes all targets in the table."""
     self._dispatch_table.clear()
+    self._buckets.clear()
+    self._unbucketed.clear()
+    self._target_buckets.clear()
     self._dispatch_cache.clear()
 
+  def _candidates(
+      self, request: trace.TraceType) -> Iterable[trace.TraceType]:
+    """Returns the targets `request` may be a subtype of, in insertion order."""
+    bucket = default_types.dispatch_bucket(request)
+    if bucket is None:
+      return self._dispatch_table.keys()
+
+    bucketed = self._buckets.get(bucket)
+    if not bucketed:
+      return self._unbucketed.keys()
+    if not self._unbucketed:
+      return bucketed.keys()
+    return (target for target, _ in heapq.merge(
+        bucketed.items(), self._unbucketed.items(), key=lambda item: item[1]))
+
   def dispatch(self, request: trace.TraceType) -> Optional[trace.TraceType]:
     """Returns the deepest subtype target if it exists in the table."""
     # For known exact matches.
@@ -87,7 +139,7 @@ class TypeDispatchTable:
       return result
 
     most_specific_subtype = None
-    for other in self._dispatch_table:
+    for other in self._candidates(request):
       if request.is_subtype_of(other):
         if most_specific_subtype is None or other.is_subtype_of(
             most_specific_subtype):
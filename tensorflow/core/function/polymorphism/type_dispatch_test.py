@@ -56,6 +56,39 @@ class MockShape(trace.TraceType):
     return self.shape == other.shape
 
 
+class MockRankedShape(MockShape):
+  """MockShape that is bucketed by rank, counting subtype checks."""
+
+  subtype_checks = 0
+
+  def is_subtype_of(self, other):
+    MockRankedShape.subtype_checks += 1
+    return super().is_subtype_of(other)
+
+  def most_specific_common_supertype(self, others):
+    supertype = super().most_specific_common_supertype(others)
+    return None if supertype is None else MockRankedShape(*supertype.shape)
+
+  def _dispatch_bucket(self):
+    return len(self.shape)
+
+
+class MockUnknownRankShape(MockShape):
+  """Supertype of all shapes, which can not be bucketed."""
+
+  def __init__(self):
+    super().__init__()
+
+  def is_subtype_of(self, other):
+    return isinstance(other, MockUnknownRankShape)
+
+  def __eq__(self, other):
+    return isinstance(other, MockUnknownRankShape)
+
+  def __hash__(self):
+    return 0
+
+
 class TypeDispatchTableTest(test.TestCase):
 
   def testVertical(self):
@@ -248,6 +281,55 @@ class TypeDispatchTableTest(test.TestCase):
     self.assertEqual(table_2.dispatch(shape), MockShape(None, 2, None))
     self.assertEqual(table_3.dispatch(shape), MockShape(None, None, 3))
 
+  def testBucketedDispatchOnlyChecksBucketTargets(self):
+    table = type_dispatch.TypeDispatchTable()
+    for i in range(100):
+      table.add_target(MockRankedShape(*([i] * (i % 10 + 1))))
+    table.add_target(MockRankedShape(None, None, None))
+
+    MockRankedShape.subtype_checks = 0
+    self.assertEqual(
+        table.dispatch(MockRankedShape(1, 2, 3)),
+        MockRankedShape(None, None, None))
+    # Only the 10 + 1 targets of rank 3 are candidates.
+    self.assertLessEqual(MockRankedShape.subtype_checks, 22)
+
+  def testBucketedDispatchIncludesUnbucketedTargets(self):
+    table = type_dispatch.TypeDispatchTable()
+    table.add_target(MockRankedShape(1, None))
+    unknown = MockUnknownRankShape()
+    table.add_target(unknown)
+    table.add_target(MockRankedShape(None, 2))
+
+    self.assertEqual(table.dispatch(MockRankedShape(1, 2)),
+                     MockRankedShape(1, None))
+    self.assertIsNone(table.dispatch(MockRankedShape(1, 2, 3)))
+
+    table.delete(MockRankedShape(1, None))
+    self.assertEqual(table.dispatch(MockRankedShape(1, 2)),
+                     MockRankedShape(None, 2))
+
+  def testBucketedDispatchOrderingDeterminism(self):
+    table = type_dispatch.TypeDispatchTable()
+    table.add_target(MockShape(1, None, None))
+    table.add_target(MockRankedShape(None, 2, None))
+    table.add_target(MockShape(None, None, 3))
+
+    self.assertEqual(
+        table.dispatch(MockRankedShape(1, 2, 3)), MockShape(1, None, None))
+    table.delete(MockShape(1, None, None))
+    self.assertEqual(
+        table.dispatch(MockRankedShape(1, 2, 3)),
+        MockRankedShape(None, 2, None))
+
+  def testAddTargetDoesNotRedirectUnrelatedCachedRequests(self):
+    table = type_dispatch.TypeDispatchTable()
+    table.add_target(MockShape(None, None))
+    self.assertEqual(table.dispatch(MockShape(1, 2)), MockShape(None, None))
+
+    table.add_target(MockShape(3, None))
+    self.assertEqual(table.dispatch(MockShape(1, 2)), MockShape(None, None))
+
   def testGeneralizedExisting(self):
     table = type_dispatch.TypeDispatchTable()
     table.add_target(MockShape(None, None, None))
@@ -28,5 +28,7 @@ Other implementations of TraceType include tf.TypeSpec and its subclasses.
 
 from tensorflow.core.function.trace_type.trace_type_builder import from_object
 from tensorflow.core.function.trace_type.trace_type_builder import InternalTracingContext
+from tensorflow.core.function.trace_type.trace_type_builder import register_trace_type_key
+from tensorflow.core.function.trace_type.trace_type_builder import TraceTypeCache
 from tensorflow.core.function.trace_type.trace_type_builder import WeakrefDeletionObserver
 
@@ -22,6 +22,23 @@ from typing import Tuple as PythonTuple
 from tensorflow.python.types import trace
 
 
+def dispatch_bucket(trace_type: trace.TraceType) -> Optional[Hashable]:
+  """Returns the dispatch bucket of a TraceType, if it defines one.
+
+  TraceTypes can narrow down dispatch by implementing a `_dispatch_bucket`
+  method returning a hashable value such that `a.is_subtype_of(b)` implies
+  `a._dispatch_bucket() == b._dispatch_bucket()` whenever both are not None.
+  A bucket of None means that the type may be related to types of any bucket.
+
+  Args:
+    trace_type: The TraceType to get the bucket of.
+  """
+  bucket_fn = getattr(trace_type, "_dispatch_bucket", None)
+  if bucket_fn is None:
+    return None
+  return bucket_fn()
+
+
 class Generic(trace.TraceType):
   """Represents an arbitrary Python object."""
 
@@ -39,6 +56,13 @@ class Generic(trace.TraceType):
   def _placeholder_value(self) -> Any:
     return self._object
 
+  def _dispatch_bucket(self) -> Optional[Hashable]:
+    # An overridden `is_subtype_of` may relate types of any bucket.
+    if type(self).is_subtype_of is not Generic.is_subtype_of:
+      return None
+    # Generic types are only subtypes of equal types, which hash the same.
+    return (Generic, self._object_hash)
+
   def __eq__(self, other) -> bool:
     if not isinstance(other, trace.TraceType):
       return NotImplemented
@@ -135,6 +159,14 @@ class OrderedCollection(trace.TraceType):
   def __hash__(self) -> int:
     return hash((self.collection_type, self.components))
 
+  def _dispatch_bucket(self) -> Optional[Hashable]:
+    if type(self).is_subtype_of is not OrderedCollection.is_subtype_of:
+      return None
+    components = tuple(dispatch_bucket(c) for c in self.components)
+    if None in components:
+      return None
+    return (OrderedCollection, self.collection_type, components)
+
   def __repr__(self):
     return (f"{self.__class__.__name__}(collection_type="
             f"{self.collection_type!r}, components={self.components!r})")
@@ -287,6 +319,16 @@ class Dict(trace.TraceType):
   def __hash__(self) -> int:
     return hash(frozenset(self.mapping.keys()))
 
+  def _dispatch_bucket(self) -> Optional[Hashable]:
+    if type(self).is_subtype_of is not Dict.is_subtype_of:
+      return None
+    values = {
+        key: dispatch_bucket(value) for key, value in self.mapping.items()
+    }
+    if None in values.values():
+      return None
+    return (Dict, frozenset(values.items()))
+
   def __repr__(self):
     return f"{self.__class__.__name__}(mapping={self.mapping!r})"
 
@@ -334,6 +376,14 @@ class Reference(trace.TraceType):
   def __hash__(self) -> int:
     return hash((self.identifier, self.base))
 
+  def _dispatch_bucket(self) -> Optional[Hashable]:
+    if type(self).is_subtype_of is not Reference.is_subtype_of:
+      return None
+    base = dispatch_bucket(self.base)
+    if base is None:
+      return None
+    return (Reference, self.identifier, base)
+
   def __repr__(self):
     return (f"{self.__class__.__name__}(base={self.base!r}, "
             f"identifier={self.identifier!r})")
@@ -234,5 +234,76 @@ class DefaultTypesTest(test.TestCase):
     self.assertIsNone(original.most_specific_common_supertype([different_id]))
     self.assertIsNone(original.most_specific_common_supertype([different_type]))
 
+  def testDispatchBucketOfSubtypesIsEqual(self):
+    nested_a = default_types.Dict({
+        'a': default_types.Tuple(default_types.Generic(1)),
+        'b': default_types.Reference(default_types.Generic(2), 0)
+    })
+    nested_b = default_types.Dict({
+        'b': default_types.Reference(default_types.Generic(2), 0),
+        'a': default_types.Tuple(default_types.Generic(1))
+    })
+    self.assertIsNotNone(default_types.dispatch_bucket(nested_a))
+    self.assertEqual(
+        default_types.dispatch_bucket(nested_a),
+        default_types.dispatch_bucket(nested_b))
+
+    self.assertNotEqual(
+        default_types.dispatch_bucket(
+            default_types.List(default_types.Generic(1))),
+        default_types.dispatch_bucket(
+            default_types.Tuple(default_types.Generic(1))))
+    self.assertNotEqual(
+        default_types.dispatch_bucket(default_types.Generic(1)),
+        default_types.dispatch_bucket(default_types.Generic(2)))
+
+  def testDispatchBucketIsNoneForUnbucketedComponents(self):
+
+    class Opaque(default_types.Generic):
+
+      def _dispatch_bucket(self):
+        return None
+
+    self.assertIsNone(
+        default_types.dispatch_bucket(
+            default_types.List(default_types.Generic(1), Opaque(2))))
+    self.assertIsNone(
+        default_types.dispatch_bucket(default_types.Dict({'a': Opaque(1)})))
+    self.assertIsNone(
+        default_types.dispatch_bucket(default_types.Reference(Opaque(1), 0)))
+    self.assertIsNone(default_types.dispatch_bucket(object()))
+
+  def testDispatchBucketIsNoneForOverriddenSubtyping(self):
+
+    class AnyGeneric(default_types.Generic):
+
+      def is_subtype_of(self, other):
+        return isinstance(other, default_types.Generic)
+
+    class AnyList(default_types.List):
+
+      def is_subtype_of(self, other):
+        return isinstance(other, default_types.List)
+
+    class AnyDict(default_types.Dict):
+
+      def is_subtype_of(self, other):
+        return isinstance(other, default_types.Dict)
+
+    class AnyReference(default_types.Reference):
+
+      def is_subtype_of(self, other):
+        return isinstance(other, default_types.Reference)
+
+    self.assertIsNone(default_types.dispatch_bucket(AnyGeneric(1)))
+    self.assertIsNone(
+        default_types.dispatch_bucket(AnyList(default_types.Generic(1))))
+    self.assertIsNone(
+        default_types.dispatch_bucket(AnyDict({'a': default_types.Generic(1)})))
+    self.assertIsNone(
+        default_types.dispatch_bucket(
+            AnyReference(default_types.Generic(1), 0)))
+
+
 if __name__ == '__main__':
   test.main()
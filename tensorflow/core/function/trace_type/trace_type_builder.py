@@ -14,8 +14,10 @@
 # ==============================================================================
 """Utitiles for Cache Key generation based on Function Trace Type."""
 
+import collections
 import collections.abc
-from typing import Any, Callable, Hashable
+import threading
+from typing import Any, Callable, Hashable, List, Tuple
 import weakref
 
 from tensorflow.core.function.trace_type import default_types
@@ -38,12 +40,30 @@ class WeakrefDeletionObserver:
   def __init__(self):
     self._triggered = False
     self._callables = []
+    self._dependencies = []
 
   def add_listener(self, on_delete: Callable[[], None]):
     if self._triggered:
       on_delete()
     else:
       self._callables.append(on_delete)
+      if len(self._callables) == 1:
+        for dependency in self._dependencies:
+          dependency.add_listener(self.weakref_deleted)
+
+  def add_dependency(self, observer: "WeakrefDeletionObserver"):
+    """Triggers this observer whenever `observer` is triggered.
+
+    The link is only established once this observer has listeners, so that
+    short-lived observers without listeners are not retained by `observer`.
+
+    Args:
+      observer: The WeakrefDeletionObserver this observer depends on.
+    """
+    if self._callables:
+      observer.add_listener(self.weakref_deleted)
+    else:
+      self._dependencies.append(observer)
 
   def weakref_deleted(self):
     self._triggered = True
@@ -134,3 +154,156 @@ def from_object(obj: Any,
       raise TypeError(
           f"Python object could not be represented through the generic tracing "
           f"type. Consider implementing the Tracing Protocol for it: {obj!r}")
+
+
+# Maps types to functions returning a hashable key of their instances that
+# determines the TraceType of the instance, see `register_trace_type_key`.
+_TRACE_TYPE_KEY_FNS = {
+    t: lambda obj: obj for t in (bool, int, float, str, bytes, type(None))
+}
+
+# The maximum number of TraceTypes held by a `TraceTypeCache`.
+_TRACE_TYPE_CACHE_CAPACITY = 1024
+
+
+def register_trace_type_key(cls: type, key_fn: Callable[[Any], Hashable]):
+  """Registers a cheap key identifying the TraceTypes of instances of `cls`.
+
+  `TraceTypeCache` uses the key to reuse the TraceType of an earlier object.
+  Only exact instances of `cls` use `key_fn`, not instances of subclasses.
+
+  Args:
+    cls: The type of objects the key function applies to.
+    key_fn: Returns a hashable key such that objects of type `cls` with equal
+      keys have equal TraceTypes, which must not depend on the TracingContext.
+  """
+  _TRACE_TYPE_KEY_FNS[cls] = key_fn
+
+
+class _UncachableError(Exception):
+  """Raised when an object can not be keyed by `TraceTypeCache`."""
+
+
+class TraceTypeCache:
+  """Memoizes the TraceTypes of structurally identical objects.
+
+  `from_object` rebuilds the whole TraceType tree of its argument. For objects
+  made of lists, tuples, namedtuples and dicts whose leaves are registered with
+  `register_trace_type_key` or are plain weakref-able Python objects, this cache
+  instead computes a structural key and reuses the TraceType of the last object
+  with the same key.
+
+  Keys of plain Python objects contain their ids. The weakrefs of a cached
+  TraceType notify a `WeakrefDeletionObserver` owned by its entry, which drops
+  the entry once any of these objects is deleted, before its id can be reused,
+  and triggers the deletion observers of every context the TraceType was
+  returned for.
+  """
+
+  def __init__(self, capacity: int = _TRACE_TYPE_CACHE_CAPACITY):
+    self._capacity = capacity
+    # Maps keys to (TraceType, WeakrefDeletionObserver) ordered from the least
+    # to the most recently used.
+    self._cache = collections.OrderedDict()
+    # Reentrant since weakref callbacks invalidating entries may run while the
+    # lock is held by the same thread.
+    self._lock = threading.RLock()
+
+  def from_object(self, obj: Any,
+                  context: InternalTracingContext) -> trace.TraceType:
+    """Returns the TraceType of `obj`, see `trace_type.from_object`.
+
+    Args:
+      obj: The object to generate a TraceType for.
+      context: The InternalTracingContext to be shared during protocol calls.
+
+    Returns:
+      A TraceType object representing the given object.
+    """
+    weak_objects = []
+    try:
+      key = self._make_key(obj, weak_objects)
+    except _UncachableError:
+      return from_object(obj, context)
+
+    with self._lock:
+      entry = self._cache.get(key)
+      if entry is not None:
+        self._cache.move_to_end(key)
+
+    if entry is None:
+      # Cachable objects never use the context other than for its deletion
+      # observer, so the TraceType is built with one owned by the entry.
+      entry_context = InternalTracingContext()
+      entry = (from_object(obj, entry_context),
+               entry_context.deletion_observer)
+      self._add(key, entry)
+
+    result, deletion_observer = entry
+    if weak_objects:
+      context.deletion_observer.add_dependency(deletion_observer)
+    return result
+
+  def _add(self, key: Hashable,
+           entry: Tuple[trace.TraceType, WeakrefDeletionObserver]):
+    result, deletion_observer = entry
+    with self._lock:
+      self._cache[key] = entry
+      if len(self._cache) > self._capacity:
+        self._cache.popitem(last=False)
+    deletion_observer.add_listener(lambda: self._invalidate(key, result))
+
+  def _invalidate(self, key: Hashable, result: trace.TraceType):
+    with self._lock:
+      entry = self._cache.get(key)
+      if entry is not None and entry[0] is result:
+        del self._cache[key]
+
+  def clear(self):
+    with self._lock:
+      self._cache.clear()
+
+  def __len__(self) -> int:
+    return len(self._cache)
+
+  def _make_key(self, obj: Any, weak_objects: List[Any]) -> Hashable:
+    """Returns a key of `obj` determining its TraceType, collecting weakrefs."""
+    obj_type = type(obj)
+    key_fn = _TRACE_TYPE_KEY_FNS.get(obj_type)
+    if key_fn is not None:
+      return (obj_type, key_fn(obj))
+
+    if obj_type is list or obj_type is tuple:
+      return (obj_type,
+              tuple(self._make_key(c, weak_objects) for c in obj))
+
+    if obj_type is dict:
+      return (dict,
+              tuple((k, self._make_key(v, weak_objects))
+                    for k, v in obj.items()))
+
+    if (isinstance(obj, tuple) and util.is_namedtuple(obj) and
+        not _has_custom_tracing(obj)):
+      return (obj_type,
+              tuple(self._make_key(c, weak_objects) for c in obj))
+
+    if _is_plain_object(obj):
+      weak_objects.append(obj)
+      return (weakref.ref, id(obj))
+
+    raise _UncachableError(obj)
+
+
+def _has_custom_tracing(obj: Any) -> bool:
+  return (hasattr(obj, "__tf_tracing_type__") or
+          hasattr(obj, "__wrapped__"))
+
+
+def _is_plain_object(obj: Any) -> bool:
+  """Whether `from_object` represents `obj` by a `default_types.Weakref`."""
+  obj_type = type(obj)
+  if not obj_type.__weakrefoffset__ or _has_custom_tracing(obj):
+    return False
+  if isinstance(obj, (list, tuple, collections.abc.Mapping)):
+    return False
+  return not util.is_attrs(obj)
@@ -271,6 +271,83 @@ class CacheKeyGenerationTest(test.TestCase, parameterized.TestCase):
         trace_type.from_object(ActualType(1, 2, 3)))
 
 
+class TraceTypeCacheTest(test.TestCase, parameterized.TestCase):
+
+  def _from_object(self, cache, obj):
+    return cache.from_object(obj, trace_type.InternalTracingContext())
+
+  @combinations.generate(combinations.combine(mode=['graph', 'eager']))
+  def testEqualStructuresReuseTraceType(self):
+    cache = trace_type.TraceTypeCache()
+    Point = collections.namedtuple('Point', ['x', 'y'])
+    first = self._from_object(cache, [1, (2, 'a'), {'p': Point(1.0, None)}])
+    second = self._from_object(cache, [1, (2, 'a'), {'p': Point(1.0, None)}])
+    self.assertIs(first, second)
+    self.assertEqual(
+        first,
+        trace_type.from_object([1, (2, 'a'), {'p': Point(1.0, None)}]))
+    self.assertLen(cache, 1)
+
+  @combinations.generate(combinations.combine(mode=['graph', 'eager']))
+  def testDifferentStructuresAreSeparateEntries(self):
+    cache = trace_type.TraceTypeCache()
+    self._from_object(cache, (1, 2))
+    self.assertEqual(
+        self._from_object(cache, (1, True)), trace_type.from_object((1, True)))
+    self.assertEqual(
+        self._from_object(cache, [1, 2]), trace_type.from_object([1, 2]))
+    self.assertLen(cache, 3)
+
+  @combinations.generate(combinations.combine(mode=['eager']))
+  def testEagerTensor(self):
+    cache = trace_type.TraceTypeCache()
+    self._from_object(cache, [array_ops.zeros([2, 3])])
+    self.assertEqual(
+        self._from_object(cache, [array_ops.ones([2, 3])]),
+        trace_type.from_object([array_ops.ones([2, 3])]))
+    self.assertLen(cache, 1)
+    self.assertEqual(
+        self._from_object(cache, [array_ops.zeros([2, 3], dtypes.int32)]),
+        trace_type.from_object([array_ops.zeros([2, 3], dtypes.int32)]))
+    self.assertLen(cache, 2)
+
+  @combinations.generate(combinations.combine(mode=['graph', 'eager']))
+  def testDeletedObjectInvalidatesEntry(self):
+    cache = trace_type.TraceTypeCache()
+    obj = DummyGenericClass()
+    self._from_object(cache, (obj, 1))
+
+    context = trace_type.InternalTracingContext()
+    self.assertEqual(
+        cache.from_object((obj, 1), context),
+        trace_type.from_object((obj, 1)))
+    self.assertLen(cache, 1)
+
+    deleted = []
+    context.deletion_observer.add_listener(lambda: deleted.append(True))
+    del obj
+    self.assertLen(cache, 0)
+    self.assertEqual(deleted, [True])
+
+  @combinations.generate(combinations.combine(mode=['eager']))
+  def testUncachableObjectFallsBack(self):
+    cache = trace_type.TraceTypeCache()
+    v = resource_variable_ops.ResourceVariable(1.0)
+    self.assertEqual(
+        self._from_object(cache, [v, v]), trace_type.from_object([v, v]))
+    self.assertLen(cache, 0)
+
+  def testLeastRecentlyUsedEntryIsEvicted(self):
+    cache = trace_type.TraceTypeCache(capacity=2)
+    one = self._from_object(cache, (1,))
+    self._from_object(cache, (2,))
+    self._from_object(cache, (1,))
+    self._from_object(cache, (3,))
+    self.assertLen(cache, 2)
+    self.assertIs(self._from_object(cache, (1,)), one)
+    self.assertLen(cache, 2)
+
+
 class CacheKeyMemoryTest(test.TestCase):
 
   @test_util.assert_no_new_pyobjects_executing_eagerly
@@ -394,6 +471,27 @@ class CacheKeyGenerationBenchmark(test.Benchmark):
             'value': t / iterations * 1000
         }])
 
+  def benchmarkCachedTensor(self):
+    shapes = [[1], [2, 19], [5, 11, 24], [4, 5, 9, 23]]
+    tensors = []
+    for s in shapes:
+      tensors.append(array_ops.zeros(s))
+    cache = trace_type.TraceTypeCache()
+
+    def encode_tensors(tensors):
+      cache.from_object(tensors, trace_type.InternalTracingContext())
+
+    iterations = 100000
+    t = timeit.timeit(lambda: encode_tensors(tensors), number=iterations)
+    self.report_benchmark(
+        name='cached_tensor_cache_key_generation',
+        iters=iterations,
+        wall_time=t,
+        metrics=[{
+            'name': 'cached_tensor_cache_key_generation_avg_ms',
+            'value': t / iterations * 1000
+        }])
+
   def benchmarkNestedStruct(self):
     struct = {(1, 2, 3): {(1, 2): {12: 2}}, (3, 2, 3): (2, {2: 3})}
 
@@ -92,7 +92,18 @@ void ValidateInputs(bool is_save_op, OpKernelContext* context,
 // Saves a list of named tensors using the tensor bundle library.
 class SaveV2 : public OpKernel {
  public:
-  explicit SaveV2(OpKernelConstruction* context) : OpKernel(context) {}
+  explicit SaveV2(OpKernelConstruction* context) : OpKernel(context) {
+    string compression;
+    OP_REQUIRES_OK(context, context->GetAttr("compression", &compression));
+    if (compression == "ZLIB") {
+      writer_options_.compression = BundleEntryProto::ZLIB;
+    } else if (compression == "SNAPPY") {
+      writer_options_.compression = BundleEntryProto::SNAPPY;
+    }
+    OP_REQUIRES_OK(context,
+                   context->GetAttr("compression_chunk_size",
+                                    &writer_options_.compression_chunk_size));
+  }
 
   void Compute(OpKernelContext* context) override {
     const Tensor& prefix = context->input(0);
@@ -108,7 +119,7 @@ class SaveV2 : public OpKernel {
     const auto& tensor_names_flat = tensor_names.flat<tstring>();
     const auto& shape_and_slices_flat = shape_and_slices.flat<tstring>();
 
-    BundleWriter writer(Env::Default(), prefix_string);
+    BundleWriter writer(Env::Default(), prefix_string, writer_options_);
     OP_REQUIRES_OK(context, writer.status());
     VLOG(1) << "BundleWriter, prefix_string: " << prefix_string;
 
@@ -179,6 +190,9 @@ class SaveV2 : public OpKernel {
       checkpoint_callback_manager->Unref();
     }
   }
+
+ private:
+  BundleWriter::Options writer_options_;
 };
 REGISTER_KERNEL_BUILDER(Name("SaveV2").Device(DEVICE_CPU), SaveV2);
 
@@ -63,6 +63,8 @@ REGISTER_OP("SaveV2")
     .Input("shape_and_slices: string")
     .Input("tensors: dtypes")
     .Attr("dtypes: list(type)")
+    .Attr("compression: {'', 'ZLIB', 'SNAPPY'} = ''")
+    .Attr("compression_chunk_size: int >= 1 = 1048576")
     .SetIsStateful()
     .SetShapeFn([](InferenceContext* c) {
       ShapeHandle unused;
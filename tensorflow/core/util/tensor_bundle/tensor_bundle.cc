@@ -18,6 +18,7 @@ limitations under the License.
 #include <algorithm>
 #include <cstdlib>
 #include <cstring>
+#include <limits>
 #include <memory>
 #include <utility>
 
@@ -42,12 +43,15 @@ limitations under the License.
 #include "tensorflow/core/lib/strings/stringprintf.h"
 #include "tensorflow/core/platform/bfloat16.h"
 #include "tensorflow/core/platform/cord.h"
+#include "tensorflow/core/platform/cpu_info.h"
 #include "tensorflow/core/platform/errors.h"
 #include "tensorflow/core/platform/mem.h"
+#include "tensorflow/core/platform/snappy.h"
 #include "tensorflow/core/util/env_var.h"
 #include "tensorflow/core/util/saved_tensor_slice_util.h"
 #include "tensorflow/core/util/tensor_bundle/byte_swap.h"
 #include "tensorflow/core/util/tensor_slice_util.h"
+#include "zlib.h"  // NOLINT(build/include)
 
 #ifdef PLATFORM_WINDOWS
 #undef DeleteFile
@@ -241,6 +245,127 @@ Status WriteTensor(const Tensor& val, FileOutputBuffer* out,
   return out->Append(StringPiece(buf, *bytes_written));
 }
 
+// Compresses "length" bytes at "data" into "output", discarding its original
+// content.
+Status CompressChunk(BundleEntryProto::Compression compression,
+                     const char* data, size_t length, string* output) {
+  switch (compression) {
+    case BundleEntryProto::ZLIB: {
+      uLongf output_length = compressBound(length);
+      output->resize(output_length);
+      if (compress(reinterpret_cast<Bytef*>(&(*output)[0]), &output_length,
+                   reinterpret_cast<const Bytef*>(data), length) != Z_OK) {
+        return errors::Internal("Failed to compress tensor data with zlib");
+      }
+      output->resize(output_length);
+      return OkStatus();
+    }
+    case BundleEntryProto::SNAPPY:
+      if (!port::Snappy_Compress(data, length, output)) {
+        return errors::Unimplemented(
+            "Snappy compression is not supported on this platform");
+      }
+      return OkStatus();
+    default:
+      return errors::InvalidArgument("Unknown tensor data compression: ",
+                                     compression);
+  }
+}
+
+// Decompresses the chunk "input" into the "length" bytes at "output".
+Status UncompressChunk(BundleEntryProto::Compression compression,
+                       StringPiece input, char* output, size_t length) {
+  switch (compression) {
+    case BundleEntryProto::ZLIB: {
+      uLongf output_length = length;
+      if (uncompress(reinterpret_cast<Bytef*>(output), &output_length,
+                     reinterpret_cast<const Bytef*>(input.data()),
+                     input.size()) != Z_OK ||
+          output_length != length) {
+        return errors::DataLoss("Failed to decompress tensor data with zlib");
+      }
+      return OkStatus();
+    }
+    case BundleEntryProto::SNAPPY: {
+      size_t output_length;
+      if (!port::Snappy_GetUncompressedLength(input.data(), input.size(),
+                                              &output_length) ||
+          output_length != length ||
+          !port::Snappy_Uncompress(input.data(), input.size(), output)) {
+        return errors::DataLoss(
+            "Failed to decompress tensor data with snappy");
+      }
+      return OkStatus();
+    }
+    default:
+      return errors::DataLoss("Unknown tensor data compression: ",
+                              compression);
+  }
+}
+
+// Serializes the data bytes of the non-string tensor "val" in compressed
+// chunks, and records them in "entry".  "bytes_written" is treated in the
+// same fashion as WriteTensor().
+//
+// Checksums the uncompressed bytes and stores it into "crc32c".
+// REQUIRES: DataTypeCanUseMemcpy(val.dtype())
+Status WriteCompressedTensor(const Tensor& val,
+                             BundleEntryProto::Compression compression,
+                             int64_t chunk_size, FileOutputBuffer* out,
+                             BundleEntryProto* entry, size_t* bytes_written,
+                             uint32* crc32c) {
+  const char* buf = GetBackingBuffer(val);
+  const size_t total_bytes = val.TotalBytes();
+  *crc32c = crc32c::Value(buf, total_bytes);
+  *bytes_written = 0;
+  entry->set_compression(compression);
+  entry->set_chunk_size(chunk_size);
+  string compressed;
+  for (size_t start = 0; start < total_bytes; start += chunk_size) {
+    const size_t length =
+        std::min(static_cast<size_t>(chunk_size), total_bytes - start);
+    TF_RETURN_IF_ERROR(
+        CompressChunk(compression, buf + start, length, &compressed));
+    TF_RETURN_IF_ERROR(out->Append(compressed));
+    entry->add_compressed_chunk_sizes(compressed.size());
+    *bytes_written += compressed.size();
+  }
+  VLOG(1) << "Appended " << *bytes_written << " bytes compressed from "
+          << total_bytes << " bytes to file";
+  return OkStatus();
+}
+
+// If the elements of "slice_spec" are contiguous in a tensor of shape
+// "full_shape", i.e. the slice only restricts the first dimension, returns
+// true and sets "begin" and "length" to the range of their bytes.
+bool GetContiguousSliceBytes(const TensorShape& full_shape,
+                             const TensorSlice& slice_spec,
+                             int64_t element_size, int64_t* begin,
+                             int64_t* length) {
+  if (full_shape.dims() == 0 || slice_spec.dims() != full_shape.dims()) {
+    return false;
+  }
+  auto is_full_at = [&](int d) {
+    return slice_spec.IsFullAt(d) ||
+           (slice_spec.start(d) == 0 &&
+            slice_spec.length(d) == full_shape.dim_size(d));
+  };
+  for (int d = 1; d < full_shape.dims(); ++d) {
+    if (!is_full_at(d)) return false;
+  }
+  const int64_t row_bytes =
+      full_shape.num_elements() / std::max<int64_t>(full_shape.dim_size(0), 1) *
+      element_size;
+  if (is_full_at(0)) {
+    *begin = 0;
+    *length = full_shape.dim_size(0) * row_bytes;
+  } else {
+    *begin = slice_spec.start(0) * row_bytes;
+    *length = slice_spec.length(0) * row_bytes;
+  }
+  return true;
+}
+
 // Serializes string tensor "val".  "bytes_written" is treated in the same
 // fashion as WriteTensor().
 //
@@ -413,6 +538,14 @@ Status PadAlignment(FileOutputBuffer* out, int alignment, int64_t* size) {
 
 BundleWriter::BundleWriter(Env* env, StringPiece prefix, const Options& options)
     : env_(env), options_(options), prefix_(prefix), out_(nullptr), size_(0) {
+  if (options_.compression != BundleEntryProto::NONE &&
+      (options_.compression_chunk_size < 1 ||
+       options_.compression_chunk_size > std::numeric_limits<uint32>::max())) {
+    status_ = errors::InvalidArgument(
+        "The compression chunk size must be a positive 32-bit integer, got ",
+        options_.compression_chunk_size);
+    return;
+  }
   status_ = env_->HasAtomicMove(prefix_, &use_temp_file_);
   if (!status_.ok()) return;
 
@@ -461,6 +594,10 @@ Status BundleWriter::Add(StringPiece key, const Tensor& val) {
     status_ = WriteStringTensor(val, out_.get(), &data_bytes_written, &crc32c);
   } else if (val.dtype() == DT_VARIANT) {
     status_ = WriteVariantTensor(val, out_.get(), &data_bytes_written, &crc32c);
+  } else if (options_.compression != BundleEntryProto::NONE) {
+    status_ = WriteCompressedTensor(
+        val, options_.compression, options_.compression_chunk_size,
+        out_.get(), entry, &data_bytes_written, &crc32c);
   } else {
     status_ = WriteTensor(val, out_.get(), &data_bytes_written);
     crc32c = out_->crc32c();
@@ -849,8 +986,14 @@ Status BundleReader::GetValue(const BundleEntryProto& entry, Tensor* val) {
     ret = new Tensor(entry.dtype(), stored_shape);
   }
 
-  // Validates the "size" field.
-  if (entry.dtype() != DT_STRING && entry.dtype() != DT_VARIANT) {
+  // Validates the "size" field.  The sizes of compressed tensors are validated
+  // by "ReadCompressedBytes()".
+  if (entry.compression() != BundleEntryProto::NONE) {
+    if (!DataTypeCanUseMemcpy(entry.dtype())) {
+      return errors::DataLoss("Compressed bundle entry of type ",
+                              DataTypeString(entry.dtype()), ": key ", key());
+    }
+  } else if (entry.dtype() != DT_STRING && entry.dtype() != DT_VARIANT) {
     if (entry.size() != ret->TotalBytes()) {
       return errors::DataLoss("Invalid size in bundle entry: key ", key(),
                               "; stored size ", entry.size(),
@@ -871,22 +1014,21 @@ Status BundleReader::GetValue(const BundleEntryProto& entry, Tensor* val) {
     }
   }
 
-  // Open the data file if it has not been opened.
-  io::InputBuffer* buffered_file = data_[entry.shard_id()];
-  if (buffered_file == nullptr) {
-    std::unique_ptr<RandomAccessFile> file = nullptr;
-    TF_RETURN_IF_ERROR(env_->NewRandomAccessFile(
-        DataFilename(prefix_, entry.shard_id(), num_shards_), &file));
-    buffered_file = new io::InputBuffer(file.release(), kBufferSize);
-    // The InputBuffer and RandomAccessFile objects are both released in dtor.
-    data_[entry.shard_id()] = buffered_file;
-  }
-  CHECK(buffered_file != nullptr);
+  io::InputBuffer* buffered_file;
+  TF_RETURN_IF_ERROR(GetDataFile(entry.shard_id(), &buffered_file));
 
   TF_RETURN_IF_ERROR(buffered_file->Seek(entry.offset()));
   uint32 actual_crc32c = 0;
 
-  if (DataTypeCanUseMemcpy(entry.dtype())) {
+  if (entry.compression() != BundleEntryProto::NONE) {
+    char* backing_buffer = const_cast<char*>((ret->tensor_data().data()));
+    TF_RETURN_IF_ERROR(
+        ReadCompressedBytes(entry, 0, ret->TotalBytes(), backing_buffer));
+    actual_crc32c = crc32c::Value(backing_buffer, ret->TotalBytes());
+    if (need_to_swap_bytes_) {
+      TF_RETURN_IF_ERROR(ByteSwapTensor(ret));
+    }
+  } else if (DataTypeCanUseMemcpy(entry.dtype())) {
     char* backing_buffer = const_cast<char*>((ret->tensor_data().data()));
     size_t unused_bytes_read;
     if (entry.size() > kBufferSize) {
@@ -938,6 +1080,104 @@ Status BundleReader::GetValue(const BundleEntryProto& entry, Tensor* val) {
   return OkStatus();
 }
 
+Status BundleReader::GetDataFile(int32_t shard_id,
+                                 io::InputBuffer** buffered_file) {
+  // Open the data file if it has not been opened.
+  *buffered_file = data_[shard_id];
+  if (*buffered_file == nullptr) {
+    std::unique_ptr<RandomAccessFile> file = nullptr;
+    TF_RETURN_IF_ERROR(env_->NewRandomAccessFile(
+        DataFilename(prefix_, shard_id, num_shards_), &file));
+    *buffered_file = new io::InputBuffer(file.release(), kBufferSize);
+    // The InputBuffer and RandomAccessFile objects are both released in dtor.
+    data_[shard_id] = *buffered_file;
+  }
+  return OkStatus();
+}
+
+Status BundleReader::ReadCompressedBytes(const BundleEntryProto& entry,
+                                         int64_t begin, int64_t length,
+                                         char* output) {
+  const int64_t total_bytes = TensorShape(entry.shape()).num_elements() *
+                              DataTypeSize(entry.dtype());
+  const int64_t chunk_size = entry.chunk_size();
+  const int num_chunks = entry.compressed_chunk_sizes_size();
+  if (chunk_size <= 0 ||
+      num_chunks != (total_bytes + chunk_size - 1) / chunk_size) {
+    return errors::DataLoss("Invalid chunks in bundle entry: key ", key(),
+                            "; ", num_chunks, " chunks of ", chunk_size,
+                            " bytes for ", total_bytes, " bytes");
+  }
+  // Offsets of the compressed chunks in the data file.
+  std::vector<int64_t> chunk_offsets(num_chunks + 1, entry.offset());
+  for (int i = 0; i < num_chunks; ++i) {
+    chunk_offsets[i + 1] = chunk_offsets[i] + entry.compressed_chunk_sizes(i);
+  }
+  if (chunk_offsets[num_chunks] - entry.offset() != entry.size()) {
+    return errors::DataLoss("Invalid size in bundle entry: key ", key(),
+                            "; stored size ", entry.size(),
+                            "; size of the compressed chunks ",
+                            chunk_offsets[num_chunks] - entry.offset());
+  }
+  if (length == 0) return OkStatus();
+
+  const int64_t first_chunk = begin / chunk_size;
+  const int64_t last_chunk = (begin + length - 1) / chunk_size;
+  io::InputBuffer* buffered_file;
+  TF_RETURN_IF_ERROR(GetDataFile(entry.shard_id(), &buffered_file));
+  const int64_t read_offset = chunk_offsets[first_chunk];
+  const int64_t read_size = chunk_offsets[last_chunk + 1] - read_offset;
+  std::unique_ptr<char[]> scratch(new char[read_size]);
+  StringPiece compressed;
+  TF_RETURN_IF_ERROR(buffered_file->file()->Read(read_offset, read_size,
+                                                 &compressed, scratch.get()));
+
+  auto decompress_chunk = [&](int64_t chunk) -> Status {
+    const int64_t chunk_begin = chunk * chunk_size;
+    const int64_t chunk_length =
+        std::min(chunk_size, total_bytes - chunk_begin);
+    const StringPiece input =
+        compressed.substr(chunk_offsets[chunk] - read_offset,
+                          entry.compressed_chunk_sizes(chunk));
+    if (chunk_begin >= begin && chunk_begin + chunk_length <= begin + length) {
+      return UncompressChunk(entry.compression(), input,
+                             output + (chunk_begin - begin), chunk_length);
+    }
+    // Only part of the chunk is read.
+    std::unique_ptr<char[]> chunk_buffer(new char[chunk_length]);
+    TF_RETURN_IF_ERROR(UncompressChunk(entry.compression(), input,
+                                       chunk_buffer.get(), chunk_length));
+    const int64_t copy_begin = std::max(begin, chunk_begin);
+    const int64_t copy_end =
+        std::min(begin + length, chunk_begin + chunk_length);
+    memcpy(output + (copy_begin - begin),
+           chunk_buffer.get() + (copy_begin - chunk_begin),
+           copy_end - copy_begin);
+    return OkStatus();
+  };
+
+  const int64_t num_read_chunks = last_chunk - first_chunk + 1;
+  if (num_read_chunks == 1) {
+    return decompress_chunk(first_chunk);
+  }
+  if (decompression_pool_ == nullptr) {
+    decompression_pool_ = std::make_unique<thread::ThreadPool>(
+        env_, "bundle_decompression", port::MaxParallelism());
+  }
+  std::vector<Status> statuses(num_read_chunks);
+  decompression_pool_->ParallelFor(
+      num_read_chunks, /*cost_per_unit=*/chunk_size,
+      [&](int64_t start, int64_t limit) {
+        for (int64_t i = start; i < limit; ++i) {
+          statuses[i] = decompress_chunk(first_chunk + i);
+        }
+      });
+  for (const Status& status : statuses) {
+    TF_RETURN_IF_ERROR(status);
+  }
+  return OkStatus();
+}
+
 Status BundleReader::Lookup(StringPiece key, Tensor* val) {
   CHECK(val != nullptr);
   BundleEntryProto entry;
@@ -1068,6 +1308,23 @@ Status BundleReader::GetSliceValue(StringPiece full_tensor_key,
       return status_;
     }
 
+    // Only reads the chunks of a compressed tensor that hold the slice, if it
+    // is contiguous.
+    int64_t slice_begin, slice_length;
+    if (stored_slice_entry.compression() != BundleEntryProto::NONE &&
+        stored_slice.IsFull() && !need_to_swap_bytes_ &&
+        val->dtype() == stored_slice_entry.dtype() &&
+        GetContiguousSliceBytes(stored_slice_shape, slice_spec,
+                                DataTypeSize(stored_slice_entry.dtype()),
+                                &slice_begin, &slice_length) &&
+        slice_length == val->TotalBytes()) {
+      VLOG(1) << "Reading " << slice_length << " bytes of compressed tensor "
+              << full_tensor_key << " for slice " << slice_spec.DebugString();
+      status_ = ReadCompressedBytes(stored_slice_entry, slice_begin,
+                                    slice_length, GetBackingBuffer(*val));
+      return status_;
+    }
+
     Tensor stored_slice_tensor(stored_slice_entry.dtype(), stored_slice_shape);
     status_ = GetValue(stored_slice_entry, &stored_slice_tensor);
     if (!status_.ok()) return status_;
@@ -1119,6 +1376,42 @@ Status BundleReader::LookupDtypeAndShape(StringPiece key, DataType* dtype,
   return OkStatus();
 }
 
+Status BundleReader::LookupTensorLocation(StringPiece key, string* filename,
+                                          int64_t* offset, int64_t* size) {
+  BundleEntryProto entry;
+  TF_RETURN_IF_ERROR(GetBundleEntryProto(key, &entry));
+  if (!entry.slices().empty()) {
+    return errors::Unimplemented(
+        "Memory-mapped reads are not supported for partitioned tensors: ",
+        key);
+  }
+  if (!DataTypeCanUseMemcpy(entry.dtype())) {
+    return errors::Unimplemented(
+        "Memory-mapped reads are not supported for tensors of type ",
+        DataTypeString(entry.dtype()), ": ", key);
+  }
+  if (entry.compression() != BundleEntryProto::NONE) {
+    return errors::Unimplemented(
+        "Memory-mapped reads are not supported for compressed tensors: ", key);
+  }
+  if (need_to_swap_bytes_) {
+    return errors::Unimplemented(
+        "Memory-mapped reads are not supported for the TensorBundle at ",
+        prefix_, ", which is of a different endianness than this machine.");
+  }
+  const int64_t expected_size =
+      TensorShape(entry.shape()).num_elements() * DataTypeSize(entry.dtype());
+  if (entry.size() != expected_size) {
+    return errors::DataLoss("Invalid size in bundle entry: key ", key,
+                            "; stored size ", entry.size(),
+                            "; expected size ", expected_size);
+  }
+  *filename = DataFilename(prefix_, entry.shard_id(), num_shards_);
+  *offset = entry.offset();
+  *size = entry.size();
+  return OkStatus();
+}
+
 Status BundleReader::LookupTensorShape(StringPiece key, TensorShape* shape) {
   DataType ignored;
   return LookupDtypeAndShape(key, &ignored, shape);
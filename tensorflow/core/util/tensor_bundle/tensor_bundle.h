@@ -62,6 +62,7 @@ limitations under the License.
 #define TENSORFLOW_CORE_UTIL_TENSOR_BUNDLE_TENSOR_BUNDLE_H_
 
 #include <map>
+#include <memory>
 #include <string>
 #include <unordered_map>
 
@@ -80,6 +81,7 @@ limitations under the License.
 #include "tensorflow/core/platform/env.h"
 #include "tensorflow/core/platform/file_system.h"
 #include "tensorflow/core/platform/macros.h"
+#include "tensorflow/core/platform/threadpool.h"
 #include "tensorflow/core/platform/types.h"
 #include "tensorflow/core/protobuf/tensor_bundle.pb.h"
 #include "tensorflow/core/util/tensor_bundle/naming.h"
@@ -116,6 +118,12 @@ class BundleWriter {
     // Alignment, in bytes, for tensor data.
     // Must be >= 1. The default size of 1 densely packs tensors.
     int data_alignment{1};
+    // Compression of the data of tensors whose dtype can be memcpy'd.  The
+    // data of other tensors is stored uncompressed.
+    BundleEntryProto::Compression compression{BundleEntryProto::NONE};
+    // Size in bytes of the chunks of tensor data that are compressed
+    // independently.  Must be >= 1 and fit in 32 bits.
+    int64_t compression_chunk_size{1 << 20};
   };
   BundleWriter(Env* env, StringPiece prefix,
                const Options& options = Options());
@@ -221,6 +229,20 @@ class BundleReader {
   Status LookupTensorShape(StringPiece key,
                            TensorShape* shape) TF_MUST_USE_RESULT;
 
+  // Looks up where the contents of the tensor keyed by "key" are stored: the
+  // data file holding them, and their offset and size in bytes in that file.
+  // The bytes are the tensor's buffer, laid out as in memory, so they can be
+  // used in place, e.g. by mapping the file into memory.  Returns an
+  // Unimplemented error if they can't be, i.e. if the tensor is partitioned,
+  // if its dtype can't be memcpy'd, if it is compressed, or if the bundle is
+  // of a different endianness than this machine.
+  //
+  // Unlike "Lookup()", does not validate the stored crc32c checksum.
+  // REQUIRES: status().ok()
+  Status LookupTensorLocation(StringPiece key, string* filename,
+                              int64_t* offset,
+                              int64_t* size) TF_MUST_USE_RESULT;
+
   // Looks up the tensor keyed by "key".  If "key" refers to a partitioned
   // tensor, attempts to look up the full contents using all stored slices.
   //
@@ -291,6 +313,16 @@ class BundleReader {
   Status GetValue(const BundleEntryProto& entry,
                   Tensor* val) TF_MUST_USE_RESULT;
 
+  // Reads bytes [begin, begin + length) of the uncompressed data of the
+  // compressed tensor described by "entry" into "output".  Only reads and
+  // decompresses the chunks holding these bytes, in parallel.
+  Status ReadCompressedBytes(const BundleEntryProto& entry, int64_t begin,
+                             int64_t length, char* output) TF_MUST_USE_RESULT;
+
+  // Opens the data file "shard_id" if it has not been opened.
+  Status GetDataFile(int32_t shard_id,
+                     io::InputBuffer** buffered_file) TF_MUST_USE_RESULT;
+
   // Reads the slice described by "slice_spec".  The corresponding full tensor
   // has key "ful_tensor_key" and metadata proto "full_tensor_entry".
   // REQUIRES: full_tensor_entry.slices_size() > 0
@@ -310,6 +342,9 @@ class BundleReader {
   // Owned the InputBuffer objects and their underlying RandomAccessFile's.
   std::unordered_map<int32, io::InputBuffer*> data_;
 
+  // Decompresses the chunks of compressed tensors.  Created on demand.
+  std::unique_ptr<thread::ThreadPool> decompression_pool_;
+
   // Maps each partitioned tensor's key to its stored slices (represented in a
   // TensorSliceSet).  Populated on-demand.
   std::unordered_map<string, checkpoint::TensorSliceSet*> tensor_slices_;
@@ -15,6 +15,7 @@ limitations under the License.
 
 #include "tensorflow/core/util/tensor_bundle/tensor_bundle.h"
 
+#include <cstring>
 #include <random>
 #include <string>
 #include <vector>
@@ -926,6 +927,100 @@ TEST(TensorBundleTest, SortForSequentialAccess) {
                           "tensor-1-2", "tensor-1-1", "tensor-1-0"));
 }
 
+TEST(TensorBundleTest, LookupTensorLocation) {
+  Env* env = Env::Default();
+  const string kPrefix = Prefix("location");
+  {
+    BundleWriter writer(env, kPrefix);
+    TF_EXPECT_OK(writer.Add("floats", Constant_2x3<float>(1.5f)));
+    TF_EXPECT_OK(writer.Add("strings", Constant_2x3<tstring>("foo")));
+    TF_ASSERT_OK(writer.Finish());
+  }
+
+  BundleReader reader(env, kPrefix);
+  TF_ASSERT_OK(reader.status());
+  string filename;
+  int64_t offset;
+  int64_t size;
+  TF_ASSERT_OK(reader.LookupTensorLocation("floats", &filename, &offset,
+                                           &size));
+  EXPECT_EQ(DataFilename(kPrefix, 0, 1), filename);
+  EXPECT_EQ(6 * sizeof(float), size);
+
+  string contents;
+  TF_ASSERT_OK(ReadFileToString(env, filename, &contents));
+  ASSERT_LE(offset + size, contents.size());
+  float values[6];
+  memcpy(values, contents.data() + offset, size);
+  EXPECT_THAT(values, ::testing::Each(1.5f));
+
+  EXPECT_EQ(error::UNIMPLEMENTED,
+            reader.LookupTensorLocation("strings", &filename, &offset, &size)
+                .code());
+  EXPECT_EQ(error::NOT_FOUND,
+            reader.LookupTensorLocation("missing", &filename, &offset, &size)
+                .code());
+}
+
+TEST(TensorBundleTest, Compression) {
+  const TensorShape kShape({100, 10});
+  Tensor floats(DT_FLOAT, kShape);
+  test::FillFn<float>(&floats, [](int offset) -> float { return offset / 10; });
+  BundleWriter::Options options;
+  options.compression = BundleEntryProto::ZLIB;
+  // 40 rows per chunk, so the 100 rows are stored in 3 chunks.
+  options.compression_chunk_size = 40 * 10 * sizeof(float);
+  {
+    BundleWriter writer(Env::Default(), Prefix("compressed"), options);
+    TF_EXPECT_OK(writer.Add("floats", floats));
+    TF_EXPECT_OK(writer.Add("strings", Constant_2x3<tstring>("foo")));
+    TF_ASSERT_OK(writer.Finish());
+  }
+
+  uint64 data_size;
+  TF_ASSERT_OK(Env::Default()->GetFileSize(
+      DataFilename(Prefix("compressed"), 0, 1), &data_size));
+  EXPECT_LT(data_size, floats.TotalBytes());
+
+  BundleReader reader(Env::Default(), Prefix("compressed"));
+  TF_ASSERT_OK(reader.status());
+  Expect<float>(&reader, "floats", floats);
+  Expect<tstring>(&reader, "strings", Constant_2x3<tstring>("foo"));
+
+  // Rows 30 to 59, which are read from the first two chunks.
+  Tensor rows(DT_FLOAT, TensorShape({30, 10}));
+  TF_ASSERT_OK(reader.LookupSlice(
+      "floats", TensorSlice::ParseOrDie("30,30:-"), &rows));
+  Tensor expected_rows(DT_FLOAT, TensorShape({30, 10}));
+  test::FillFn<float>(&expected_rows,
+                      [](int offset) -> float { return 30 + offset / 10; });
+  test::ExpectTensorEqual<float>(rows, expected_rows);
+
+  // A column is not contiguous, so it is read from the whole tensor.
+  Tensor column(DT_FLOAT, TensorShape({100, 1}));
+  TF_ASSERT_OK(reader.LookupSlice(
+      "floats", TensorSlice::ParseOrDie("-:3,1"), &column));
+  Tensor expected_column(DT_FLOAT, TensorShape({100, 1}));
+  test::FillFn<float>(&expected_column,
+                      [](int offset) -> float { return offset; });
+  test::ExpectTensorEqual<float>(column, expected_column);
+
+  string filename;
+  int64_t offset;
+  int64_t size;
+  EXPECT_EQ(error::UNIMPLEMENTED,
+            reader.LookupTensorLocation("floats", &filename, &offset, &size)
+                .code());
+}
+
+TEST(TensorBundleTest, InvalidCompressionChunkSize) {
+  BundleWriter::Options options;
+  options.compression = BundleEntryProto::ZLIB;
+  options.compression_chunk_size = 0;
+  BundleWriter writer(Env::Default(), Prefix("invalid_chunks"), options);
+  EXPECT_EQ(error::INVALID_ARGUMENT, writer.status().code());
+}
+
 TEST(TensorBundleTest, Error) {
   {  // Dup keys.
     BundleWriter writer(Env::Default(), Prefix("dup"));
@@ -21,6 +21,7 @@ import os
 import sys
 import textwrap
 import traceback
+import types
 
 from tensorflow.python.autograph import operators
 from tensorflow.python.autograph import utils
@@ -45,11 +46,13 @@ from tensorflow.python.autograph.impl import conversion
 from tensorflow.python.autograph.lang import special_functions
 from tensorflow.python.autograph.operators import py_builtins
 from tensorflow.python.autograph.pyct import anno
+from tensorflow.python.autograph.pyct import cache
 from tensorflow.python.autograph.pyct import cfg
 from tensorflow.python.autograph.pyct import error_utils
 from tensorflow.python.autograph.pyct import errors
 from tensorflow.python.autograph.pyct import inspect_utils
 from tensorflow.python.autograph.pyct import origin_info
+from tensorflow.python.autograph.pyct import profiling
 from tensorflow.python.autograph.pyct import qual_names
 from tensorflow.python.autograph.pyct import transpiler
 from tensorflow.python.autograph.pyct.static_analysis import activity
@@ -57,6 +60,8 @@ from tensorflow.python.autograph.pyct.static_analysis import reaching_definition
 from tensorflow.python.autograph.utils import ag_logging as logging
 from tensorflow.python.eager import function
 from tensorflow.python.framework import errors_impl
+from tensorflow.python.framework import versions
+from tensorflow.python.profiler import trace
 from tensorflow.python.util import tf_decorator
 from tensorflow.python.util import tf_inspect
 from tensorflow.python.util import tf_stack
@@ -219,6 +224,25 @@ class PyToTF(transpiler.PyToPy):
   def get_caching_key(self, ctx):
     return ctx.options
 
+  def get_persistent_caching_key(self, fn, ctx):
+    try:
+      source = inspect_utils.getimmediatesource(fn)
+    except (OSError, TypeError):
+      return None
+    code = fn.__code__
+    options = ctx.options
+    return (
+        versions.__version__,
+        source,
+        code.co_filename,
+        code.co_firstlineno,
+        code.co_varnames,
+        (options.recursive, options.user_requested,
+         options.internal_convert_user_code,
+         sorted(f.name for f in options.optional_features)),
+        _namespace_fingerprint(fn),
+    )
+
   def initial_analysis(self, node, ctx):
     graphs = cfg.build(node)
     node = qual_names.resolve(node)
@@ -233,30 +257,74 @@ class PyToTF(transpiler.PyToPy):
     return node
 
   def transform_ast(self, node, ctx):
-    unsupported_features_checker.verify(node)
+    _run_converter(unsupported_features_checker.verify, node)
     node = self.initial_analysis(node, ctx)
 
-    node = functions.transform(node, ctx)
-    node = directives.transform(node, ctx)
-    node = break_statements.transform(node, ctx)
+    node = _run_converter(functions.transform, node, ctx)
+    node = _run_converter(directives.transform, node, ctx)
+    node = _run_converter(break_statements.transform, node, ctx)
     if ctx.user.options.uses(converter.Feature.ASSERT_STATEMENTS):
-      node = asserts.transform(node, ctx)
+      node = _run_converter(asserts.transform, node, ctx)
     # Note: sequencing continue canonicalization before for loop one avoids
     # dealing with the extra loop increment operation that the for
     # canonicalization creates.
-    node = continue_statements.transform(node, ctx)
-    node = return_statements.transform(node, ctx)
+    node = _run_converter(continue_statements.transform, node, ctx)
+    node = _run_converter(return_statements.transform, node, ctx)
     if ctx.user.options.uses(converter.Feature.LISTS):
-      node = lists.transform(node, ctx)
-      node = slices.transform(node, ctx)
-    node = call_trees.transform(node, ctx)
-    node = control_flow.transform(node, ctx)
-    node = conditional_expressions.transform(node, ctx)
-    node = logical_expressions.transform(node, ctx)
-    node = variables.transform(node, ctx)
+      node = _run_converter(lists.transform, node, ctx)
+      node = _run_converter(slices.transform, node, ctx)
+    node = _run_converter(call_trees.transform, node, ctx)
+    node = _run_converter(control_flow.transform, node, ctx)
+    node = _run_converter(conditional_expressions.transform, node, ctx)
+    node = _run_converter(logical_expressions.transform, node, ctx)
+    node = _run_converter(variables.transform, node, ctx)
     return node
 
 
+def _run_converter(converter_fn, *args):
+  """Calls `converter_fn`, timing it in a section named after its module."""
+  name = converter_fn.__module__.rsplit('.', 1)[-1]
+  with profiling.section('converter/' + name):
+    return converter_fn(*args)
+
+
+def _value_fingerprint(value):
+  """Returns a description of `value` that is stable across processes."""
+  if inspect.ismodule(value):
+    return ('module', value.__name__)
+  if inspect.isclass(value) or callable(value):
+    return (type(value).__name__, getattr(value, '__module__', None),
+            getattr(value, '__qualname__', None))
+  return (type(value).__module__, type(value).__qualname__)
+
+
+def _namespace_fingerprint(fn):
+  """Describes the parts of the namespace of `fn` its conversion depends on.
+
+  Conversion avoids name collisions with any symbol in the namespace, and
+  resolves some of the symbols that `fn` references to their values.
+
+  Args:
+    fn: The function being converted.
+
+  Returns:
+    A tuple of the sorted namespace symbols, and descriptions of the values of
+    the symbols referenced by `fn`.
+  """
+  namespace = inspect_utils.getnamespace(fn)
+  referenced = set()
+  codes = [fn.__code__]
+  while codes:
+    code = codes.pop()
+    referenced.update(code.co_names)
+    referenced.update(code.co_freevars)
+    codes.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+  return (tuple(sorted(namespace)),
+          tuple((name, _value_fingerprint(namespace[name]))
+                for name in sorted(referenced)
+                if name in namespace))
+
+
 def _convert_actual(entity, program_ctx):
   """Applies AutoGraph to entity."""
 
@@ -945,4 +1013,69 @@ def to_code(entity, recursive=True, experimental_optional_features=None):
   return textwrap.dedent(source)
 
 
+def enable_persistent_cache(cache_dir):
+  """Caches converted code on disk, for reuse by later processes.
+
+  Converting a function whose source code, conversion options and referenced
+  symbols match those of a function converted earlier by any process using the
+  same `cache_dir` loads the earlier converted code instead of parsing and
+  transforming it again. The cache may also be enabled by setting the
+  `AUTOGRAPH_CACHE_DIR` environment variable.
+
+  Args:
+    cache_dir: The directory to store converted code in. It is created if it
+      does not exist.
+  """
+  _TRANSPILER.set_persistent_cache(
+      cache.PersistentSourceCache(cache_dir, version=versions.__version__))
+
+
+def disable_persistent_cache():
+  """Stops using the cache enabled by `enable_persistent_cache`."""
+  _TRANSPILER.set_persistent_cache(None)
+
+
+def profile_conversion():
+  """Returns a context manager that profiles conversions on this thread.
+
+  The context manager yields a `profiling.ConversionProfile` which aggregates
+  the time spent in each stage of the conversions that run while it is active:
+  parsing, each converter, static analyses like the CFG construction, activity
+  and liveness analysis, and loading the converted code. The stages are also
+  reported as TraceMe events to the TensorFlow profiler, when it is enabled.
+
+  Example:
+
+      with api.profile_conversion() as p:
+        api.to_graph(f)
+      print(p)  # Or inspect p.sections.
+
+  Returns:
+    A context manager yielding a `profiling.ConversionProfile`.
+  """
+  return profiling.profile()
+
+
+def _trace_section(name):
+  if trace.enabled:
+    return trace.Trace('autograph/' + name)
+  return None
+
+
+def _enable_persistent_cache_from_environment():
+  """Enables the cache in the `AUTOGRAPH_CACHE_DIR` directory, if set."""
+  cache_dir = os.environ.get('AUTOGRAPH_CACHE_DIR')
+  if not cache_dir:
+    return
+  try:
+    enable_persistent_cache(cache_dir)
+  except (OSError, ValueError) as e:
+    # Runs on import, which a bad cache directory must not make fail.
+    logging.warning(
+        'Not caching AutoGraph conversions in AUTOGRAPH_CACHE_DIR=%s: %s',
+        cache_dir, e)
+
+
+profiling.set_trace_hook(_trace_section)
 _TRANSPILER = PyToTF()
+_enable_persistent_cache_from_environment()
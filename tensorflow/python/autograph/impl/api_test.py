@@ -35,6 +35,7 @@ from tensorflow.python.autograph.core import converter
 from tensorflow.python.autograph.core import converter_testing
 from tensorflow.python.autograph.impl import api
 from tensorflow.python.autograph.impl import conversion
+from tensorflow.python.autograph.pyct import cache
 from tensorflow.python.autograph.pyct import errors
 from tensorflow.python.autograph.pyct import inspect_utils
 from tensorflow.python.autograph.pyct import parser
@@ -47,6 +48,7 @@ from tensorflow.python.framework import constant_op
 from tensorflow.python.framework import errors as tf_errors
 from tensorflow.python.framework import ops
 from tensorflow.python.framework import test_util
+from tensorflow.python.framework import versions
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import variables
 from tensorflow.python.platform import test
@@ -963,6 +965,61 @@ class ApiTest(test.TestCase):
       x = compiled_fn(constant_op.constant((4, 8)), 4)
       self.assertAllEqual(self.evaluate(x), (1, 2))
 
+  def test_to_graph_persistent_cache(self):
+    cache_dir = os.path.join(self.get_temp_dir(), 'to_graph_persistent_cache')
+    api.enable_persistent_cache(cache_dir)
+    self.addCleanup(api.disable_persistent_cache)
+
+    def test_fn(x, s):
+      while math_ops.reduce_sum(x) > s:
+        x //= 2
+      return x
+
+    api.to_graph(test_fn)
+    self.assertLen(os.listdir(cache_dir), 1)
+
+    # A new transpiler stands in for a new process.
+    transpiler = api.PyToTF()
+    transpiler.set_persistent_cache(
+        cache.PersistentSourceCache(cache_dir, version=versions.__version__))
+    program_ctx = converter.ProgramContext(
+        options=converter.ConversionOptions(
+            recursive=True, user_requested=True, optional_features=None))
+    with test.mock.patch.object(
+        api.PyToTF, 'transform_ast', side_effect=AssertionError):
+      loaded_fn, _, _ = transpiler.transform(test_fn, program_ctx)
+
+    with ops.Graph().as_default():
+      x = loaded_fn(constant_op.constant((4, 8)), 4)
+      self.assertAllEqual(self.evaluate(x), (1, 2))
+
+  def test_invalid_persistent_cache_dir_in_environment(self):
+    not_a_dir = os.path.join(self.get_temp_dir(), 'not_a_dir')
+    with open(not_a_dir, 'w') as f:
+      f.write('')
+    api.disable_persistent_cache()
+    with test.mock.patch.dict(os.environ,
+                              {'AUTOGRAPH_CACHE_DIR': not_a_dir}):
+      api._enable_persistent_cache_from_environment()
+    self.assertIsNone(api._TRANSPILER._persistent_cache)
+
+  def test_profile_conversion(self):
+
+    def test_fn(x, s):
+      while math_ops.reduce_sum(x) > s:
+        x //= 2
+      return x
+
+    with api.profile_conversion() as p:
+      api.to_graph(test_fn)
+
+    sections = p.sections
+    for name in ('convert', 'parse', 'converter/control_flow',
+                 'analysis/cfg', 'analysis/liveness', 'loader/compile'):
+      self.assertIn(name, sections)
+    self.assertLessEqual(sections['converter/control_flow'].total_time,
+                         sections['convert'].total_time)
+
   @test_util.run_deprecated_v1
   def test_to_graph_with_defaults(self):
 
@@ -110,6 +110,10 @@ class Static(NoValue):
   CLOSURE_TYPES = 'Types of closure symbols at each detected call site.'
   VALUE = 'Static value information. See type_inference.py.'
 
+  ANALYSIS_CACHE = (
+      'Results of static analyses, reused while the node is unchanged. See'
+      ' incremental.py.')
+
 
 FAIL = object()
 
@@ -15,6 +15,9 @@
 """Caching utilities."""
 
 import inspect
+import json
+import os
+import tempfile
 import weakref
 
 
@@ -91,3 +94,56 @@ class UnboundInstanceCache(_TransformedFnCache):
     return entity
 
 
+class PersistentSourceCache(object):
+  """An on-disk cache of transformed code, shared across processes.
+
+  Each entry is a JSON-serializable value stored in its own file, named after
+  its key. Writes are atomic, so concurrent processes may share a directory.
+  Entries are stored along with the `version` of the cache that wrote them, and
+  are ignored by caches of other versions. Otherwise, entries are never
+  invalidated; it is the responsibility of the caller to include everything an
+  entry depends on in its key.
+  """
+
+  __slots__ = ('_cache_dir', '_version')
+
+  def __init__(self, cache_dir, version=''):
+    os.makedirs(cache_dir, exist_ok=True)
+    self._cache_dir = cache_dir
+    self._version = version
+
+  @property
+  def cache_dir(self):
+    return self._cache_dir
+
+  @property
+  def version(self):
+    return self._version
+
+  def _path(self, key):
+    if not key.isalnum():
+      raise ValueError('invalid cache key: {}'.format(key))
+    return os.path.join(self._cache_dir, key + '.json')
+
+  def get(self, key):
+    """Returns the entry stored for `key`, or None if missing or unreadable."""
+    try:
+      with open(self._path(key), encoding='utf-8') as f:
+        stored = json.load(f)
+    except (OSError, ValueError):
+      return None
+    if not isinstance(stored, dict) or stored.get('version') != self._version:
+      return None
+    return stored.get('entry')
+
+  def put(self, key, entry):
+    """Stores `entry` for `key`, replacing any existing entry."""
+    path = self._path(key)
+    fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+    try:
+      with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({'version': self._version, 'entry': entry}, f)
+      os.replace(tmp_path, path)
+    finally:
+      if os.path.exists(tmp_path):
+        os.remove(tmp_path)
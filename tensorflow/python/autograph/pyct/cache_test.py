@@ -14,6 +14,8 @@
 # ==============================================================================
 """Tests for cache module."""
 
+import os
+
 from tensorflow.python.autograph.pyct import cache
 from tensorflow.python.platform import test
 
@@ -70,6 +72,36 @@ class CacheTest(test.TestCase):
     self.assertIs(c[o2.method][1], dummy)
     self.assertEqual(len(c), 1)
 
+  def test_persistent_source_cache(self):
+    cache_dir = os.path.join(self.get_temp_dir(), 'persistent_source_cache')
+    c = cache.PersistentSourceCache(cache_dir)
+
+    self.assertIsNone(c.get('a1'))
+    c.put('a1', {'source': 'pass', 'lines': [1, 2]})
+    c.put('b2', None)
+    self.assertEqual(c.get('a1'), {'source': 'pass', 'lines': [1, 2]})
+    self.assertCountEqual(os.listdir(cache_dir), ['a1.json', 'b2.json'])
+
+    # Another instance stands in for another process.
+    c = cache.PersistentSourceCache(cache_dir)
+    self.assertEqual(c.get('a1'), {'source': 'pass', 'lines': [1, 2]})
+
+    with open(os.path.join(cache_dir, 'a1.json'), 'w') as f:
+      f.write('{')
+    self.assertIsNone(c.get('a1'))
+
+    with self.assertRaisesRegex(ValueError, 'invalid cache key'):
+      c.put('../a1', {})
+
+  def test_persistent_source_cache_ignores_other_versions(self):
+    cache_dir = os.path.join(self.get_temp_dir(), 'versioned_source_cache')
+    cache.PersistentSourceCache(cache_dir, version='1').put('a1', {'x': 1})
+
+    self.assertEqual(
+        cache.PersistentSourceCache(cache_dir, version='1').get('a1'), {'x': 1})
+    self.assertIsNone(
+        cache.PersistentSourceCache(cache_dir, version='2').get('a1'))
+
 
 if __name__ == '__main__':
   test.main()
@@ -44,6 +44,8 @@ import astunparse
 import gast
 
 from tensorflow.python.autograph.pyct import anno
+from tensorflow.python.autograph.pyct import incremental
+from tensorflow.python.autograph.pyct import profiling
 
 
 class Node(object):
@@ -743,6 +745,19 @@ class AstToCfg(gast.NodeVisitor):
     if self.builder is not None:
       self.builder.add_ordinary_node(node)
 
+    # The graph of a function does not depend on the functions nested in it,
+    # so it remains valid as long as the rest of the function is unchanged.
+    memo = incremental.Memo(
+        node, 'cfg', stop_at=(gast.FunctionDef, gast.Lambda))
+    if memo.hit:
+      self.builder_stack.append(self.builder)
+      self.builder = None
+      for nested_fn in memo.boundaries:
+        self.visit(nested_fn)
+      self.builder = self.builder_stack.pop()
+      self.cfgs[node] = memo.result
+      return
+
     self.builder_stack.append(self.builder)
     self.builder = GraphBuilder(node)
 
@@ -760,6 +775,7 @@ class AstToCfg(gast.NodeVisitor):
     self._exit_lexical_scope(node)
 
     self.cfgs[node] = self.builder.build()
+    memo.record(self.cfgs[node])
     self.builder = self.builder_stack.pop()
 
   def visit_FunctionDef(self, node):
@@ -965,6 +981,7 @@ class AstToCfg(gast.NodeVisitor):
       self.visit(stmt)
 
 
+@profiling.timed('analysis/cfg')
 def build(node):
   visitor = AstToCfg()
   visitor.visit(node)
@@ -1597,6 +1597,42 @@ class AstToCfgTest(test.TestCase):
     )
     self.assertGraphEnds(graph, '', ('return b',))
 
+  def test_rebuild_reuses_graphs_of_unchanged_functions(self):
+
+    def test_fn(a):
+
+      def f(b):
+        return b
+
+      return f(a)
+
+    node, _ = parser.parse_entity(test_fn, future_features=())
+    outer_node = node
+    inner_node = node.body[0]
+    first_graphs = cfg.build(node)
+
+    second_graphs = cfg.build(node)
+    self.assertIs(second_graphs[outer_node], first_graphs[outer_node])
+    self.assertIs(second_graphs[inner_node], first_graphs[inner_node])
+
+    # Changes inside a nested function only invalidate that function's graph.
+    inner_node.body.insert(0, parser.parse('b = b + 1'))
+    third_graphs = cfg.build(node)
+    self.assertIs(third_graphs[outer_node], first_graphs[outer_node])
+    self.assertIsNot(third_graphs[inner_node], first_graphs[inner_node])
+    self.assertGraphMatches(
+        third_graphs[inner_node],
+        (
+            ('b', 'b = (b + 1)', 'return b'),
+        ),
+    )
+    self.assertEqual(list(third_graphs), [inner_node, outer_node])
+
+    outer_node.body[-1] = parser.parse('return a')
+    fourth_graphs = cfg.build(node)
+    self.assertIsNot(fourth_graphs[outer_node], first_graphs[outer_node])
+    self.assertIs(fourth_graphs[inner_node], third_graphs[inner_node])
+
 
 if __name__ == '__main__':
   test.main()
@@ -0,0 +1,191 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Reuse of static analysis results across unchanged ASTs.
+
+Converters run one after another over the same function, and most of them
+re-run some static analysis before transforming it. When the preceding
+converters left a function unchanged, the analysis would produce the same
+result again. A `Memo` detects that case, so the analysis can be skipped.
+
+A node is considered unchanged if the nodes reachable from it are the same
+objects, with the same field values, as when the result was recorded. Since
+transformers either edit nodes in place or replace them with new nodes, this
+invalidates exactly the functions that a transformation touched.
+
+Example:
+
+    memo = incremental.Memo(node, 'my_analysis', inputs=(ctx,))
+    if not memo.hit:
+      memo.record(analyze(node, ctx))
+    result = memo.result
+"""
+
+import gast
+
+from tensorflow.python.autograph.pyct import anno
+
+
+# Annotations hold analysis results, not structure. Nodes that have any get an
+# extra field by this name, see anno.setanno.
+_ANNO_FIELD = '___pyct_anno'
+
+
+class Fingerprint(object):
+  """Snapshot of the structure of an AST, compared by node identity.
+
+  The snapshot keeps the nodes it walked alive, so that their ids cannot be
+  reused by new nodes while it exists.
+
+  Attributes:
+    boundaries: List[ast.AST], the nodes at which the walk stopped. These are
+      included in the fingerprint as references only, so changes inside them
+      do not change the fingerprint.
+  """
+
+  __slots__ = ('_nodes', '_structure', 'boundaries')
+
+  def __init__(self, node, stop_at=()):
+    """Creates a fingerprint.
+
+    Args:
+      node: ast.AST, the root of the tree.
+      stop_at: Tuple[Type[ast.AST]], node types that are not walked into,
+        unless they are the root.
+    """
+    self._nodes = []
+    self._structure = []
+    self.boundaries = []
+
+    # Nodes are walked in source order, so boundaries are listed in the same
+    # order that a NodeVisitor would visit them.
+    to_visit = [node]
+    while to_visit:
+      n = to_visit.pop()
+      if n is not node and isinstance(n, stop_at):
+        self.boundaries.append(n)
+        continue
+      self._nodes.append(n)
+      fields = []
+      children = []
+      for name, value in gast.iter_fields(n):
+        if name == _ANNO_FIELD:
+          continue
+        if isinstance(value, list):
+          fields.append(tuple(_encode(v, children) for v in value))
+        else:
+          fields.append(_encode(value, children))
+      # Some converters pass code to the ones that follow in annotations.
+      extra_test = anno.getanno(n, anno.Basic.EXTRA_LOOP_TEST, default=None)
+      if extra_test is not None:
+        fields.append(_encode(extra_test, children))
+      fields.append(anno.hasanno(n, anno.Basic.SKIP_PROCESSING))
+      self._structure.append((id(n), tuple(fields)))
+      to_visit.extend(reversed(children))
+
+  def __eq__(self, other):
+    if not isinstance(other, Fingerprint):
+      return NotImplemented
+    return self._structure == other._structure
+
+  def __ne__(self, other):
+    return not self == other
+
+  __hash__ = None
+
+
+def _encode(value, children):
+  if isinstance(value, gast.AST):
+    children.append(value)
+    return id(value)
+  # The type disambiguates values that compare equal, like 1 and True.
+  return (type(value), value)
+
+
+class _Entry(object):
+
+  __slots__ = ('fingerprint', 'inputs', 'result')
+
+  def __init__(self, fingerprint, inputs, result):
+    self.fingerprint = fingerprint
+    self.inputs = inputs
+    self.result = result
+
+
+class Memo(object):
+  """Looks up and records the result of an analysis of a node.
+
+  Results are stored in an annotation of the node. A recorded result is reused
+  if the node is unchanged, and the analysis inputs are the same objects as
+  when it was recorded.
+
+  Attributes:
+    hit: bool, whether a recorded result can be reused.
+    result: Any, the reusable result, or the result passed to `record`.
+    boundaries: List[ast.AST], see Fingerprint.
+  """
+
+  def __init__(self, node, analysis, inputs=(), stop_at=()):
+    """Creates a memo.
+
+    Args:
+      node: ast.AST, the node being analyzed.
+      analysis: Hashable, identifies the analysis.
+      inputs: Tuple, other values that the analysis result depends on. They
+        are compared by identity.
+      stop_at: Tuple[Type[ast.AST]], see Fingerprint. Use it for analyses that
+        do not depend on what is inside nodes of these types.
+    """
+    self._node = node
+    self._analysis = analysis
+    self._inputs = tuple(inputs)
+    self._fingerprint = Fingerprint(node, stop_at)
+    self.boundaries = self._fingerprint.boundaries
+
+    entries = anno.getanno(node, anno.Static.ANALYSIS_CACHE, default=None)
+    entry = entries.get(analysis) if entries is not None else None
+    self.hit = (
+        entry is not None and entry.fingerprint == self._fingerprint and
+        _same_objects(entry.inputs, self._inputs))
+    self.result = entry.result if self.hit else None
+
+  def record(self, result):
+    """Stores the result of the analysis, replacing any previous one."""
+    entries = anno.getanno(self._node, anno.Static.ANALYSIS_CACHE, default=None)
+    if entries is None:
+      entries = {}
+      anno.setanno(self._node, anno.Static.ANALYSIS_CACHE, entries)
+    entries[self._analysis] = _Entry(self._fingerprint, self._inputs, result)
+    self.result = result
+
+
+def version(node, analysis):
+  """Returns a token that changes whenever an analysis of node is recorded.
+
+  Dependent analyses can use it in their `Memo` inputs.
+
+  Args:
+    node: ast.AST
+    analysis: Hashable, identifies the analysis.
+  Returns:
+    An object, compared by identity.
+  """
+  entries = anno.getanno(node, anno.Static.ANALYSIS_CACHE, default=None)
+  if entries is None or analysis not in entries:
+    return object()
+  return entries[analysis]
+
+
+def _same_objects(a, b):
+  return len(a) == len(b) and all(x is y for x, y in zip(a, b))
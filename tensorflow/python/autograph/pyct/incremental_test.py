@@ -0,0 +1,126 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for incremental module."""
+
+import gast
+
+from tensorflow.python.autograph.pyct import anno
+from tensorflow.python.autograph.pyct import incremental
+from tensorflow.python.autograph.pyct import parser
+from tensorflow.python.platform import test
+
+
+class FingerprintTest(test.TestCase):
+
+  def test_unchanged(self):
+    node = parser.parse('a = b + 1')
+    self.assertEqual(
+        incremental.Fingerprint(node), incremental.Fingerprint(node))
+
+  def test_ignores_annotations(self):
+    node = parser.parse('a = b + 1')
+    before = incremental.Fingerprint(node)
+    anno.setanno(node.value, 'foo', 1)
+    self.assertEqual(before, incremental.Fingerprint(node))
+
+  def test_field_modified(self):
+    node = parser.parse('a = b + 1')
+    before = incremental.Fingerprint(node)
+    node.value.right.value = True
+    self.assertNotEqual(before, incremental.Fingerprint(node))
+
+  def test_node_replaced(self):
+    node = parser.parse('a = b + 1')
+    before = incremental.Fingerprint(node)
+    node.value.left = parser.parse_expression('b')
+    self.assertNotEqual(before, incremental.Fingerprint(node))
+
+  def test_extra_loop_test_modified(self):
+    node = parser.parse('for i in x: pass')
+    before = incremental.Fingerprint(node)
+    anno.setanno(node, anno.Basic.EXTRA_LOOP_TEST,
+                 parser.parse_expression('y'))
+    self.assertNotEqual(before, incremental.Fingerprint(node))
+
+  def test_stop_at(self):
+    node = parser.parse('\n'.join((
+        'def f():',
+        '  def g():',
+        '    return 1',
+        '  def h():',
+        '    return 2',
+        '  return g',
+    )))
+    g_node, h_node = node.body[:2]
+    before = incremental.Fingerprint(node, stop_at=(gast.FunctionDef,))
+    self.assertEqual(before.boundaries, [g_node, h_node])
+
+    g_node.body[0].value.value = 3
+    self.assertEqual(
+        before, incremental.Fingerprint(node, stop_at=(gast.FunctionDef,)))
+    self.assertNotEqual(before, incremental.Fingerprint(node))
+
+
+class MemoTest(test.TestCase):
+
+  def test_hit(self):
+    node = parser.parse('a = b')
+    inputs = (object(),)
+
+    memo = incremental.Memo(node, 'test', inputs=inputs)
+    self.assertFalse(memo.hit)
+    memo.record('result')
+
+    memo = incremental.Memo(node, 'test', inputs=inputs)
+    self.assertTrue(memo.hit)
+    self.assertEqual(memo.result, 'result')
+
+  def test_miss_on_different_inputs(self):
+    node = parser.parse('a = b')
+    incremental.Memo(node, 'test', inputs=(object(),)).record('result')
+
+    memo = incremental.Memo(node, 'test', inputs=(object(),))
+    self.assertFalse(memo.hit)
+    self.assertIsNone(memo.result)
+
+  def test_miss_on_changed_node(self):
+    node = parser.parse('a = b')
+    incremental.Memo(node, 'test').record('result')
+
+    node.targets[0].id = 'c'
+    self.assertFalse(incremental.Memo(node, 'test').hit)
+
+  def test_analyses_are_independent(self):
+    node = parser.parse('a = b')
+    incremental.Memo(node, 'test').record('result')
+
+    self.assertFalse(incremental.Memo(node, 'other_test').hit)
+    self.assertTrue(incremental.Memo(node, 'test').hit)
+
+  def test_version(self):
+    node = parser.parse('a = b')
+    self.assertIsNot(
+        incremental.version(node, 'test'), incremental.version(node, 'test'))
+
+    incremental.Memo(node, 'test').record('result')
+    version = incremental.version(node, 'test')
+    self.assertIs(incremental.version(node, 'test'), version)
+
+    incremental.Memo(node, 'test').record('result')
+    self.assertIsNot(incremental.version(node, 'test'), version)
+
+
+if __name__ == '__main__':
+  test.main()
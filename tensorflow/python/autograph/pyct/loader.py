@@ -26,6 +26,7 @@ import tempfile
 
 from tensorflow.python.autograph.pyct import origin_info
 from tensorflow.python.autograph.pyct import parser
+from tensorflow.python.autograph.pyct import profiling
 
 
 def _remove_file(file_name):
@@ -90,11 +91,15 @@ def load_ast(nodes,
   if not isinstance(nodes, (list, tuple)):
     nodes = (nodes,)
 
-  source = parser.unparse(nodes, indentation=indentation)
-  module, _ = load_source(source, delete_on_exit)
+  with profiling.section('loader/unparse'):
+    source = parser.unparse(nodes, indentation=indentation)
+  with profiling.section('loader/compile'):
+    module, _ = load_source(source, delete_on_exit)
 
   if include_source_map:
-    source_map = origin_info.create_source_map(nodes, source, module.__file__)
+    with profiling.section('loader/source_map'):
+      source_map = origin_info.create_source_map(
+          nodes, source, module.__file__)
   else:
     source_map = None
 
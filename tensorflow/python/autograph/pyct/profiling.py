@@ -0,0 +1,190 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Timing instrumentation for the stages of source code transformation.
+
+Code that runs a stage of the transformation wraps it in a `section`:
+
+    with profiling.section('analysis/liveness'):
+      ...
+
+Sections are recorded by the `ConversionProfile` activated with `profile` on
+the current thread, if any, and are reported to the trace hook set with
+`set_trace_hook`, if any. Otherwise, sections do nothing.
+
+Example:
+
+    with profiling.profile() as p:
+      transpiler.transform(f, None)
+    print(p)
+"""
+
+import collections
+import contextlib
+import functools
+import threading
+import time
+
+
+class SectionStats(
+    collections.namedtuple('SectionStats',
+                           ('count', 'total_time', 'self_time'))):
+  """Aggregated timing of a section.
+
+  Attributes:
+    count: int, the number of times the section ran.
+    total_time: float, the seconds spent in the section.
+    self_time: float, the seconds spent in the section outside of its nested
+      sections.
+  """
+  pass
+
+
+class ConversionProfile(object):
+  """Aggregates the time spent in each section, by section name."""
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._sections = {}
+
+  def record(self, name, total_time, self_time):
+    with self._lock:
+      stats = self._sections.get(name, SectionStats(0, 0.0, 0.0))
+      self._sections[name] = SectionStats(stats.count + 1,
+                                          stats.total_time + total_time,
+                                          stats.self_time + self_time)
+
+  @property
+  def sections(self):
+    """Returns a Dict[Text, SectionStats] with the stats of each section."""
+    with self._lock:
+      return dict(self._sections)
+
+  def as_dict(self):
+    """Returns the stats of each section as nested dicts, e.g. for JSON."""
+    return {
+        name: stats._asdict() for name, stats in self.sections.items()
+    }
+
+  def __str__(self):
+    lines = ['{:<40} {:>8} {:>12} {:>12}'.format('section', 'count',
+                                                 'total (ms)', 'self (ms)')]
+    for name, stats in sorted(
+        self.sections.items(), key=lambda item: -item[1].self_time):
+      lines.append('{:<40} {:>8} {:>12.3f} {:>12.3f}'.format(
+          name, stats.count, stats.total_time * 1000, stats.self_time * 1000))
+    return '\n'.join(lines)
+
+
+_state = threading.local()
+_trace_hook = None
+
+
+def set_trace_hook(hook):
+  """Sets a callable that reports sections to an external profiler.
+
+  Args:
+    hook: A callable taking the section name and returning a context manager
+      that is entered for the duration of the section, or None to skip the
+      section. Pass None to disable the hook.
+  """
+  global _trace_hook
+  _trace_hook = hook
+
+
+@contextlib.contextmanager
+def profile():
+  """Records the sections that run on this thread in a ConversionProfile.
+
+  Yields:
+    The ConversionProfile.
+  """
+  previous = getattr(_state, 'profile', None)
+  current = ConversionProfile()
+  _state.profile = current
+  try:
+    yield current
+  finally:
+    _state.profile = previous
+
+
+class _Section(object):
+  """Context manager for a section, see `section`."""
+
+  __slots__ = ('_name', '_profile', '_trace', '_start', '_child_time')
+
+  def __init__(self, name, profile_, trace):
+    self._name = name
+    self._profile = profile_
+    self._trace = trace
+
+  def __enter__(self):
+    if self._trace is not None:
+      self._trace.__enter__()
+    if self._profile is not None:
+      stack = getattr(_state, 'stack', None)
+      if stack is None:
+        stack = _state.stack = []
+      stack.append(self)
+      self._child_time = 0.0
+      self._start = time.perf_counter()
+    return self
+
+  def __exit__(self, exc_type, exc_value, tb):
+    if self._profile is not None:
+      elapsed = time.perf_counter() - self._start
+      stack = _state.stack
+      stack.pop()
+      if stack:
+        stack[-1]._child_time += elapsed  # pylint:disable=protected-access
+      self._profile.record(self._name, elapsed, elapsed - self._child_time)
+    if self._trace is not None:
+      self._trace.__exit__(exc_type, exc_value, tb)
+    return False
+
+
+_NULL_SECTION = contextlib.nullcontext()
+
+
+def section(name):
+  """Returns a context manager that times a stage of the transformation.
+
+  Args:
+    name: Text, the name of the section. Sections with the same name are
+      aggregated. By convention, names are paths like 'analysis/liveness'.
+
+  Returns:
+    A context manager.
+  """
+  current = getattr(_state, 'profile', None)
+  hook = _trace_hook
+  trace = hook(name) if hook is not None else None
+  if current is None and trace is None:
+    return _NULL_SECTION
+  return _Section(name, current, trace)
+
+
+def timed(name):
+  """Decorator that runs the decorated function in a `section`."""
+
+  def decorator(f):
+
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+      with section(name):
+        return f(*args, **kwargs)
+
+    return wrapper
+
+  return decorator
@@ -0,0 +1,123 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for profiling module."""
+
+import contextlib
+import threading
+import time
+
+from tensorflow.python.autograph.pyct import profiling
+from tensorflow.python.autograph.pyct import transformer
+from tensorflow.python.autograph.pyct import transpiler
+from tensorflow.python.platform import test
+
+
+class TestTranspiler(transpiler.PyToPy):
+
+  def get_caching_key(self, ctx):
+    del ctx
+    return 0
+
+  def get_extra_locals(self):
+    return {}
+
+  def transform_ast(self, node, ctx):
+    with profiling.section('test_pass'):
+      return transformer.Base(ctx).visit(node)
+
+
+class ProfilingTest(test.TestCase):
+
+  def test_nested_sections(self):
+    with profiling.profile() as p:
+      with profiling.section('outer'):
+        for _ in range(2):
+          with profiling.section('inner'):
+            time.sleep(0.01)
+
+    sections = p.sections
+    self.assertEqual(sections['outer'].count, 1)
+    self.assertEqual(sections['inner'].count, 2)
+    self.assertGreaterEqual(sections['inner'].total_time, 0.02)
+    self.assertEqual(sections['inner'].self_time, sections['inner'].total_time)
+    self.assertGreaterEqual(sections['outer'].total_time,
+                            sections['inner'].total_time)
+    self.assertLess(sections['outer'].self_time, 0.02)
+    self.assertEqual(p.as_dict()['inner']['count'], 2)
+    self.assertIn('inner', str(p))
+
+  def test_sections_outside_profile_are_ignored(self):
+    with profiling.section('before'):
+      pass
+    with profiling.profile() as p:
+      pass
+    with profiling.section('after'):
+      pass
+    self.assertEqual(p.sections, {})
+
+  def test_profile_is_thread_local(self):
+
+    def convert_in_thread():
+      with profiling.section('other_thread'):
+        pass
+
+    with profiling.profile() as p:
+      t = threading.Thread(target=convert_in_thread)
+      t.start()
+      t.join()
+    self.assertNotIn('other_thread', p.sections)
+
+  def test_timed(self):
+
+    @profiling.timed('timed_fn')
+    def f(x):
+      return x + 1
+
+    with profiling.profile() as p:
+      self.assertEqual(f(1), 2)
+    self.assertEqual(p.sections['timed_fn'].count, 1)
+
+  def test_trace_hook(self):
+    events = []
+
+    @contextlib.contextmanager
+    def hook(name):
+      events.append(('enter', name))
+      yield
+      events.append(('exit', name))
+
+    profiling.set_trace_hook(hook)
+    self.addCleanup(profiling.set_trace_hook, None)
+    with profiling.section('traced'):
+      pass
+    self.assertEqual(events, [('enter', 'traced'), ('exit', 'traced')])
+
+  def test_transpiler_stages(self):
+
+    def f(a):
+      return a + 1
+
+    with profiling.profile() as p:
+      TestTranspiler().transform(f, None)
+
+    for name in ('convert', 'parse', 'transform', 'test_pass', 'loader/unparse',
+                 'loader/compile', 'loader/source_map'):
+      self.assertEqual(p.sections[name].count, 1, name)
+    self.assertLessEqual(p.sections['test_pass'].total_time,
+                         p.sections['transform'].total_time)
+
+
+if __name__ == '__main__':
+  test.main()
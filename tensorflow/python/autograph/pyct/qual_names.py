@@ -27,6 +27,7 @@ import gast
 
 from tensorflow.python.autograph.pyct import anno
 from tensorflow.python.autograph.pyct import parser
+from tensorflow.python.autograph.pyct import profiling
 
 
 class CallerMustSetThis(object):
@@ -256,6 +257,7 @@ class QnResolver(gast.NodeTransformer):
     return node
 
 
+@profiling.timed('analysis/qual_names')
 def resolve(node):
   return QnResolver().visit(node)
 
@@ -23,6 +23,8 @@ import weakref
 import gast
 
 from tensorflow.python.autograph.pyct import anno
+from tensorflow.python.autograph.pyct import incremental
+from tensorflow.python.autograph.pyct import profiling
 from tensorflow.python.autograph.pyct import qual_names
 from tensorflow.python.autograph.pyct import transformer
 from tensorflow.python.autograph.pyct.static_analysis.annos import NodeAnno
@@ -700,5 +702,13 @@ class ActivityAnalyzer(transformer.Base):
     return node
 
 
+@profiling.timed('analysis/activity')
 def resolve(node, context, parent_scope=None):
-  return ActivityAnalyzer(context, parent_scope).visit(node)
+  # Converters don't modify the scopes of existing nodes, so those remain
+  # valid as long as the nodes are unchanged.
+  memo = incremental.Memo(node, 'activity', inputs=(context, parent_scope))
+  if memo.hit:
+    return node
+  node = ActivityAnalyzer(context, parent_scope).visit(node)
+  memo.record(None)
+  return node
@@ -863,6 +863,33 @@ class ActivityAnalyzerTest(ActivityAnalyzerTestBase):
     body_scope = anno.getanno(fn_node, NodeAnno.BODY_SCOPE)
     self.assertScopeIs(body_scope, ('a', 'b', 'C', 'c'), ('C',))
 
+  def test_resolve_reuses_scopes_of_unchanged_nodes(self):
+
+    def test_fn(a):
+      b = a + 1
+      return b
+
+    node, source = parser.parse_entity(test_fn, future_features=())
+    entity_info = transformer.EntityInfo(
+        name=test_fn.__name__,
+        source_code=source,
+        source_file=None,
+        future_features=(),
+        namespace={})
+    node = qual_names.resolve(node)
+    ctx = transformer.Context(entity_info, naming.Namer({}), None)
+
+    node = activity.resolve(node, ctx)
+    body_scope = anno.getanno(node, NodeAnno.BODY_SCOPE)
+    node = activity.resolve(node, ctx)
+    self.assertIs(anno.getanno(node, NodeAnno.BODY_SCOPE), body_scope)
+
+    node.body[0].value = parser.parse_expression('a + c')
+    node = qual_names.resolve(node)
+    node = activity.resolve(node, ctx)
+    body_scope = anno.getanno(node, NodeAnno.BODY_SCOPE)
+    self.assertScopeIs(body_scope, ('a', 'b', 'c'), ('b',))
+
 
 if __name__ == '__main__':
   test.main()
@@ -29,6 +29,8 @@ import gast
 
 from tensorflow.python.autograph.pyct import anno
 from tensorflow.python.autograph.pyct import cfg
+from tensorflow.python.autograph.pyct import incremental
+from tensorflow.python.autograph.pyct import profiling
 from tensorflow.python.autograph.pyct import transformer
 from tensorflow.python.autograph.pyct.static_analysis import annos
 
@@ -51,7 +53,8 @@ class Analyzer(cfg.GraphVisitor):
 
       gen = node_scope.read
       if not self.include_annotations:
-        gen -= node_scope.annotations
+        # Scopes may be reused by later analyses, so don't modify them.
+        gen = gen - node_scope.annotations
       # TODO(mdan): verify whether composites' parents need to be added.
       # E.g. whether x needs to be added if x.y is live. Theoretically the
       # activity analysis should have both so that wouldn't be needed.
@@ -199,6 +202,7 @@ class TreeAnnotator(transformer.Base):
 
 
 # TODO(mdan): Investigate the possibility of removing include_annotations.
+@profiling.timed('analysis/liveness')
 def resolve(node, source_info, graphs, include_annotations=True):
   """Resolves the live symbols at the exit of control flow statements.
 
@@ -211,5 +215,13 @@ def resolve(node, source_info, graphs, include_annotations=True):
   Returns:
     ast.AST
   """
+  memo = incremental.Memo(
+      node, 'liveness',
+      inputs=(include_annotations, incremental.version(node, 'activity'),
+              incremental.version(node, 'reaching_fndefs')) +
+      tuple(graphs.values()))
+  if memo.hit:
+    return node
   node = TreeAnnotator(source_info, graphs, include_annotations).visit(node)
+  memo.record(None)
   return node
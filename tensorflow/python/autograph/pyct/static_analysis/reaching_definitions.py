@@ -30,6 +30,8 @@ import gast
 
 from tensorflow.python.autograph.pyct import anno
 from tensorflow.python.autograph.pyct import cfg
+from tensorflow.python.autograph.pyct import incremental
+from tensorflow.python.autograph.pyct import profiling
 from tensorflow.python.autograph.pyct import transformer
 
 
@@ -272,6 +274,7 @@ class TreeAnnotator(transformer.Base):
     return node
 
 
+@profiling.timed('analysis/reaching_definitions')
 def resolve(node, source_info, graphs, definition_factory=Definition):
   """Resolves reaching definitions for each symbol.
 
@@ -283,6 +286,13 @@ def resolve(node, source_info, graphs, definition_factory=Definition):
   Returns:
     ast.AST
   """
+  memo = incremental.Memo(
+      node, 'reaching_definitions',
+      inputs=(definition_factory, incremental.version(node, 'activity')) +
+      tuple(graphs.values()))
+  if memo.hit:
+    return node
   visitor = TreeAnnotator(source_info, graphs, definition_factory)
   node = visitor.visit(node)
+  memo.record(None)
   return node
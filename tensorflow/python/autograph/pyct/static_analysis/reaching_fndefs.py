@@ -22,6 +22,8 @@ import gast
 
 from tensorflow.python.autograph.pyct import anno
 from tensorflow.python.autograph.pyct import cfg
+from tensorflow.python.autograph.pyct import incremental
+from tensorflow.python.autograph.pyct import profiling
 from tensorflow.python.autograph.pyct import transformer
 
 
@@ -163,6 +165,7 @@ class TreeAnnotator(transformer.Base):
     return super(TreeAnnotator, self).visit(node)
 
 
+@profiling.timed('analysis/reaching_fndefs')
 def resolve(node, source_info, graphs):
   """Resolves reaching definitions for each symbol.
 
@@ -173,6 +176,12 @@ def resolve(node, source_info, graphs):
   Returns:
     ast.AST
   """
+  memo = incremental.Memo(
+      node, 'reaching_fndefs',
+      inputs=(incremental.version(node, 'activity'),) + tuple(graphs.values()))
+  if memo.hit:
+    return node
   visitor = TreeAnnotator(source_info, graphs)
   node = visitor.visit(node)
+  memo.record(None)
   return node
@@ -35,6 +35,7 @@ import gast
 
 from tensorflow.python.autograph.pyct import anno
 from tensorflow.python.autograph.pyct import cfg
+from tensorflow.python.autograph.pyct import profiling
 from tensorflow.python.autograph.pyct import qual_names
 from tensorflow.python.autograph.pyct import transformer
 from tensorflow.python.autograph.pyct.static_analysis import activity
@@ -607,6 +608,7 @@ class FunctionVisitor(transformer.Base):
     return node
 
 
+@profiling.timed('analysis/type_inference')
 def resolve(node, source_info, graphs, resolver):
   """Performs type inference.
 
@@ -14,7 +14,9 @@
 # ==============================================================================
 """Generic source code transformation infrastructure."""
 
+import hashlib
 import inspect
+import sys
 import threading
 import types
 
@@ -26,6 +28,7 @@ from tensorflow.python.autograph.pyct import loader
 from tensorflow.python.autograph.pyct import naming
 from tensorflow.python.autograph.pyct import origin_info
 from tensorflow.python.autograph.pyct import parser
+from tensorflow.python.autograph.pyct import profiling
 from tensorflow.python.autograph.pyct import templates
 from tensorflow.python.autograph.pyct import transformer
 from tensorflow.python.autograph.utils import ag_logging as logging
@@ -140,6 +143,15 @@ def _wrap_into_factory(nodes, entity_name, inner_factory_name,
       outer_factory_name=outer_factory_name)
 
 
+def _source_digest(fn):
+  """Returns a hash of the source code of `fn`, or None if unavailable."""
+  try:
+    source = inspect_utils.getimmediatesource(fn)
+  except (OSError, TypeError):
+    return None
+  return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
 class _PythonFnFactory(object):
   """Helper object that wraps a Python function factory."""
 
@@ -158,7 +170,9 @@ class _PythonFnFactory(object):
 
     self._unbound_factory = None
     self.module = None
+    self.source = None
     self.source_map = None
+    self.outer_factory_name = None
 
   def create(self,
              nodes,
@@ -176,12 +190,41 @@ class _PythonFnFactory(object):
                                outer_factory_name, self._freevars,
                                self._extra_locals.keys(), future_features)
 
-    module, _, source_map = loader.load_ast(
+    module, source, source_map = loader.load_ast(
         nodes, include_source_map=True)
+    self._set_module(module, outer_factory_name)
+    self.source = source
+    self.source_map = source_map
+
+  def create_from_source(self, source, outer_factory_name, source_map_lines):
+    """Initializes a function from the source code generated by `create`.
+
+    Args:
+      source: Text, the source code of a module generated by `create`.
+      outer_factory_name: Text, the name of the outer factory in `source`.
+      source_map_lines: Iterable[Tuple[int, origin_info.OriginInfo]], the line
+        numbers in `source` and their origin, see `source_map_lines`.
+    """
+    if self._unbound_factory is not None:
+      raise ValueError('double initialization; create a new object instead')
+
+    module, file_name = loader.load_source(source, delete_on_exit=True)
+    self._set_module(module, outer_factory_name)
+    self.source = source
+    self.source_map = {
+        origin_info.LineLocation(file_name, lineno): origin
+        for lineno, origin in source_map_lines
+    }
+
+  def source_map_lines(self):
+    """Returns the source map keyed by line number only, for serialization."""
+    return [(loc.lineno, origin) for loc, origin in self.source_map.items()]
+
+  def _set_module(self, module, outer_factory_name):
     outer_factory = getattr(module, outer_factory_name)
     self._unbound_factory = outer_factory()
     self.module = module
-    self.source_map = source_map
+    self.outer_factory_name = outer_factory_name
 
   def instantiate(self,
                   globals_,
@@ -338,11 +381,13 @@ class GenericTranspiler(object):
       together with a `transformer.Context` containing information about the
       transformation process.
     """
-    future_features = inspect_utils.getfutureimports(fn)
-    node, source = parser.parse_entity(fn, future_features=future_features)
+    with profiling.section('parse'):
+      future_features = inspect_utils.getfutureimports(fn)
+      node, source = parser.parse_entity(fn, future_features=future_features)
     logging.log(3, 'Source code of %s:\n\n%s\n', fn, source)
 
-    origin_info.resolve_entity(node, source, fn)
+    with profiling.section('origin_info'):
+      origin_info.resolve_entity(node, source, fn)
 
     namespace = inspect_utils.getnamespace(fn)
     namer = naming.Namer(namespace)
@@ -356,7 +401,8 @@ class GenericTranspiler(object):
     context = transformer.Context(entity_info, namer, user_context)
 
     node = self._erase_arg_defaults(node)
-    result = self.transform_ast(node, context)
+    with profiling.section('transform'):
+      result = self.transform_ast(node, context)
 
     return result, context
 
@@ -394,6 +440,19 @@ class PyToPy(GenericTranspiler):
   def __init__(self):
     self._cache_lock = threading.RLock()
     self._cache = cache.CodeObjectCache()
+    self._persistent_cache = None
+
+  def set_persistent_cache(self, persistent_cache):
+    """Sets an on-disk cache of transformed code shared across processes.
+
+    Only functions for which `get_persistent_caching_key` returns a key use
+    the persistent cache.
+
+    Args:
+      persistent_cache: A cache.PersistentSourceCache, or None to disable
+        persistent caching.
+    """
+    self._persistent_cache = persistent_cache
 
   def get_extra_locals(self):
     """Returns extra static local variables to be made to transformed code.
@@ -423,6 +482,87 @@ class PyToPy(GenericTranspiler):
     """
     raise NotImplementedError('subclasses must override this')
 
+  def get_persistent_caching_key(self, fn, user_context):
+    """Returns a key to use for caching transformed code across processes.
+
+    Subclasses may override this. The default disables persistent caching.
+
+    Unlike `get_caching_key`, the key must identify everything that the
+    transformation of `fn` depends on, and must be stable across processes.
+    The source code of `fn` need not be part of it: persisted code is only
+    loaded for functions with the same source code. Only the transformed code
+    is persisted; the output of `transform_ast` is not, so it must be the same
+    for functions with equal keys.
+
+    Args:
+      fn: The function being transformed.
+      user_context: The context object which was passed to `transform`.
+
+    Returns:
+      A value whose `repr` identifies it across processes, such as a tuple of
+      strings and numbers, or None if `fn` should not be cached persistently.
+    """
+    del fn, user_context
+    return None
+
+  def _persistent_caching_key(self, fn, user_context):
+    if self._persistent_cache is None:
+      return None
+    key = self.get_persistent_caching_key(fn, user_context)
+    if key is None:
+      return None
+    source_digest = _source_digest(fn)
+    if source_digest is None:
+      return None
+    key = (type(self).__name__, key, source_digest,
+           sorted(self.get_extra_locals()), fn.__code__.co_freevars,
+           sys.version)
+    return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+
+  def _load_persisted_factory(self, fn, persistent_key):
+    """Returns a factory for the persisted code of `fn`, or None."""
+    entry = self._persistent_cache.get(persistent_key)
+    if entry is None:
+      return None
+    # The directory may be shared, so the entry is checked against `fn`.
+    if (not isinstance(entry, dict) or
+        entry.get('fn_source_digest') != _source_digest(fn)):
+      logging.log(1, 'Ignoring persisted code for a different source of %s',
+                  fn)
+      return None
+    try:
+      factory = _PythonFnFactory(
+          entry['name'], fn.__code__.co_freevars, self.get_extra_locals())
+      factory.create_from_source(
+          entry['source'], entry['outer_factory_name'],
+          ((lineno, origin_info.OriginInfo(
+              origin_info.Location(*loc), function_name, source_code_line,
+              comment))
+           for lineno, loc, function_name, source_code_line, comment in
+           entry['source_map']))
+    except (AttributeError, KeyError, SyntaxError, TypeError, ValueError) as e:
+      logging.log(1, 'Ignoring invalid persisted code for %s: %s', fn, e)
+      return None
+    logging.log(3, 'Persistent cache hit for %s: %s', fn, persistent_key)
+    return factory
+
+  def _persist_factory(self, fn, factory, persistent_key):
+    entry = {
+        'fn_source_digest': _source_digest(fn),
+        'name': factory._name,  # pylint:disable=protected-access
+        'outer_factory_name': factory.outer_factory_name,
+        'source': factory.source,
+        'source_map': [
+            (lineno, tuple(origin.loc), origin.function_name,
+             origin.source_code_line, origin.comment)
+            for lineno, origin in factory.source_map_lines()
+        ],
+    }
+    try:
+      self._persistent_cache.put(persistent_key, entry)
+    except OSError as e:
+      logging.log(1, 'Unable to persist transformed code: %s', e)
+
   def _cached_factory(self, fn, cache_subkey):
     cached_factory = self._cache[fn][cache_subkey]
     logging.log(3, 'Cache hit for %s subkey %s: %s', fn, cache_subkey,
@@ -462,29 +602,17 @@ class PyToPy(GenericTranspiler):
 
         else:
           logging.log(1, '%s is not cached for subkey %s', fn, cache_subkey)
-          # TODO(mdan): Confusing overloading pattern. Fix.
-          nodes, ctx = super(PyToPy, self).transform_function(fn, user_context)
-
-          if isinstance(nodes, gast.Lambda):
-            nodes = gast.Assign(
-                targets=[
-                    gast.Name(
-                        ctx.info.name,
-                        ctx=gast.Store(),
-                        annotation=None,
-                        type_comment=None)
-                ],
-                value=nodes)
-          else:
-            nodes.name = ctx.info.name
-
-          if logging.has_verbosity(2):
-            logging.log(2, 'Transformed %s:\n\n%s\n', fn, parser.unparse(nodes))
-
-          factory = _PythonFnFactory(
-              ctx.info.name, fn.__code__.co_freevars, self.get_extra_locals())
-          factory.create(
-              nodes, ctx.namer, future_features=ctx.info.future_features)
+          with profiling.section('convert'):
+            persistent_key = self._persistent_caching_key(fn, user_context)
+            factory = None
+            if persistent_key is not None:
+              with profiling.section('persistent_cache/load'):
+                factory = self._load_persisted_factory(fn, persistent_key)
+            if factory is None:
+              factory = self._transform_to_factory(fn, user_context)
+              if persistent_key is not None:
+                with profiling.section('persistent_cache/store'):
+                  self._persist_factory(fn, factory, persistent_key)
           self._cache[fn][cache_subkey] = factory
 
     transformed_fn = factory.instantiate(
@@ -493,3 +621,30 @@ class PyToPy(GenericTranspiler):
         defaults=fn.__defaults__,
         kwdefaults=getattr(fn, '__kwdefaults__', None))
     return transformed_fn, factory.module, factory.source_map
+
+  def _transform_to_factory(self, fn, user_context):
+    """Transforms `fn` and loads the result into a new factory."""
+    # TODO(mdan): Confusing overloading pattern. Fix.
+    nodes, ctx = super(PyToPy, self).transform_function(fn, user_context)
+
+    if isinstance(nodes, gast.Lambda):
+      nodes = gast.Assign(
+          targets=[
+              gast.Name(
+                  ctx.info.name,
+                  ctx=gast.Store(),
+                  annotation=None,
+                  type_comment=None)
+          ],
+          value=nodes)
+    else:
+      nodes.name = ctx.info.name
+
+    if logging.has_verbosity(2):
+      logging.log(2, 'Transformed %s:\n\n%s\n', fn, parser.unparse(nodes))
+
+    factory = _PythonFnFactory(
+        ctx.info.name, fn.__code__.co_freevars, self.get_extra_locals())
+    factory.create(
+        nodes, ctx.namer, future_features=ctx.info.future_features)
+    return factory
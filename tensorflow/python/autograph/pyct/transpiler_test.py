@@ -14,10 +14,13 @@
 # ==============================================================================
 """Tests for transpiler module."""
 
+import json
+import os
 import threading
 
 import gast
 
+from tensorflow.python.autograph.pyct import cache
 from tensorflow.python.autograph.pyct import transformer
 from tensorflow.python.autograph.pyct import transpiler
 from tensorflow.python.platform import test
@@ -235,6 +238,112 @@ class PyToPyTest(test.TestCase):
         obj.global_var_for_test_namespace_collisions, None)
     self.assertIs(f(obj), global_var_for_test_namespace_collisions)
 
+  def test_persistent_cache(self):
+
+    class PersistentTranspiler(TestTranspiler):
+
+      def __init__(self):
+        super(PersistentTranspiler, self).__init__()
+        self.transform_count = 0
+
+      def get_persistent_caching_key(self, fn, ctx):
+        del ctx
+        return fn.__code__.co_name
+
+      def transform_ast(self, node, ctx):
+        self.transform_count += 1
+        return super(PersistentTranspiler, self).transform_ast(node, ctx)
+
+    def f(a):
+      return a + 1
+
+    persistent_cache = cache.PersistentSourceCache(
+        os.path.join(self.get_temp_dir(), 'test_persistent_cache'))
+
+    tr = PersistentTranspiler()
+    tr.set_persistent_cache(persistent_cache)
+    f1, _, source_map = tr.transform(f, None)
+    self.assertEqual(f1(1), 0)
+    self.assertEqual(tr.transform_count, 1)
+
+    # A new transpiler stands in for a new process.
+    tr = PersistentTranspiler()
+    tr.set_persistent_cache(persistent_cache)
+    f2, module, loaded_source_map = tr.transform(f, None)
+    self.assertEqual(f2(1), 0)
+    self.assertEqual(tr.transform_count, 0)
+    self.assertNotEqual(f2.__code__.co_filename, f1.__code__.co_filename)
+    self.assertEqual(
+        sorted((loc.lineno, origin) for loc, origin in source_map.items()),
+        sorted((loc.lineno, origin)
+               for loc, origin in loaded_source_map.items()))
+    self.assertTrue(
+        all(loc.filename == module.__file__ for loc in loaded_source_map))
+
+  def test_persistent_cache_ignores_invalid_entries(self):
+
+    class PersistentTranspiler(TestTranspiler):
+
+      def get_persistent_caching_key(self, fn, ctx):
+        del ctx
+        return fn.__code__.co_name
+
+    def f(a):
+      return a + 1
+
+    cache_dir = os.path.join(self.get_temp_dir(), 'test_invalid_entries')
+    persistent_cache = cache.PersistentSourceCache(cache_dir)
+    tr = PersistentTranspiler()
+    tr.set_persistent_cache(persistent_cache)
+    tr.transform(f, None)
+    (entry,) = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, entry), 'w') as entry_file:
+      entry_file.write('{"source": "def outer_factory(:"}')
+
+    tr = PersistentTranspiler()
+    tr.set_persistent_cache(persistent_cache)
+    f, _, _ = tr.transform(f, None)
+    self.assertEqual(f(1), 0)
+
+  def test_persistent_cache_ignores_entries_for_other_sources(self):
+
+    class PersistentTranspiler(TestTranspiler):
+
+      def __init__(self):
+        super(PersistentTranspiler, self).__init__()
+        self.transform_count = 0
+
+      def get_persistent_caching_key(self, fn, ctx):
+        del ctx
+        return fn.__code__.co_name
+
+      def transform_ast(self, node, ctx):
+        self.transform_count += 1
+        return super(PersistentTranspiler, self).transform_ast(node, ctx)
+
+    def f(a):
+      return a + 1
+
+    cache_dir = os.path.join(self.get_temp_dir(), 'test_other_sources')
+    persistent_cache = cache.PersistentSourceCache(cache_dir)
+    tr = PersistentTranspiler()
+    tr.set_persistent_cache(persistent_cache)
+    tr.transform(f, None)
+    (entry_name,) = os.listdir(cache_dir)
+    entry_path = os.path.join(cache_dir, entry_name)
+    with open(entry_path) as entry_file:
+      stored = json.load(entry_file)
+    # Stands in for an entry written for another version of the source of f.
+    stored['entry']['fn_source_digest'] = 'other'
+    with open(entry_path, 'w') as entry_file:
+      json.dump(stored, entry_file)
+
+    tr = PersistentTranspiler()
+    tr.set_persistent_cache(persistent_cache)
+    f, _, _ = tr.transform(f, None)
+    self.assertEqual(f(1), 0)
+    self.assertEqual(tr.transform_count, 1)
+
 
 if __name__ == '__main__':
   test.main()
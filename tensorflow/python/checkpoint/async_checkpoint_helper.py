@@ -0,0 +1,119 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tracks the asynchronous checkpoint save running in the background.
+
+At most one asynchronous save runs at a time. Starting a new save, restoring a
+checkpoint and `tf.train.Checkpoint.sync()` all wait for the running save
+first. If it failed, its error is raised by whichever of them waits for it.
+"""
+
+import threading
+
+from tensorflow.python.platform import tf_logging as logging
+
+# Guards _current_save and the callbacks of the save.
+_lock = threading.Lock()
+_current_save = None
+
+
+class _AsyncSave(threading.Thread):
+  """Runs a save function and then the callbacks waiting for it."""
+
+  def __init__(self, save_fn):
+    super(_AsyncSave, self).__init__(name="AsyncCheckpointSave")
+    self._save_fn = save_fn
+    self.callbacks = []
+    self.done = False
+    self.error = None
+
+  def run(self):
+    try:
+      self._save_fn()
+      while True:
+        with _lock:
+          if not self.callbacks:
+            # Set under the same lock as the check, so that no callback can
+            # be added after the last one ran.
+            self.done = True
+            return
+          callback = self.callbacks.pop(0)
+        callback()
+    except Exception as e:  # pylint: disable=broad-except
+      logging.error("Asynchronous checkpoint save failed: %s", e)
+      with _lock:
+        self.error = e
+        self.done = True
+
+
+def start(save_fn):
+  """Waits for the running save, then runs `save_fn` in the background.
+
+  Args:
+    save_fn: A callable performing the save. It must not depend on state that
+      the caller may modify after `start` returns.
+
+  Raises:
+    Exception: The error of the previous save, if it failed. `save_fn` is not
+      run in that case.
+  """
+  global _current_save
+  wait()
+  save = _AsyncSave(save_fn)
+  with _lock:
+    _current_save = save
+  save.start()
+
+
+def wait():
+  """Waits for the running save to finish, if any.
+
+  Raises:
+    Exception: The error of the save, if it failed. Each error is raised once.
+  """
+  global _current_save
+  with _lock:
+    save = _current_save
+  if save is None:
+    return
+  save.join()
+  with _lock:
+    if _current_save is not save:
+      # Another thread already waited for this save, and reported its error.
+      return
+    _current_save = None
+  if save.error is not None:
+    raise save.error
+
+
+def add_done_callback(callback):
+  """Runs `callback` once the running save has finished successfully.
+
+  The callback runs on the background thread, before the save counts as
+  finished, so `wait()` also waits for it. If no save is running, the callback
+  runs right away on the calling thread. If the last save failed, it is
+  dropped.
+
+  Args:
+    callback: A callable taking no arguments.
+  """
+  with _lock:
+    save = _current_save
+    if save is not None:
+      if not save.done:
+        save.callbacks.append(callback)
+        return
+      if save.error is not None:
+        return
+  callback()
@@ -0,0 +1,108 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+"""Tests for the tracking of asynchronous checkpoint saves."""
+
+import threading
+
+from tensorflow.python.checkpoint import async_checkpoint_helper
+from tensorflow.python.platform import test
+
+
+class AsyncCheckpointHelperTest(test.TestCase):
+
+  def tearDown(self):
+    try:
+      async_checkpoint_helper.wait()
+    except ValueError:
+      pass
+    super(AsyncCheckpointHelperTest, self).tearDown()
+
+  def test_start_waits_for_previous_save(self):
+    events = []
+    unblock = threading.Event()
+
+    def first_save():
+      unblock.wait()
+      events.append("first")
+
+    async_checkpoint_helper.start(first_save)
+    self.assertEqual([], events)
+    unblock.set()
+    async_checkpoint_helper.start(lambda: events.append("second"))
+    self.assertEqual("first", events[0])
+    async_checkpoint_helper.wait()
+    self.assertEqual(["first", "second"], events)
+
+  def test_callbacks_run_after_save(self):
+    events = []
+    unblock = threading.Event()
+
+    def save():
+      unblock.wait()
+      events.append("save")
+
+    async_checkpoint_helper.start(save)
+    async_checkpoint_helper.add_done_callback(lambda: events.append("a"))
+    async_checkpoint_helper.add_done_callback(lambda: events.append("b"))
+    self.assertEqual([], events)
+    unblock.set()
+    async_checkpoint_helper.wait()
+    self.assertEqual(["save", "a", "b"], events)
+
+  def test_callback_runs_immediately_without_save(self):
+    events = []
+    async_checkpoint_helper.add_done_callback(lambda: events.append("a"))
+    self.assertEqual(["a"], events)
+
+  def test_error_is_raised_once(self):
+
+    def save():
+      raise ValueError("Disk full")
+
+    async_checkpoint_helper.start(save)
+    with self.assertRaisesRegex(ValueError, "Disk full"):
+      async_checkpoint_helper.wait()
+    async_checkpoint_helper.wait()
+
+  def test_error_is_raised_by_next_start(self):
+    events = []
+
+    def save():
+      raise ValueError("Disk full")
+
+    async_checkpoint_helper.start(save)
+    with self.assertRaisesRegex(ValueError, "Disk full"):
+      async_checkpoint_helper.start(lambda: events.append("second"))
+    async_checkpoint_helper.wait()
+    self.assertEqual([], events)
+
+  def test_callbacks_are_dropped_after_error(self):
+    events = []
+    unblock = threading.Event()
+
+    def save():
+      unblock.wait()
+      raise ValueError("Disk full")
+
+    async_checkpoint_helper.start(save)
+    async_checkpoint_helper.add_done_callback(lambda: events.append("a"))
+    unblock.set()
+    with self.assertRaisesRegex(ValueError, "Disk full"):
+      async_checkpoint_helper.wait()
+    self.assertEqual([], events)
+
+
+if __name__ == "__main__":
+  test.main()
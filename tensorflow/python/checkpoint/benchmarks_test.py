@@ -62,6 +62,16 @@ class _LazyTrivialObjects(module.Module):
     return
 
 
+class _ManyTrivialObjects(base.Trackable):
+
+  def __init__(self, num_children, num_grandchildren):
+    for i in range(num_children):
+      child = base.Trackable()
+      for j in range(num_grandchildren):
+        child._track_trackable(_TrivialRestore(), name=str(j))  # pylint: disable=protected-access
+      self._track_trackable(child, name=str(i))
+
+
 def _save_checkpoint():
   original_checkpoint = util.Checkpoint(m=_LazyTrivialObjects())
   original_checkpoint.m()
@@ -121,6 +131,15 @@ class SavingBenchmarks(test.Benchmark):
 
     self._run(_call_restore_v2, 3)
 
+  def benchmark_serialize_large_object_graph(self):
+    # 100k objects in total, with unchanged dependencies between saves.
+    checkpoint = util.Checkpoint(m=_ManyTrivialObjects(1000, 100))
+
+    def _gather_saveables():
+      checkpoint._saver._gather_saveables()  # pylint: disable=protected-access
+
+    self._run(_gather_saveables, 3)
+
 
 if __name__ == "__main__":
   ops.enable_eager_execution()
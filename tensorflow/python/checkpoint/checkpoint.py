@@ -26,8 +26,10 @@ import weakref
 import six
 
 from tensorflow.core.protobuf import trackable_object_graph_pb2
+from tensorflow.python.checkpoint import async_checkpoint_helper
 from tensorflow.python.checkpoint import checkpoint_management
 from tensorflow.python.checkpoint import checkpoint_options
+from tensorflow.python.checkpoint import delta_checkpoint
 from tensorflow.python.checkpoint import functional_saver
 from tensorflow.python.checkpoint import graph_view as graph_view_lib
 from tensorflow.python.checkpoint import util
@@ -45,6 +47,7 @@ from tensorflow.python.lib.io import file_io
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import gen_io_ops as io_ops
 from tensorflow.python.ops import init_ops
+from tensorflow.python.ops import resource_variable_ops
 from tensorflow.python.ops import variable_scope
 from tensorflow.python.ops import variables
 from tensorflow.python.platform import gfile
@@ -77,9 +80,6 @@ _END_TIME_OF_LAST_WRITE_LOCK = threading.Lock()
 _CHECKPOINT_V1 = "checkpoint_v1"
 _CHECKPOINT_V2 = "checkpoint_v2"
 
-# Async thread used for asynchronous checkpoint.
-_ASYNC_CHECKPOINT_THREAD = None
-
 
 def _get_duration_microseconds(start_time_seconds, end_time_seconds):
   if end_time_seconds < start_time_seconds:
@@ -231,7 +231,8 @@ class _CheckpointRestoreCoordinator(object):
         `tf.train.latest_checkpoint`.
       save_path_tensor: A string `Tensor` which contains or will be fed the save
         path.
-      reader: A `CheckpointReader` for `save_path`. If None,
+      reader: A `CheckpointReader` for `save_path`, or a
+        `delta_checkpoint.ChainReader` if it is a delta checkpoint. If None,
         `_CheckpointRestoreCoordinator` will initialize one itself.
       restore_op_cache: A dictionary shared between
         `_CheckpointRestoreCoordinator`s for the same Python objects, used to
@@ -265,6 +266,8 @@ class _CheckpointRestoreCoordinator(object):
     self.all_python_objects = object_identity.ObjectIdentityWeakSet()
     self.save_path_tensor = save_path_tensor
     self.save_path_string = save_path
+    # Prefixes of the checkpoints that a delta checkpoint builds on.
+    self._base_path_tensors = {}
     self.reader = reader
     if self.reader is None:
       self.reader = py_checkpoint_reader.NewCheckpointReader(save_path)
@@ -318,6 +321,28 @@ class _CheckpointRestoreCoordinator(object):
     self.expect_partial_attr = expect_partial
     self._deleter.set_expect_partial(expect_partial)
 
+  def save_path_tensor_for_key(self, checkpoint_key):
+    """Returns the prefix of the checkpoint to read a value from.
+
+    Differs from `save_path_tensor` for values that a delta checkpoint does
+    not hold.
+
+    Args:
+      checkpoint_key: The checkpoint key of the value.
+
+    Returns:
+      A string `Tensor`.
+    """
+    if not isinstance(self.reader, delta_checkpoint.ChainReader):
+      return self.save_path_tensor
+    prefix = self.reader.prefix_of(checkpoint_key)
+    if prefix == self.save_path_string:
+      return self.save_path_tensor
+    if prefix not in self._base_path_tensors:
+      with ops.device("/cpu:0"):
+        self._base_path_tensors[prefix] = constant_op.constant(prefix)
+    return self._base_path_tensors[prefix]
+
   def new_restore_ops(self, new_ops):
     self.restore_ops.extend(new_ops)
     if self.new_restore_ops_callback:
@@ -355,9 +380,16 @@ class _CheckpointRestoreCoordinator(object):
         raise AssertionError(
             "Saveable keys changed when validating. Got back "
             f"{tensor_saveables.keys()}, was expecting {validated_names}")
-      new_restore_ops = functional_saver.MultiDeviceSaver(
-          validated_saveables,
-          registered_savers).restore(self.save_path_tensor, self.options)
+      if self.options.experimental_lazy_restore and context.executing_eagerly():
+        validated_saveables = self._defer_variable_restores(
+            validated_saveables)
+      if isinstance(self.reader, delta_checkpoint.ChainReader):
+        new_restore_ops = self._restore_from_chain(validated_saveables,
+                                                   registered_savers)
+      else:
+        new_restore_ops = functional_saver.MultiDeviceSaver(
+            validated_saveables,
+            registered_savers).restore(self.save_path_tensor, self.options)
       if not context.executing_eagerly():
         for name, restore_op in sorted(new_restore_ops.items()):
           restore_ops.append(restore_op)
@@ -365,6 +397,62 @@ class _CheckpointRestoreCoordinator(object):
           self.restore_ops_by_name[name] = restore_op
     return restore_ops
 
+  def _defer_variable_restores(self, saveables):
+    """Defers the restores of variables until their first use.
+
+    Args:
+      saveables: A list of validated `SaveableObject`s.
+
+    Returns:
+      The `SaveableObject`s that must be restored right away.
+    """
+    remaining = []
+    for saveable in saveables:
+      if (isinstance(saveable, saveable_object_util.ResourceVariableSaveable)
+          and isinstance(saveable.op, resource_variable_ops.ResourceVariable)
+          and len(saveable.specs) == 1 and not saveable.specs[0].slice_spec):
+        saveable.op._set_lazy_restore_fn(  # pylint: disable=protected-access
+            functools.partial(_restore_lazily, saveable, self.reader))
+      else:
+        remaining.append(saveable)
+    return remaining
+
+  def _restore_from_chain(self, saveables, registered_savers):
+    """Restores each value from the checkpoint of a delta chain holding it."""
+    saveables_by_prefix = collections.defaultdict(list)
+    for saveable in saveables:
+      saveables_by_prefix[self.reader.prefix_of(saveable.name)].append(
+          saveable)
+    restore_ops = {}
+    # Registered savers always write to the delta checkpoint itself.
+    restore_ops.update(
+        functional_saver.MultiDeviceSaver(
+            saveables_by_prefix.pop(self.save_path_string, []),
+            registered_savers).restore(self.save_path_tensor, self.options))
+    for prefix, prefix_saveables in saveables_by_prefix.items():
+      restore_ops.update(
+          functional_saver.MultiDeviceSaver(prefix_saveables).restore(
+              self.save_path_tensor_for_key(prefix_saveables[0].name),
+              self.options))
+    return restore_ops
+
+
+def _restore_lazily(saveable, reader):
+  """Reads the value of a variable and assigns it, see `_set_lazy_restore_fn`.
+
+  Reuses the reader of the restore, which reads only the bytes of this value.
+
+  Args:
+    saveable: The `ResourceVariableSaveable` of the variable.
+    reader: The `CheckpointReader` or `delta_checkpoint.ChainReader` of the
+      restore.
+  """
+  spec, = saveable.specs
+  value = reader.get_tensor(spec.name)
+  with ops.device("/cpu:0"):
+    tensor = constant_op.constant(value, dtype=spec.dtype)
+  saveable.restore([tensor], None)
+
 
 class _NameBasedRestoreCoordinator(object):
   """Keeps the status of a name-based checkpoint restore."""
@@ -1155,6 +1243,9 @@ class TrackableSaver(object):
         object graph to save.
     """
     self._graph_view = graph_view
+    # Traversal of the object graph, reused by saves while the dependencies
+    # don't change.
+    self._object_graph_cache = util.ObjectGraphCache()
 
     # The following attributes are used when graph building.
 
@@ -1180,11 +1271,16 @@ class TrackableSaver(object):
     # Op caching for restore, shared between _CheckpointRestoreCoordinators
     self._restore_op_cache = {}
 
+    # The `DeltaState` of the checkpoint that the next delta checkpoint builds
+    # on, see `_drop_unchanged_saveables`.
+    self._delta_state = None
+
   def _gather_saveables(self, object_graph_tensor=None):
     """Wraps _serialize_object_graph to include the object graph proto."""
     named_saveable_objects, graph_proto, feed_additions, registered_savers = (
         util.serialize_object_graph_with_registered_savers(
-            self._graph_view, self._saveables_cache))
+            self._graph_view, self._saveables_cache,
+            self._object_graph_cache))
     if object_graph_tensor is None:
       with ops.device("/cpu:0"):
         object_graph_tensor = constant_op.constant(
@@ -1199,6 +1295,62 @@ class TrackableSaver(object):
     return (named_saveable_objects, graph_proto, feed_additions,
             registered_savers)
 
+  def _drop_unchanged_saveables(self, file_prefix, named_saveable_objects,
+                                base_state, options):
+    """Leaves out the values that did not change since the last checkpoint.
+
+    Args:
+      file_prefix: The prefix of the checkpoint being written.
+      named_saveable_objects: The `SaveableObject`s to save.
+      base_state: The `DeltaState` of the last checkpoint written, or None.
+      options: `CheckpointOptions` object.
+
+    Returns:
+      A tuple of the `SaveableObject`s to write, and the `DeltaState` to set
+      once they are written.
+
+    Raises:
+      NotImplementedError: If not executing eagerly.
+    """
+    if not context.executing_eagerly() or ops.inside_function():
+      raise NotImplementedError(
+          "Delta checkpoints are only supported when executing eagerly.")
+    file_prefix = _convert_file_name_tensor_to_string(file_prefix)
+    if base_state is not None:
+      # Wait for the base checkpoint to be written, in case it was saved
+      # asynchronously, and only build on the chain if all of it exists.
+      async_checkpoint_helper.wait()
+      if (len(base_state.chain) > options.experimental_max_delta_chain_length
+          or file_prefix in base_state.chain or not all(
+              checkpoint_management.checkpoint_exists_internal(prefix)
+              for prefix in base_state.chain)):
+        base_state = None
+
+    fingerprints = {}
+    to_write = []
+    for saveable in named_saveable_objects:
+      if saveable.name == base.OBJECT_GRAPH_PROTO_KEY:
+        to_write.append(saveable)
+        continue
+      fingerprint = delta_checkpoint.fingerprint(saveable)
+      if fingerprint is not None:
+        fingerprints[saveable.name] = fingerprint
+      if (base_state is None or fingerprint is None or
+          base_state.fingerprints.get(saveable.name) != fingerprint):
+        to_write.append(saveable)
+
+    if base_state is None:
+      chain = (file_prefix,)
+    else:
+      chain = base_state.chain + (file_prefix,)
+      with ops.device("/cpu:0"):
+        base_reference = constant_op.constant(
+            delta_checkpoint.base_reference(file_prefix, base_state.prefix))
+      to_write.append(
+          base.NoRestoreSaveable(
+              tensor=base_reference, name=delta_checkpoint.DELTA_BASE_KEY))
+    return to_write, delta_checkpoint.DeltaState(chain, fingerprints)
+
   def _save_cached_when_graph_building(self,
                                        file_prefix,
                                        object_graph_tensor,
@@ -1271,27 +1423,42 @@ class TrackableSaver(object):
           _update_checkpoint_state_internal(
               _convert_file_name_tensor_to_string(file_prefix))
 
+    write_delta = options.experimental_max_delta_chain_length > 0
+    # If this save fails, the next one must not build on the previous
+    # checkpoint, which may have been overwritten.
+    base_state, self._delta_state = self._delta_state, None
+
     if options.experimental_enable_async_checkpoint:
       # Execute async-checkpoint.
 
       # Step-1: Explicitly copy the tensors to their host CPU device.
       _copy_tensors()
+      if write_delta:
+        named_saveable_objects, delta_state = self._drop_unchanged_saveables(
+            file_prefix, named_saveable_objects, base_state, options)
 
       # Step-2: Execute the rest of the checkpoint operations on the host device
-      #         using an async executor.
-      global _ASYNC_CHECKPOINT_THREAD
-      if _ASYNC_CHECKPOINT_THREAD is not None:
-        _ASYNC_CHECKPOINT_THREAD.join()
-      _ASYNC_CHECKPOINT_THREAD = threading.Thread(target=_async_save_fn)
-      _ASYNC_CHECKPOINT_THREAD.start()
+      #         using an async executor, once the previous save has finished.
+      async_checkpoint_helper.start(_async_save_fn)
+      if write_delta:
+        # If the save fails, the next one sees that this checkpoint does not
+        # exist and writes a full checkpoint.
+        self._delta_state = delta_state
 
       # Step-3: Return the expected checkpoint file path though the save op may
       #         not have finished.
       self._cached_save_operation = file_prefix
       return self._cached_save_operation, feed_additions
 
+    if write_delta:
+      named_saveable_objects, delta_state = self._drop_unchanged_saveables(
+          file_prefix, named_saveable_objects, base_state, options)
+
     # Execute the normal checkpoint, i.e., synchronous.
-    return _run_save()
+    result = _run_save()
+    if write_delta:
+      self._delta_state = delta_state
+    return result
 
   def save(self, file_prefix, checkpoint_number=None, session=None,
            options=None, update_ckpt_state=False):
@@ -1439,12 +1606,15 @@ class TrackableSaver(object):
     #                   are still ongiing. Need to add timeout mechanism along
     #                   with conditional variables to notify when the checkpoint
     #                   file is ready.
-    global _ASYNC_CHECKPOINT_THREAD
-    if _ASYNC_CHECKPOINT_THREAD is not None:
-      _ASYNC_CHECKPOINT_THREAD.join()
+    async_checkpoint_helper.wait()
 
     reader = py_checkpoint_reader.NewCheckpointReader(save_path)
     graph_building = not context.executing_eagerly()
+    if reader.has_tensor(delta_checkpoint.DELTA_BASE_KEY):
+      if graph_building:
+        raise NotImplementedError(
+            "Delta checkpoints can only be restored when executing eagerly.")
+      reader = delta_checkpoint.ChainReader(save_path, reader)
     if graph_building:
       dtype_map = None
     else:
@@ -2222,6 +2392,9 @@ class Checkpoint(autotrackable.AutoTrackable):
     checkpoint.read("/tmp/ckpt", options=options)
     ```
 
+    With `experimental_enable_async_checkpoint=True` in `options`, `write`
+    returns before the checkpoint files are complete. See `sync`.
+
     Args:
       file_prefix: A prefix to use for the checkpoint filenames
         (/path/to/directory/and_a_prefix).
@@ -2393,6 +2566,32 @@ class Checkpoint(autotrackable.AutoTrackable):
 
     return file_path
 
+  def sync(self):
+    """Waits for the asynchronous checkpoint save in progress to finish.
+
+    With `tf.train.CheckpointOptions(experimental_enable_async_checkpoint=True)`
+    `write` and `save` return once the values to save are copied to host
+    memory, and the files are written in the background. The next save and
+    `restore` wait for the files to be complete. Call `sync` to wait without
+    starting another save, e.g. before the files are copied or at the end of a
+    program.
+
+    ```
+    options = tf.train.CheckpointOptions(
+        experimental_enable_async_checkpoint=True)
+    path = checkpoint.save("/tmp/ckpt", options=options)
+    # Keep training while the checkpoint is written.
+    checkpoint.sync()
+    # The files at `path` are complete.
+    ```
+
+    Does nothing if there is no save in progress.
+
+    Raises:
+      Exception: Any error that made the asynchronous save fail.
+    """
+    async_checkpoint_helper.wait()
+
   def read(self, save_path, options=None):
     """Reads a training checkpoint written with `write`.
 
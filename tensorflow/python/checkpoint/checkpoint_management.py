@@ -18,11 +18,14 @@
 import collections
 import os.path
 import re
+import threading
 import time
 
 from google.protobuf import text_format
 
 from tensorflow.core.protobuf import saver_pb2
+from tensorflow.python.checkpoint import async_checkpoint_helper
+from tensorflow.python.checkpoint import delta_checkpoint
 from tensorflow.python.eager import context
 from tensorflow.python.framework import errors
 from tensorflow.python.framework import ops
@@ -177,7 +180,8 @@ def update_checkpoint_state_internal(save_dir,
                                      latest_filename=None,
                                      save_relative_paths=False,
                                      all_model_checkpoint_timestamps=None,
-                                     last_preserved_timestamp=None):
+                                     last_preserved_timestamp=None,
+                                     pending_deletion_paths=None):
   """Updates the content of the 'checkpoint' file.
 
   This updates the checkpoint file containing a CheckpointState
@@ -201,6 +205,9 @@ def update_checkpoint_state_internal(save_dir,
       the Epoch when the last preserved checkpoint was written, e.g. due to a
       `keep_checkpoint_every_n_hours` parameter (see
       `tf.train.CheckpointManager` for an implementation).
+    pending_deletion_paths: Optional list of strings. Paths to checkpoints
+      whose files are being deleted in the background (see
+      `tf.train.CheckpointManager` for an implementation).
 
   Raises:
     RuntimeError: If any of the model checkpoint paths conflict with the file
@@ -233,6 +240,12 @@ def update_checkpoint_state_internal(save_dir,
         all_model_checkpoint_paths=all_model_checkpoint_paths,
         all_model_checkpoint_timestamps=all_model_checkpoint_timestamps,
         last_preserved_timestamp=last_preserved_timestamp)
+  for p in pending_deletion_paths or []:
+    # Written like all_model_checkpoint_paths.
+    if ((save_relative_paths and os.path.isabs(p)) or
+        (not os.path.isabs(save_dir) and not os.path.isabs(p))):
+      p = os.path.relpath(p, save_dir)
+    ckpt.pending_deletion_paths.append(p)
 
   if coord_checkpoint_filename == ckpt.model_checkpoint_path:
     raise RuntimeError("Save path '%s' conflicts with path used for "
@@ -289,6 +302,9 @@ def get_checkpoint_state(checkpoint_dir, latest_filename=None):
       for i, p in enumerate(ckpt.all_model_checkpoint_paths):
         if not os.path.isabs(p):
           ckpt.all_model_checkpoint_paths[i] = os.path.join(checkpoint_dir, p)
+      for i, p in enumerate(ckpt.pending_deletion_paths):
+        if not os.path.isabs(p):
+          ckpt.pending_deletion_paths[i] = os.path.join(checkpoint_dir, p)
   except errors.OpError as e:
     # It's ok if the file cannot be read
     logging.warning("%s: %s", type(e).__name__, e)
@@ -349,13 +365,7 @@ def latest_checkpoint(checkpoint_dir, latest_filename=None):
   # Pick the latest checkpoint based on checkpoint state.
   ckpt = get_checkpoint_state(checkpoint_dir, latest_filename)
   if ckpt and ckpt.model_checkpoint_path:
-    # Look for either a V2 path or a V1 path, with priority for V2.
-    v2_path = _prefix_to_checkpoint_path(ckpt.model_checkpoint_path,
-                                         saver_pb2.SaverDef.V2)
-    v1_path = _prefix_to_checkpoint_path(ckpt.model_checkpoint_path,
-                                         saver_pb2.SaverDef.V1)
-    if file_io.get_matching_files(v2_path) or file_io.get_matching_files(
-        v1_path):
+    if _checkpoint_files_exist(ckpt.model_checkpoint_path):
       return ckpt.model_checkpoint_path
     else:
       logging.error("Couldn't match files for checkpoint %s",
@@ -363,6 +373,155 @@ def latest_checkpoint(checkpoint_dir, latest_filename=None):
   return None
 
 
+def _checkpoint_files_exist(checkpoint_prefix):
+  """Returns whether the files of a checkpoint in the state file exist."""
+  # Look for either a V2 path or a V1 path, with priority for V2.
+  v2_path = _prefix_to_checkpoint_path(checkpoint_prefix,
+                                       saver_pb2.SaverDef.V2)
+  v1_path = _prefix_to_checkpoint_path(checkpoint_prefix,
+                                       saver_pb2.SaverDef.V1)
+  return bool(file_io.get_matching_files(v2_path) or
+              file_io.get_matching_files(v1_path))
+
+
+# On filesystems with coarse modification times, a state file may be modified
+# again without changing its modification time or size. A watcher reads it
+# again until it was read this many seconds after its modification time.
+_STATE_FILE_MTIME_RESOLUTION_SECONDS = 2.
+
+# The number of times a watcher returns its cached state before reading the
+# state file again anyway, e.g. if the clock of the filesystem is behind.
+_MAX_CACHED_STATE_USES = 30
+
+
+class CheckpointStateWatcher(object):
+  """Finds the latest checkpoint in a directory, caching its state.
+
+  `latest_checkpoint(checkpoint_dir)` reads the "checkpoint" file and globs for
+  the files of the latest checkpoint on each call, which is slow when polling
+  many directories on a network filesystem. A watcher only stats the file, and
+  reads it and globs again when its modification time or size changed. Until
+  the files of the latest checkpoint are found, it globs for them on each call.
+
+  Since modification times may be coarse, the file is also read again while
+  its modification time is within a few seconds of the last read, and after
+  every few dozen calls.
+  """
+
+  def __init__(self, checkpoint_dir, latest_filename=None):
+    """Creates a watcher, which reads the state file on first use.
+
+    Args:
+      checkpoint_dir: Directory where the variables were saved.
+      latest_filename: Optional name for the protocol buffer file that
+        contains the list of most recent checkpoint filenames.
+        See the corresponding argument to `v1.train.Saver.save`.
+    """
+    if isinstance(checkpoint_dir, os.PathLike):
+      checkpoint_dir = os.fspath(checkpoint_dir)
+    self._checkpoint_dir = checkpoint_dir
+    self._latest_filename = latest_filename
+    self._filename = _GetCheckpointFilename(checkpoint_dir, latest_filename)
+    self._read = False
+    # The (modification time, size) of the state file when it was read, or
+    # None if it did not exist.
+    self._file_stat = None
+    self._read_time = None
+    self._cached_uses = 0
+    self._state = None
+    self._found = False
+
+  @property
+  def checkpoint_dir(self):
+    return self._checkpoint_dir
+
+  def _stat_file(self):
+    try:
+      stat = file_io.stat(self._filename)
+    except errors.NotFoundError:
+      return None
+    return stat.mtime_nsec, stat.length
+
+  def checkpoint_state(self):
+    """Returns the CheckpointState proto, reading it again only if it changed.
+
+    Returns:
+      The CheckpointState, as returned by `get_checkpoint_state`, or None if it
+      is not available. Must not be modified.
+    """
+    file_stat = self._stat_file()
+    if (self._read and file_stat == self._file_stat and
+        not self._may_have_changed_unseen() and
+        self._cached_uses < _MAX_CACHED_STATE_USES):
+      self._cached_uses += 1
+      return self._state
+    # Stats before reading, so that a modification while reading is seen by
+    # the next call.
+    self._read = True
+    self._file_stat = file_stat
+    self._read_time = time.time()
+    self._cached_uses = 0
+    previous_path = self._state.model_checkpoint_path if self._state else None
+    if file_stat is None:
+      self._state = None
+    else:
+      self._state = get_checkpoint_state(self._checkpoint_dir,
+                                         self._latest_filename)
+    if not self._state or self._state.model_checkpoint_path != previous_path:
+      self._found = False
+    return self._state
+
+  def _may_have_changed_unseen(self):
+    """Whether the state file may have changed since it was read."""
+    if self._file_stat is None:
+      return False
+    mtime = self._file_stat[0] / 1e9
+    return self._read_time - mtime < _STATE_FILE_MTIME_RESOLUTION_SECONDS
+
+  def latest_checkpoint(self):
+    """Finds the latest checkpoint, like `latest_checkpoint`.
+
+    Returns:
+      The full path to the latest checkpoint or `None` if no checkpoint was
+      found.
+    """
+    state = self.checkpoint_state()
+    if not state or not state.model_checkpoint_path:
+      return None
+    if not self._found:
+      self._found = _checkpoint_files_exist(state.model_checkpoint_path)
+    return state.model_checkpoint_path if self._found else None
+
+  def wait_for_new_checkpoint(self,
+                              last_checkpoint=None,
+                              seconds_to_sleep=1,
+                              timeout=None):
+    """Waits until a new checkpoint is found.
+
+    Args:
+      last_checkpoint: The last checkpoint path used or `None` if we're
+        expecting a checkpoint for the first time.
+      seconds_to_sleep: The number of seconds to sleep for before looking for
+        a new checkpoint.
+      timeout: The maximum number of seconds to wait. If left as `None`, then
+        the process will wait indefinitely.
+
+    Returns:
+      a new checkpoint path, or None if the timeout was reached.
+    """
+    logging.info("Waiting for new checkpoint at %s", self._checkpoint_dir)
+    stop_time = time.time() + timeout if timeout is not None else None
+    while True:
+      checkpoint_path = self.latest_checkpoint()
+      if checkpoint_path is None or checkpoint_path == last_checkpoint:
+        if stop_time is not None and time.time() + seconds_to_sleep > stop_time:
+          return None
+        time.sleep(seconds_to_sleep)
+      else:
+        logging.info("Found new checkpoint at %s", checkpoint_path)
+        return checkpoint_path
+
+
 def checkpoint_exists_internal(checkpoint_prefix):
   """Checks whether a V1 or V2 checkpoint exists with the specified prefix.
 
@@ -494,6 +653,124 @@ def _delete_file_if_exists(filespec):
           "process/thread is also deleting/moving the same file", pathname)
 
 
+# Matches the index and data files of V2 checkpoints, capturing their prefix.
+_CHECKPOINT_FILE_RE = re.compile(r"^(.*)\.(?:index|data-\d{5}-of-\d{5})$")
+
+
+def _checkpoint_files(checkpoint_prefixes):
+  """Returns the paths of the files of V2 checkpoints.
+
+  Lists each directory once, rather than globbing for the files of each
+  checkpoint, which is slow on network filesystems.
+
+  Args:
+    checkpoint_prefixes: A list of V2 checkpoint prefixes.
+
+  Returns:
+    A list of the paths of the index and data files of the checkpoints.
+  """
+  names_by_directory = collections.defaultdict(set)
+  for prefix in checkpoint_prefixes:
+    directory, name = os.path.split(prefix)
+    names_by_directory[directory].add(name)
+  pathnames = []
+  for directory, names in names_by_directory.items():
+    try:
+      filenames = file_io.list_directory(directory or ".")
+    except errors.NotFoundError:
+      continue
+    for filename in sorted(filenames):
+      match = _CHECKPOINT_FILE_RE.match(filename)
+      if match and match.group(1) in names:
+        pathnames.append(os.path.join(directory, filename))
+  return pathnames
+
+
+def _delete_checkpoints(checkpoint_prefixes, max_deletions_per_second=None):
+  """Deletes the files of V2 checkpoints.
+
+  Args:
+    checkpoint_prefixes: A list of V2 checkpoint prefixes.
+    max_deletions_per_second: An optional float. If set, waits between the
+      deletions of files so that at most this many are deleted per second.
+  """
+  next_deletion_time = time.time()
+  for pathname in _checkpoint_files(checkpoint_prefixes):
+    if max_deletions_per_second:
+      delay = next_deletion_time - time.time()
+      if delay > 0:
+        time.sleep(delay)
+      next_deletion_time = (max(next_deletion_time, time.time()) +
+                            1. / max_deletions_per_second)
+    try:
+      file_io.delete_file(pathname)
+    except errors.NotFoundError:
+      logging.warning(
+          "Hit NotFoundError when deleting '%s', possibly because another "
+          "process/thread is also deleting/moving the same file", pathname)
+
+
+class _CheckpointDeleter(object):
+  """Deletes checkpoints on a background thread."""
+
+  def __init__(self, max_deletions_per_second, done_callback):
+    """Creates a deleter, whose thread is started on demand.
+
+    Args:
+      max_deletions_per_second: An optional float bounding the rate at which
+        files are deleted.
+      done_callback: Called from the background thread with each list of
+        checkpoint prefixes passed to `delete`, once they are deleted.
+    """
+    self._max_deletions_per_second = max_deletions_per_second
+    self._done_callback = done_callback
+    self._condition = threading.Condition()
+    self._pending = []
+    self._busy = False
+    self._thread = None
+
+  def delete(self, checkpoint_prefixes):
+    """Schedules the deletion of the files of V2 checkpoints."""
+    with self._condition:
+      self._pending.append(list(checkpoint_prefixes))
+      if self._thread is None:
+        self._thread = threading.Thread(
+            target=self._run, name="checkpoint_deleter", daemon=True)
+        self._thread.start()
+      self._condition.notify_all()
+
+  def wait(self):
+    """Waits until all scheduled deletions are complete."""
+    with self._condition:
+      while self._pending or self._busy:
+        self._condition.wait()
+
+  def _run(self):
+    while True:
+      with self._condition:
+        while not self._pending:
+          self._condition.wait()
+        # Deletes the checkpoints scheduled so far in one batch, listing
+        # each directory once.
+        batches = self._pending
+        self._pending = []
+        self._busy = True
+      checkpoint_prefixes = [prefix for batch in batches for prefix in batch]
+      try:
+        _delete_checkpoints(checkpoint_prefixes,
+                            self._max_deletions_per_second)
+        self._done_callback(checkpoint_prefixes)
+      except Exception as e:  # pylint: disable=broad-except
+        # The checkpoints remain pending deletion, so that a later
+        # CheckpointManager retries.
+        logging.warning("Failed to delete checkpoints %s: %s",
+                        checkpoint_prefixes, e)
+      finally:
+        with self._condition:
+          self._busy = False
+          self._condition.notify_all()
+
+
 def meta_graph_filename(checkpoint_filename, meta_graph_suffix="meta"):
   """Returns the meta graph filename.
 
@@ -543,7 +820,9 @@ class CheckpointManager(object):
                checkpoint_name="ckpt",
                step_counter=None,
                checkpoint_interval=None,
-               init_fn=None):
+               init_fn=None,
+               background_deletion=False,
+               max_deletions_per_second=None):
     """Configure a `CheckpointManager` for use in `directory`.
 
     If a `CheckpointManager` was previously used in `directory`, its
@@ -564,6 +843,13 @@ class CheckpointManager(object):
     `CheckpointManager` instantiated in `directory` (subject to its
     `max_to_keep` and `keep_checkpoint_every_n_hours` settings).
 
+    With `background_deletion=True`, the files of the checkpoints removed from
+    the active set are deleted by a background thread, so that `save` does not
+    wait for them, which can be slow on network filesystems. Until they are
+    deleted, they are listed as pending deletion in the state file, and a
+    future `CheckpointManager` instantiated in `directory` finishes deleting
+    them, e.g. after a preemption.
+
     `CheckpointManager` can be also used for initializing the model if
     there is no checkpoints for restoring in `directory`. An example usage is:
 
@@ -611,9 +897,17 @@ class CheckpointManager(object):
         between two checkpoints.
       init_fn: Callable. A function to do customized intialization if no
         checkpoints are in the directory.
+      background_deletion: A boolean. If `True`, old checkpoints are deleted by
+        a background thread. Use `wait_for_deletions` to wait for it. Defaults
+        to `False`, i.e. `save` deletes them before returning.
+      max_deletions_per_second: An optional number bounding the rate at which
+        files of old checkpoints are deleted, to limit the load on the
+        filesystem. Mostly useful with `background_deletion`. If `None`
+        (default), files are deleted as fast as possible.
 
     Raises:
-      ValueError: If `max_to_keep` is not a positive integer.
+      ValueError: If `max_to_keep` or `max_deletions_per_second` is not
+        positive.
     """
     self._checkpoint = checkpoint
     self._save_counter_assign = None
@@ -622,6 +916,10 @@ class CheckpointManager(object):
           ("Expected a positive integer or `None` for `max_to_keep`, "
            "got %d.")
           % (max_to_keep,))
+    if max_deletions_per_second is not None and max_deletions_per_second <= 0:
+      raise ValueError("Expected a positive number or `None` for "
+                       "`max_deletions_per_second`, got "
+                       f"{max_deletions_per_second}.")
     self._max_to_keep = max_to_keep
     self._keep_checkpoint_every_n_hours = keep_checkpoint_every_n_hours
     if isinstance(directory, os.PathLike):
@@ -640,7 +938,23 @@ class CheckpointManager(object):
 
     recovered_state = get_checkpoint_state(directory)
     current_clock = time.time()
+    # Guards _maybe_delete, which asynchronous saves update in the background.
+    self._lock = threading.Lock()
     self._maybe_delete = collections.OrderedDict()
+    # Maps checkpoint prefixes to the prefixes of their delta checkpoint base,
+    # or None for full checkpoints.
+    self._delta_bases = {}
+    self._max_deletions_per_second = max_deletions_per_second
+    # Checkpoints removed from the active set whose files may not be deleted
+    # yet, recorded in the state file until they are.
+    self._pending_deletion = []
+    # The state last recorded in `directory`, without `_pending_deletion`.
+    self._recorded_state = None
+    if background_deletion:
+      self._deleter = _CheckpointDeleter(max_deletions_per_second,
+                                         self._deletions_done)
+    else:
+      self._deleter = None
     if recovered_state is None:
       self._latest_checkpoint = None
       # Set the clock back slightly to avoid race conditions when quickly
@@ -660,6 +974,12 @@ class CheckpointManager(object):
         self._last_preserved_timestamp = current_clock
       all_timestamps = recovered_state.all_model_checkpoint_timestamps
       all_paths = recovered_state.all_model_checkpoint_paths
+      self._pending_deletion = list(recovered_state.pending_deletion_paths)
+      self._recorded_state = dict(
+          model_checkpoint_path=recovered_state.model_checkpoint_path,
+          all_model_checkpoint_paths=list(all_paths),
+          all_model_checkpoint_timestamps=list(all_timestamps),
+          last_preserved_timestamp=self._last_preserved_timestamp)
       del recovered_state  # Uses modified values from now on
       if not all_timestamps:
         all_timestamps = [self._last_preserved_timestamp] * len(all_paths)
@@ -668,6 +988,10 @@ class CheckpointManager(object):
         timestamp = min(timestamp, current_clock)
         if timestamp > self._last_preserved_timestamp:
           self._maybe_delete[filename] = timestamp
+      if self._deleter is not None and self._pending_deletion:
+        # Finishes the deletions interrupted by the previous manager. Without
+        # background deletion, the next save deletes them.
+        self._deleter.delete(self._pending_deletion)
 
   @property
   def directory(self):
@@ -701,37 +1025,101 @@ class CheckpointManager(object):
     Returns:
       A list of filenames, sorted from oldest to newest.
     """
-    return list(self._maybe_delete.keys())
+    with self._lock:
+      return list(self._maybe_delete.keys())
+
+  def _delta_base(self, filename):
+    """Returns the base of a delta checkpoint, or None for full checkpoints."""
+    if filename not in self._delta_bases:
+      self._delta_bases[filename] = delta_checkpoint.read_base(filename)
+    return self._delta_bases[filename]
+
+  def _delta_bases_of(self, filenames):
+    """Returns the checkpoints that the deltas in `filenames` build on."""
+    bases = set()
+    for filename in filenames:
+      base = self._delta_base(filename)
+      while base is not None and base not in bases:
+        bases.add(base)
+        base = self._delta_base(base)
+    return bases
 
   def _sweep(self):
-    """Deletes or preserves managed checkpoints."""
+    """Removes managed checkpoints from the active set or preserves them.
+
+    Returns:
+      A list of the prefixes of the removed checkpoints, whose files are to be
+      deleted.
+    """
+    removed = []
     if not self._max_to_keep:
       # Does not update self._last_preserved_timestamp, since everything is kept
       # in the active set.
-      return
+      return removed
+    # Checkpoints that the kept delta checkpoints build on stay in the active
+    # set, even beyond max_to_keep, until a full checkpoint replaces them.
+    needed = self._delta_bases_of(
+        list(self._maybe_delete.keys())[-self._max_to_keep:])
     while len(self._maybe_delete) > self._max_to_keep:
-      filename, timestamp = self._maybe_delete.popitem(last=False)
+      filename = next(iter(self._maybe_delete))
+      if filename in needed:
+        break
+      timestamp = self._maybe_delete.pop(filename)
       # Even if we're keeping this checkpoint due to
       # keep_checkpoint_every_n_hours, we won't reference it to avoid
-      # infinitely-growing CheckpointState protos.
+      # infinitely-growing CheckpointState protos. Delta checkpoints are not
+      # preserved, since the checkpoints they build on would be deleted.
       if (self._keep_checkpoint_every_n_hours
+          and self._delta_base(filename) is None
           and (timestamp - self._keep_checkpoint_every_n_hours * 3600.
                >= self._last_preserved_timestamp)):
         self._last_preserved_timestamp = timestamp
         continue
-      _delete_file_if_exists(filename + ".index")
-      _delete_file_if_exists(filename + ".data-?????-of-?????")
+      self._delta_bases.pop(filename, None)
+      removed.append(filename)
+    return removed
 
   def _record_state(self):
     """Saves the `CheckpointManager`'s state in `directory`."""
+    self._snapshot_state()
+    self._write_state()
+
+  def _snapshot_state(self):
+    """Remembers the state that `_write_state` records."""
     filenames, timestamps = zip(*self._maybe_delete.items())
-    update_checkpoint_state_internal(
-        self._directory,
+    self._recorded_state = dict(
         model_checkpoint_path=self.latest_checkpoint,
         all_model_checkpoint_paths=filenames,
         all_model_checkpoint_timestamps=timestamps,
-        last_preserved_timestamp=self._last_preserved_timestamp,
-        save_relative_paths=True)
+        last_preserved_timestamp=self._last_preserved_timestamp)
+
+  def _write_state(self):
+    update_checkpoint_state_internal(
+        self._directory,
+        pending_deletion_paths=self._pending_deletion,
+        save_relative_paths=True,
+        **self._recorded_state)
+
+  def _deletions_done(self, filenames):
+    """Called by the background deleter once `filenames` are deleted."""
+    with self._lock:
+      deleted = set(filenames)
+      self._pending_deletion = [
+          filename for filename in self._pending_deletion
+          if filename not in deleted]
+      # Rewrites the state last recorded, rather than the current one: an
+      # asynchronous save may have added a checkpoint that is not complete.
+      if self._recorded_state is not None:
+        self._write_state()
+
+  def wait_for_deletions(self):
+    """Waits until the files of old checkpoints are deleted.
+
+    Only needed with `background_deletion=True`. Otherwise, `save` deletes
+    them before returning.
+    """
+    if self._deleter is not None:
+      self._deleter.wait()
 
   @property
   def _prefix(self):
@@ -771,7 +1159,14 @@ class CheckpointManager(object):
         step.
       options: Optional `tf.train.CheckpointOptions` object. This argument only
         works with TF2 checkpoint objects. For example, options =
-        tf.saved_model.SaveOptions(experimental_io_device='/job:localhost')
+        tf.saved_model.SaveOptions(experimental_io_device='/job:localhost').
+        With `experimental_enable_async_checkpoint=True`, the checkpoint is
+        written in the background. Old checkpoints are deleted, and the new
+        one is recorded in the state file in `directory`, only once it is
+        complete. Use `tf.train.Checkpoint.sync` to wait for it.
+        With `experimental_max_delta_chain_length`, the checkpoints that the
+        kept delta checkpoints build on are not deleted, even if there are
+        more than `max_to_keep` checkpoints.
 
     Returns:
       The path to the new checkpoint. It is also recorded in the `checkpoints`
@@ -813,28 +1208,59 @@ class CheckpointManager(object):
       checkpoint_number = training_util.global_step(
           sess=session, global_step_tensor=checkpoint_number)
     prefix = "%s-%d" % (self._prefix, checkpoint_number)
+    with self._lock:
+      overwrites_pending_deletion = prefix in self._pending_deletion
+    if overwrites_pending_deletion:
+      # Must not delete the files of the new checkpoint.
+      self.wait_for_deletions()
     if options is None:
       save_path = self._checkpoint.write(prefix)
     else:
       save_path = self._checkpoint.write(prefix, options=options)
     timestamp = time.time()
-    # If this is an overwritten checkpoint we were previously tracking, delete
-    # and reinsert it to make sure it goes to the end of the queue.
-    if save_path in self._maybe_delete:
-      del self._maybe_delete[save_path]
-    self._maybe_delete[save_path] = timestamp
+    with self._lock:
+      # If this is an overwritten checkpoint we were previously tracking,
+      # delete and reinsert it to make sure it goes to the end of the queue.
+      if save_path in self._maybe_delete:
+        del self._maybe_delete[save_path]
+      self._maybe_delete[save_path] = timestamp
+      self._delta_bases.pop(save_path, None)
+      if save_path in self._pending_deletion:
+        self._pending_deletion.remove(save_path)
     self._latest_checkpoint = save_path
-    # Before deleting anything we update the Checkpoint proto with the new
-    # checkpoint. We'll go back and correct it after cleaning up old files, but
-    # a preemption while deleting will be more likely to see the new checkpoint
-    # this way.
-    self._record_state()
-    self._sweep()
-    # Write out the Checkpoint proto a second time, now without the deleted
-    # checkpoints.
-    self._record_state()
+    if options is not None and options.experimental_enable_async_checkpoint:
+      # The new checkpoint is still being written. A preemption must not find
+      # it in the Checkpoint proto, nor find the older checkpoints deleted,
+      # until it is complete. The next save waits for this to finish.
+      async_checkpoint_helper.add_done_callback(self._record_and_sweep)
+    else:
+      self._record_and_sweep()
     return save_path
 
+  def _record_and_sweep(self):
+    """Records the latest checkpoint and deletes unneeded ones."""
+    with self._lock:
+      # Before deleting anything we update the Checkpoint proto with the new
+      # checkpoint. We'll go back and correct it after cleaning up old files,
+      # but a preemption while deleting will be more likely to see the new
+      # checkpoint this way.
+      self._record_state()
+      removed = self._sweep()
+      if self._deleter is not None:
+        # Lists the removed checkpoints as pending deletion until the deleter
+        # is done with them, so that a preemption does not leak their files.
+        self._pending_deletion.extend(removed)
+        self._record_state()
+        if removed:
+          self._deleter.delete(removed)
+        return
+      _delete_checkpoints(self._pending_deletion + removed,
+                          self._max_deletions_per_second)
+      self._pending_deletion = []
+      # Write out the Checkpoint proto a second time, now without the deleted
+      # checkpoints.
+      self._record_state()
+
   def restore_or_initialize(self):
     """Restore items in `checkpoint` from the latest checkpoint file.
 
@@ -19,12 +19,15 @@ import os
 import pathlib
 import shutil
 import tempfile
+import threading
 
 from google.protobuf import text_format
 
 from tensorflow.core.protobuf import saver_pb2
 from tensorflow.python.checkpoint import checkpoint as util
 from tensorflow.python.checkpoint import checkpoint_management
+from tensorflow.python.checkpoint import checkpoint_options
+from tensorflow.python.checkpoint import functional_saver
 from tensorflow.python.eager import context
 from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import ops as ops_lib
@@ -348,6 +351,74 @@ class CheckpointManagerTest(test.TestCase):
     self.assertTrue(checkpoint_management.checkpoint_exists(second_path))
     self.assertFalse(checkpoint_management.checkpoint_exists(first_path))
 
+  @test_util.run_in_graph_and_eager_modes
+  def testBackgroundDeletion(self):
+    checkpoint = util.Checkpoint()
+    directory = os.path.join(self.get_temp_dir(),
+                             str(context.executing_eagerly()))
+    manager = checkpoint_management.CheckpointManager(
+        checkpoint, directory, max_to_keep=2, background_deletion=True,
+        max_deletions_per_second=100)
+    first_path = manager.save()
+    second_path = manager.save()
+    third_path = manager.save()
+    manager.wait_for_deletions()
+    self.assertFalse(checkpoint_management.checkpoint_exists(first_path))
+    self.assertTrue(checkpoint_management.checkpoint_exists(second_path))
+    self.assertTrue(checkpoint_management.checkpoint_exists(third_path))
+    self.assertEqual([second_path, third_path], manager.checkpoints)
+    state = checkpoint_management.get_checkpoint_state(directory)
+    self.assertEmpty(state.pending_deletion_paths)
+
+  @test_util.run_in_graph_and_eager_modes
+  def testPendingDeletionIsResumed(self):
+    checkpoint = util.Checkpoint()
+    directory = os.path.join(self.get_temp_dir(),
+                             str(context.executing_eagerly()))
+    manager = checkpoint_management.CheckpointManager(
+        checkpoint, directory, max_to_keep=None)
+    first_path = manager.save()
+    second_path = manager.save()
+    # As if a preemption interrupted the deletion of the first checkpoint.
+    checkpoint_management.update_checkpoint_state_internal(
+        directory,
+        model_checkpoint_path=second_path,
+        all_model_checkpoint_paths=[second_path],
+        pending_deletion_paths=[first_path],
+        save_relative_paths=True)
+    state = checkpoint_management.get_checkpoint_state(directory)
+    self.assertEqual([first_path], state.pending_deletion_paths)
+
+    manager = checkpoint_management.CheckpointManager(
+        checkpoint, directory, max_to_keep=1, background_deletion=True)
+    manager.wait_for_deletions()
+    self.assertFalse(checkpoint_management.checkpoint_exists(first_path))
+    self.assertTrue(checkpoint_management.checkpoint_exists(second_path))
+    state = checkpoint_management.get_checkpoint_state(directory)
+    self.assertEmpty(state.pending_deletion_paths)
+
+    # Without background deletion, the next save finishes the deletion.
+    checkpoint_management.update_checkpoint_state_internal(
+        directory,
+        model_checkpoint_path=second_path,
+        all_model_checkpoint_paths=[second_path],
+        pending_deletion_paths=[second_path],
+        save_relative_paths=True)
+    manager = checkpoint_management.CheckpointManager(
+        checkpoint, directory, max_to_keep=1)
+    self.assertTrue(checkpoint_management.checkpoint_exists(second_path))
+    third_path = manager.save()
+    self.assertFalse(checkpoint_management.checkpoint_exists(second_path))
+    self.assertTrue(checkpoint_management.checkpoint_exists(third_path))
+    state = checkpoint_management.get_checkpoint_state(directory)
+    self.assertEmpty(state.pending_deletion_paths)
+
+  def testMaxDeletionsPerSecondValidation(self):
+    with self.assertRaisesRegex(ValueError, "max_deletions_per_second"):
+      checkpoint_management.CheckpointManager(
+          util.Checkpoint(), self.get_temp_dir(), max_to_keep=1,
+          max_deletions_per_second=0)
+
   @test_util.run_in_graph_and_eager_modes
   def testKeepAll(self):
     checkpoint = util.Checkpoint()
@@ -391,6 +462,164 @@ class CheckpointManagerTest(test.TestCase):
     self.assertFalse(checkpoint_management.checkpoint_exists(second_path))
     self.assertFalse(checkpoint_management.checkpoint_exists(first_path))
 
+  def testDeltaCheckpointsKeepTheirBases(self):
+    v = variables.Variable(1.)
+    checkpoint = util.Checkpoint(v=v)
+    directory = self.get_temp_dir()
+    manager = checkpoint_management.CheckpointManager(
+        checkpoint, directory, max_to_keep=1)
+    options = checkpoint_options.CheckpointOptions(
+        experimental_max_delta_chain_length=2)
+    paths = []
+    for _ in range(3):
+      v.assign_add(1.)
+      paths.append(manager.save(options=options))
+    # The last checkpoint is a delta built on the other two.
+    self.assertEqual(paths, manager.checkpoints)
+    for path in paths:
+      self.assertTrue(checkpoint_management.checkpoint_exists(path))
+
+    # Compaction into a full checkpoint frees the chain.
+    v.assign_add(1.)
+    full_path = manager.save(options=options)
+    self.assertEqual([full_path], manager.checkpoints)
+    for path in paths:
+      self.assertFalse(checkpoint_management.checkpoint_exists(path))
+    v.assign(0.)
+    checkpoint.restore(manager.latest_checkpoint).assert_consumed()
+    self.assertEqual(5., self.evaluate(v))
+
+  def testSweepBeyondMaxToKeepWithDeltaCheckpoints(self):
+    v = variables.Variable(0.)
+    checkpoint = util.Checkpoint(v=v)
+    directory = self.get_temp_dir()
+    manager = checkpoint_management.CheckpointManager(
+        checkpoint, directory, max_to_keep=2)
+    options = checkpoint_options.CheckpointOptions(
+        experimental_max_delta_chain_length=1)
+    # Full and delta checkpoints alternate.
+    paths = []
+    for _ in range(3):
+      v.assign_add(1.)
+      paths.append(manager.save(options=options))
+    # The delta checkpoint kept keeps its base beyond max_to_keep.
+    self.assertEqual(paths, manager.checkpoints)
+    for path in paths:
+      self.assertTrue(checkpoint_management.checkpoint_exists(path))
+
+    v.assign_add(1.)
+    paths.append(manager.save(options=options))
+    self.assertEqual(paths[2:], manager.checkpoints)
+    for path in paths[:2]:
+      self.assertFalse(checkpoint_management.checkpoint_exists(path))
+    for path in paths[2:]:
+      self.assertTrue(checkpoint_management.checkpoint_exists(path))
+
+    v.assign_add(1.)
+    paths.append(manager.save(options=options))
+    # The delta among the last two still builds on the third checkpoint.
+    self.assertEqual(paths[2:], manager.checkpoints)
+    self.assertTrue(checkpoint_management.checkpoint_exists(paths[2]))
+    v.assign(0.)
+    checkpoint.restore(paths[3]).assert_consumed()
+    self.assertEqual(4., self.evaluate(v))
+
+  def testAsyncSaveSweepsOnceComplete(self):
+    checkpoint = util.Checkpoint(v=variables.Variable(1.))
+    directory = self.get_temp_dir()
+    manager = checkpoint_management.CheckpointManager(
+        checkpoint, directory, max_to_keep=1)
+    options = checkpoint_options.CheckpointOptions(
+        experimental_enable_async_checkpoint=True)
+    first_path = manager.save(options=options)
+    checkpoint.sync()
+    self.assertEqual(first_path,
+                     checkpoint_management.latest_checkpoint(directory))
+
+    unblock = threading.Event()
+    original_save = functional_saver.MultiDeviceSaver.save
+
+    def _blocked_save(saver, *args, **kwargs):
+      unblock.wait()
+      return original_save(saver, *args, **kwargs)
+
+    with test.mock.patch.object(functional_saver.MultiDeviceSaver, "save",
+                                _blocked_save):
+      second_path = manager.save(options=options)
+      self.assertEqual(second_path, manager.latest_checkpoint)
+      # Until the new checkpoint is complete, the previous one is neither
+      # deleted nor replaced in the state file.
+      self.assertTrue(checkpoint_management.checkpoint_exists(first_path))
+      self.assertEqual(first_path,
+                       checkpoint_management.latest_checkpoint(directory))
+      unblock.set()
+      checkpoint.sync()
+    self.assertFalse(checkpoint_management.checkpoint_exists(first_path))
+    self.assertTrue(checkpoint_management.checkpoint_exists(second_path))
+    self.assertEqual(second_path,
+                     checkpoint_management.latest_checkpoint(directory))
+
+  def testBackgroundDeletionDuringAsyncSave(self):
+    checkpoint = util.Checkpoint(v=variables.Variable(1.))
+    directory = self.get_temp_dir()
+    manager = checkpoint_management.CheckpointManager(
+        checkpoint, directory, max_to_keep=1, background_deletion=True)
+    options = checkpoint_options.CheckpointOptions(
+        experimental_enable_async_checkpoint=True)
+    unblock_deletion = threading.Event()
+    unblock_save = threading.Event()
+    original_delete = checkpoint_management._delete_checkpoints
+    original_save = functional_saver.MultiDeviceSaver.save
+
+    def _blocked_delete(*args, **kwargs):
+      unblock_deletion.wait()
+      return original_delete(*args, **kwargs)
+
+    def _blocked_save(saver, *args, **kwargs):
+      unblock_save.wait()
+      return original_save(saver, *args, **kwargs)
+
+    with test.mock.patch.object(checkpoint_management, "_delete_checkpoints",
+                                _blocked_delete):
+      first_path = manager.save(options=options)
+      second_path = manager.save(options=options)
+      checkpoint.sync()
+      # The first checkpoint is being deleted when the third one is saved.
+      with test.mock.patch.object(functional_saver.MultiDeviceSaver, "save",
+                                  _blocked_save):
+        third_path = manager.save(options=options)
+        unblock_deletion.set()
+        manager.wait_for_deletions()
+        # The deletion must not record the incomplete third checkpoint.
+        self.assertEqual(second_path,
+                         checkpoint_management.latest_checkpoint(directory))
+        state = checkpoint_management.get_checkpoint_state(directory)
+        self.assertEqual([second_path], state.all_model_checkpoint_paths)
+        self.assertEmpty(state.pending_deletion_paths)
+        unblock_save.set()
+        checkpoint.sync()
+    manager.wait_for_deletions()
+    self.assertFalse(checkpoint_management.checkpoint_exists(first_path))
+    self.assertFalse(checkpoint_management.checkpoint_exists(second_path))
+    self.assertEqual(third_path,
+                     checkpoint_management.latest_checkpoint(directory))
+
+  def testAsyncSaveErrorIsRaisedBySync(self):
+    checkpoint = util.Checkpoint(v=variables.Variable(1.))
+    directory = self.get_temp_dir()
+    manager = checkpoint_management.CheckpointManager(
+        checkpoint, directory, max_to_keep=1)
+    options = checkpoint_options.CheckpointOptions(
+        experimental_enable_async_checkpoint=True)
+    with test.mock.patch.object(functional_saver.MultiDeviceSaver, "save",
+                                side_effect=ValueError("Disk full")):
+      manager.save(options=options)
+      with self.assertRaisesRegex(ValueError, "Disk full"):
+        checkpoint.sync()
+    # The failed checkpoint is not recorded, and the error is raised once.
+    self.assertIsNone(checkpoint_management.latest_checkpoint(directory))
+    checkpoint.sync()
+
   @test_util.run_in_graph_and_eager_modes
   @test.mock.patch.object(checkpoint_management, "time")
   def testSaveRestoreState(self, mock_time):
@@ -704,5 +933,108 @@ class CheckpointManagerTest(test.TestCase):
     self.assertIsNone(path)
 
 
+class CheckpointStateWatcherTest(test.TestCase):
+
+  def testLatestCheckpoint(self):
+    directory = os.path.join(self.get_temp_dir(), "watched")
+    watcher = checkpoint_management.CheckpointStateWatcher(directory)
+    self.assertIsNone(watcher.checkpoint_state())
+    self.assertIsNone(watcher.latest_checkpoint())
+
+    manager = checkpoint_management.CheckpointManager(
+        util.Checkpoint(), directory, max_to_keep=None)
+    first_path = manager.save()
+    self.assertEqual(first_path, watcher.latest_checkpoint())
+    # The state file was just written, so it would be read on every call.
+    resolution = test.mock.patch.object(
+        checkpoint_management, "_STATE_FILE_MTIME_RESOLUTION_SECONDS", 0.)
+    resolution.start()
+    self.addCleanup(resolution.stop)
+    with test.mock.patch.object(
+        file_io, "get_matching_files",
+        wraps=file_io.get_matching_files) as mock_get_matching_files:
+      with test.mock.patch.object(
+          checkpoint_management, "get_checkpoint_state",
+          wraps=checkpoint_management.get_checkpoint_state
+      ) as mock_get_checkpoint_state:
+        # The state file did not change, so it is neither read nor globbed.
+        self.assertEqual(first_path, watcher.latest_checkpoint())
+        self.assertEqual(first_path, watcher.latest_checkpoint())
+        mock_get_matching_files.assert_not_called()
+        mock_get_checkpoint_state.assert_not_called()
+
+        second_path = manager.save()
+        self.assertEqual(second_path, watcher.latest_checkpoint())
+        self.assertEqual(second_path, watcher.latest_checkpoint())
+        mock_get_checkpoint_state.assert_called_once()
+        self.assertEqual(
+            [first_path, second_path],
+            list(watcher.checkpoint_state().all_model_checkpoint_paths))
+
+  def _rewrite_state_keeping_stat(self, directory, model_checkpoint_path,
+                                  all_model_checkpoint_paths):
+    filename = os.path.join(directory, "checkpoint")
+    stat = os.stat(filename)
+    checkpoint_management.update_checkpoint_state_internal(
+        directory, model_checkpoint_path, all_model_checkpoint_paths)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    self.assertEqual(stat.st_size, os.stat(filename).st_size)
+
+  def testRewriteWithinMtimeResolutionIsSeen(self):
+    directory = os.path.join(self.get_temp_dir(), "coarse_mtime")
+    gfile.MakeDirs(directory)
+    checkpoint_management.update_checkpoint_state_internal(
+        directory, "ckpt-10", ["ckpt-09", "ckpt-10"])
+    watcher = checkpoint_management.CheckpointStateWatcher(directory)
+    self.assertEndsWith(watcher.checkpoint_state().model_checkpoint_path,
+                        "ckpt-10")
+
+    # As if the filesystem only had a resolution of seconds.
+    self._rewrite_state_keeping_stat(directory, "ckpt-11",
+                                     ["ckpt-10", "ckpt-11"])
+    self.assertEndsWith(watcher.checkpoint_state().model_checkpoint_path,
+                        "ckpt-11")
+
+  def testCachedStateIsReadAgainPeriodically(self):
+    directory = os.path.join(self.get_temp_dir(), "skewed_clock")
+    gfile.MakeDirs(directory)
+    checkpoint_management.update_checkpoint_state_internal(
+        directory, "ckpt-10", ["ckpt-09", "ckpt-10"])
+    watcher = checkpoint_management.CheckpointStateWatcher(directory)
+    with test.mock.patch.object(
+        checkpoint_management, "_STATE_FILE_MTIME_RESOLUTION_SECONDS", 0.):
+      with test.mock.patch.object(checkpoint_management,
+                                  "_MAX_CACHED_STATE_USES", 2):
+        watcher.checkpoint_state()
+        self._rewrite_state_keeping_stat(directory, "ckpt-11",
+                                         ["ckpt-10", "ckpt-11"])
+        for _ in range(2):
+          self.assertEndsWith(watcher.checkpoint_state().model_checkpoint_path,
+                              "ckpt-10")
+        self.assertEndsWith(watcher.checkpoint_state().model_checkpoint_path,
+                            "ckpt-11")
+
+  def testWaitsUntilFilesExist(self):
+    directory = os.path.join(self.get_temp_dir(), "missing_files")
+    gfile.MakeDirs(directory)
+    checkpoint_management.update_checkpoint_state_internal(
+        directory, model_checkpoint_path=os.path.join(directory, "ckpt-1"))
+    watcher = checkpoint_management.CheckpointStateWatcher(directory)
+    self.assertIsNone(watcher.latest_checkpoint())
+    self.assertIsNone(
+        watcher.wait_for_new_checkpoint(seconds_to_sleep=0.1, timeout=0.2))
+
+    checkpoint = util.Checkpoint()
+    prefix = checkpoint.write(os.path.join(directory, "ckpt-1"))
+    # The state file did not change, but the files of its checkpoint appeared.
+    self.assertEqual(prefix, watcher.latest_checkpoint())
+    self.assertEqual(
+        prefix, watcher.wait_for_new_checkpoint(seconds_to_sleep=0.1,
+                                                timeout=0.2))
+    self.assertIsNone(
+        watcher.wait_for_new_checkpoint(prefix, seconds_to_sleep=0.1,
+                                        timeout=0.2))
+
+
 if __name__ == "__main__":
   test.main()
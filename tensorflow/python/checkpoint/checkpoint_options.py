@@ -36,10 +36,22 @@ class CheckpointOptions(object):
   """
 
   # Define object attributes in __slots__ for improved memory and performance.
-  __slots__ = ("experimental_io_device", "experimental_enable_async_checkpoint")
+  __slots__ = ("experimental_io_device", "experimental_enable_async_checkpoint",
+               "experimental_write_parallelism",
+               "experimental_shard_size_bytes",
+               "experimental_max_delta_chain_length",
+               "experimental_lazy_restore",
+               "experimental_read_parallelism",
+               "experimental_compression")
 
   def __init__(self, experimental_io_device=None,
-               experimental_enable_async_checkpoint=False):
+               experimental_enable_async_checkpoint=False,
+               experimental_write_parallelism=None,
+               experimental_shard_size_bytes=None,
+               experimental_max_delta_chain_length=0,
+               experimental_lazy_restore=False,
+               experimental_read_parallelism=None,
+               experimental_compression=None):
     """Creates an object that stores options for a Checkpoint.
 
     Args:
@@ -61,6 +73,92 @@ class CheckpointOptions(object):
         writing runs in the background. Async checkpoint reduces TPU device idle
         cycles and speeds up model training process, while memory consumption
         may increase.
+
+      experimental_write_parallelism: int or None. Applies when saving
+        eagerly. If set, the checkpoint shards are written by this many
+        threads, while the tensors of the next shards are copied to their host
+        CPU device. At most this many copied shards wait to be written at any
+        time. If `None` (default), the shards are written by the save ops
+        without this pipelining.
+
+      experimental_shard_size_bytes: int or None. Applies when
+        `experimental_write_parallelism` is set. The tensors of each device
+        are split into shards of at most this many bytes, so that large
+        devices are written by several threads, and to bound the host memory
+        used by the copies waiting to be written. A tensor larger than this
+        gets a shard of its own. If `None` (default), each device is saved in
+        one shard.
+
+      experimental_max_delta_chain_length: int. Applies when saving eagerly.
+        If positive, a save only writes the values that changed since the
+        previous checkpoint written by the same `tf.train.Checkpoint`, along
+        with a reference to that checkpoint. Restoring such a delta checkpoint
+        reads the other values from the checkpoints it refers to, which must
+        not be deleted before it. After this many deltas in a row, the next
+        save writes a full checkpoint, which bounds the number of checkpoints
+        read by a restore. Default is 0, i.e., always write full checkpoints.
+
+        `tf.train.load_checkpoint` and `tf.train.list_variables` only read the
+        checkpoint they are given, so that on a delta checkpoint they miss the
+        values stored in the checkpoints it refers to.
+
+      experimental_lazy_restore: bool. Applies when restoring eagerly. If
+        True, the value of a `tf.Variable` is only read from the checkpoint
+        when the variable is first used, e.g. read, assigned, saved or
+        captured by a `tf.function`, rather than when it is matched to the
+        checkpoint. Values that are never used, such as the slot variables of
+        an optimizer during inference, are never read. The restore status
+        and the variable values are the same as with a regular restore. The
+        checkpoint files must remain available until all values are used.
+        Default is False.
+
+      experimental_read_parallelism: int or None. Applies when restoring
+        eagerly. If set, the checkpoint is read by this many threads. The
+        values of each device are split into this many groups, and the reads
+        of at most this many groups run ahead of the group whose values are
+        being assigned to their variables. The restore throughput is then
+        recorded in the "/tensorflow/core/checkpoint/read/read_throughput"
+        metric. If `None` (default), the values of each device are read and
+        assigned in turn.
+
+      experimental_compression: "ZLIB", "SNAPPY" or None. Applies when saving.
+        If set, the values of numeric and boolean tensors are compressed in
+        chunks of 1 MiB, which are decompressed in parallel when restoring.
+        Restoring a slice of a compressed tensor, e.g. a partition of a
+        variable, only reads and decompresses the chunks that hold it.
+        Compressed checkpoints can't be read by older versions of TensorFlow.
+        If `None` (default), values are stored uncompressed.
+
+    Raises:
+      ValueError: If `experimental_write_parallelism`,
+        `experimental_shard_size_bytes` or `experimental_read_parallelism` is
+        not a positive integer, if `experimental_max_delta_chain_length` is
+        negative, or if `experimental_compression` is not supported.
     """
+    if (experimental_write_parallelism is not None and
+        experimental_write_parallelism < 1):
+      raise ValueError("`experimental_write_parallelism` must be a positive "
+                       f"integer, got {experimental_write_parallelism}.")
+    if (experimental_shard_size_bytes is not None and
+        experimental_shard_size_bytes < 1):
+      raise ValueError("`experimental_shard_size_bytes` must be a positive "
+                       f"integer, got {experimental_shard_size_bytes}.")
+    if (experimental_read_parallelism is not None and
+        experimental_read_parallelism < 1):
+      raise ValueError("`experimental_read_parallelism` must be a positive "
+                       f"integer, got {experimental_read_parallelism}.")
+    if experimental_compression not in (None, "ZLIB", "SNAPPY"):
+      raise ValueError("`experimental_compression` must be 'ZLIB', 'SNAPPY' or "
+                       f"None, got {experimental_compression!r}.")
+    if experimental_max_delta_chain_length < 0:
+      raise ValueError("`experimental_max_delta_chain_length` must not be "
+                       f"negative, got {experimental_max_delta_chain_length}.")
     self.experimental_io_device = experimental_io_device
     self.experimental_enable_async_checkpoint = experimental_enable_async_checkpoint
+    self.experimental_write_parallelism = experimental_write_parallelism
+    self.experimental_shard_size_bytes = experimental_shard_size_bytes
+    self.experimental_max_delta_chain_length = (
+        experimental_max_delta_chain_length)
+    self.experimental_lazy_restore = experimental_lazy_restore
+    self.experimental_read_parallelism = experimental_read_parallelism
+    self.experimental_compression = experimental_compression
@@ -25,6 +25,7 @@ import six
 from tensorflow.python.checkpoint import checkpoint as trackable_utils
 from tensorflow.python.checkpoint import checkpoint_management
 from tensorflow.python.checkpoint import checkpoint_options
+from tensorflow.python.checkpoint import delta_checkpoint
 from tensorflow.python.checkpoint import graph_view
 from tensorflow.python.eager import context
 from tensorflow.python.eager import def_function
@@ -45,6 +46,7 @@ from tensorflow.python.platform import tf_logging as logging
 from tensorflow.python.saved_model import save as saved_model_save
 from tensorflow.python.trackable import autotrackable
 from tensorflow.python.trackable import base
+from tensorflow.python.training import py_checkpoint_reader
 from tensorflow.python.training import saver as saver_lib
 
 
@@ -354,6 +356,148 @@ class CheckpointingTests(parameterized.TestCase, test.TestCase):
         self.fail("%s should have suffix %s" % (path, expected_suffix))
       self.evaluate(step.assign_add(2))
 
+  @parameterized.named_parameters(
+      ("_enable_async_ckpt", True),
+      ("_disable_async_ckpt", False))
+  def testDeltaCheckpoint(self, enable_async_ckpt):
+    with context.eager_mode():
+      changed = variables_lib.Variable([1., 2.])
+      unchanged = variables_lib.Variable([3., 4., 5.])
+      checkpoint = trackable_utils.Checkpoint(
+          changed=changed, unchanged=unchanged)
+      prefix = os.path.join(self.get_temp_dir(), "ckpt")
+      ckpt_options = checkpoint_options.CheckpointOptions(
+          experimental_enable_async_checkpoint=enable_async_ckpt,
+          experimental_max_delta_chain_length=1)
+      checkpoint.write(prefix + "-1", options=ckpt_options)
+      changed.assign([6., 7.])
+      delta_path = checkpoint.write(prefix + "-2", options=ckpt_options)
+      checkpoint.sync()
+
+      delta_keys = py_checkpoint_reader.NewCheckpointReader(
+          delta_path).get_variable_to_shape_map()
+      self.assertIn(delta_checkpoint.DELTA_BASE_KEY, delta_keys)
+      self.assertIn("changed/.ATTRIBUTES/VARIABLE_VALUE", delta_keys)
+      self.assertNotIn("unchanged/.ATTRIBUTES/VARIABLE_VALUE", delta_keys)
+
+      changed.assign([0., 0.])
+      unchanged.assign([0., 0., 0.])
+      checkpoint.read(delta_path).assert_consumed()
+      self.assertAllEqual([6., 7.], changed)
+      self.assertAllEqual([3., 4., 5.], unchanged)
+
+      # Deferred restorations also compose the chain.
+      deferred = trackable_utils.Checkpoint()
+      status = deferred.read(delta_path)
+      deferred.changed = variables_lib.Variable([0., 0.])
+      deferred.unchanged = variables_lib.Variable([0., 0., 0.])
+      status.assert_consumed()
+      self.assertAllEqual([6., 7.], deferred.changed)
+      self.assertAllEqual([3., 4., 5.], deferred.unchanged)
+
+      # The chain is full, so the next checkpoint is a full one again.
+      full_path = checkpoint.write(prefix + "-3", options=ckpt_options)
+      checkpoint.sync()
+      full_keys = py_checkpoint_reader.NewCheckpointReader(
+          full_path).get_variable_to_shape_map()
+      self.assertNotIn(delta_checkpoint.DELTA_BASE_KEY, full_keys)
+      self.assertIn("unchanged/.ATTRIBUTES/VARIABLE_VALUE", full_keys)
+
+  def testDeltaCheckpointWithMissingBase(self):
+    with context.eager_mode():
+      v = variables_lib.Variable(1.)
+      checkpoint = trackable_utils.Checkpoint(v=v)
+      prefix = os.path.join(self.get_temp_dir(), "ckpt")
+      ckpt_options = checkpoint_options.CheckpointOptions(
+          experimental_max_delta_chain_length=2)
+      base_path = checkpoint.write(prefix + "-1", options=ckpt_options)
+      delta_path = checkpoint.write(prefix + "-2", options=ckpt_options)
+      checkpoint_management.remove_checkpoint(base_path)
+      with self.assertRaises(errors_impl.NotFoundError):
+        checkpoint.read(delta_path)
+      # The next checkpoint can't build on deleted checkpoints.
+      new_path = checkpoint.write(prefix + "-3", options=ckpt_options)
+      self.assertFalse(
+          py_checkpoint_reader.NewCheckpointReader(new_path).has_tensor(
+              delta_checkpoint.DELTA_BASE_KEY))
+
+  def testObjectGraphChangesBetweenSaves(self):
+    with context.eager_mode():
+      child = autotrackable.AutoTrackable()
+      child.v = variables_lib.Variable(1.)
+      checkpoint = trackable_utils.Checkpoint(child=child)
+      prefix = os.path.join(self.get_temp_dir(), "ckpt")
+      first_path = checkpoint.write(prefix + "-1")
+      # Unchanged dependencies reuse the traversal of the object graph.
+      second_path = checkpoint.write(prefix + "-2")
+      self.assertEqual(
+          py_checkpoint_reader.NewCheckpointReader(first_path).get_tensor(
+              base.OBJECT_GRAPH_PROTO_KEY),
+          py_checkpoint_reader.NewCheckpointReader(second_path).get_tensor(
+              base.OBJECT_GRAPH_PROTO_KEY))
+
+      child.w = variables_lib.Variable(2.)
+      child.v = variables_lib.Variable(3.)
+      save_path = checkpoint.write(prefix + "-3")
+      new_child = autotrackable.AutoTrackable()
+      new_child.v = variables_lib.Variable(0.)
+      new_child.w = variables_lib.Variable(0.)
+      trackable_utils.Checkpoint(child=new_child).read(
+          save_path).assert_consumed()
+      self.assertEqual(3., new_child.v.numpy())
+      self.assertEqual(2., new_child.w.numpy())
+
+  def testLazyRestore(self):
+    with context.eager_mode():
+      checkpoint = trackable_utils.Checkpoint(
+          v=variables_lib.Variable(1.), w=variables_lib.Variable([2., 3.]))
+      save_path = checkpoint.write(os.path.join(self.get_temp_dir(), "ckpt"))
+      v = variables_lib.Variable(0.)
+      w = variables_lib.Variable([0., 0.])
+      status = trackable_utils.Checkpoint(v=v, w=w).read(
+          save_path,
+          options=checkpoint_options.CheckpointOptions(
+              experimental_lazy_restore=True))
+      status.assert_consumed()
+      self.assertIsNotNone(v._lazy_restore_fn)
+      self.assertIsNotNone(w._lazy_restore_fn)
+      self.assertEqual(1., v.numpy())
+      self.assertIsNone(v._lazy_restore_fn)
+      self.assertIsNotNone(w._lazy_restore_fn)
+      # Writes apply on top of the restored value.
+      w.assign_add([1., 1.])
+      self.assertAllEqual([3., 4.], w.numpy())
+
+  def testLazyRestoreOnCreate(self):
+    with context.eager_mode():
+      checkpoint = trackable_utils.Checkpoint(v=variables_lib.Variable(1.))
+      save_path = checkpoint.write(os.path.join(self.get_temp_dir(), "ckpt"))
+      new_checkpoint = trackable_utils.Checkpoint()
+      new_checkpoint.read(
+          save_path,
+          options=checkpoint_options.CheckpointOptions(
+              experimental_lazy_restore=True))
+      new_checkpoint.v = variables_lib.Variable(0.)
+      self.assertIsNotNone(new_checkpoint.v._lazy_restore_fn)
+      self.assertEqual(1., new_checkpoint.v.numpy())
+
+  def testSaveAfterLazyRestore(self):
+    with context.eager_mode():
+      checkpoint = trackable_utils.Checkpoint(v=variables_lib.Variable(1.))
+      prefix = os.path.join(self.get_temp_dir(), "ckpt")
+      save_path = checkpoint.write(prefix + "-1")
+      v = variables_lib.Variable(0.)
+      new_checkpoint = trackable_utils.Checkpoint(v=v)
+      new_checkpoint.read(
+          save_path,
+          options=checkpoint_options.CheckpointOptions(
+              experimental_lazy_restore=True))
+      new_save_path = new_checkpoint.write(prefix + "-2")
+      self.assertIsNone(v._lazy_restore_fn)
+      v.assign(0.)
+      new_checkpoint.read(new_save_path)
+      self.assertEqual(1., v.numpy())
+
   def testPartialRestoreWarningAttribute(self):
     with context.eager_mode():
       original_root = trackable_utils.Checkpoint(v1=variables_lib.Variable(2.),
@@ -874,10 +1018,9 @@ class CheckpointingTests(parameterized.TestCase, test.TestCase):
         b={"a": variables_lib.Variable(6.), "b": variables_lib.Variable(7.)})
     # When async checkpoint is enabled, we need to first make sure that the
     # checkpoint saving is fully complete before the checkpoint file can be
-    # loaded by another checkpoint instance. Calling checkpoint.restore() is a
-    # trick to make sure its async thread is joined.
+    # loaded by another checkpoint instance.
     if enable_async_ckpt:
-      checkpoint.restore(save_path)
+      checkpoint.sync()
     load_checkpoint.restore(save_path)
     self.assertAllClose(self.evaluate(load_checkpoint.a), [0, 1])
     self.assertAllClose(self.evaluate(load_checkpoint.b), {"a": 2, "b": 3})
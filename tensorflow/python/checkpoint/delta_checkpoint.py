@@ -0,0 +1,196 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Delta checkpoints, which only hold the values changed since another one.
+
+A delta checkpoint is a regular checkpoint from which the values that did not
+change since its base checkpoint are left out. Its object graph is complete,
+and the tensor under `DELTA_BASE_KEY` refers to the base checkpoint, which may
+itself be a delta. A restore reads each value from the newest checkpoint of
+this chain that has it, see `ChainReader`. Other readers, such as
+`tf.train.load_checkpoint` and `tf.train.list_variables`, don't follow the
+chain, and only see the values changed in the delta itself.
+
+Changes are detected by comparing fingerprints of the values, so that the
+values of unchanged variables are read, but not written.
+"""
+
+import os
+
+from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import errors_impl
+from tensorflow.python.framework import ops
+from tensorflow.python.ops import array_ops
+from tensorflow.python.training import py_checkpoint_reader
+from tensorflow.python.util import compat
+
+DELTA_BASE_KEY = "_CHECKPOINT_DELTA_BASE"
+
+# Values of these types are handles, which can't be compared by fingerprint.
+_UNFINGERPRINTABLE_DTYPES = (dtypes.resource, dtypes.variant)
+
+
+class DeltaState(object):
+  """Describes the checkpoint that the next delta checkpoint builds on.
+
+  Attributes:
+    chain: A tuple of checkpoint prefixes, starting with a full checkpoint and
+      followed by the deltas built on it. The last one is the checkpoint
+      described.
+    fingerprints: A dict mapping checkpoint keys to the fingerprints of their
+      values in the checkpoint. Keys without fingerprint are always written.
+  """
+
+  __slots__ = ("chain", "fingerprints")
+
+  def __init__(self, chain, fingerprints):
+    self.chain = chain
+    self.fingerprints = fingerprints
+
+  @property
+  def prefix(self):
+    return self.chain[-1]
+
+
+def fingerprint(saveable):
+  """Returns a value identifying the values saved by a `SaveableObject`.
+
+  Must be called eagerly.
+
+  Args:
+    saveable: A `SaveableObject`.
+
+  Returns:
+    A hashable value, equal for equal values, or None if the values can't be
+    fingerprinted.
+  """
+  parts = []
+  for spec in saveable.specs:
+    tensor = spec.tensor
+    if tensor is None:
+      continue
+    if tensor.dtype in _UNFINGERPRINTABLE_DTYPES:
+      return None
+    with ops.device("/cpu:0"):
+      # A single row, so that the whole value is hashed into one fingerprint.
+      value = array_ops.fingerprint(array_ops.reshape(tensor, [1, -1]))
+    parts.append((spec.name, spec.slice_spec, tensor.dtype,
+                  tuple(tensor.shape.as_list()), value.numpy().tobytes()))
+  return tuple(parts)
+
+
+def base_reference(prefix, base_prefix):
+  """Returns how the checkpoint at `prefix` refers to its base checkpoint.
+
+  The reference is relative if both are in the same directory, so that the
+  directory can be moved.
+
+  Args:
+    prefix: The prefix of a delta checkpoint.
+    base_prefix: The prefix of its base checkpoint.
+
+  Returns:
+    A string to save under `DELTA_BASE_KEY`.
+  """
+  if os.path.dirname(prefix) == os.path.dirname(base_prefix):
+    return os.path.basename(base_prefix)
+  return base_prefix
+
+
+def _resolve_base(prefix, reference):
+  if os.path.dirname(reference):
+    return reference
+  return os.path.join(os.path.dirname(prefix), reference)
+
+
+def _base_of(prefix, reader):
+  if not reader.has_tensor(DELTA_BASE_KEY):
+    return None
+  return _resolve_base(prefix,
+                       compat.as_str(reader.get_tensor(DELTA_BASE_KEY)))
+
+
+def read_base(prefix):
+  """Returns the prefix of the base of a delta checkpoint.
+
+  Args:
+    prefix: The prefix of a checkpoint.
+
+  Returns:
+    The prefix of its base checkpoint, or None if it is not a delta
+    checkpoint or can't be read.
+  """
+  try:
+    reader = py_checkpoint_reader.NewCheckpointReader(prefix)
+  except errors_impl.OpError:
+    return None
+  return _base_of(prefix, reader)
+
+
+class ChainReader(object):
+  """Reads the values of a delta checkpoint and of the ones it builds on.
+
+  Implements the methods of `CheckpointReader` that restores use. Each value
+  is read from the newest checkpoint of the chain that has it.
+  """
+
+  def __init__(self, save_path, reader):
+    """Opens the checkpoints of a chain.
+
+    Args:
+      save_path: The prefix of a delta checkpoint.
+      reader: A `CheckpointReader` for `save_path`.
+
+    Raises:
+      ValueError: If the chain refers to a checkpoint twice.
+      NotFoundError: If a checkpoint of the chain does not exist.
+    """
+    self.prefixes = [save_path]
+    self._readers = [reader]
+    base = _base_of(save_path, reader)
+    while base is not None:
+      if base in self.prefixes:
+        raise ValueError(
+            f"The delta checkpoint {save_path} refers to {base} twice.")
+      reader = py_checkpoint_reader.NewCheckpointReader(base)
+      self.prefixes.append(base)
+      self._readers.append(reader)
+      base = _base_of(base, reader)
+
+    self._index = {}
+    self._dtype_map = {}
+    self._shape_map = {}
+    for index, reader in enumerate(self._readers):
+      dtype_map = reader.get_variable_to_dtype_map()
+      for key, shape in reader.get_variable_to_shape_map().items():
+        if key not in self._index:
+          self._index[key] = index
+          self._dtype_map[key] = dtype_map[key]
+          self._shape_map[key] = shape
+
+  def prefix_of(self, key):
+    """Returns the prefix of the checkpoint to read `key` from."""
+    return self.prefixes[self._index.get(key, 0)]
+
+  def has_tensor(self, key):
+    return key in self._index
+
+  def get_tensor(self, key):
+    return self._readers[self._index.get(key, 0)].get_tensor(key)
+
+  def get_variable_to_dtype_map(self):
+    return dict(self._dtype_map)
+
+  def get_variable_to_shape_map(self):
+    return dict(self._shape_map)
@@ -14,6 +14,10 @@
 # ==============================================================================
 """Saves and restore variables inside traced @tf.functions."""
 
+import collections
+from concurrent import futures
+import time
+
 from tensorflow.core.protobuf import saver_pb2
 from tensorflow.python.checkpoint import checkpoint_options
 from tensorflow.python.eager import context
@@ -27,9 +31,12 @@ from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import gen_io_ops
 from tensorflow.python.ops import io_ops
 from tensorflow.python.ops import string_ops
+from tensorflow.python.platform import tf_logging as logging
 from tensorflow.python.saved_model import registration
+from tensorflow.python.saved_model.pywrap_saved_model import metrics
 from tensorflow.python.training.saving import saveable_object
 from tensorflow.python.training.saving import saveable_object_util
+from tensorflow.python.util import compat
 from tensorflow.python.util import nest
 
 
@@ -61,6 +68,19 @@ class _SingleDeviceSaver(object):
       An `Operation`, or None when executing eagerly.
     """
     options = options or checkpoint_options.CheckpointOptions()
+    tensor_names, tensors, tensor_slices = self.tensors_to_save()
+    save_device = options.experimental_io_device or "cpu:0"
+    with ops.device(save_device):
+      return io_ops.save_v2(file_prefix, tensor_names, tensor_slices, tensors,
+                            compression=options.experimental_compression or "")
+
+  def tensors_to_save(self):
+    """Reads the tensors to save.
+
+    Returns:
+      A tuple (tensor_names, tensors, tensor_slices) of lists, with the
+      arguments of the save op.
+    """
     tensor_names = []
     tensors = []
     tensor_slices = []
@@ -74,9 +94,7 @@ class _SingleDeviceSaver(object):
           tensor_names.append(spec.name)
           tensors.append(tensor)
           tensor_slices.append(spec.slice_spec)
-    save_device = options.experimental_io_device or "cpu:0"
-    with ops.device(save_device):
-      return io_ops.save_v2(file_prefix, tensor_names, tensor_slices, tensors)
+    return tensor_names, tensors, tensor_slices
 
   def restore(self, file_prefix, options=None):
     """Restore the saveable objects from a checkpoint with `file_prefix`.
@@ -90,27 +108,84 @@ class _SingleDeviceSaver(object):
       A dictionary mapping from SaveableObject names to restore operations.
     """
     options = options or checkpoint_options.CheckpointOptions()
-    restore_specs = []
-    tensor_structure = []
-    for saveable in self._saveable_objects:
-      saveable_tensor_structure = []
-      tensor_structure.append(saveable_tensor_structure)
-      for spec in saveable.specs:
-        saveable_tensor_structure.append(spec.name)
-        restore_specs.append((spec.name, spec.slice_spec, spec.dtype))
-    tensor_names, tensor_slices, tensor_dtypes = zip(*restore_specs)
-    restore_device = options.experimental_io_device or "cpu:0"
-    with ops.device(restore_device):
-      restored_tensors = io_ops.restore_v2(
-          file_prefix, tensor_names, tensor_slices, tensor_dtypes)
-    structured_restored_tensors = nest.pack_sequence_as(
-        tensor_structure, restored_tensors)
-    restore_ops = {}
-    for saveable, restored_tensors in zip(self._saveable_objects,
-                                          structured_restored_tensors):
-      restore_ops[saveable.name] = saveable.restore(
-          restored_tensors, restored_shapes=None)
-    return restore_ops
+    structured_restored_tensors = _read_saveables(
+        file_prefix, self._saveable_objects,
+        options.experimental_io_device or "cpu:0")
+    return _assign_saveables(self._saveable_objects,
+                             structured_restored_tensors)
+
+
+def _read_saveables(file_prefix, saveables, restore_device):
+  """Reads the values of `saveables` from a checkpoint.
+
+  Args:
+    file_prefix: A string or scalar string Tensor containing the prefix for
+      files to read from.
+    saveables: A list of `SaveableObject`s.
+    restore_device: The device to run the restore op on.
+
+  Returns:
+    A list with the list of restored tensors of each saveable.
+  """
+  restore_specs = []
+  tensor_structure = []
+  for saveable in saveables:
+    saveable_tensor_structure = []
+    tensor_structure.append(saveable_tensor_structure)
+    for spec in saveable.specs:
+      saveable_tensor_structure.append(spec.name)
+      restore_specs.append((spec.name, spec.slice_spec, spec.dtype))
+  tensor_names, tensor_slices, tensor_dtypes = zip(*restore_specs)
+  with ops.device(restore_device):
+    restored_tensors = io_ops.restore_v2(
+        file_prefix, tensor_names, tensor_slices, tensor_dtypes)
+  return nest.pack_sequence_as(tensor_structure, restored_tensors)
+
+
+def _assign_saveables(saveables, structured_restored_tensors):
+  """Restores `saveables` from the values read by `_read_saveables`."""
+  restore_ops = {}
+  for saveable, restored_tensors in zip(saveables,
+                                        structured_restored_tensors):
+    restore_ops[saveable.name] = saveable.restore(
+        restored_tensors, restored_shapes=None)
+  return restore_ops
+
+
+def _split_by_count(items, num_groups):
+  """Splits `items` into at most `num_groups` consecutive groups of equal size.
+
+  Args:
+    items: A list.
+    num_groups: The number of groups.
+
+  Returns:
+    A list of non-empty lists, whose sizes differ by at most one.
+  """
+  groups = []
+  start = 0
+  for group in range(num_groups):
+    end = start + (len(items) - start) // (num_groups - group)
+    if end > start:
+      groups.append(items[start:end])
+    start = end
+  return groups
+
+
+def _restored_size(tensors):
+  """Returns the size in bytes of restored tensors.
+
+  Values of variable size, such as strings, are not counted.
+
+  Args:
+    tensors: A list of eager tensors.
+  """
+  size = 0
+  for tensor in tensors:
+    if tensor.dtype in (dtypes.string, dtypes.resource, dtypes.variant):
+      continue
+    size += tensor.shape.num_elements() * tensor.dtype.size
+  return size
 
 
 def sharded_filename(filename_tensor, shard, num_shards):
@@ -127,6 +202,56 @@ def sharded_filename(filename_tensor, shard, num_shards):
   return gen_io_ops.sharded_filename(filename_tensor, shard, num_shards)
 
 
+def _split_by_size(tensor_names, tensors, tensor_slices, max_shard_size_bytes):
+  """Splits the arguments of a save op into shards of bounded size.
+
+  Args:
+    tensor_names: List of the names of the tensors.
+    tensors: List of tensors.
+    tensor_slices: List of the slice specs of the tensors.
+    max_shard_size_bytes: Int or None. The size budget of each shard. A tensor
+      larger than the budget gets a shard of its own. Tensors of unknown size
+      are counted as empty.
+
+  Returns:
+    A list of (tensor_names, tensors, tensor_slices) tuples, one per shard.
+  """
+  if max_shard_size_bytes is None:
+    return [(tensor_names, tensors, tensor_slices)]
+  shards = []
+  shard = ([], [], [])
+  shard_size = 0
+  for name, tensor, slice_spec in zip(tensor_names, tensors, tensor_slices):
+    num_elements = tensor.shape.num_elements()
+    size = num_elements * tensor.dtype.size if num_elements else 0
+    if shard[0] and shard_size + size > max_shard_size_bytes:
+      shards.append(shard)
+      shard = ([], [], [])
+      shard_size = 0
+    shard[0].append(name)
+    shard[1].append(tensor)
+    shard[2].append(slice_spec)
+    shard_size += size
+  if shard[0] or not shards:
+    shards.append(shard)
+  return shards
+
+
+class SaveTimings(
+    collections.namedtuple("SaveTimings",
+                           ("copy", "write", "merge", "total"))):
+  """Time spent in the phases of a pipelined save, in seconds.
+
+  Attributes:
+    copy: The time spent copying tensors to their host CPU device.
+    write: The time spent serializing and writing shards. Shards are written
+      in parallel, so this may exceed `total`.
+    merge: The time spent merging the shards into the checkpoint.
+    total: The duration of the save.
+  """
+  pass
+
+
 def registered_saver_filename(filename_tensor, saver_name):
   return string_ops.string_join(
       [filename_tensor, constant_op.constant(f"-{saver_name}")])
@@ -175,6 +300,10 @@ class MultiDeviceSaver(object):
   Note that this is a low-level utility which stores Tensors in the keys
   specified by `SaveableObject`s. Higher-level utilities for object-based
   checkpointing are built on top of it.
+
+  Attributes:
+    last_save_timings: A `SaveTimings` for the last save with
+      `CheckpointOptions.experimental_write_parallelism` set, or None.
   """
 
   def __init__(self,
@@ -219,6 +348,8 @@ class MultiDeviceSaver(object):
             trackables, call_with_mapped_captures)
         self._registered_savers[registered_name] = (save_fn, restore_fn)
 
+    self.last_save_timings = None
+
   def to_proto(self):
     """Serializes to a SaverDef referencing the current graph."""
     filename_tensor = array_ops.placeholder(
@@ -249,6 +380,22 @@ class MultiDeviceSaver(object):
       with ops.control_dependencies(restore_ops.values()):
         return array_ops.identity(file_prefix)
 
+  def _save_with_registered_savers(self, registered_paths):
+    """Saves with the registered savers, and returns the saved prefixes."""
+    saved_prefixes = []
+    for saver_name, (save_fn, _) in self._registered_savers.items():
+      maybe_saved_prefixes = save_fn(registered_paths[saver_name])
+      if maybe_saved_prefixes is not None:
+        flattened_saved_prefixes = nest.flatten(maybe_saved_prefixes)
+        if not all(
+            tensor_util.is_tf_type(x) and x.dtype == dtypes.string
+            for x in flattened_saved_prefixes):
+          raise ValueError(
+              "Registered saver must return a (maybe empty) list of "
+              f"string type tensors. Got {maybe_saved_prefixes}.")
+        saved_prefixes.extend(flattened_saved_prefixes)
+    return saved_prefixes
+
   def save(self, file_prefix, options=None):
     """Save the saveable objects to a checkpoint with `file_prefix`.
 
@@ -260,6 +407,10 @@ class MultiDeviceSaver(object):
       An `Operation`, or None when executing eagerly.
     """
     options = options or checkpoint_options.CheckpointOptions()
+    if (options.experimental_write_parallelism is not None and
+        context.executing_eagerly()):
+      self._pipelined_save(file_prefix, options)
+      return None
 
     # IMPLEMENTATION DETAILS: most clients should skip.
     #
@@ -302,20 +453,9 @@ class MultiDeviceSaver(object):
       }
 
     def save_fn():
-      saved_prefixes = []
       # Save with the registered savers. These run before default savers due to
       # the API contract.
-      for saver_name, (save_fn, _) in self._registered_savers.items():
-        maybe_saved_prefixes = save_fn(registered_paths[saver_name])
-        if maybe_saved_prefixes is not None:
-          flattened_saved_prefixes = nest.flatten(maybe_saved_prefixes)
-          if not all(
-              tensor_util.is_tf_type(x) and x.dtype == dtypes.string
-              for x in flattened_saved_prefixes):
-            raise ValueError(
-                "Registered saver must return a (maybe empty) list of "
-                f"string type tensors. Got {maybe_saved_prefixes}.")
-          saved_prefixes.extend(flattened_saved_prefixes)
+      saved_prefixes = self._save_with_registered_savers(registered_paths)
 
       # (Default saver) Save with single device savers.
       num_shards = len(self._single_device_savers)
@@ -361,6 +501,103 @@ class MultiDeviceSaver(object):
     else:
       return save_fn()
 
+  def _pipelined_save(self, file_prefix, options):
+    """Saves eagerly, overlapping the host copies and writes of shards.
+
+    The main thread copies the tensors of each shard to the host CPU device,
+    and then hands them over to a pool of
+    `options.experimental_write_parallelism` threads that write the shards,
+    while it copies the next shard. The shards are then merged as in `save`.
+    The time spent in each phase is stored in `last_save_timings`.
+
+    Args:
+      file_prefix: A string or scalar string Tensor containing the prefix to
+        save under.
+      options: `CheckpointOptions` object.
+    """
+    start_time = time.time()
+    parallelism = options.experimental_write_parallelism
+    file_prefix = ops.convert_to_tensor(file_prefix, dtype=dtypes.string)
+    # See the comments in `save` for the temporary prefix.
+    if compat.as_str(file_prefix.numpy()).startswith("s3://"):
+      sharded_suffix = ".part"
+    else:
+      sharded_suffix = "_temp/part"
+    with ops.device("CPU"):
+      tmp_checkpoint_prefix = string_ops.string_join(
+          [file_prefix, sharded_suffix])
+      registered_paths = {
+          saver_name: registered_saver_filename(file_prefix, saver_name)
+          for saver_name in self._registered_savers
+      }
+
+    saved_prefixes = self._save_with_registered_savers(registered_paths)
+
+    shards = []
+    for device, saver in sorted(self._single_device_savers.items()):
+      with ops.device(device):
+        tensor_names, tensors, tensor_slices = saver.tensors_to_save()
+      for shard in _split_by_size(tensor_names, tensors, tensor_slices,
+                                  options.experimental_shard_size_bytes):
+        shards.append((device, shard))
+    num_shards_tensor = constant_op.constant(len(shards), name="num_shards")
+
+    def write_shard(shard_prefix, save_device, tensor_names, tensor_slices,
+                    tensors):
+      write_start_time = time.time()
+      with ops.device(save_device):
+        io_ops.save_v2(shard_prefix, tensor_names, tensor_slices, tensors,
+                       compression=options.experimental_compression or "")
+      return time.time() - write_start_time
+
+    copy_time = 0.
+    write_time = 0.
+    host_device = "cpu:0"
+    pending_writes = collections.deque()
+    with futures.ThreadPoolExecutor(
+        max_workers=parallelism,
+        thread_name_prefix="checkpoint_write") as executor:
+      for shard, (device, (tensor_names, tensors,
+                           tensor_slices)) in enumerate(shards):
+        host_device = saveable_object_util.set_cpu0(device)
+        with ops.device(host_device):
+          shard_prefix = sharded_filename(tmp_checkpoint_prefix, shard,
+                                          num_shards_tensor)
+        saved_prefixes.append(shard_prefix)
+        # Bound the number of copies waiting to be written, and the host
+        # memory that they use.
+        while len(pending_writes) >= parallelism:
+          write_time += pending_writes.popleft().result()
+        copy_start_time = time.time()
+        with ops.device(host_device):
+          host_tensors = [array_ops.identity(t) for t in tensors]
+        copy_time += time.time() - copy_start_time
+        pending_writes.append(
+            executor.submit(write_shard, shard_prefix,
+                            options.experimental_io_device or host_device,
+                            tensor_names, tensor_slices, host_tensors))
+      while pending_writes:
+        write_time += pending_writes.popleft().result()
+
+    merge_start_time = time.time()
+    # Merge on the io_device if specified, otherwise co-locates the merge op
+    # with the last device used.
+    with ops.device(options.experimental_io_device or host_device):
+      gen_io_ops.merge_v2_checkpoints(
+          saved_prefixes, file_prefix, delete_old_dirs=True)
+    end_time = time.time()
+
+    self.last_save_timings = SaveTimings(
+        copy=copy_time,
+        write=write_time,
+        merge=end_time - merge_start_time,
+        total=end_time - start_time)
+    logging.info(
+        "Saved %d checkpoint shards in %.2fs: copy %.2fs, write %.2fs "
+        "(across %d threads), merge %.2fs.", len(shards),
+        self.last_save_timings.total, copy_time, write_time, parallelism,
+        self.last_save_timings.merge)
+
   def restore(self, file_prefix, options=None):
     """Restore the saveable objects from a checkpoint with `file_prefix`.
 
@@ -370,11 +607,15 @@ class MultiDeviceSaver(object):
       options: Optional `CheckpointOptions` object.
 
     Returns:
-      When not run eagerly or when saving on a single device, returns a
-      dictionary mapping from SaveableObject names to restore operations;
-      otherwise, returns an empty dict.
+      When not run eagerly, when saving on a single device or when
+      `options.experimental_read_parallelism` is set, returns a dictionary
+      mapping from SaveableObject names to restore operations; otherwise,
+      returns an empty dict.
     """
     options = options or checkpoint_options.CheckpointOptions()
+    if (options.experimental_read_parallelism is not None and
+        context.executing_eagerly()):
+      return self._parallel_restore(file_prefix, options)
 
     def restore_fn():
       restore_ops = {}
@@ -403,3 +644,76 @@ class MultiDeviceSaver(object):
       restore_ops = restore_fn()
 
     return restore_ops
+
+  def _parallel_restore(self, file_prefix, options):
+    """Restores eagerly, overlapping the reads and assignments of values.
+
+    The saveables of each device are split into
+    `options.experimental_read_parallelism` groups, which are read by as many
+    threads. The main thread assigns the values of the groups in order, while
+    the reads of at most that many of the following groups run ahead. The
+    restore throughput is recorded in the
+    "/tensorflow/core/checkpoint/read/read_throughput" metric.
+
+    Args:
+      file_prefix: A string or scalar string Tensor containing the prefix for
+        files to read from.
+      options: `CheckpointOptions` object.
+
+    Returns:
+      A dictionary mapping from SaveableObject names to restore operations.
+    """
+    start_time = time.time()
+    parallelism = options.experimental_read_parallelism
+    with ops.device("CPU"):
+      file_prefix = ops.convert_to_tensor(file_prefix, dtype=dtypes.string)
+
+    groups = []
+    for device, saver in sorted(self._single_device_savers.items()):
+      saveables = saver._saveable_objects  # pylint: disable=protected-access
+      for group in _split_by_count(saveables, parallelism):
+        groups.append((device, group))
+
+    def read_group(device, saveables):
+      with ops.device(device):
+        structured_restored_tensors = _read_saveables(
+            file_prefix, saveables, options.experimental_io_device or "cpu:0")
+      return structured_restored_tensors, _restored_size(
+          nest.flatten(structured_restored_tensors))
+
+    restore_ops = {}
+    num_bytes = 0
+    pending_reads = collections.deque()
+
+    def assign_group():
+      nonlocal num_bytes
+      device, saveables, read = pending_reads.popleft()
+      structured_restored_tensors, group_bytes = read.result()
+      num_bytes += group_bytes
+      with ops.device(device):
+        restore_ops.update(
+            _assign_saveables(saveables, structured_restored_tensors))
+
+    with futures.ThreadPoolExecutor(
+        max_workers=parallelism,
+        thread_name_prefix="checkpoint_read") as executor:
+      for device, saveables in groups:
+        pending_reads.append(
+            (device, saveables, executor.submit(read_group, device,
+                                                saveables)))
+        if len(pending_reads) > parallelism:
+          assign_group()
+      while pending_reads:
+        assign_group()
+
+    # Run registered restore methods after the default restore ops.
+    for _, (_, restore_fn) in self._registered_savers.items():
+      restore_fn(file_prefix)
+
+    duration = time.time() - start_time
+    if duration > 0:
+      metrics.AddCheckpointReadThroughput(bytes_per_second=num_bytes / duration)
+    logging.info(
+        "Restored %d bytes in %d groups in %.2fs (across %d threads).",
+        num_bytes, len(groups), duration, parallelism)
+    return restore_ops
@@ -16,6 +16,7 @@
 
 import os
 
+from tensorflow.core.framework import summary_pb2
 from tensorflow.python.checkpoint import checkpoint_options
 from tensorflow.python.checkpoint import functional_saver
 from tensorflow.python.eager import context
@@ -26,8 +27,10 @@ from tensorflow.python.framework import config
 from tensorflow.python.framework import constant_op
 from tensorflow.python.framework import ops
 from tensorflow.python.framework import test_util
+from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import resource_variable_ops
 from tensorflow.python.platform import gfile
+from tensorflow.python.saved_model.pywrap_saved_model import metrics
 from tensorflow.python.training import server_lib
 from tensorflow.python.training.saving import saveable_object_util
 
@@ -187,6 +190,107 @@ class SaverTest(test.TestCase):
           self.assertEqual(LOCALHOST, op.device)
 
 
+  def test_pipelined_save(self):
+    variables = []
+    for i in range(3):
+      with ops.device("cpu:%d" % i):
+        variables.append(resource_variable_ops.ResourceVariable([float(i)] * 4))
+    saveables = []
+    for i, v in enumerate(variables):
+      saveables.extend(
+          saveable_object_util.saveable_objects_for_op(v, "v%d" % i))
+    saver = functional_saver.MultiDeviceSaver(saveables)
+    prefix = os.path.join(self.get_temp_dir(), "ckpt")
+    options = checkpoint_options.CheckpointOptions(
+        experimental_write_parallelism=2,
+        experimental_shard_size_bytes=16)
+    self.assertIsNone(saver.save(constant_op.constant(prefix), options))
+    # One data file per variable, and the index.
+    self.assertLen(gfile.Glob(prefix + ".data-*"), 3)
+    self.assertLen(gfile.Glob(prefix + "*"), 4)
+    self.assertFalse(gfile.Glob(prefix + "_temp*"))
+
+    timings = saver.last_save_timings
+    self.assertIsInstance(timings, functional_saver.SaveTimings)
+    self.assertGreaterEqual(timings.total, timings.merge)
+    self.assertGreater(timings.total, 0.)
+
+    for v in variables:
+      v.assign([-1.] * 4)
+    saver.restore(constant_op.constant(prefix))
+    for i, v in enumerate(variables):
+      self.assertAllEqual([float(i)] * 4, v)
+
+  def test_pipelined_save_options_validation(self):
+    with self.assertRaisesRegex(ValueError, "experimental_write_parallelism"):
+      checkpoint_options.CheckpointOptions(experimental_write_parallelism=0)
+    with self.assertRaisesRegex(ValueError, "experimental_shard_size_bytes"):
+      checkpoint_options.CheckpointOptions(experimental_shard_size_bytes=0)
+
+  def test_compressed_save(self):
+    with ops.device("cpu:0"):
+      v = resource_variable_ops.ResourceVariable(array_ops.zeros([1000, 10]))
+    saver = functional_saver.MultiDeviceSaver(
+        saveable_object_util.saveable_objects_for_op(v, "v"))
+    prefix = os.path.join(self.get_temp_dir(), "ckpt")
+    saver.save(constant_op.constant(prefix))
+    compressed_prefix = os.path.join(self.get_temp_dir(), "compressed")
+    options = checkpoint_options.CheckpointOptions(
+        experimental_compression="ZLIB")
+    saver.save(constant_op.constant(compressed_prefix), options)
+    self.assertLess(
+        gfile.Stat(compressed_prefix + ".data-00000-of-00001").length,
+        gfile.Stat(prefix + ".data-00000-of-00001").length)
+
+    v.assign(array_ops.ones([1000, 10]))
+    saver.restore(constant_op.constant(compressed_prefix))
+    self.assertAllEqual(array_ops.zeros([1000, 10]), v)
+
+  def test_compression_options_validation(self):
+    with self.assertRaisesRegex(ValueError, "experimental_compression"):
+      checkpoint_options.CheckpointOptions(experimental_compression="GZIP")
+
+  def _read_throughput_count(self):
+    histogram_proto = summary_pb2.HistogramProto()
+    histogram_proto.ParseFromString(metrics.GetCheckpointReadThroughputs())
+    return histogram_proto.num
+
+  def test_parallel_restore(self):
+    variables = []
+    saveables = []
+    for i in range(6):
+      with ops.device("cpu:%d" % (i % 3)):
+        v = resource_variable_ops.ResourceVariable([float(i)] * 4)
+      variables.append(v)
+      saveables.extend(
+          saveable_object_util.saveable_objects_for_op(v, "v%d" % i))
+    saver = functional_saver.MultiDeviceSaver(saveables)
+    prefix = os.path.join(self.get_temp_dir(), "ckpt")
+    saver.save(constant_op.constant(prefix))
+
+    for v in variables:
+      v.assign([-1.] * 4)
+    num_restores = self._read_throughput_count()
+    options = checkpoint_options.CheckpointOptions(
+        experimental_read_parallelism=2)
+    restore_ops = saver.restore(constant_op.constant(prefix), options)
+    self.assertLen(restore_ops, 6)
+    for i, v in enumerate(variables):
+      self.assertAllEqual([float(i)] * 4, v)
+    self.assertEqual(num_restores + 1, self._read_throughput_count())
+
+  def test_split_by_count(self):
+    self.assertEqual([[0], [1, 2], [3, 4]],
+                     functional_saver._split_by_count(list(range(5)), 3))
+    self.assertEqual([[0], [1]],
+                     functional_saver._split_by_count(list(range(2)), 4))
+    self.assertEqual([], functional_saver._split_by_count([], 2))
+
+  def test_parallel_restore_options_validation(self):
+    with self.assertRaisesRegex(ValueError, "experimental_read_parallelism"):
+      checkpoint_options.CheckpointOptions(experimental_read_parallelism=0)
+
+
 if __name__ == "__main__":
   ops.enable_eager_execution()
   test.main()
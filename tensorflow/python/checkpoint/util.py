@@ -15,6 +15,7 @@
 """Utilities for extracting checkpoint info`."""
 
 import collections
+import weakref
 
 from tensorflow.core.protobuf import trackable_object_graph_pb2
 from tensorflow.python.framework import constant_op
@@ -36,55 +37,63 @@ _CheckpointFactoryData = collections.namedtuple(
     "_CheckpointFactoryData", ["factory", "name", "checkpoint_key"])
 
 
-def _serialize_slot_variables(trackable_objects, node_ids, object_names):
+def _may_have_slot_variables(trackable):
+  """Returns whether `trackable` is an optimizer, which may own slots."""
+  return (isinstance(trackable, optimizer_v1.Optimizer)
+          # TODO(b/110718070): Fix Keras imports.
+          # Note: dir() is used rather than hasattr() here to avoid triggering
+          # custom __getattr__ code, see b/152031870 for context.
+          or "_create_or_restore_slot_variable" in dir(trackable))
+
+
+def _serialize_slot_variables(trackable_objects, node_ids, object_names,
+                              optimizers=None):
   """Gather and name slot variables."""
   non_slot_objects = list(trackable_objects)
   slot_variables = object_identity.ObjectIdentityDictionary()
-  for trackable in non_slot_objects:
-    if (isinstance(trackable, optimizer_v1.Optimizer)
-        # TODO(b/110718070): Fix Keras imports.
-        # Note: dir() is used rather than hasattr() here to avoid triggering
-        # custom __getattr__ code, see b/152031870 for context.
-        or "_create_or_restore_slot_variable" in dir(trackable)):
-      slot_names = trackable.get_slot_names()
-      for slot_name in slot_names:
-        for original_variable_node_id, original_variable in enumerate(
-            non_slot_objects):
-          try:
-            slot_variable = trackable.get_slot(
-                original_variable, slot_name)
-          except (AttributeError, KeyError):
-            slot_variable = None
-          if slot_variable is None:
-            continue
-          slot_variable._maybe_initialize_trackable()  # pylint: disable=protected-access
-          if slot_variable._trackable_children():  # pylint: disable=protected-access
-            # TODO(allenl): Gather dependencies of slot variables.
-            raise NotImplementedError(
-                "Currently only variables with no dependencies can be saved as "
-                "slot variables. File a feature request if this limitation "
-                "bothers you.")
-          if slot_variable in node_ids:
-            raise NotImplementedError(
-                "A slot variable was re-used as a dependency of a Trackable "
-                f"object: {slot_variable}. This is not currently allowed. "
-                "File a feature request if this limitation bothers you.")
-          checkpoint_name = trackable_utils.slot_variable_key(
-              variable_path=object_names[original_variable],
-              optimizer_path=object_names[trackable],
-              slot_name=slot_name)
-          object_names[slot_variable] = checkpoint_name
-          slot_variable_node_id = len(trackable_objects)
-          node_ids[slot_variable] = slot_variable_node_id
-          trackable_objects.append(slot_variable)
-          slot_variable_proto = (
-              trackable_object_graph_pb2.TrackableObjectGraph
-              .TrackableObject.SlotVariableReference(
-                  slot_name=slot_name,
-                  original_variable_node_id=original_variable_node_id,
-                  slot_variable_node_id=slot_variable_node_id))
-          slot_variables.setdefault(trackable, []).append(
-              slot_variable_proto)
+  if optimizers is None:
+    optimizers = [trackable for trackable in non_slot_objects
+                  if _may_have_slot_variables(trackable)]
+  for trackable in optimizers:
+    slot_names = trackable.get_slot_names()
+    for slot_name in slot_names:
+      for original_variable_node_id, original_variable in enumerate(
+          non_slot_objects):
+        try:
+          slot_variable = trackable.get_slot(
+              original_variable, slot_name)
+        except (AttributeError, KeyError):
+          slot_variable = None
+        if slot_variable is None:
+          continue
+        slot_variable._maybe_initialize_trackable()  # pylint: disable=protected-access
+        if slot_variable._trackable_children():  # pylint: disable=protected-access
+          # TODO(allenl): Gather dependencies of slot variables.
+          raise NotImplementedError(
+              "Currently only variables with no dependencies can be saved as "
+              "slot variables. File a feature request if this limitation "
+              "bothers you.")
+        if slot_variable in node_ids:
+          raise NotImplementedError(
+              "A slot variable was re-used as a dependency of a Trackable "
+              f"object: {slot_variable}. This is not currently allowed. "
+              "File a feature request if this limitation bothers you.")
+        checkpoint_name = trackable_utils.slot_variable_key(
+            variable_path=object_names[original_variable],
+            optimizer_path=object_names[trackable],
+            slot_name=slot_name)
+        object_names[slot_variable] = checkpoint_name
+        slot_variable_node_id = len(trackable_objects)
+        node_ids[slot_variable] = slot_variable_node_id
+        trackable_objects.append(slot_variable)
+        slot_variable_proto = (
+            trackable_object_graph_pb2.TrackableObjectGraph
+            .TrackableObject.SlotVariableReference(
+                slot_name=slot_name,
+                original_variable_node_id=original_variable_node_id,
+                slot_variable_node_id=slot_variable_node_id))
+        slot_variables.setdefault(trackable, []).append(
+            slot_variable_proto)
   return slot_variables
 
 
@@ -336,27 +345,153 @@ def _fill_object_graph_proto(graph_view,
   return object_graph_proto
 
 
+class ObjectGraphCache(object):
+  """Caches the traversal of an object graph between saves.
+
+  Traversing the graph, naming its objects and listing their dependencies in a
+  `TrackableObjectGraph` proto takes a while for graphs with many objects. The
+  cache keeps the results while the dependencies of the objects don't change.
+  Each lookup lists the children of the cached objects once to check this,
+  instead of traversing the graph and listing the children twice.
+
+  Only holds weak references to the objects.
+  """
+
+  def __init__(self):
+    # Weak references to the non-slot objects, in breadth-first order.
+    self._node_refs = None
+    # For each object, a list of (local name, node id) of its children.
+    self._children = None
+    self._object_names = None
+    # Node ids of the objects which may have slot variables.
+    self._optimizer_ids = None
+    # Nodes with their children, without slot variables and attributes.
+    self._object_graph_proto = None
+
+  def gather(self, graph_view):
+    """Returns the non-slot objects of the graph, reusing the cache if valid.
+
+    Args:
+      graph_view: The `ObjectGraphView` to traverse.
+
+    Returns:
+      A tuple of (trackable objects in breadth-first order, object -> name,
+      object -> node id, objects which may have slot variables, a
+      `TrackableObjectGraph` proto with a node for each object listing its
+      children). The caller may modify all of them.
+    """
+    trackable_objects = self._lookup(graph_view)
+    if trackable_objects is None:
+      trackable_objects = self._update(graph_view)
+    object_names = object_identity.ObjectIdentityDictionary()
+    node_ids = object_identity.ObjectIdentityDictionary()
+    for node_id, (trackable, object_name) in enumerate(
+        zip(trackable_objects, self._object_names)):
+      object_names[trackable] = object_name
+      node_ids[trackable] = node_id
+    optimizers = [trackable_objects[node_id]
+                  for node_id in self._optimizer_ids]
+    object_graph_proto = trackable_object_graph_pb2.TrackableObjectGraph()
+    object_graph_proto.CopyFrom(self._object_graph_proto)
+    return (trackable_objects, object_names, node_ids, optimizers,
+            object_graph_proto)
+
+  def _lookup(self, graph_view):
+    """Returns the cached objects, or None if the dependencies changed."""
+    if self._node_refs is None:
+      return None
+    trackable_objects = [node_ref() for node_ref in self._node_refs]
+    if trackable_objects[0] is not graph_view.root:
+      return None
+    for trackable, children in zip(trackable_objects, self._children):
+      if trackable is None:
+        return None
+      current_children = graph_view.list_children(trackable)
+      if len(current_children) != len(children):
+        return None
+      for child, (name, node_id) in zip(current_children, children):
+        if child.name != name or child.ref is not trackable_objects[node_id]:
+          return None
+    return trackable_objects
+
+  def _update(self, graph_view):
+    """Traverses the graph and caches the results."""
+    trackable_objects, node_paths = graph_view.breadth_first_traversal()
+    node_ids = object_identity.ObjectIdentityDictionary()
+    for node_id, node in enumerate(trackable_objects):
+      node_ids[node] = node_id
+    self._object_graph_proto = _fill_object_graph_proto(
+        graph_view=graph_view,
+        trackable_objects=trackable_objects,
+        node_ids=node_ids,
+        slot_variables=object_identity.ObjectIdentityDictionary())
+    self._children = [
+        [(child.local_name, child.node_id) for child in object_proto.children]
+        for object_proto in self._object_graph_proto.nodes]
+    self._object_names = [
+        trackable_utils.object_path_to_string(node_paths[trackable])
+        for trackable in trackable_objects]
+    self._optimizer_ids = [
+        node_id for node_id, trackable in enumerate(trackable_objects)
+        if _may_have_slot_variables(trackable)]
+    try:
+      self._node_refs = [weakref.ref(trackable)
+                         for trackable in trackable_objects]
+    except TypeError:
+      # Some objects can't be referenced weakly, so the next lookup must
+      # traverse the graph again.
+      self._node_refs = None
+    return trackable_objects
+
+
+def _add_slot_variables_to_object_graph_proto(trackable_objects, node_ids,
+                                              slot_variables,
+                                              object_graph_proto):
+  """Adds slot variables to a proto filled with the non-slot objects."""
+  for trackable, slot_variable_protos in slot_variables.items():
+    object_graph_proto.nodes[node_ids[trackable]].slot_variables.extend(
+        slot_variable_protos)
+  # Slot variables have no children.
+  for _ in range(len(object_graph_proto.nodes), len(trackable_objects)):
+    object_graph_proto.nodes.add()
+
+
 def _serialize_gathered_objects(graph_view,
                                 object_map=None,
                                 call_with_mapped_captures=None,
-                                saveables_cache=None):
+                                saveables_cache=None,
+                                object_graph_cache=None):
   """Create SaveableObjects and protos for gathered objects."""
-  trackable_objects, node_paths = graph_view.breadth_first_traversal()
-  object_names = object_identity.ObjectIdentityDictionary()
-  for obj, path in node_paths.items():
-    object_names[obj] = trackable_utils.object_path_to_string(path)
-  node_ids = object_identity.ObjectIdentityDictionary()
-  for node_id, node in enumerate(trackable_objects):
-    node_ids[node] = node_id
-  slot_variables = _serialize_slot_variables(
-      trackable_objects=trackable_objects,
-      node_ids=node_ids,
-      object_names=object_names)
-  object_graph_proto = _fill_object_graph_proto(
-      graph_view=graph_view,
-      trackable_objects=trackable_objects,
-      node_ids=node_ids,
-      slot_variables=slot_variables)
+  if object_graph_cache is None:
+    trackable_objects, node_paths = graph_view.breadth_first_traversal()
+    object_names = object_identity.ObjectIdentityDictionary()
+    for obj, path in node_paths.items():
+      object_names[obj] = trackable_utils.object_path_to_string(path)
+    node_ids = object_identity.ObjectIdentityDictionary()
+    for node_id, node in enumerate(trackable_objects):
+      node_ids[node] = node_id
+    slot_variables = _serialize_slot_variables(
+        trackable_objects=trackable_objects,
+        node_ids=node_ids,
+        object_names=object_names)
+    object_graph_proto = _fill_object_graph_proto(
+        graph_view=graph_view,
+        trackable_objects=trackable_objects,
+        node_ids=node_ids,
+        slot_variables=slot_variables)
+  else:
+    (trackable_objects, object_names, node_ids, optimizers,
+     object_graph_proto) = object_graph_cache.gather(graph_view)
+    slot_variables = _serialize_slot_variables(
+        trackable_objects=trackable_objects,
+        node_ids=node_ids,
+        object_names=object_names,
+        optimizers=optimizers)
+    _add_slot_variables_to_object_graph_proto(
+        trackable_objects=trackable_objects,
+        node_ids=node_ids,
+        slot_variables=slot_variables,
+        object_graph_proto=object_graph_proto)
   named_saveable_objects, feed_additions, registered_savers = (
       _add_attributes_to_object_graph(
           trackable_objects=trackable_objects,
@@ -373,10 +508,14 @@ def _serialize_gathered_objects(graph_view,
           registered_savers)
 
 
-def serialize_object_graph_with_registered_savers(graph_view, saveables_cache):
+def serialize_object_graph_with_registered_savers(graph_view,
+                                                  saveables_cache,
+                                                  object_graph_cache=None):
   """Determine checkpoint keys for variables and build a serialized graph."""
   return _serialize_gathered_objects(
-      graph_view, saveables_cache=saveables_cache)
+      graph_view,
+      saveables_cache=saveables_cache,
+      object_graph_cache=object_graph_cache)
 
 
 def frozen_saveables_and_savers(graph_view,
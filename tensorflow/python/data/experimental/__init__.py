@@ -32,6 +32,7 @@ See [Importing Data](https://tensorflow.org/guide/datasets) for an overview.
 @@DatasetStructure
 @@DistributeOptions
 @@ExternalStatePolicy
+@@IndexedTFRecordDataset
 @@OptimizationOptions
 @@Optional
 @@OptionalStructure
@@ -48,6 +49,7 @@ See [Importing Data](https://tensorflow.org/guide/datasets) for an overview.
 
 @@assert_cardinality
 @@bucket_by_sequence_length
+@@build_tf_record_index
 @@cardinality
 @@choose_from_datasets
 @@copy_to_device
@@ -56,6 +58,7 @@ See [Importing Data](https://tensorflow.org/guide/datasets) for an overview.
 @@distribute
 @@enable_debug_mode
 @@enumerate_dataset
+@@from_numpy_file
 @@from_variant
 @@get_next_as_optional
 @@get_single_element
@@ -73,6 +76,7 @@ See [Importing Data](https://tensorflow.org/guide/datasets) for an overview.
 @@parallel_interleave
 @@parse_example_dataset
 @@prefetch_to_device
+@@profile
 @@rejection_resample
 @@sample_from_datasets
 @@save
@@ -124,8 +128,12 @@ from tensorflow.python.data.experimental.ops.lookup_ops import table_from_datase
 from tensorflow.python.data.experimental.ops.parsing_ops import parse_example_dataset
 from tensorflow.python.data.experimental.ops.prefetching_ops import copy_to_device
 from tensorflow.python.data.experimental.ops.prefetching_ops import prefetch_to_device
+from tensorflow.python.data.experimental.ops.profiling import profile
 from tensorflow.python.data.experimental.ops.random_ops import RandomDataset
+from tensorflow.python.data.experimental.ops.readers import build_tf_record_index
 from tensorflow.python.data.experimental.ops.readers import CsvDataset
+from tensorflow.python.data.experimental.ops.readers import from_numpy_file
+from tensorflow.python.data.experimental.ops.readers import IndexedTFRecordDataset
 from tensorflow.python.data.experimental.ops.readers import make_batched_features_dataset
 from tensorflow.python.data.experimental.ops.readers import make_csv_dataset
 from tensorflow.python.data.experimental.ops.readers import SqlDataset
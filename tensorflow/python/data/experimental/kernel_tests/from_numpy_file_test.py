@@ -0,0 +1,127 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tf.data.experimental.from_numpy_file()`."""
+import os
+
+from absl.testing import parameterized
+import numpy as np
+
+from tensorflow.python.data.experimental.ops import readers
+from tensorflow.python.data.kernel_tests import test_base
+from tensorflow.python.framework import combinations
+from tensorflow.python.platform import test
+
+
+class FromNumpyFileTest(test_base.DatasetTestBase, parameterized.TestCase):
+
+  def _save(self, name, array):
+    path = os.path.join(self.get_temp_dir(), name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.save(path, array)
+    return path
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testRows(self):
+    array = np.arange(12, dtype=np.float32).reshape([6, 2])
+    path = self._save("rows.npy", array)
+    dataset = readers.from_numpy_file(path)
+    self.assertEqual([2], dataset.element_spec.shape.as_list())
+    self.assertDatasetProduces(dataset, list(array))
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testBatches(self):
+    array = np.arange(10, dtype=np.int64)
+    path = self._save("batches.npy", array)
+    dataset = readers.from_numpy_file(path, batch_size=4)
+    self.assertDatasetProduces(
+        dataset, [array[0:4], array[4:8], array[8:10]])
+
+    dataset = readers.from_numpy_file(path, batch_size=4, drop_remainder=True)
+    self.assertEqual([4], dataset.element_spec.shape.as_list())
+    self.assertDatasetProduces(dataset, [array[0:4], array[4:8]])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testDirectory(self):
+    first = np.arange(6, dtype=np.int32).reshape([3, 2])
+    second = np.arange(6, 10, dtype=np.int32).reshape([2, 2])
+    self._save("shards/b.npy", second)
+    path = self._save("shards/a.npy", first)
+    self._save("shards/empty.npy", np.zeros([0, 2], dtype=np.int32))
+    dataset = readers.from_numpy_file(os.path.dirname(path), batch_size=4)
+    self.assertDatasetProduces(
+        dataset, [np.concatenate([first, second[:1]]), second[1:]])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testShuffle(self):
+    first = np.arange(50, dtype=np.int64)
+    second = np.arange(50, 100, dtype=np.int64)
+    paths = [self._save("first.npy", first), self._save("second.npy", second)]
+    dataset = readers.from_numpy_file(paths, shuffle=True, seed=42)
+    self.assertDatasetProduces(
+        dataset, list(range(100)), assert_items_equal=True)
+
+    dataset = readers.from_numpy_file(
+        paths, batch_size=10, shuffle=True, seed=42)
+    elements = self.getDatasetOutput(dataset)
+    self.assertLen(elements, 10)
+    values = np.concatenate(elements)
+    self.assertCountEqual(range(100), values)
+    self.assertNotEqual(list(range(100)), list(values))
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testReshuffleEachIteration(self):
+    path = self._save("array.npy", np.arange(100, dtype=np.int64))
+    dataset = readers.from_numpy_file(path, shuffle=True, seed=42)
+    first = self.getDatasetOutput(dataset)
+    second = self.getDatasetOutput(dataset)
+    self.assertCountEqual(range(100), first)
+    self.assertCountEqual(range(100), second)
+    self.assertNotEqual(first, second)
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testShuffleEmptyFile(self):
+    path = self._save("empty.npy", np.zeros([0, 3], dtype=np.float32))
+    self.assertDatasetProduces(
+        readers.from_numpy_file(path, shuffle=True), [])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testNonNativeByteOrder(self):
+    array = np.arange(4, dtype=">i4")
+    path = self._save("big_endian.npy", array)
+    self.assertDatasetProduces(readers.from_numpy_file(path), [0, 1, 2, 3])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testMismatchedShapes(self):
+    paths = [self._save("a.npy", np.zeros([2, 3])),
+             self._save("b.npy", np.zeros([2, 4]))]
+    with self.assertRaisesRegex(ValueError, "same dtype and the same shape"):
+      readers.from_numpy_file(paths)
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testScalar(self):
+    path = self._save("scalar.npy", np.float32(1.))
+    with self.assertRaisesRegex(ValueError, "at least one dimension"):
+      readers.from_numpy_file(path)
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testEmptyDirectory(self):
+    directory = os.path.join(self.get_temp_dir(), "empty")
+    os.makedirs(directory, exist_ok=True)
+    with self.assertRaisesRegex(ValueError, "at least one `.npy` file"):
+      readers.from_numpy_file(directory)
+
+
+if __name__ == "__main__":
+  test.main()
@@ -0,0 +1,113 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tf.data.experimental.IndexedTFRecordDataset`."""
+import os
+
+from absl.testing import parameterized
+
+from tensorflow.python.data.experimental.ops import readers
+from tensorflow.python.data.kernel_tests import test_base
+from tensorflow.python.framework import combinations
+from tensorflow.python.lib.io import python_io
+from tensorflow.python.platform import test
+
+
+class IndexedTFRecordDatasetTest(test_base.DatasetTestBase,
+                                 parameterized.TestCase):
+
+  def setUp(self):
+    super(IndexedTFRecordDatasetTest, self).setUp()
+    self._records = [b"record %d" % i * (i + 1) for i in range(10)]
+    self._filenames = [
+        self._write("first.tfrecord", self._records[:4]),
+        self._write("empty.tfrecord", []),
+        self._write("second.tfrecord", self._records[4:]),
+    ]
+
+  def _write(self, name, records):
+    filename = os.path.join(self.get_temp_dir(), name)
+    with python_io.TFRecordWriter(filename) as writer:
+      for record in records:
+        writer.write(record)
+    return filename
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testRead(self):
+    self.assertEqual([4, 0, 6],
+                     readers.build_tf_record_index(self._filenames))
+    dataset = readers.IndexedTFRecordDataset(self._filenames)
+    self.assertEqual(10, dataset.num_records)
+    self.assertDatasetProduces(dataset, self._records)
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testAt(self):
+    readers.build_tf_record_index(self._filenames)
+    dataset = readers.IndexedTFRecordDataset(
+        self._filenames, shuffle=True, num_shards=2, shard_index=1)
+    for index in [9, 0, 4, 3, 5]:
+      self.assertEqual(self._records[index], dataset.at(index))
+    with self.assertRaises(IndexError):
+      dataset.at(10)
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testShuffle(self):
+    readers.build_tf_record_index(self._filenames)
+    dataset = readers.IndexedTFRecordDataset(
+        self._filenames, shuffle=True, seed=42)
+    self.assertDatasetProduces(
+        dataset, self._records, assert_items_equal=True)
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testShards(self):
+    readers.build_tf_record_index(self._filenames)
+    for shard_index in range(3):
+      dataset = readers.IndexedTFRecordDataset(
+          self._filenames, num_shards=3, shard_index=shard_index)
+      self.assertDatasetProduces(dataset, self._records[shard_index::3])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testShuffledShards(self):
+    readers.build_tf_record_index(self._filenames)
+    for shard_index in range(3):
+      dataset = readers.IndexedTFRecordDataset(
+          self._filenames,
+          shuffle=True,
+          seed=42,
+          num_shards=3,
+          shard_index=shard_index)
+      self.assertDatasetProduces(
+          dataset, self._records[shard_index::3], assert_items_equal=True)
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testMissingIndex(self):
+    with self.assertRaisesRegex(ValueError, "has no index"):
+      readers.IndexedTFRecordDataset(self._filenames[0])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testOutOfDateIndex(self):
+    readers.build_tf_record_index(self._filenames[0])
+    self._write("first.tfrecord", self._records[:3])
+    with self.assertRaisesRegex(ValueError, "out of date"):
+      readers.IndexedTFRecordDataset(self._filenames[0])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testShardIndexWithoutNumShards(self):
+    readers.build_tf_record_index(self._filenames)
+    with self.assertRaisesRegex(ValueError, "must be set together"):
+      readers.IndexedTFRecordDataset(self._filenames, shard_index=0)
+
+
+if __name__ == "__main__":
+  test.main()
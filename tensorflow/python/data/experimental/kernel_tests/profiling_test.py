@@ -0,0 +1,117 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tf.data.experimental.profile()`."""
+import json
+import time
+
+from absl.testing import parameterized
+
+from tensorflow.python.data.experimental.ops import profiling
+from tensorflow.python.data.kernel_tests import test_base
+from tensorflow.python.data.ops import dataset_ops
+from tensorflow.python.framework import combinations
+from tensorflow.python.framework import dtypes
+from tensorflow.python.ops import script_ops
+from tensorflow.python.platform import test
+
+
+class ProfileTest(test_base.DatasetTestBase, parameterized.TestCase):
+
+  @combinations.generate(test_base.v2_eager_only_combinations())
+  def testStages(self):
+    dataset = dataset_ops.Dataset.range(100)
+    dataset = dataset.map(lambda x: x * 2)
+    dataset = dataset.batch(4)
+    dataset = dataset.prefetch(1)
+    pipeline_profile = profiling.profile(dataset, num_elements=10)
+
+    stages = pipeline_profile.stages
+    self.assertEqual(["Range", "Map", "Batch", "Prefetch"],
+                     [stage.name for stage in stages])
+    self.assertEqual([[], [0], [1], [2]], [stage.inputs for stage in stages])
+    self.assertEqual([10] * 4, [stage.num_elements for stage in stages])
+    self.assertEqual([None, 1., 4., 1.],
+                     [stage.input_ratio for stage in stages])
+    self.assertEqual([4., 4., 1., 1.],
+                     [stage.output_ratio for stage in stages])
+    for stage in stages:
+      self.assertGreater(stage.elements_per_second, 0)
+      self.assertEqual([50, 90, 99], sorted(stage.latency_percentiles))
+      self.assertBetween(stage.input_wait_fraction, 0., 1.)
+    self.assertEqual(0., stages[0].input_wait_fraction)
+    self.assertEqual([None] * 3,
+                     [stage.buffered_fraction for stage in stages[:3]])
+    self.assertBetween(stages[3].buffered_fraction, 0., 1.)
+
+    report = json.loads(pipeline_profile.to_json())
+    self.assertEqual(["Range", "Map", "Batch", "Prefetch"],
+                     [stage["name"] for stage in report["stages"]])
+    self.assertIn("3 Prefetch", str(pipeline_profile))
+
+  @combinations.generate(test_base.v2_eager_only_combinations())
+  def testBottleneck(self):
+
+    def slow(x):
+      time.sleep(0.01)
+      return x
+
+    dataset = dataset_ops.Dataset.range(100)
+    dataset = dataset.map(
+        lambda x: script_ops.py_func(slow, [x], dtypes.int64))
+    dataset = dataset.batch(2)
+    pipeline_profile = profiling.profile(dataset, num_elements=5)
+    self.assertEqual("Map", pipeline_profile.bottleneck.name)
+    self.assertIn("bottleneck: 1 Map", str(pipeline_profile))
+    self.assertEqual(1, json.loads(pipeline_profile.to_json())["bottleneck"])
+
+  @combinations.generate(test_base.v2_eager_only_combinations())
+  def testMultipleInputs(self):
+    dataset = dataset_ops.Dataset.zip(
+        (dataset_ops.Dataset.range(5), dataset_ops.Dataset.range(5)))
+    pipeline_profile = profiling.profile(dataset, num_elements=10)
+    stages = pipeline_profile.stages
+    self.assertEqual(["Range", "Range", "Zip"],
+                     [stage.name for stage in stages])
+    self.assertEqual([[], [], [0, 1]], [stage.inputs for stage in stages])
+    self.assertEqual([5] * 3, [stage.num_elements for stage in stages])
+    self.assertIsNone(stages[2].input_wait_fraction)
+    self.assertIsNone(stages[0].output_ratio)
+    self.assertIn("2 Zip <- 0,1", str(pipeline_profile))
+
+  @combinations.generate(test_base.v2_eager_only_combinations())
+  def testSingleElement(self):
+    pipeline_profile = profiling.profile(
+        dataset_ops.Dataset.range(1), num_elements=10)
+    stage, = pipeline_profile.stages
+    self.assertEqual(1, stage.num_elements)
+    self.assertIsNotNone(stage.first_element_seconds)
+    self.assertIsNone(stage.elements_per_second)
+    self.assertEqual({}, stage.latency_percentiles)
+    self.assertIsNone(pipeline_profile.bottleneck)
+    json.loads(pipeline_profile.to_json())
+
+  @combinations.generate(test_base.v2_eager_only_combinations())
+  def testInvalidNumElements(self):
+    with self.assertRaisesRegex(ValueError, "at least 2"):
+      profiling.profile(dataset_ops.Dataset.range(10), num_elements=1)
+
+  @combinations.generate(test_base.graph_only_combinations())
+  def testGraphMode(self):
+    with self.assertRaisesRegex(RuntimeError, "executing eagerly"):
+      profiling.profile(dataset_ops.Dataset.range(10))
+
+
+if __name__ == "__main__":
+  test.main()
@@ -0,0 +1,354 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Profiling of the transformations of input pipelines."""
+import json
+import time
+
+import numpy as np
+
+from tensorflow.python.data.ops import dataset_ops
+from tensorflow.python.eager import context
+from tensorflow.python.util.tf_export import tf_export
+
+# pylint: disable=protected-access
+# Transformations that consume one input element per element they produce.
+_ONE_TO_ONE_DATASETS = (
+    dataset_ops.CacheDataset,
+    dataset_ops.DatasetV1Adapter,
+    dataset_ops.MapDataset,
+    dataset_ops.ParallelMapDataset,
+    dataset_ops.PrefetchDataset,
+    dataset_ops.RepeatDataset,
+    dataset_ops.ShuffleDataset,
+    dataset_ops.TakeDataset,
+    dataset_ops._OptionsDataset,
+    dataset_ops._RestructuredDataset,
+)
+# pylint: enable=protected-access
+
+_BATCH_DATASETS = (
+    dataset_ops.BatchDataset,
+    dataset_ops.PaddedBatchDataset,
+    dataset_ops.ParallelBatchDataset,
+)
+
+# Transformations that produce elements into a buffer, ahead of their consumer.
+_ASYNC_DATASETS = (
+    dataset_ops.ParallelBatchDataset,
+    dataset_ops.ParallelInterleaveDataset,
+    dataset_ops.ParallelMapDataset,
+    dataset_ops.PrefetchDataset,
+)
+
+_PERCENTILES = (50, 90, 99)
+
+
+class StageProfile(object):
+  """The measurements of one transformation of a profiled pipeline.
+
+  Each transformation is measured by iterating over the pipeline that ends
+  with it, on its own, so that its rate is the rate at which the pipeline could
+  produce elements if the later transformations were free.
+
+  Attributes:
+    name: The name of the transformation, e.g. "ParallelMap".
+    inputs: The indices of the input transformations in
+      `PipelineProfile.stages`.
+    num_elements: The number of elements produced while profiling.
+    first_element_seconds: The time taken to create an iterator and to produce
+      the first element, which includes filling buffers and caches.
+    elements_per_second: The rate at which the other elements were produced,
+      or None if there are none.
+    latency_percentiles: A dict mapping the percentiles 50, 90 and 99 to the
+      time taken to produce the other elements, in seconds.
+    input_ratio: The number of input elements consumed per element produced,
+      or None if it is unknown, e.g. for `filter`.
+    output_ratio: The number of elements of this transformation consumed per
+      element produced by the pipeline, or None if it is unknown.
+    input_wait_fraction: The estimated fraction of the time spent producing an
+      element that is spent waiting for the input elements, or None if
+      unknown. 0 for the sources of the pipeline.
+    buffered_fraction: For transformations that produce elements ahead of
+      their consumer, e.g. `prefetch` or `map` with `num_parallel_calls`, the
+      fraction of elements that were buffered when requested, i.e. produced
+      in less than half the time the input takes to produce them. None for
+      other transformations, or if unknown.
+  """
+
+  __slots__ = ("name", "inputs", "num_elements", "first_element_seconds",
+               "elements_per_second", "latency_percentiles", "input_ratio",
+               "output_ratio", "input_wait_fraction", "buffered_fraction")
+
+  def __init__(self, name, inputs, latencies):
+    self.name = name
+    self.inputs = inputs
+    self.num_elements = len(latencies)
+    self.first_element_seconds = latencies[0] if latencies else None
+    steady_latencies = np.array(latencies[1:], dtype=np.float64)
+    if steady_latencies.size and steady_latencies.sum() > 0:
+      self.elements_per_second = steady_latencies.size / steady_latencies.sum()
+      self.latency_percentiles = dict(
+          zip(_PERCENTILES, np.percentile(steady_latencies, _PERCENTILES)))
+    else:
+      self.elements_per_second = None
+      self.latency_percentiles = {}
+    self.input_ratio = None
+    self.output_ratio = None
+    self.input_wait_fraction = None
+    self.buffered_fraction = None
+
+  @property
+  def self_seconds_per_element(self):
+    """The estimated time spent producing an element, besides waiting for input.
+
+    Returns:
+      A number of seconds, or None if unknown.
+    """
+    if not self.elements_per_second or self.input_wait_fraction is None:
+      return None
+    return (1. - self.input_wait_fraction) / self.elements_per_second
+
+  def to_dict(self):
+    """Returns the measurements as a JSON-serializable dict."""
+    result = {name: getattr(self, name) for name in self.__slots__}
+    result["latency_percentiles"] = {
+        str(percentile): float(latency)
+        for percentile, latency in self.latency_percentiles.items()}
+    result["self_seconds_per_element"] = self.self_seconds_per_element
+    return result
+
+
+class PipelineProfile(object):
+  """The measurements of the transformations of an input pipeline.
+
+  Returned by `tf.data.experimental.profile`. `str()` formats them as a table.
+
+  Attributes:
+    stages: A list of `StageProfile`s, with the inputs of each transformation
+      before it, and the last transformation of the pipeline last.
+  """
+
+  def __init__(self, stages):
+    self.stages = stages
+
+  @property
+  def bottleneck(self):
+    """The transformation that takes the most time per pipeline element.
+
+    Only considers the transformations whose `self_seconds_per_element` and
+    `output_ratio` are known.
+
+    Returns:
+      A `StageProfile`, or None if no transformation can be compared.
+    """
+    best, best_seconds = None, None
+    for stage in self.stages:
+      seconds = stage.self_seconds_per_element
+      if seconds is None or stage.output_ratio is None:
+        continue
+      seconds *= stage.output_ratio
+      if best_seconds is None or seconds > best_seconds:
+        best, best_seconds = stage, seconds
+    return best
+
+  def to_json(self):
+    """Returns the measurements as a JSON string."""
+    bottleneck = self.bottleneck
+    return json.dumps({
+        "stages": [stage.to_dict() for stage in self.stages],
+        "bottleneck": (self.stages.index(bottleneck)
+                       if bottleneck is not None else None),
+    })
+
+  def __str__(self):
+    header = ("stage", "elements", "elements/s", "p50 ms", "p90 ms", "p99 ms",
+              "input wait", "buffered")
+    rows = []
+    for index, stage in enumerate(self.stages):
+      name = "%d %s" % (index, stage.name)
+      if stage.inputs and stage.inputs != [index - 1]:
+        name += " <- %s" % ",".join(str(i) for i in stage.inputs)
+      rows.append((
+          name,
+          str(stage.num_elements),
+          _format(stage.elements_per_second, "%.1f"),
+          _format(stage.latency_percentiles.get(50), "%.3f", scale=1e3),
+          _format(stage.latency_percentiles.get(90), "%.3f", scale=1e3),
+          _format(stage.latency_percentiles.get(99), "%.3f", scale=1e3),
+          _format(stage.input_wait_fraction, "%.0f%%", scale=100),
+          _format(stage.buffered_fraction, "%.0f%%", scale=100),
+      ))
+    widths = [max(len(row[i]) for row in [header] + rows)
+              for i in range(len(header))]
+    lines = []
+    for row in [header] + rows:
+      cells = [row[0].ljust(widths[0])]
+      cells.extend(cell.rjust(width) for cell, width in zip(row[1:],
+                                                             widths[1:]))
+      lines.append("  ".join(cells))
+    bottleneck = self.bottleneck
+    if bottleneck is not None:
+      lines.append("bottleneck: %d %s" % (self.stages.index(bottleneck),
+                                          bottleneck.name))
+    return "\n".join(lines)
+
+
+def _format(value, fmt, scale=1):
+  if value is None:
+    return "-"
+  return fmt % (value * scale)
+
+
+def _stage_name(dataset):
+  name = type(dataset).__name__.lstrip("_")
+  if name.endswith("Dataset") and name != "Dataset":
+    name = name[:-len("Dataset")]
+  return name
+
+
+def _pipeline_datasets(dataset):
+  """Returns the datasets of a pipeline, inputs first, and their inputs."""
+  datasets = []
+  inputs = []
+  indices = {}
+
+  def visit(ds):
+    if id(ds) not in indices:
+      # pylint: disable=protected-access
+      input_indices = [visit(input_ds) for input_ds in ds._inputs()]
+      # pylint: enable=protected-access
+      indices[id(ds)] = len(datasets)
+      datasets.append(ds)
+      inputs.append(input_indices)
+    return indices[id(ds)]
+
+  visit(dataset)
+  return datasets, inputs
+
+
+def _input_ratio(dataset, input_dataset):
+  """Returns the number of input elements consumed per element, if known."""
+  if isinstance(dataset, _ONE_TO_ONE_DATASETS):
+    return 1.
+  if isinstance(dataset, _BATCH_DATASETS):
+    return float(dataset._batch_size)  # pylint: disable=protected-access
+  cardinality = int(dataset.cardinality())
+  input_cardinality = int(input_dataset.cardinality())
+  if cardinality > 0 and input_cardinality > 0:
+    return input_cardinality / cardinality
+  return None
+
+
+def _measure_latencies(dataset, num_elements):
+  """Returns the times taken to produce the first elements of `dataset`."""
+  latencies = []
+  start = time.perf_counter()
+  iterator = iter(dataset)
+  for _ in range(num_elements):
+    try:
+      next(iterator)
+    except StopIteration:
+      break
+    end = time.perf_counter()
+    latencies.append(end - start)
+    start = end
+  return latencies
+
+
+@tf_export("data.experimental.profile")
+def profile(dataset, num_elements=100):
+  """Measures how fast each transformation of an input pipeline is.
+
+  Iterates over the pipeline that ends with each transformation of `dataset`,
+  from its sources to `dataset` itself, and measures the rate at which each
+  produces `num_elements` elements. Comparing the rate of a transformation with
+  the rate of its input shows the fraction of the time it spends waiting for
+  its input, and the transformation that spends the most time per element of
+  `dataset` on its own is reported as the bottleneck:
+
+  ```python
+  dataset = tf.data.Dataset.range(1000)
+  dataset = dataset.map(parse, num_parallel_calls=tf.data.AUTOTUNE)
+  dataset = dataset.batch(32).prefetch(1)
+  pipeline_profile = tf.data.experimental.profile(dataset, num_elements=20)
+  print(pipeline_profile)
+  print(pipeline_profile.bottleneck.name)
+  ```
+
+  The pipeline is iterated over once per transformation, so that the
+  transformations earlier in the pipeline produce more elements than
+  `num_elements` in total, and side effects of the pipeline happen several
+  times. The measurements are wall times, which are affected by anything else
+  running on the host.
+
+  Args:
+    dataset: A `tf.data.Dataset` to profile.
+    num_elements: The number of elements to produce from each transformation.
+      At least 2, since the first element, which fills buffers and caches, is
+      measured separately.
+
+  Returns:
+    A `PipelineProfile`, with the measurements of each transformation in its
+    `stages` attribute, which can be formatted as a table with `str()` or as
+    JSON with `to_json()`.
+
+  Raises:
+    RuntimeError: If not executing eagerly.
+    ValueError: If `num_elements` is less than 2.
+  """
+  if not context.executing_eagerly():
+    raise RuntimeError("`tf.data.experimental.profile` is only supported when "
+                       "executing eagerly.")
+  if num_elements < 2:
+    raise ValueError("`num_elements` must be at least 2, got "
+                     f"{num_elements}.")
+  datasets, inputs = _pipeline_datasets(dataset)
+  all_latencies = [_measure_latencies(ds, num_elements) for ds in datasets]
+  stages = [
+      StageProfile(_stage_name(ds), input_indices, latencies)
+      for ds, input_indices, latencies in zip(datasets, inputs, all_latencies)
+  ]
+
+  for ds, stage, latencies in zip(datasets, stages, all_latencies):
+    if not stage.inputs:
+      stage.input_wait_fraction = 0.
+    if len(stage.inputs) != 1:
+      continue
+    input_index = stage.inputs[0]
+    input_stage = stages[input_index]
+    stage.input_ratio = _input_ratio(ds, datasets[input_index])
+    if (stage.input_ratio is None or not stage.elements_per_second or
+        not input_stage.elements_per_second):
+      continue
+    stage.input_wait_fraction = min(
+        1., stage.input_ratio * stage.elements_per_second /
+        input_stage.elements_per_second)
+    if isinstance(ds, _ASYNC_DATASETS) and input_stage.latency_percentiles:
+      # An element was buffered if it was produced faster than the input
+      # could produce it.
+      threshold = 0.5 * stage.input_ratio * input_stage.latency_percentiles[50]
+      stage.buffered_fraction = (
+          sum(latency < threshold for latency in latencies[1:]) /
+          (len(latencies) - 1))
+
+  # Propagates the number of elements consumed per output element from the
+  # output to the sources, through transformations with a single input.
+  stages[-1].output_ratio = 1.
+  for stage in reversed(stages):
+    if (len(stage.inputs) == 1 and stage.output_ratio is not None and
+        stage.input_ratio is not None):
+      stages[stage.inputs[0]].output_ratio = (
+          stage.output_ratio * stage.input_ratio)
+  return PipelineProfile(stages)
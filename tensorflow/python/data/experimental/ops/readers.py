@@ -17,6 +17,9 @@ import collections
 import csv
 import functools
 import gzip
+import io
+import os
+import threading
 
 import numpy as np
 
@@ -28,14 +31,20 @@ from tensorflow.python.data.ops import options as options_lib
 from tensorflow.python.data.ops import readers as core_readers
 from tensorflow.python.data.util import convert
 from tensorflow.python.data.util import nest
+from tensorflow.python.data.util import random_seed
 from tensorflow.python.framework import constant_op
 from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import ops
+from tensorflow.python.framework import tensor_shape
 from tensorflow.python.framework import tensor_spec
 from tensorflow.python.framework import tensor_util
 from tensorflow.python.lib.io import file_io
+from tensorflow.python.lib.io import tf_record
 from tensorflow.python.ops import gen_experimental_dataset_ops
 from tensorflow.python.ops import io_ops
+from tensorflow.python.ops import math_ops
+from tensorflow.python.ops import script_ops
+from tensorflow.python.ops import stateless_random_ops
 from tensorflow.python.platform import gfile
 from tensorflow.python.util.tf_export import tf_export
 
@@ -1201,6 +1210,397 @@ class SqlDatasetV1(dataset_ops.DatasetV1Adapter):
     super(SqlDatasetV1, self).__init__(wrapped)
 
 
+# The number of rows read by each call to NumPy when elements are not batched.
+_NUMPY_ROWS_PER_READ = 1024
+
+
+class _NumpyFiles(object):
+  """Memory-maps `.npy` files, and reads their rows as if concatenated."""
+
+  def __init__(self, paths):
+    if not paths:
+      raise ValueError("`path` must name at least one `.npy` file.")
+    self._arrays = []
+    for path in paths:
+      try:
+        array = np.load(path, mmap_mode="r", allow_pickle=False)
+      except ValueError as e:
+        raise ValueError(f"Can't memory-map the `.npy` file {path}: {e}")
+      if array.ndim < 1:
+        raise ValueError(f"The array in {path} must have at least one "
+                         f"dimension, got shape {array.shape}.")
+      if self._arrays and (array.dtype != self._arrays[0].dtype or
+                           array.shape[1:] != self._arrays[0].shape[1:]):
+        raise ValueError(
+            f"The arrays in {paths[0]} and {path} must have the same dtype "
+            "and the same shape besides their first dimension, got "
+            f"{self._arrays[0].dtype}{list(self._arrays[0].shape)} and "
+            f"{array.dtype}{list(array.shape)}.")
+      self._arrays.append(array)
+    # Converts e.g. big-endian values to the native byte order when copying.
+    self.dtype = self._arrays[0].dtype.newbyteorder("=")
+    self.row_shape = self._arrays[0].shape[1:]
+    self._offsets = np.cumsum([0] + [array.shape[0] for array in self._arrays])
+    self.num_rows = int(self._offsets[-1])
+
+  def read(self, indices):
+    """Returns the rows at `indices`, copying only them out of the files."""
+    rows = np.empty((len(indices),) + self.row_shape, dtype=self.dtype)
+    file_indices = np.searchsorted(self._offsets, indices, side="right") - 1
+    for file_index in np.unique(file_indices):
+      mask = file_indices == file_index
+      local_indices = indices[mask] - self._offsets[file_index]
+      array = self._arrays[file_index]
+      if np.all(np.diff(local_indices) == 1):
+        # Contiguous rows are read with a single slice of the mapping.
+        rows[mask] = array[local_indices[0]:local_indices[-1] + 1]
+      else:
+        rows[mask] = array[local_indices]
+    return rows
+
+
+def _shuffled_range(num_elements, seed):
+  """Returns a `Dataset` permuting `range(num_elements)` anew each iteration.
+
+  Unlike `Dataset.range(num_elements).shuffle(num_elements)`, nothing is
+  buffered: the element at each position is computed by
+  `tf.random.experimental.index_shuffle`, with a seed drawn once per iteration.
+  """
+  seed, seed2 = random_seed.get_seed(seed)
+  lock = threading.Lock()
+  generator = []
+
+  def next_seed(seed, seed2):
+    with lock:
+      if not generator:
+        entropy = None if seed == 0 and seed2 == 0 else [seed, seed2]
+        generator.append(np.random.default_rng(entropy))
+      return generator[0].integers(
+          np.iinfo(np.int64).max, size=2, dtype=np.int64)
+
+  def permutation(_):
+    iteration_seed = script_ops.numpy_function(next_seed, [seed, seed2],
+                                               dtypes.int64)
+    iteration_seed.set_shape([2])
+
+    def shuffle_index(index):
+      return stateless_random_ops.index_shuffle(index, iteration_seed,
+                                                num_elements - 1)
+
+    return dataset_ops.Dataset.range(num_elements).map(shuffle_index)
+
+  return dataset_ops.Dataset.from_tensors(0).flat_map(permutation)
+
+
+def _numpy_file_paths(path):
+  """Returns the `.npy` files named by `path`, in order."""
+  if isinstance(path, (list, tuple)):
+    paths = []
+    for p in path:
+      paths.extend(_numpy_file_paths(p))
+    return paths
+  path = os.fspath(path)
+  if gfile.IsDirectory(path):
+    return sorted(gfile.Glob(os.path.join(path, "*.npy")))
+  return [path]
+
+
+@tf_export("data.experimental.from_numpy_file", v1=[])
+def from_numpy_file(path,
+                    batch_size=None,
+                    drop_remainder=False,
+                    shuffle=False,
+                    seed=None):
+  """Creates a `Dataset` of the rows of arrays stored in `.npy` files.
+
+  Unlike `tf.data.Dataset.from_tensor_slices`, which copies a NumPy array into
+  a constant of the graph, the files are memory-mapped, and only the rows of
+  each element are copied out of them when the element is produced. This
+  makes it possible to iterate over arrays larger than the host memory:
+
+  ```python
+  np.save("/tmp/features.npy", np.random.rand(100000, 128))
+  dataset = tf.data.experimental.from_numpy_file(
+      "/tmp/features.npy", batch_size=256, shuffle=True)
+  for batch in dataset:
+    ...  # A float64 tensor of shape [256, 128], except for the last batch.
+  ```
+
+  Several files, e.g. the shards of a large array, are read as if their
+  arrays were concatenated along their first dimension. Files must be on a
+  local filesystem, and the arrays must not hold Python objects.
+
+  The rows are read by a `tf.numpy_function`, so that the dataset can't be
+  serialized, e.g. for `tf.data` service or for a SavedModel.
+
+  Args:
+    path: The path to a `.npy` file, to a directory whose `.npy` files are read
+      in sorted order, or a list of such paths.
+    batch_size: (Optional.) A `tf.int64` scalar. If set, each element is a
+      batch of this many consecutive rows, which are read with a single slice
+      of the file when not shuffled. Otherwise, each element is a row.
+    drop_remainder: (Optional.) A `tf.bool` scalar. Applies when `batch_size`
+      is set. Whether the last batch should be dropped in the case it has
+      fewer than `batch_size` rows. Defaults to `False`.
+    shuffle: (Optional.) A `tf.bool` scalar. If `True`, the rows are read in a
+      random order, which changes with each iteration over the dataset. Unlike
+      `tf.data.Dataset.shuffle`, no buffer of rows or of indices is filled
+      before the first element is produced. Defaults to `False`.
+    seed: (Optional.) A `tf.int64` scalar, the random seed used to shuffle the
+      rows. See `tf.random.set_seed` for behavior.
+
+  Returns:
+    A `Dataset` of the rows, or of batches of rows.
+
+  Raises:
+    ValueError: If no file is named, or if the arrays can't be memory-mapped,
+      have no dimension, or have different dtypes or row shapes.
+  """
+  numpy_files = _NumpyFiles(_numpy_file_paths(path))
+  dtype = dtypes.as_dtype(numpy_files.dtype)
+  row_shape = tensor_shape.TensorShape(numpy_files.row_shape)
+
+  if shuffle:
+    dataset = _shuffled_range(numpy_files.num_rows, seed)
+  else:
+    dataset = dataset_ops.Dataset.range(numpy_files.num_rows)
+  if batch_size is None:
+    dataset = dataset.batch(_NUMPY_ROWS_PER_READ)
+  else:
+    dataset = dataset.batch(batch_size, drop_remainder=drop_remainder)
+
+  def read(indices):
+    rows = script_ops.numpy_function(numpy_files.read, [indices], dtype)
+    rows.set_shape(indices.shape.concatenate(row_shape))
+    return rows
+
+  dataset = dataset.map(read, num_parallel_calls=dataset_ops.AUTOTUNE)
+  if batch_size is None:
+    dataset = dataset.unbatch()
+  return dataset
+
+
+# Appended to the name of a TFRecord file to name its index.
+_TF_RECORD_INDEX_SUFFIX = ".index"
+
+
+def _tf_record_filenames(filenames):
+  if isinstance(filenames, (str, bytes, os.PathLike)):
+    filenames = [filenames]
+  return [os.fspath(filename) for filename in filenames]
+
+
+@tf_export("data.experimental.build_tf_record_index", v1=[])
+def build_tf_record_index(filenames, num_parallel_reads=None):
+  """Writes the offsets of the records of TFRecord files next to them.
+
+  Scans each file once, many files at a time, and writes the offsets of its
+  records to a file named like it, with an ".index" suffix, which
+  `IndexedTFRecordDataset` reads. The index must be built again whenever the
+  file changes.
+
+  >>> import tempfile
+  >>> filename = os.path.join(tempfile.mkdtemp(), "data.tfrecord")
+  >>> with tf.io.TFRecordWriter(filename) as writer:
+  ...   for record in [b"a", b"b", b"c"]:
+  ...     writer.write(record)
+  >>> tf.data.experimental.build_tf_record_index(filename)
+  [3]
+
+  Args:
+    filenames: The name of an uncompressed TFRecord file, or a list of them.
+    num_parallel_reads: (Optional.) The number of files scanned at a time.
+      Defaults to 32, or to the number of files if fewer.
+
+  Returns:
+    A list of the numbers of records of the files.
+
+  Raises:
+    DataLossError: If a file is corrupted or truncated.
+    ValueError: If `num_parallel_reads` is not positive.
+  """
+
+  def build_index(filename):
+    reader = tf_record.tf_record_random_reader(filename)
+    offsets = [0]
+    try:
+      while True:
+        try:
+          _, offset = reader.read(offsets[-1])
+        except IndexError:
+          break
+        offsets.append(offset)
+    finally:
+      reader.close()
+    # The last offset is the end of the last record, i.e. the file size.
+    index = io.BytesIO()
+    np.save(index, np.array(offsets, dtype="<i8"))
+    file_io.atomic_write_string_to_file(filename + _TF_RECORD_INDEX_SUFFIX,
+                                        index.getvalue())
+    return len(offsets) - 1
+
+  return tf_record.map_files(build_index, _tf_record_filenames(filenames),
+                             num_parallel_reads)
+
+
+class _IndexedTFRecordFiles(object):
+  """Reads the records of TFRecord files by their index among all records."""
+
+  def __init__(self, filenames):
+    if not filenames:
+      raise ValueError("`filenames` must name at least one TFRecord file.")
+    self._filenames = filenames
+    self._offsets = []
+    for filename in filenames:
+      index_filename = filename + _TF_RECORD_INDEX_SUFFIX
+      if not gfile.Exists(index_filename):
+        raise ValueError(
+            f"The TFRecord file {filename} has no index. Use "
+            "`tf.data.experimental.build_tf_record_index` to build it.")
+      offsets = np.load(
+          io.BytesIO(
+              file_io.read_file_to_string(index_filename, binary_mode=True)),
+          allow_pickle=False)
+      if offsets[-1] != file_io.stat(filename).length:
+        raise ValueError(
+            f"The index of the TFRecord file {filename} is out of date. Use "
+            "`tf.data.experimental.build_tf_record_index` to build it again.")
+      self._offsets.append(offsets)
+    self._starts = np.cumsum([0] + [len(offsets) - 1
+                                    for offsets in self._offsets])
+    self.num_records = int(self._starts[-1])
+    # Readers are opened on first use, and are not thread-safe.
+    self._readers = [None] * len(filenames)
+    self._locks = [threading.Lock() for _ in filenames]
+
+  def read(self, index):
+    """Returns the record at `index`."""
+    if not 0 <= index < self.num_records:
+      raise IndexError(f"Record index {index} is out of range for "
+                       f"{self.num_records} records.")
+    file_index = int(np.searchsorted(self._starts, index, side="right")) - 1
+    offset = int(self._offsets[file_index][index - self._starts[file_index]])
+    with self._locks[file_index]:
+      if self._readers[file_index] is None:
+        # Reads are at scattered offsets, where read-ahead would be wasted.
+        self._readers[file_index] = tf_record.tf_record_random_reader(
+            self._filenames[file_index], buffer_size=0)
+      record, _ = self._readers[file_index].read(offset)
+    return record
+
+
+@tf_export("data.experimental.IndexedTFRecordDataset", v1=[])
+class IndexedTFRecordDataset(dataset_ops.DatasetV2):
+  """A `Dataset` of the records of TFRecord files, read by their index.
+
+  Unlike `tf.data.TFRecordDataset`, which reads files from start to end, the
+  records are read at the offsets stored by
+  `tf.data.experimental.build_tf_record_index`. This makes it possible to
+  shuffle all the records, rather than those in a buffer, to split them into
+  shards with the same number of records, and to read any record with `at`,
+  without reading the records before it.
+
+  >>> import tempfile
+  >>> filename = os.path.join(tempfile.mkdtemp(), "data.tfrecord")
+  >>> with tf.io.TFRecordWriter(filename) as writer:
+  ...   for record in [b"a", b"b", b"c", b"d"]:
+  ...     writer.write(record)
+  >>> _ = tf.data.experimental.build_tf_record_index(filename)
+  >>> dataset = tf.data.experimental.IndexedTFRecordDataset(
+  ...     filename, num_shards=2, shard_index=1)
+  >>> list(dataset.as_numpy_iterator())
+  [b'b', b'd']
+  >>> dataset.at(2)
+  b'c'
+
+  The records are read by a `tf.numpy_function`, so that the dataset can't be
+  serialized, e.g. for `tf.data` service or for a SavedModel.
+  """
+
+  def __init__(self,
+               filenames,
+               shuffle=False,
+               seed=None,
+               num_shards=None,
+               shard_index=None):
+    """Creates a `IndexedTFRecordDataset` to read indexed TFRecord files.
+
+    Args:
+      filenames: The name of an uncompressed TFRecord file, or a list of them,
+        indexed by `tf.data.experimental.build_tf_record_index`.
+      shuffle: (Optional.) A `tf.bool` scalar. If `True`, the records of all
+        files are read in a random order, which changes with each iteration
+        over the dataset. Unlike `tf.data.Dataset.shuffle`, no buffer of records
+        or of indices is filled before the first record is read. Defaults to
+        `False`.
+      seed: (Optional.) A `tf.int64` scalar, the random seed used to shuffle the
+        records. See `tf.random.set_seed` for behavior.
+      num_shards: (Optional.) A `tf.int64` scalar. If set, only every
+        `num_shards`-th record, starting with the `shard_index`-th, is read, so
+        that the shards differ by at most one record.
+      shard_index: (Optional.) A `tf.int64` scalar, the shard to read. Must be
+        set if `num_shards` is.
+
+    Raises:
+      ValueError: If no file is named, if a file has no index or if its index
+        is out of date, or if only one of `num_shards` and `shard_index` is
+        set.
+    """
+    if (num_shards is None) != (shard_index is None):
+      raise ValueError("`num_shards` and `shard_index` must be set together, "
+                       f"got {num_shards} and {shard_index}.")
+    self._records = _IndexedTFRecordFiles(_tf_record_filenames(filenames))
+
+    if shuffle:
+      dataset = _shuffled_range(self._records.num_records, seed)
+      if num_shards is not None:
+        # Keeps the same records in each shard as without shuffling.
+        dataset = dataset.filter(
+            lambda index: math_ops.equal(index % num_shards, shard_index))
+    else:
+      dataset = dataset_ops.Dataset.range(self._records.num_records)
+      if num_shards is not None:
+        dataset = dataset.shard(num_shards, shard_index)
+
+    def read(index):
+      record = script_ops.numpy_function(self._records.read, [index],
+                                         dtypes.string)
+      record.set_shape([])
+      return record
+
+    self._impl = dataset.map(read, num_parallel_calls=dataset_ops.AUTOTUNE)
+    super(IndexedTFRecordDataset, self).__init__(
+        self._impl._variant_tensor)  # pylint: disable=protected-access
+
+  @property
+  def num_records(self):
+    """The number of records of all the files."""
+    return self._records.num_records
+
+  def at(self, index):
+    """Reads the record at `index` among the records of all the files.
+
+    The index does not depend on `shuffle` or on the shard.
+
+    Args:
+      index: An integer in `[0, num_records)`.
+
+    Returns:
+      The record, as `bytes`.
+
+    Raises:
+      IndexError: If `index` is out of range.
+    """
+    return self._records.read(index)
+
+  def _inputs(self):
+    return self._impl._inputs()  # pylint: disable=protected-access
+
+  @property
+  def element_spec(self):
+    return tensor_spec.TensorSpec([], dtypes.string)
+
+
 if tf2.enabled():
   CsvDataset = CsvDatasetV2
   SqlDataset = SqlDatasetV2
@@ -523,6 +523,118 @@ class FromGeneratorTest(test_base.DatasetTestBase, parameterized.TestCase):
         output_shapes=[1],
         name="from_generator")
 
+  @combinations.generate(test_base.default_test_combinations())
+  def testBatched(self):
+
+    def generator():
+      yield np.arange(3), np.array([[0.], [1.], [2.]], dtype=np.float32)
+      yield np.zeros([0], dtype=np.int64), np.zeros([0, 1], dtype=np.float32)
+      yield [(3, [3.]), (4, [4.])]
+      yield []
+
+    dataset = dataset_ops.Dataset.from_generator(
+        generator,
+        output_signature=(tensor_spec.TensorSpec([], dtypes.int64),
+                          tensor_spec.TensorSpec([1], dtypes.float32)),
+        batched=True)
+    self.assertEqual([], dataset.element_spec[0].shape.as_list())
+    self.assertEqual([1], dataset.element_spec[1].shape.as_list())
+    self.assertDatasetProduces(
+        dataset, [(i, np.array([i], dtype=np.float32)) for i in range(5)])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testBatchedListOfDicts(self):
+
+    def generator():
+      yield [{"a": 1, "b": b"x"}, {"a": 2, "b": b"y"}]
+
+    dataset = dataset_ops.Dataset.from_generator(
+        generator,
+        output_signature={
+            "a": tensor_spec.TensorSpec([], dtypes.int32),
+            "b": tensor_spec.TensorSpec([], dtypes.string)
+        },
+        batched=True)
+    self.assertDatasetProduces(dataset, [{
+        "a": 1,
+        "b": b"x"
+    }, {
+        "a": 2,
+        "b": b"y"
+    }])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testBatchedWrongShape(self):
+
+    def generator():
+      yield np.zeros([2, 3], dtype=np.int64)
+
+    dataset = dataset_ops.Dataset.from_generator(
+        generator,
+        output_signature=tensor_spec.TensorSpec([2], dtypes.int64),
+        batched=True)
+    self.assertDatasetProduces(
+        dataset,
+        expected_error=(errors.InvalidArgumentError,
+                        "`generator` yielded an element of shape"))
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testParallelGenerators(self):
+
+    def generator(offset, index):
+      for i in range(index + 1):
+        yield offset + 10 * index + i
+
+    dataset = dataset_ops.Dataset.from_generator(
+        generator,
+        output_signature=tensor_spec.TensorSpec([], dtypes.int64),
+        args=(np.int64(100),),
+        num_parallel_generators=3)
+    self.assertDatasetProduces(dataset,
+                               [100, 110, 120, 111, 121, 122])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testParallelBatchedGenerators(self):
+
+    def generator(index):
+      for i in range(2):
+        yield np.full([2], 10 * index + i)
+
+    dataset = dataset_ops.Dataset.from_generator(
+        generator,
+        output_signature=tensor_spec.TensorSpec([], dtypes.int64),
+        batched=True,
+        num_parallel_generators=2)
+    self.assertDatasetProduces(dataset, [0, 0, 10, 10, 1, 1, 11, 11])
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testParallelGeneratorsRunConcurrently(self):
+    num_generators = 4
+    barrier = threading.Barrier(num_generators, timeout=60)
+
+    def generator(index):
+      # Each generator waits for all the others to start.
+      barrier.wait()
+      yield index
+
+    dataset = dataset_ops.Dataset.from_generator(
+        generator,
+        output_signature=tensor_spec.TensorSpec([], dtypes.int64),
+        num_parallel_generators=num_generators)
+    self.assertDatasetProduces(dataset, list(range(num_generators)))
+
+  @combinations.generate(test_base.default_test_combinations())
+  def testInvalidNumParallelGenerators(self):
+
+    def generator():
+      yield 42
+
+    with self.assertRaisesRegex(ValueError, "must be positive"):
+      dataset_ops.Dataset.from_generator(
+          generator,
+          output_signature=tensor_spec.TensorSpec([], dtypes.int64),
+          num_parallel_generators=0)
+
 
 if __name__ == "__main__":
   test.main()
@@ -865,6 +865,8 @@ class DatasetV2(collections_abc.Iterable, tracking_base.Trackable,
                      output_shapes=None,
                      args=None,
                      output_signature=None,
+                     batched=False,
+                     num_parallel_generators=None,
                      name=None):
     """Creates a `Dataset` whose elements are generated by `generator`.
 
@@ -925,6 +927,46 @@ class DatasetV2(collections_abc.Iterable, tracking_base.Trackable,
     tf.data operations within the generator function is an anti-pattern and may
     result in incremental memory growth.
 
+    Each element yielded by `generator` costs a call from the tf.data runtime
+    into Python. If `batched` is `True`, `generator` yields batches of
+    elements instead, which are split into elements without calling into
+    Python. A batch is either a structure like the elements whose components
+    have an additional first dimension, or a list of elements, which are
+    stacked:
+
+    >>> def gen():
+    ...   yield np.arange(3), np.zeros(3, dtype=np.float32)
+    ...   yield [(3, 1.), (4, 1.)]
+    >>>
+    >>> dataset = tf.data.Dataset.from_generator(
+    ...      gen,
+    ...      output_signature=(
+    ...          tf.TensorSpec(shape=(), dtype=tf.int64),
+    ...          tf.TensorSpec(shape=(), dtype=tf.float32)),
+    ...      batched=True)
+    >>> [int(x) for x, _ in dataset.as_numpy_iterator()]
+    [0, 1, 2, 3, 4]
+
+    If `num_parallel_generators` is set, that many instances of `generator`
+    run concurrently, and their elements are interleaved. Each instance is
+    passed its index in `[0, num_parallel_generators)` as an additional last
+    argument, so that instances can generate different elements, e.g. by each
+    reading its own files:
+
+    >>> def gen(index):
+    ...   for i in range(3):
+    ...     yield 10 * index + i
+    >>>
+    >>> dataset = tf.data.Dataset.from_generator(
+    ...      gen,
+    ...      output_signature=tf.TensorSpec(shape=(), dtype=tf.int64),
+    ...      num_parallel_generators=2)
+    >>> list(dataset.as_numpy_iterator())
+    [0, 10, 1, 11, 2, 12]
+
+    The instances run in threads of the same Python process, and so only run
+    in parallel while they release the GIL, e.g. in NumPy operations or I/O.
+
     Args:
       generator: A callable object that returns an object that supports the
         `iter()` protocol. If `args` is not specified, `generator` must take no
@@ -940,6 +982,13 @@ class DatasetV2(collections_abc.Iterable, tracking_base.Trackable,
       output_signature: (Optional.) A (nested) structure of `tf.TypeSpec`
         objects corresponding to each component of an element yielded by
         `generator`.
+      batched: (Optional.) If `True`, `generator` yields batches of elements
+        rather than elements. A batch that is a `list` is a list of elements,
+        whose components must be dense, unless the elements are themselves
+        lists. Defaults to `False`.
+      num_parallel_generators: (Optional.) If set, the number of instances of
+        `generator` that run concurrently, each passed its index as an
+        additional last argument.
       name: (Optional.) A name for the tf.data operations used by
         `from_generator`.
 
@@ -948,6 +997,9 @@ class DatasetV2(collections_abc.Iterable, tracking_base.Trackable,
     """
     if not callable(generator):
       raise TypeError("`generator` must be a Python callable.")
+    if num_parallel_generators is not None and num_parallel_generators < 1:
+      raise ValueError("`num_parallel_generators` must be positive, got "
+                       f"{num_parallel_generators}.")
 
     if output_signature is not None:
       if output_types is not None:
@@ -991,6 +1043,51 @@ class DatasetV2(collections_abc.Iterable, tracking_base.Trackable,
     else:
       args = tuple(ops.convert_n_to_tensor(args, name="args"))
 
+    if batched:
+
+      def stack(component_spec, *components):
+        return np.asarray(
+            components, dtype=component_spec.dtype.as_numpy_dtype)
+
+      def batch_generator(*generator_args):
+        for batch in generator(*generator_args):
+          if isinstance(batch, list) and not isinstance(output_signature, list):
+            if not batch:
+              continue
+            batch = nest.map_structure_up_to(output_signature, stack,
+                                             output_signature, *batch)
+          yield batch
+
+      # pylint: disable=protected-access
+      batch_signature = nest.map_structure(
+          lambda component_spec: component_spec._batch(None), output_signature)
+      # pylint: enable=protected-access
+      # Batches are generated, and interleaved if there are many instances of
+      # `generator`, before they are split into elements.
+      return DatasetV2.from_generator(
+          batch_generator,
+          args=args,
+          output_signature=batch_signature,
+          num_parallel_generators=num_parallel_generators,
+          name=name).unbatch(name=name)
+
+    if num_parallel_generators is not None:
+
+      def instance_dataset(index):
+        return DatasetV2.from_generator(
+            generator,
+            args=args + (index,),
+            output_signature=output_signature,
+            name=name)
+
+      # Each instance of `generator` is iterated by its own interleave thread.
+      return DatasetV2.range(num_parallel_generators, name=name).interleave(
+          instance_dataset,
+          cycle_length=num_parallel_generators,
+          block_length=1,
+          num_parallel_calls=num_parallel_generators,
+          name=name)
+
     generator_state = DatasetV2._GeneratorState(generator)
 
     def get_iterator_id_fn(unused_dummy):
@@ -3915,6 +4012,8 @@ class DatasetV1(DatasetV2):
                      output_shapes=None,
                      args=None,
                      output_signature=None,
+                     batched=False,
+                     num_parallel_generators=None,
                      name=None):
     # Calling DatasetV2.from_generator with output_shapes or output_types is
     # deprecated, but this is already checked by the decorator on this function.
@@ -3926,6 +4025,8 @@ class DatasetV1(DatasetV2):
               output_shapes,
               args,
               output_signature,
+              batched=batched,
+              num_parallel_generators=num_parallel_generators,
               name=name))
 
   @staticmethod
@@ -28,6 +28,7 @@ to the regular expression is executed.
 e.g. --benchmarks=".*matmul*." will run all matmul related benchmarks.
 
 """
+import itertools
 import time
 
 import numpy as np
@@ -1348,6 +1349,30 @@ class MicroBenchmarks(benchmarks_test_base.MicroBenchmarksBase):
       values.append(array_ops.zeros(shape=(1000,)))
     self._run(lambda: np.array([x.numpy() for x in values]), 1000)
 
+  def _benchmark_function_dispatch_with_num_traces(self, num_traces):
+
+    @def_function.function
+    def add_offset(x, offset):
+      return x + offset
+
+    for offset in range(num_traces):
+      add_offset.get_concrete_function(
+          tensor_spec.TensorSpec([None], dtypes.float32), offset)
+
+    # Cycles through more distinct shapes than the dispatch cache holds so that
+    # every call goes through the subtype lookup of the function cache.
+    inputs = itertools.cycle([array_ops.zeros([i]) for i in range(2048)])
+    self._run(lambda: add_offset(next(inputs), num_traces - 1), 10000)
+
+  def benchmark_function_dispatch_with_10_traces(self):
+    self._benchmark_function_dispatch_with_num_traces(10)
+
+  def benchmark_function_dispatch_with_100_traces(self):
+    self._benchmark_function_dispatch_with_num_traces(100)
+
+  def benchmark_function_dispatch_with_1000_traces(self):
+    self._benchmark_function_dispatch_with_num_traces(1000)
+
   def benchmark_function_trace(self):
 
     def func(x):
@@ -60,6 +60,7 @@ ops above and associated assignment operations), tf.function traces a second
 time if it sees variables on the first call.
 """
 
+from concurrent import futures
 import functools
 import os
 import threading
@@ -1240,6 +1241,92 @@ class Function(core.GenericFunction, trackable.Trackable):
     concrete._garbage_collector.release()  # pylint: disable=protected-access
     return concrete
 
+  def _trace_concurrently(self, *args):
+    """Like `get_concrete_function`, but lets other threads trace meanwhile."""
+    with self._lock:
+      if self._stateful_fn is None:
+        # The first trace, which may create variables, is not concurrent.
+        initializers = []
+        self._initialize(args, {}, add_initializers_to=initializers)
+        self._initialize_uninitialized_variables(initializers)
+
+    if self._created_variables:
+      concrete = self._stateless_fn._trace_concurrently(*args)  # pylint: disable=protected-access
+    else:
+      concrete = self._stateful_fn._trace_concurrently(*args)  # pylint: disable=protected-access
+      if self._created_variables:
+        raise ValueError("Creating variables on a non-first call to a function"
+                         " decorated with tf.function.")
+    concrete._garbage_collector.release()  # pylint: disable=protected-access
+    return concrete
+
+  def experimental_trace_in_background(self, signatures, max_workers=None):
+    """Traces concrete functions for `signatures` in a background thread pool.
+
+    This is useful to warm up a `tf.function` whose input signatures are known
+    ahead of time, for example one per sequence length bucket, while the
+    calling thread goes on with other work, such as building the input
+    pipeline, rather than blocking on each `get_concrete_function` call.
+
+    >>> @tf.function
+    ... def double(a):
+    ...   return a + a
+    >>> results = double.experimental_trace_in_background(
+    ...     [[tf.TensorSpec([n], tf.float32)] for n in range(1, 5)])
+    >>> [f.result().structured_input_signature[0][0].shape for f in results]
+    [TensorShape([1]), TensorShape([2]), TensorShape([3]), TensorShape([4])]
+    >>> double.experimental_get_tracing_count()
+    4
+
+    The signatures are traced concurrently, by up to `max_workers` threads,
+    except that the first trace of a function that was never traced runs
+    alone, since it may create variables. The function cache is only updated
+    under the lock of the function. Python code runs under the GIL, so what
+    overlaps is mostly the graph construction done in C++, such as shape
+    inference and the conversion of graphs to functions.
+
+    The worker threads do not inherit the caller's graph, device or
+    distribution strategy scopes; functions are traced as if
+    `get_concrete_function` were called eagerly at the top level.
+
+    Args:
+      signatures: A list of signatures, each a list or tuple of positional
+        arguments for `get_concrete_function`, typically `tf.TensorSpec`s.
+      max_workers: The number of threads to trace with. Defaults to the number
+        of signatures, bounded by the number of CPUs.
+
+    Returns:
+      A list with a `concurrent.futures.Future` per signature, which resolves
+      to its `ConcreteFunction` or raises the error raised while tracing it.
+
+    Raises:
+      TypeError: If a signature is not a list or tuple.
+      ValueError: If `max_workers` is not positive.
+    """
+    signatures = list(signatures)
+    for signature in signatures:
+      if not isinstance(signature, (list, tuple)):
+        raise TypeError("Each signature passed to "
+                        "`experimental_trace_in_background` must be a list or "
+                        f"tuple of positional arguments, got {signature!r}.")
+    if max_workers is None:
+      max_workers = max(1, min(len(signatures), os.cpu_count() or 1))
+    if max_workers < 1:
+      raise ValueError("`max_workers` must be positive, got "
+                       f"{max_workers}.")
+
+    executor = futures.ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix=f"tf_function_trace_{self._name}")
+    try:
+      return [
+          executor.submit(self._trace_concurrently, *signature)
+          for signature in signatures
+      ]
+    finally:
+      # Lets the submitted traces finish without blocking the caller.
+      executor.shutdown(wait=False)
+
   def __get__(self, instance, owner):
     """Makes it possible to defun instance methods."""
     del owner
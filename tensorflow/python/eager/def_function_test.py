@@ -18,6 +18,7 @@ import itertools
 import pickle
 import re
 import sys
+import threading
 import unittest
 import weakref
 
@@ -1263,6 +1264,85 @@ class DefFunctionTest(test.TestCase, parameterized.TestCase):
     self.assertAllEqual(obj2.testDouble.experimental_get_tracing_count(), 3)
     self.assertAllEqual(obj1.testDouble.experimental_get_tracing_count(), 2)
 
+  def test_experimental_trace_in_background(self):
+
+    @def_function.function
+    def double(a):
+      return a + a
+
+    results = double.experimental_trace_in_background(
+        [[tensor_spec.TensorSpec([n], dtypes.float32)] for n in range(1, 9)],
+        max_workers=4)
+    concretes = [f.result() for f in results]
+    self.assertEqual(double.experimental_get_tracing_count(), 8)
+    for n, concrete in enumerate(concretes, 1):
+      self.assertEqual(concrete.structured_input_signature[0][0].shape, [n])
+      self.assertAllEqual(concrete(array_ops.ones([n])), [2.0] * n)
+
+    double(array_ops.ones([3]))
+    self.assertEqual(double.experimental_get_tracing_count(), 8)
+
+  def test_experimental_trace_in_background_overlaps_caller(self):
+    caller_done = threading.Event()
+
+    @def_function.function(autograph=False)
+    def wait_for_caller(a):
+      # Tracing blocks until the caller goes on after submitting the traces.
+      caller_done.wait(timeout=60)
+      return a
+
+    results = wait_for_caller.experimental_trace_in_background(
+        [[tensor_spec.TensorSpec([n], dtypes.float32)] for n in range(1, 3)])
+    self.assertFalse(any(f.done() for f in results))
+    caller_done.set()
+    for f in results:
+      f.result(timeout=60)
+    self.assertEqual(wait_for_caller.experimental_get_tracing_count(), 2)
+
+  def test_experimental_trace_in_background_traces_concurrently(self):
+    both_tracing = threading.Barrier(2, timeout=60)
+
+    @def_function.function(autograph=False)
+    def wait_for_other_trace(a):
+      if a.shape[0] > 1:
+        # Each of these traces only finishes once the other one has started.
+        both_tracing.wait()
+      return a
+
+    # The first trace of a function runs alone.
+    wait_for_other_trace.get_concrete_function(
+        tensor_spec.TensorSpec([1], dtypes.float32))
+    results = wait_for_other_trace.experimental_trace_in_background(
+        [[tensor_spec.TensorSpec([n], dtypes.float32)] for n in (2, 3)],
+        max_workers=2)
+    for n, f in zip((2, 3), results):
+      self.assertEqual(
+          f.result(timeout=60).structured_input_signature[0][0].shape, [n])
+    self.assertEqual(wait_for_other_trace.experimental_get_tracing_count(), 3)
+
+  def test_experimental_trace_in_background_reports_errors(self):
+
+    @def_function.function
+    def only_vectors(a):
+      if a.shape.rank != 1:
+        raise ValueError('Expected a vector.')
+      return a
+
+    vector, matrix = only_vectors.experimental_trace_in_background(
+        [(tensor_spec.TensorSpec([2], dtypes.float32),),
+         (tensor_spec.TensorSpec([2, 2], dtypes.float32),)])
+    self.assertEqual(
+        vector.result().structured_input_signature[0][0].shape, [2])
+    with self.assertRaisesRegex(ValueError, 'Expected a vector'):
+      matrix.result()
+
+    with self.assertRaisesRegex(TypeError, 'list or tuple'):
+      only_vectors.experimental_trace_in_background(
+          [tensor_spec.TensorSpec([2], dtypes.float32)])
+    with self.assertRaisesRegex(ValueError, 'must be positive'):
+      only_vectors.experimental_trace_in_background(
+          [(tensor_spec.TensorSpec([2], dtypes.float32),)], max_workers=0)
+
   def test_recursive_tf_function(self):
 
     @def_function.function
@@ -272,6 +272,54 @@ def clear_function_callbacks():
   _function_callbacks.clear()
 
 
+# Bounds of the trace cache of each `Function` created afterwards, see
+# `set_function_cache_limits`.
+_function_cache_max_entries = None
+_function_cache_max_size_bytes = None
+
+
+def set_function_cache_limits(max_entries=None, max_size_bytes=None):
+  """Bounds the trace cache of `Function`s created after this call.
+
+  Once a `Function` holds more than `max_entries` concrete functions, or their
+  estimated total size exceeds `max_size_bytes`, its least recently used
+  concrete functions are dropped. A dropped function is removed from the eager
+  context once no other references to it remain, and is retraced if it is
+  needed again.
+
+  Args:
+    max_entries: Maximum number of concrete functions per `Function`, or None
+      for no limit.
+    max_size_bytes: Maximum estimated size in bytes of the concrete functions
+      of a `Function`, or None for no limit.
+  """
+  global _function_cache_max_entries, _function_cache_max_size_bytes
+  _function_cache_max_entries = max_entries
+  _function_cache_max_size_bytes = max_size_bytes
+
+
+def _estimate_concrete_function_size(concrete_function):
+  """Returns the size of the FunctionDef of `concrete_function` in bytes."""
+  # Avoids `function_def`, which keeps the FunctionDef alive.
+  return concrete_function._inference_function._get_definition().ByteSize()  # pylint: disable=protected-access
+
+
+# Optional persistent store of traced functions shared by all `Function`s, see
+# `function_trace_cache.PersistentTraceCache`.
+_persistent_trace_cache = None
+
+
+def set_persistent_trace_cache(cache):
+  """Sets the persistent trace cache used by all `Function`s.
+
+  Args:
+    cache: A `function_trace_cache.PersistentTraceCache`, or None to disable
+      persistent caching.
+  """
+  global _persistent_trace_cache
+  _persistent_trace_cache = cache
+
+
 _FORWARD_PREFIX = "__forward_"
 _BACKWARD_PREFIX = "__backward_"
 _INFERENCE_PREFIX = "__inference_"
@@ -2472,7 +2520,10 @@ class Function(object):
     self._autograph = autograph
     self._autograph_options = autograph_options
     self._reduce_retracing = reduce_retracing
-    self._function_cache = function_cache.FunctionCache()
+    self._function_cache = function_cache.FunctionCache(
+        max_entries=_function_cache_max_entries,
+        max_size_bytes=_function_cache_max_size_bytes,
+        size_fn=_estimate_concrete_function_size)
     self._function_attributes = attributes or {}
     self._capture_by_value = capture_by_value
     self.tracing_count = 0
@@ -2543,6 +2594,31 @@ class Function(object):
       *args: inputs to specialize on.
       **kwargs: inputs to specialize on.
     """
+    args, kwargs = self._check_concrete_function_inputs(args, kwargs)
+    with self._lock:
+      graph_function, _ = self._maybe_define_function(args, kwargs)
+      self._set_arg_keywords(graph_function)
+      return graph_function
+
+  def _trace_concurrently(self, *args, **kwargs):
+    """Returns a `ConcreteFunction`, letting other threads trace meanwhile.
+
+    Like `_get_concrete_function_garbage_collected`, except that `self._lock`
+    is not held while tracing, so that several threads can trace different
+    inputs at once.
+
+    Args:
+      *args: inputs to specialize on.
+      **kwargs: inputs to specialize on.
+    """
+    args, kwargs = self._check_concrete_function_inputs(args, kwargs)
+    graph_function = self._define_function_concurrently(args, kwargs)
+    with self._lock:
+      self._set_arg_keywords(graph_function)
+    return graph_function
+
+  def _check_concrete_function_inputs(self, args, kwargs):
+    """Checks inputs against the input signature, if any, to trace on them."""
     if self.input_signature:
       if kwargs:
         raise ValueError("Cannot define a TensorFlow function from a Python "
@@ -2569,31 +2645,32 @@ class Function(object):
                            f"inputs ({args}), input_signature "
                            f"({self.input_signature}).")
       args, kwargs = None, None
-    with self._lock:
-      graph_function, _ = self._maybe_define_function(args, kwargs)
-      seen_names = set()
-      captured = object_identity.ObjectIdentitySet(
-          graph_function.graph.internal_captures)
-      # pylint: disable=protected-access
-      graph_function._arg_keywords = []
-      prefix_counts = {}
-      # pylint: enable=protected-access
-      num_positional = 0
-      for arg in graph_function.graph.inputs:
-        if arg in captured:
-          break
-        num_positional += 1
-        user_arg_name = compat.as_str(arg.op.get_attr("_user_specified_name"))
-        proposal = user_arg_name
-        while proposal in seen_names:
-          index = prefix_counts.get(user_arg_name, 1)
-          proposal = "{}_{}".format(user_arg_name, index)
-          prefix_counts[user_arg_name] = index + 1
-        seen_names.add(proposal)
-        graph_function._arg_keywords.append(proposal)  # pylint: disable=protected-access
-      # Anything can be a positional argument, in the same order as .inputs
-      graph_function._num_positional_args = num_positional  # pylint: disable=protected-access
-      return graph_function
+    return args, kwargs
+
+  def _set_arg_keywords(self, graph_function):
+    """Names the arguments of `graph_function`. Caller must hold self._lock."""
+    seen_names = set()
+    captured = object_identity.ObjectIdentitySet(
+        graph_function.graph.internal_captures)
+    # pylint: disable=protected-access
+    graph_function._arg_keywords = []
+    prefix_counts = {}
+    # pylint: enable=protected-access
+    num_positional = 0
+    for arg in graph_function.graph.inputs:
+      if arg in captured:
+        break
+      num_positional += 1
+      user_arg_name = compat.as_str(arg.op.get_attr("_user_specified_name"))
+      proposal = user_arg_name
+      while proposal in seen_names:
+        index = prefix_counts.get(user_arg_name, 1)
+        proposal = "{}_{}".format(user_arg_name, index)
+        prefix_counts[user_arg_name] = index + 1
+      seen_names.add(proposal)
+      graph_function._arg_keywords.append(proposal)  # pylint: disable=protected-access
+    # Anything can be a positional argument, in the same order as .inputs
+    graph_function._num_positional_args = num_positional  # pylint: disable=protected-access
 
   def get_concrete_function(self, *args, **kwargs):
     """Returns a `ConcreteFunction` specialized to inputs and execution context.
@@ -2612,6 +2689,14 @@ class Function(object):
   def _list_all_concrete_functions(self) -> List[ConcreteFunction]:
     return self._function_cache.values()
 
+  def function_cache_entries(self) -> List[function_cache.CacheEntryInfo]:
+    """Returns size, hit count and last use time of each traced function.
+
+    Entries are ordered from the least to the most recently used.
+    """
+    with self._lock:
+      return self._function_cache.entries()
+
   def __get__(self, instance, owner):
     """Makes it possible to defun instance methods."""
     del owner
@@ -2648,7 +2733,8 @@ class Function(object):
 
   def _create_graph_function(self, args, kwargs):
     """Create a `ConcreteFunction` from `args` and `kwargs`."""
-    self.tracing_count += 1
+    with self._lock:
+      self.tracing_count += 1
 
     if self.input_signature is None:
       arglen = len(args)
@@ -2683,6 +2769,19 @@ class Function(object):
         shared_func_graph=False)
     return graph_function
 
+  def _load_persisted_function(self, cache_key):
+    """Returns a function from the persistent trace cache, or None."""
+    if _persistent_trace_cache is None:
+      return None
+    graph_function = _persistent_trace_cache.lookup(self, cache_key)
+    if graph_function is None:
+      return None
+    graph_function._set_function_spec(self.function_spec)  # pylint: disable=protected-access
+    # Rehydrated functions own their graph like freshly traced ones.
+    graph_function._garbage_collector = ConcreteFunctionGarbageCollector(  # pylint: disable=protected-access
+        graph_function.graph)
+    return graph_function
+
   def _maybe_define_function(self, args, kwargs):
     """Gets a function for these inputs, defining it if necessary.
 
@@ -2706,6 +2805,60 @@ class Function(object):
       RuntimeError: If there's an internal bug (inconsistency) in handling
         shape relaxation retracing.
     """
+    (args, kwargs, filtered_flat_args, cache_key,
+     cache_key_deletion_observer) = self._make_cache_key(args, kwargs)
+
+    graph_function = self._function_cache.lookup(cache_key, True)
+    if graph_function is not None:
+      return graph_function, filtered_flat_args
+
+    if (self._reduce_retracing and self.input_signature is None):
+      cache_key = self._function_cache.generalize(cache_key)
+      (args, kwargs) = cache_key._placeholder_value()  # pylint: disable=protected-access
+
+    graph_function = self._trace_function(cache_key, args, kwargs)
+    self._function_cache.add(cache_key, cache_key_deletion_observer,
+                             graph_function)
+    return graph_function, filtered_flat_args
+
+  def _define_function_concurrently(self, args, kwargs):
+    """Gets a function for these inputs, tracing it without holding the lock.
+
+    Unlike `_maybe_define_function`, the caller must not hold self._lock. It is
+    only taken to look up and to update the function cache, so that other
+    threads can trace other inputs meanwhile. If another thread defined a
+    function for the same inputs first, that function is kept and returned.
+
+    Args:
+      args: The varargs for the Python function.
+      kwargs: The keyword args for the Python function.
+
+    Returns:
+      A graph function corresponding to the input signature implied by args and
+      kwargs.
+    """
+    with self._lock:
+      (args, kwargs, _, cache_key,
+       cache_key_deletion_observer) = self._make_cache_key(args, kwargs)
+      graph_function = self._function_cache.lookup(cache_key, True)
+      if graph_function is not None:
+        return graph_function
+      if (self._reduce_retracing and self.input_signature is None):
+        cache_key = self._function_cache.generalize(cache_key)
+        (args, kwargs) = cache_key._placeholder_value()  # pylint: disable=protected-access
+
+    graph_function = self._trace_function(cache_key, args, kwargs)
+
+    with self._lock:
+      existing_function = self._function_cache.lookup(cache_key, True)
+      if existing_function is not None:
+        return existing_function
+      self._function_cache.add(cache_key, cache_key_deletion_observer,
+                               graph_function)
+      return graph_function
+
+  def _make_cache_key(self, args, kwargs):
+    """Returns canonicalized inputs and their function cache key."""
     if self.input_signature is None or args is not None or kwargs is not None:
       args, kwargs, filtered_flat_args = (
           self._function_spec.canonicalize_function_inputs(*args, **kwargs))
@@ -2725,11 +2878,11 @@ class Function(object):
       raise TypeError(
           "Arguments supplied to `defun`-generated functions must be "
           f"hashable.  Original error: {e}.")
+    return (args, kwargs, filtered_flat_args, cache_key,
+            cache_key_deletion_observer)
 
-    graph_function = self._function_cache.lookup(cache_key, True)
-    if graph_function is not None:
-      return graph_function, filtered_flat_args
-
+  def _trace_function(self, cache_key, args, kwargs):
+    """Traces a function for `cache_key`, or loads it from the trace cache."""
     with monitoring.MonitoredTimer(_graph_building_time_counter.get_cell()):
       with trace.Trace("tf.function-graph_building"):
         logging.vlog(1,
@@ -2743,16 +2896,12 @@ class Function(object):
             if self._autograph else ag_ctx.Status.DISABLED)
         with ag_ctx.ControlStatusCtx(
             status=ag_status, options=self._autograph_options):
-
-          if (self._reduce_retracing and self.input_signature is None):
-            cache_key = self._function_cache.generalize(cache_key)
-            (args, kwargs) = cache_key._placeholder_value()  # pylint: disable=protected-access
-
-          graph_function = self._create_graph_function(args, kwargs)
-          self._function_cache.add(cache_key, cache_key_deletion_observer,
-                                   graph_function)
-
-          return graph_function, filtered_flat_args
+          graph_function = self._load_persisted_function(cache_key)
+          if graph_function is None:
+            graph_function = self._create_graph_function(args, kwargs)
+            if _persistent_trace_cache is not None:
+              _persistent_trace_cache.store(self, cache_key, graph_function)
+          return graph_function
 
 
 def register(func, *args, **kwargs):
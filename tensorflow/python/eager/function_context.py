@@ -25,6 +25,14 @@ from tensorflow.python.framework import ops
 from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.saved_model import save_context
 
+# pylint: disable=protected-access
+trace_type.register_trace_type_key(
+    ops.EagerTensor, lambda t: (t._shape_tuple(), t._datatype_enum()))
+# pylint: enable=protected-access
+
+# Reuses the TraceTypes of arguments with the same structure across calls.
+_TRACE_TYPE_CACHE = trace_type.TraceTypeCache()
+
 
 # EagerContext is used by tf.function to identify cases where tracing
 # needs to occur due to a change in conditions other than the arguments.
@@ -125,8 +133,7 @@ def make_cache_key(
 ) -> Tuple[function_cache.FunctionCacheKey, trace_type.WeakrefDeletionObserver]:
   """Computes the cache key given the function arguments."""
   signature_context = trace_type.InternalTracingContext()
-  function_signature = trace_type.from_object(
-      args, signature_context)
+  function_signature = _TRACE_TYPE_CACHE.from_object(args, signature_context)
   return function_cache.FunctionCacheKey(
       function_signature,
       make_function_context()), signature_context.deletion_observer
@@ -441,6 +441,33 @@ class FunctionTest(test.TestCase, parameterized.TestCase):
     self.assertTrue(unknown_dim[0])
     self.assertLen(total_function_cache(func), 2)
 
+  def testFunctionCacheLimitEvictsLeastRecentlyUsed(self):
+    function.set_function_cache_limits(max_entries=2)
+    self.addCleanup(function.set_function_cache_limits)
+
+    @function.defun
+    def func(a):
+      return a + 1
+
+    func(constant_op.constant(1))
+    func(constant_op.constant([1]))
+    func(constant_op.constant(1))
+    func(constant_op.constant([[1]]))
+    self.assertLen(total_function_cache(func), 2)
+    self.assertEqual(func.tracing_count, 3)
+
+    entries = func.function_cache_entries()
+    self.assertLen(entries, 2)
+    self.assertEqual(entries[0].hit_count, 1)
+    self.assertEqual(entries[1].hit_count, 0)
+    self.assertGreater(entries[0].size_bytes, 0)
+
+    # The rank 1 trace was the least recently used one and got evicted.
+    func(constant_op.constant(2))
+    self.assertEqual(func.tracing_count, 3)
+    func(constant_op.constant([2]))
+    self.assertEqual(func.tracing_count, 4)
+
   def testInputShapeRelaxationOnInstanceMethod(self):
     # Test that reduce_retracing is passed during
     # instance method bounding.
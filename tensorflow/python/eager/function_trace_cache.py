@@ -0,0 +1,409 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Persistent on-disk cache of traced `tf.function` graphs.
+
+Tracing a `tf.function` runs the Python function (and AutoGraph) to build a
+FuncGraph. For processes that are restarted often, re-tracing every function is
+a significant part of the startup time. `PersistentTraceCache` stores the
+FunctionDefs of traced concrete functions on disk, keyed by the
+`FunctionCacheKey` of the call and a fingerprint of the Python function, so that
+a restarted process can rehydrate the `ConcreteFunction` without tracing.
+
+Only functions whose graphs are fully described by their FunctionDefs are
+persisted: functions that capture tensors or variables, register custom
+gradients or call back into Python are always traced. Python side effects of
+the traced function (e.g. `print`) do not run when a function is loaded from
+the cache.
+
+The fingerprint covers the source code of the function, its default argument
+values and closure, the simple global constants it references, the TensorFlow
+version and the tracing options. Changes to other Python code called by the
+function are not detected; clear the cache directory when they change.
+
+Usage:
+
+```python
+function_trace_cache.enable_persistent_cache("/tmp/tf_function_cache")
+```
+"""
+
+import hashlib
+import os
+import re
+import threading
+
+from tensorflow.core.protobuf import meta_graph_pb2
+from tensorflow.python.eager import function as function_lib
+from tensorflow.python.eager import monitoring
+from tensorflow.python.framework import errors
+from tensorflow.python.framework import func_graph as func_graph_module
+from tensorflow.python.framework import ops
+from tensorflow.python.framework import versions
+from tensorflow.python.lib.io import file_io
+from tensorflow.python.platform import tf_logging as logging
+from tensorflow.python.saved_model import function_deserialization
+from tensorflow.python.saved_model import nested_structure_coder
+from tensorflow.python.util import tf_decorator
+from tensorflow.python.util import tf_inspect
+
+_persistent_cache_counter = monitoring.Counter(
+    "/tensorflow/core/tf_function/persistent_cache",
+    "Number of persistent tf.function trace cache events by type.", "event")
+
+# Suffix of the files holding cache entries.
+_ENTRY_SUFFIX = ".tfcache"
+
+# Reprs containing memory addresses differ between processes and can not be
+# part of a persistent key.
+_UNSTABLE_REPR = re.compile(r" at 0x[0-9a-fA-F]+")
+
+# Ops whose FunctionDef refers to process-local state.
+_UNPERSISTABLE_OPS = frozenset(
+    ["PyFunc", "PyFuncStateless", "EagerPyFunc"])
+
+# Types of global values that are folded into the function fingerprint.
+_FINGERPRINTED_GLOBAL_TYPES = (bool, int, float, str, bytes, type(None))
+
+
+class _UnstableKeyError(Exception):
+  """Raised when a value has no process-independent representation."""
+
+
+def _stable_repr(value):
+  """Returns a repr of `value` that is identical across processes."""
+  value_repr = repr(value)
+  if _UNSTABLE_REPR.search(value_repr):
+    raise _UnstableKeyError(value_repr)
+  return value_repr
+
+
+def _function_fingerprint(function):
+  """Returns the parts of a `function.Function` identifying its traces."""
+  # pylint: disable=protected-access
+  python_function = function.python_function
+  _, python_function = tf_decorator.unwrap(python_function)
+  code = getattr(python_function, "__code__", None)
+  if code is None:
+    raise _UnstableKeyError(python_function)
+
+  try:
+    source = tf_inspect.getsource(python_function)
+  except (IOError, OSError, TypeError):
+    source = repr((code.co_code, code.co_consts))
+
+  closure = tuple(
+      cell.cell_contents for cell in getattr(python_function, "__closure__",
+                                             None) or ())
+  function_globals = getattr(python_function, "__globals__", {})
+  referenced_globals = tuple(
+      (name, function_globals[name])
+      for name in code.co_names
+      if isinstance(function_globals.get(name), _FINGERPRINTED_GLOBAL_TYPES))
+
+  return (
+      versions.__version__,
+      versions.GRAPH_DEF_VERSION,
+      getattr(python_function, "__module__", None),
+      getattr(python_function, "__qualname__", None),
+      source,
+      _stable_repr(getattr(python_function, "__defaults__", None)),
+      _stable_repr(getattr(python_function, "__kwdefaults__", None)),
+      _stable_repr(closure),
+      _stable_repr(referenced_globals),
+      function._autograph,
+      _stable_repr(function._autograph_options),
+      function._jit_compile,
+      _stable_repr(sorted(function._function_attributes.items())),
+  )
+  # pylint: enable=protected-access
+
+
+def _is_persistable(concrete_function):
+  """Whether the FunctionDefs of `concrete_function` fully describe it."""
+  if concrete_function.captured_inputs:
+    return False
+  graphs = [concrete_function.graph]
+  graphs.extend(f.graph for f in concrete_function.graph._functions.values()  # pylint: disable=protected-access
+                if hasattr(f, "graph"))
+  for graph in graphs:
+    for op in graph.get_operations():
+      if op.type in _UNPERSISTABLE_OPS:
+        return False
+      try:
+        op.get_attr("_gradient_op_type")
+        return False
+      except ValueError:
+        pass
+  return True
+
+
+class PersistentTraceCache(object):
+  """Stores traced concrete functions in a directory.
+
+  Entries are evicted oldest first once the cache holds more than
+  `max_size_bytes` bytes or more than `max_entries` entries.
+
+  `PersistentTraceCache` is thread-safe. Several processes may share a cache
+  directory: entries are written atomically and a missing or corrupt entry is
+  treated as a cache miss.
+  """
+
+  def __init__(self, cache_dir, max_size_bytes=1 << 30, max_entries=None):
+    """Creates a `PersistentTraceCache`.
+
+    Args:
+      cache_dir: Directory holding the cache entries. Created if missing.
+      max_size_bytes: Maximum total size of the entries, or None for no limit.
+      max_entries: Maximum number of entries, or None for no limit.
+
+    Raises:
+      ValueError: If `max_size_bytes` or `max_entries` is not positive.
+    """
+    if max_size_bytes is not None and max_size_bytes <= 0:
+      raise ValueError("`max_size_bytes` must be positive or None, got "
+                       f"{max_size_bytes}.")
+    if max_entries is not None and max_entries <= 0:
+      raise ValueError("`max_entries` must be positive or None, got "
+                       f"{max_entries}.")
+    self._cache_dir = cache_dir
+    self._max_size_bytes = max_size_bytes
+    self._max_entries = max_entries
+    self._lock = threading.Lock()
+    # Maps entry paths to (mtime_nsec, length). Populated on first write.
+    self._entries = None
+    self._hits = 0
+    self._misses = 0
+    self._writes = 0
+    self._evictions = 0
+    self._store_errors = 0
+    file_io.recursive_create_dir_v2(cache_dir)
+
+  @property
+  def cache_dir(self):
+    return self._cache_dir
+
+  @property
+  def hits(self):
+    """Number of lookups served from the cache."""
+    return self._hits
+
+  @property
+  def misses(self):
+    """Number of lookups for persistable keys not found in the cache."""
+    return self._misses
+
+  @property
+  def writes(self):
+    """Number of entries written by this object."""
+    return self._writes
+
+  @property
+  def evictions(self):
+    """Number of entries evicted by this object."""
+    return self._evictions
+
+  @property
+  def store_errors(self):
+    """Number of traces that could not be serialized or written."""
+    return self._store_errors
+
+  def _entry_path(self, function, cache_key):
+    """Returns the entry path for a key, or None if it is not persistable."""
+    try:
+      key_parts = (_function_fingerprint(function), _stable_repr(cache_key))
+    except _UnstableKeyError:
+      return None
+    digest = hashlib.sha256(repr(key_parts).encode("utf-8")).hexdigest()
+    return os.path.join(self._cache_dir, digest + _ENTRY_SUFFIX)
+
+  def lookup(self, function, cache_key):
+    """Returns a `ConcreteFunction` for `cache_key` or None.
+
+    Args:
+      function: The `function.Function` being called.
+      cache_key: The `FunctionCacheKey` of the call.
+
+    Returns:
+      A rehydrated `ConcreteFunction` without captures, or None on a miss.
+    """
+    path = self._entry_path(function, cache_key)
+    if path is None:
+      return None
+
+    try:
+      serialized = file_io.read_file_to_string(path, binary_mode=True)
+    except errors.NotFoundError:
+      self._record("miss")
+      return None
+
+    try:
+      concrete_function = _deserialize(serialized)
+    except Exception as e:  # pylint: disable=broad-except
+      logging.warning("Ignoring unreadable tf.function cache entry %s: %s",
+                      path, e)
+      self._record("miss")
+      return None
+
+    self._record("hit")
+    return concrete_function
+
+  def store(self, function, cache_key, concrete_function):
+    """Writes `concrete_function` to the cache if it can be persisted.
+
+    Args:
+      function: The `function.Function` that traced `concrete_function`.
+      cache_key: The `FunctionCacheKey` of `concrete_function`.
+      concrete_function: The traced `ConcreteFunction`.
+
+    Returns:
+      Whether an entry was written. Errors serializing or writing the entry
+      are logged rather than raised, since the cache must not make a call to
+      the function fail.
+    """
+    if not _is_persistable(concrete_function):
+      return False
+    path = self._entry_path(function, cache_key)
+    if path is None:
+      return False
+
+    try:
+      serialized = _serialize(concrete_function)
+      file_io.atomic_write_string_to_file(path, serialized)
+      mtime_nsec = file_io.stat_v2(path).mtime_nsec
+    except Exception as e:  # pylint: disable=broad-except
+      logging.warning("Failed to write tf.function cache entry %s: %s", path,
+                      e)
+      self._record("store_error")
+      return False
+
+    with self._lock:
+      self._writes += 1
+      try:
+        self._load_entries()
+        self._entries[path] = (mtime_nsec, len(serialized))
+        self._evict()
+      except errors.OpError as e:
+        logging.warning("Failed to evict tf.function cache entries in %s: %s",
+                        self._cache_dir, e)
+    return True
+
+  def clear(self):
+    """Deletes all entries in the cache directory."""
+    with self._lock:
+      self._load_entries()
+      for path in list(self._entries):
+        self._delete(path)
+
+  def _record(self, event):
+    with self._lock:
+      if event == "hit":
+        self._hits += 1
+      elif event == "miss":
+        self._misses += 1
+      else:
+        self._store_errors += 1
+    _persistent_cache_counter.get_cell(event).increase_by(1)
+
+  def _load_entries(self):
+    """Reads the entries currently in the cache directory."""
+    if self._entries is not None:
+      return
+    self._entries = {}
+    for path in file_io.get_matching_files_v2(
+        os.path.join(self._cache_dir, "*" + _ENTRY_SUFFIX)):
+      try:
+        stat = file_io.stat_v2(path)
+      except errors.NotFoundError:
+        continue
+      self._entries[path] = (stat.mtime_nsec, stat.length)
+
+  def _evict(self):
+    """Deletes the oldest entries until the cache is within its bounds."""
+    total_size = sum(length for _, length in self._entries.values())
+    by_age = sorted(self._entries, key=lambda path: self._entries[path][0])
+    for path in by_age:
+      over_size = (
+          self._max_size_bytes is not None and
+          total_size > self._max_size_bytes)
+      over_count = (
+          self._max_entries is not None and
+          len(self._entries) > self._max_entries)
+      if not (over_size or over_count):
+        break
+      total_size -= self._entries[path][1]
+      self._delete(path)
+      self._evictions += 1
+      _persistent_cache_counter.get_cell("eviction").increase_by(1)
+
+  def _delete(self, path):
+    del self._entries[path]
+    try:
+      file_io.delete_file_v2(path)
+    except errors.NotFoundError:
+      # Another process sharing the directory deleted the entry.
+      pass
+
+
+def _serialize(concrete_function):
+  """Serializes a `ConcreteFunction` and the functions it calls."""
+  graph = ops.Graph()
+  concrete_function.add_to_graph(graph)
+
+  meta_graph = meta_graph_pb2.MetaGraphDef()
+  meta_graph.graph_def.library.CopyFrom(graph.as_graph_def().library)
+  saved_function = meta_graph.object_graph_def.concrete_functions[
+      concrete_function.name]
+  saved_function.canonicalized_input_signature.CopyFrom(
+      nested_structure_coder.encode_structure(
+          concrete_function.structured_input_signature))
+  saved_function.output_signature.CopyFrom(
+      nested_structure_coder.encode_structure(
+          func_graph_module.convert_structure_to_signature(
+              concrete_function.structured_outputs)))
+  return meta_graph.SerializeToString()
+
+
+def _deserialize(serialized):
+  """Rehydrates the `ConcreteFunction` written by `_serialize`."""
+  meta_graph = meta_graph_pb2.MetaGraphDef.FromString(serialized)
+  (name,) = meta_graph.object_graph_def.concrete_functions.keys()
+  functions = function_deserialization.load_function_def_library(
+      meta_graph.graph_def.library, meta_graph.object_graph_def)
+  concrete_function = functions[name]
+  for f in functions.values():
+    f.add_to_graph()
+  return concrete_function
+
+
+def enable_persistent_cache(cache_dir, max_size_bytes=1 << 30,
+                            max_entries=None):
+  """Makes all `tf.function`s use a persistent trace cache in `cache_dir`.
+
+  Args:
+    cache_dir: Directory holding the cache entries.
+    max_size_bytes: Maximum total size of the entries, or None for no limit.
+    max_entries: Maximum number of entries, or None for no limit.
+
+  Returns:
+    The `PersistentTraceCache` in use.
+  """
+  cache = PersistentTraceCache(cache_dir, max_size_bytes, max_entries)
+  function_lib.set_persistent_trace_cache(cache)
+  return cache
+
+
+def disable_persistent_cache():
+  """Stops using the persistent trace cache."""
+  function_lib.set_persistent_trace_cache(None)
@@ -0,0 +1,164 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for function_trace_cache."""
+
+import os
+
+from tensorflow.python.eager import function
+from tensorflow.python.eager import function_trace_cache
+from tensorflow.python.framework import constant_op
+from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import errors
+from tensorflow.python.framework import tensor_spec
+from tensorflow.python.lib.io import file_io
+from tensorflow.python.ops import math_ops
+from tensorflow.python.ops import resource_variable_ops
+from tensorflow.python.platform import test
+
+
+def _square_plus_one(x):
+  return {"y": math_ops.square(x) + 1}
+
+
+def _cube(x):
+  return x * x * x
+
+
+class PersistentTraceCacheTest(test.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self._cache_dir = os.path.join(self.get_temp_dir(), self._testMethodName)
+    self._cache = function_trace_cache.enable_persistent_cache(self._cache_dir)
+    self.addCleanup(function_trace_cache.disable_persistent_cache)
+
+  def _num_entries(self):
+    return len(file_io.list_directory_v2(self._cache_dir))
+
+  def testRestartedFunctionIsLoadedWithoutTracing(self):
+    x = constant_op.constant([1.0, 2.0])
+
+    traced = function.Function(_square_plus_one, "square_plus_one")
+    expected = traced(x)
+    self.assertEqual(traced.tracing_count, 1)
+    self.assertEqual(self._cache.misses, 1)
+    self.assertEqual(self._cache.writes, 1)
+
+    # A new `Function` stands in for a restarted process.
+    restored = function.Function(_square_plus_one, "square_plus_one")
+    result = restored(x)
+    self.assertEqual(restored.tracing_count, 0)
+    self.assertEqual(self._cache.hits, 1)
+    self.assertAllEqual(result["y"], expected["y"])
+    self.assertAllEqual(restored(x)["y"], expected["y"])
+    self.assertEqual(self._cache.hits, 1)
+
+  def testDifferentSignaturesAreSeparateEntries(self):
+    traced = function.Function(_cube, "cube")
+    traced(constant_op.constant(2.0))
+    traced(constant_op.constant([2, 3]))
+    self.assertEqual(self._num_entries(), 2)
+
+    restored = function.Function(_cube, "cube")
+    self.assertAllEqual(restored(constant_op.constant([2, 3])), [8, 27])
+    self.assertEqual(restored.tracing_count, 0)
+
+  def testInputSignatureIsRestored(self):
+    signature = [tensor_spec.TensorSpec([None], dtypes.float32)]
+    function.Function(_cube, "cube", input_signature=signature)(
+        constant_op.constant([1.0]))
+
+    restored = function.Function(_cube, "cube", input_signature=signature)
+    concrete = restored.get_concrete_function()
+    self.assertEqual(restored.tracing_count, 0)
+    self.assertAllEqual(concrete(constant_op.constant([3.0])), [27.0])
+
+  def testCapturingFunctionIsNotPersisted(self):
+    v = resource_variable_ops.ResourceVariable(2.0)
+
+    def scale(x):
+      return x * v
+
+    function.Function(scale, "scale")(constant_op.constant(1.0))
+    self.assertEqual(self._cache.writes, 0)
+    self.assertEqual(self._num_entries(), 0)
+
+  def testClosureChangeInvalidatesEntry(self):
+    def make(exponent):
+
+      def power(x):
+        return x**exponent
+
+      return power
+
+    function.Function(make(2), "power")(constant_op.constant(3.0))
+    restored = function.Function(make(3), "power")
+    self.assertAllEqual(restored(constant_op.constant(3.0)), 27.0)
+    self.assertEqual(restored.tracing_count, 1)
+    self.assertEqual(self._cache.hits, 0)
+
+  def testOldestEntriesAreEvicted(self):
+    cache = function_trace_cache.enable_persistent_cache(
+        os.path.join(self._cache_dir, "bounded"), max_entries=2)
+    traced = function.Function(_cube, "cube")
+    for i in range(4):
+      traced(constant_op.constant([1] * (i + 1)))
+    self.assertEqual(cache.writes, 4)
+    self.assertEqual(cache.evictions, 2)
+    self.assertLen(file_io.list_directory_v2(cache.cache_dir), 2)
+
+  def testCorruptEntryIsAMiss(self):
+    x = constant_op.constant(1.0)
+    function.Function(_cube, "cube")(x)
+    (entry,) = file_io.list_directory_v2(self._cache_dir)
+    file_io.write_string_to_file(
+        os.path.join(self._cache_dir, entry), "not a proto")
+
+    restored = function.Function(_cube, "cube")
+    self.assertAllEqual(restored(x), 1.0)
+    self.assertEqual(restored.tracing_count, 1)
+
+  def testUnencodableOutputIsNotPersisted(self):
+
+    class Opaque(object):
+      pass
+
+    def opaque(x):
+      return x + 1, Opaque()
+
+    result, obj = function.Function(opaque, "opaque")(constant_op.constant(1.0))
+    self.assertAllEqual(result, 2.0)
+    self.assertIsInstance(obj, Opaque)
+    self.assertEqual(self._cache.store_errors, 1)
+    self.assertEqual(self._cache.writes, 0)
+    self.assertEqual(self._num_entries(), 0)
+
+  def testUnwritableCacheDirectoryIsIgnored(self):
+    # Permissions do not stop a test running as root, so the write fails.
+    with test.mock.patch.object(
+        file_io, "atomic_write_string_to_file",
+        side_effect=errors.PermissionDeniedError(None, None, "Read-only")):
+      traced = function.Function(_cube, "cube")
+      self.assertAllEqual(traced(constant_op.constant(2.0)), 8.0)
+    self.assertEqual(self._cache.store_errors, 1)
+    self.assertEqual(self._cache.writes, 0)
+
+  def testInvalidBoundsRaise(self):
+    with self.assertRaisesRegex(ValueError, "max_entries"):
+      function_trace_cache.PersistentTraceCache(self._cache_dir, max_entries=0)
+
+
+if __name__ == "__main__":
+  test.main()
@@ -88,6 +88,13 @@ class DenseSpec(type_spec.TypeSpec):
   def _serialize(self):
     return (self._shape, self._dtype, self._name)
 
+  def _dispatch_bucket(self):
+    if (type(self).is_subtype_of is not type_spec.TypeSpec.is_subtype_of or
+        self._shape.rank is None):
+      return None
+    # Shapes of different known ranks are unrelated and dtypes are invariant.
+    return (type(self), self._dtype, self._shape.rank)
+
   def _to_legacy_output_types(self):
     return self._dtype
 
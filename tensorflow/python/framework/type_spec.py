@@ -17,7 +17,7 @@
 import abc
 import functools
 import re
-from typing import List, Optional, Sequence, Any
+from typing import Any, Hashable, List, Optional, Sequence
 import warnings
 
 import numpy as np
@@ -184,6 +184,13 @@ class TypeSpec(trace.TraceType, metaclass=abc.ABCMeta):
 
     return self._deserialize(serialized_supertype) if has_supertype else None
 
+  def _dispatch_bucket(self) -> Optional[Hashable]:
+    """Returns a value shared by all subtypes of `self`, see `type_dispatch`."""
+    # The default `is_subtype_of` only relates TypeSpecs of the same type.
+    if type(self).is_subtype_of is TypeSpec.is_subtype_of:
+      return type(self)
+    return None
+
   # TODO(b/223659753): Return the actual Tensor-based value instead of spec.
   def _placeholder_value(self) -> "TypeSpec":
     """Value used for tracing a function signature with this TraceType."""
@@ -114,14 +114,19 @@ class PyRecordReader {
 
 class PyRecordRandomReader {
  public:
+  static constexpr tensorflow::uint64 kReaderBufferSize = 16 * 1024 * 1024;
+
+  // A `buffer_size` of 0 reads each record with its own reads from the file,
+  // rather than filling a buffer at each offset that is not buffered yet.
   static tensorflow::Status New(const std::string& filename,
+                                tensorflow::uint64 buffer_size,
                                 PyRecordRandomReader** out) {
     std::unique_ptr<tensorflow::RandomAccessFile> file;
     TF_RETURN_IF_ERROR(
         tensorflow::Env::Default()->NewRandomAccessFile(filename, &file));
     auto options =
         tensorflow::io::RecordReaderOptions::CreateRecordReaderOptions("");
-    options.buffer_size = kReaderBufferSize;
+    options.buffer_size = buffer_size;
     auto reader =
         absl::make_unique<tensorflow::io::RecordReader>(file.get(), options);
     *out = new PyRecordRandomReader(std::move(file), std::move(reader));
@@ -148,8 +153,6 @@ class PyRecordRandomReader {
   }
 
  private:
-  static constexpr tensorflow::uint64 kReaderBufferSize = 16 * 1024 * 1024;
-
   PyRecordRandomReader(std::unique_ptr<tensorflow::RandomAccessFile> file,
                        std::unique_ptr<tensorflow::io::RecordReader> reader)
       : file_(std::move(file)), reader_(std::move(reader)) {}
@@ -226,6 +229,44 @@ class PyRecordWriter {
   TF_DISALLOW_COPY_AND_ASSIGN(PyRecordWriter);
 };
 
+// Counts the records of a TFRecord file. Unless `validate_checksums` is true,
+// the data of the records is skipped rather than read, and only the checksums
+// of their lengths are validated.
+tensorflow::Status CountRecords(const std::string& filename,
+                                const std::string& compression_type,
+                                bool validate_checksums, int64_t* count) {
+  std::unique_ptr<tensorflow::RandomAccessFile> file;
+  TF_RETURN_IF_ERROR(
+      tensorflow::Env::Default()->NewRandomAccessFile(filename, &file));
+  auto options = tensorflow::io::RecordReaderOptions::CreateRecordReaderOptions(
+      compression_type);
+  options.buffer_size = PyRecordRandomReader::kReaderBufferSize;
+  tensorflow::io::RecordReader reader(file.get(), options);
+
+  if (!validate_checksums) {
+    tensorflow::io::RecordReader::Metadata metadata;
+    tensorflow::Status status = reader.GetMetadata(&metadata);
+    if (tensorflow::errors::IsOutOfRange(status)) {
+      // The end of the file was reached while skipping the data of a record.
+      return tensorflow::errors::DataLoss("truncated record in ", filename);
+    }
+    TF_RETURN_IF_ERROR(status);
+    *count = metadata.stats.entries;
+    return ::tensorflow::OkStatus();
+  }
+
+  tensorflow::uint64 offset = 0;
+  tensorflow::tstring record;
+  *count = 0;
+  while (true) {
+    tensorflow::Status status = reader.ReadRecord(&offset, &record);
+    if (tensorflow::errors::IsOutOfRange(status)) break;
+    TF_RETURN_IF_ERROR(status);
+    ++*count;
+  }
+  return ::tensorflow::OkStatus();
+}
+
 PYBIND11_MODULE(_pywrap_record_io, m) {
   py::class_<PyRecordReader>(m, "RecordIterator")
       .def(py::init(
@@ -272,16 +313,19 @@ PYBIND11_MODULE(_pywrap_record_io, m) {
       });
 
   py::class_<PyRecordRandomReader>(m, "RandomRecordReader")
-      .def(py::init([](const std::string& filename) {
-        tensorflow::Status status;
-        PyRecordRandomReader* self = nullptr;
-        {
-          py::gil_scoped_release release;
-          status = PyRecordRandomReader::New(filename, &self);
-        }
-        MaybeRaiseRegisteredFromStatus(status);
-        return self;
-      }))
+      .def(py::init([](const std::string& filename,
+                       tensorflow::uint64 buffer_size) {
+             tensorflow::Status status;
+             PyRecordRandomReader* self = nullptr;
+             {
+               py::gil_scoped_release release;
+               status = PyRecordRandomReader::New(filename, buffer_size, &self);
+             }
+             MaybeRaiseRegisteredFromStatus(status);
+             return self;
+           }),
+           py::arg("filename"),
+           py::arg("buffer_size") = PyRecordRandomReader::kReaderBufferSize)
       .def("read",
            [](PyRecordRandomReader* self, tensorflow::uint64 offset) {
              tensorflow::uint64 temp_offset = offset;
@@ -300,6 +344,23 @@ PYBIND11_MODULE(_pywrap_record_io, m) {
            })
       .def("close", [](PyRecordRandomReader* self) { self->Close(); });
 
+  m.def(
+      "CountRecords",
+      [](const std::string& filename, const std::string& compression_type,
+         bool validate_checksums) {
+        int64_t count = 0;
+        tensorflow::Status status;
+        {
+          py::gil_scoped_release release;
+          status = CountRecords(filename, compression_type, validate_checksums,
+                                &count);
+        }
+        MaybeRaiseRegisteredFromStatus(status);
+        return count;
+      },
+      py::arg("filename"), py::arg("compression_type"),
+      py::arg("validate_checksums"));
+
   using tensorflow::io::ZlibCompressionOptions;
   py::class_<ZlibCompressionOptions>(m, "ZlibCompressionOptions")
       .def_readwrite("flush_mode", &ZlibCompressionOptions::flush_mode)
@@ -15,6 +15,9 @@
 
 """For reading and writing TFRecords files."""
 
+from concurrent import futures
+import os
+
 from tensorflow.python.lib.io import _pywrap_record_io
 from tensorflow.python.util import compat
 from tensorflow.python.util import deprecation
@@ -167,7 +170,7 @@ def tf_record_iterator(path, options=None):
   return _pywrap_record_io.RecordIterator(path, compression_type)
 
 
-def tf_record_random_reader(path):
+def tf_record_random_reader(path, buffer_size=None):
   """Creates a reader that allows random-access reads from a TFRecords file.
 
   The created reader object has the following method:
@@ -198,6 +201,10 @@ def tf_record_random_reader(path):
 
   Args:
     path: The path to the TFRecords file.
+    buffer_size: (Optional.) The number of bytes read ahead of the records. 0
+      reads only the bytes of each record, which is faster when reading
+      records at scattered offsets. If `None`, 16 MiB are read ahead, which is
+      faster when reading records in order.
 
   Returns:
     An object that supports random-access reading of the serialized TFRecords.
@@ -205,7 +212,101 @@ def tf_record_random_reader(path):
   Raises:
     IOError: If `path` cannot be opened for reading.
   """
-  return _pywrap_record_io.RandomRecordReader(path)
+  if buffer_size is None:
+    return _pywrap_record_io.RandomRecordReader(path)
+  return _pywrap_record_io.RandomRecordReader(path, buffer_size)
+
+
+# The default number of files read concurrently by functions that read many
+# files, which mostly wait for the file system, so that it exceeds the number
+# of CPUs.
+_DEFAULT_NUM_PARALLEL_READS = 32
+
+
+def map_files(fn, paths, num_parallel_reads=None):
+  """Applies `fn` to each of `paths` with a pool of threads.
+
+  `fn` should release the GIL while reading, as the readers of this module do.
+
+  Args:
+    fn: A function of a path.
+    paths: A list of paths.
+    num_parallel_reads: (Optional.) The number of threads. Defaults to 32, or
+      to the number of paths if fewer.
+
+  Returns:
+    A list of the results of `fn`, in the order of `paths`.
+
+  Raises:
+    ValueError: If `num_parallel_reads` is not positive.
+  """
+  if num_parallel_reads is None:
+    num_parallel_reads = _DEFAULT_NUM_PARALLEL_READS
+  if num_parallel_reads < 1:
+    raise ValueError("`num_parallel_reads` must be positive, got "
+                     f"{num_parallel_reads}.")
+  num_parallel_reads = min(num_parallel_reads, len(paths))
+  if num_parallel_reads <= 1:
+    return [fn(path) for path in paths]
+  with futures.ThreadPoolExecutor(max_workers=num_parallel_reads) as executor:
+    return list(executor.map(fn, paths))
+
+
+@tf_export("io.count_tf_records")
+def count_tf_records(paths,
+                     options=None,
+                     validate_checksums=False,
+                     num_parallel_reads=None):
+  """Counts the records of TFRecord files, reading many files at a time.
+
+  This is much faster than iterating over the records, as the files are read
+  concurrently, and by default the data of the records is skipped rather than
+  read. The counts can then be used to set the cardinality of a dataset of the
+  records, e.g. to split it without reading it first:
+
+  >>> import tempfile
+  >>> paths = [os.path.join(tempfile.mkdtemp(), f"{i}.tfrecord")
+  ...          for i in range(2)]
+  >>> for i, path in enumerate(paths):
+  ...   with tf.io.TFRecordWriter(path) as writer:
+  ...     for _ in range(i + 2):
+  ...       writer.write(b"record")
+  >>> counts = tf.io.count_tf_records(paths)
+  >>> counts
+  [2, 3]
+  >>> dataset = tf.data.TFRecordDataset(paths).apply(
+  ...     tf.data.experimental.assert_cardinality(sum(counts)))
+  >>> dataset.cardinality().numpy()
+  5
+
+  Args:
+    paths: The path to a TFRecords file, or a list of them.
+    options: (Optional.) A `tf.io.TFRecordOptions` object, or a compression
+      type string.
+    validate_checksums: (Optional.) If `True`, the data of the records is read,
+      and its checksums are validated. Otherwise, only the lengths of the
+      records are read and validated. Defaults to `False`.
+    num_parallel_reads: (Optional.) The number of files read at a time.
+      Defaults to 32, or to the number of files if fewer.
+
+  Returns:
+    A list of the numbers of records of the files.
+
+  Raises:
+    DataLossError: If a file is corrupted or truncated.
+    NotFoundError: If a file does not exist.
+    ValueError: If `num_parallel_reads` is not positive.
+  """
+  if isinstance(paths, (str, bytes, os.PathLike)):
+    paths = [paths]
+  paths = [compat.path_to_str(path) for path in paths]
+  compression_type = TFRecordOptions.get_compression_type_string(options)
+
+  def count(path):
+    return _pywrap_record_io.CountRecords(path, compression_type,
+                                          validate_checksums)
+
+  return map_files(count, paths, num_parallel_reads)
 
 
 @tf_export(
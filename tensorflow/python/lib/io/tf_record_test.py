@@ -553,6 +553,23 @@ class TFRecordRandomReaderTest(TFCompressionTestCase):
       self.assertEqual(offset, offsets[i + 1])
       self.assertEqual(record, records[i])
 
+  def testUnbufferedRandomReaderReadingWorks(self):
+    records = [self._Record(0, i) for i in range(self._num_records)]
+    fn = self._WriteRecordsToFile(records, "uncompressed_records")
+    reader = tf_record.tf_record_random_reader(fn, buffer_size=0)
+
+    offsets = [0]
+    for i in range(self._num_records):
+      record, offset = reader.read(offsets[-1])
+      self.assertEqual(record, records[i])
+      offsets.append(offset)
+    with self.assertRaisesRegex(IndexError, r"Out of range.*offset"):
+      reader.read(offsets[-1])
+    for i in reversed(range(self._num_records)):
+      record, offset = reader.read(offsets[i])
+      self.assertEqual(offset, offsets[i + 1])
+      self.assertEqual(record, records[i])
+
   def testRandomReaderThrowsErrorForInvalidOffset(self):
     records = [self._Record(0, i) for i in range(self._num_records)]
     fn = self._WriteRecordsToFile(records, "uncompressed_records")
@@ -569,6 +586,57 @@ class TFRecordRandomReaderTest(TFCompressionTestCase):
       reader.read(0)
 
 
+class TFRecordCountTest(TFCompressionTestCase):
+
+  def setUp(self):
+    super(TFRecordCountTest, self).setUp()
+    self._num_files = 5
+
+  def testCount(self):
+    fns = self._CreateFiles()
+    fns.append(self._WriteRecordsToFile([], "empty"))
+    expected = [self._num_records] * self._num_files + [0]
+    self.assertEqual(expected, tf_record.count_tf_records(fns))
+    self.assertEqual(
+        expected, tf_record.count_tf_records(fns, validate_checksums=True))
+    self.assertEqual(
+        expected, tf_record.count_tf_records(fns, num_parallel_reads=1))
+    self.assertEqual([self._num_records], tf_record.count_tf_records(fns[0]))
+
+  def testCountCompressedFiles(self):
+    options = tf_record.TFRecordOptions(TFRecordCompressionType.GZIP)
+    fns = self._CreateFiles(options, prefix="gzip")
+    self.assertEqual([self._num_records] * self._num_files,
+                     tf_record.count_tf_records(fns, options))
+    self.assertEqual([self._num_records] * self._num_files,
+                     tf_record.count_tf_records(fns, "GZIP",
+                                                validate_checksums=True))
+
+  def testValidateChecksums(self):
+    fn = self._WriteRecordsToFile([self._Record(0, 0)], "corrupted")
+    with open(fn, "r+b") as f:
+      # Changes the first byte of the data, after the 12 bytes of the header.
+      f.seek(12)
+      f.write(b"r")
+    self.assertEqual([1], tf_record.count_tf_records(fn))
+    with self.assertRaisesRegex(errors_impl.DataLossError, "corrupted record"):
+      tf_record.count_tf_records(fn, validate_checksums=True)
+
+  def testTruncatedFile(self):
+    fn = self._WriteRecordsToFile([self._Record(0, 0)], "truncated")
+    with open(fn, "r+b") as f:
+      f.truncate(os.path.getsize(fn) - 1)
+    for validate_checksums in [False, True]:
+      with self.assertRaisesRegex(errors_impl.DataLossError, "truncated"):
+        tf_record.count_tf_records(
+            fn, validate_checksums=validate_checksums)
+
+  def testInvalidNumParallelReads(self):
+    fns = self._CreateFiles()
+    with self.assertRaisesRegex(ValueError, "must be positive"):
+      tf_record.count_tf_records(fns, num_parallel_reads=0)
+
+
 class TFRecordWriterCloseAndFlushTests(test.TestCase):
   """TFRecordWriter close and flush tests"""
 
@@ -17,6 +17,7 @@
 # pylint: disable=g-bad-name
 import contextlib
 import functools
+import threading
 import weakref
 
 import numpy as np
@@ -328,9 +329,20 @@ def variable_accessed(variable):
     tape.variable_accessed(variable)
 
 
+# Serializes lazy restores, so that other threads wait for a restore in
+# progress before using the handle.
+_lazy_restore_lock = threading.RLock()
+# Marks a variable whose lazy restore is in progress.
+_LAZY_RESTORE_IN_PROGRESS = object()
+
+
 class BaseResourceVariable(variables.VariableV1, core.Tensor):
   """A python variable from an existing handle."""
 
+  # A callable restoring the value of this variable from a checkpoint, run
+  # when the handle is first used. See `_set_lazy_restore_fn`.
+  _lazy_restore_fn = None
+
   # TODO(wangpeng): Deprecate `constraint` when callers no long pass it in.
   def __init__(  # pylint: disable=super-init-not-called
       self,
@@ -571,8 +583,37 @@ class BaseResourceVariable(variables.VariableV1, core.Tensor):
   @property
   def handle(self):
     """The handle by which this variable can be accessed."""
+    if self._lazy_restore_fn is not None:
+      self._run_lazy_restore()
     return self._handle
 
+  def _set_lazy_restore_fn(self, restore_fn):
+    """Defers restoring this variable until its handle is first used.
+
+    Any use of the handle, to read, write, save or capture the variable, first
+    runs `restore_fn`, so that the variable behaves as if it had been restored
+    right away.
+
+    Args:
+      restore_fn: A callable assigning the restored value without using the
+        `handle` property, or None to cancel a deferred restore.
+    """
+    with _lazy_restore_lock:
+      self._lazy_restore_fn = restore_fn
+
+  def _run_lazy_restore(self):
+    with _lazy_restore_lock:
+      restore_fn = self._lazy_restore_fn
+      # Uses of the handle while restoring, on this thread, see the marker.
+      if restore_fn is None or restore_fn is _LAZY_RESTORE_IN_PROGRESS:
+        return
+      self._lazy_restore_fn = _LAZY_RESTORE_IN_PROGRESS
+      try:
+        with ops.init_scope():
+          restore_fn()
+      finally:
+        self._lazy_restore_fn = None
+
   def value(self):
     """A cached operation which reads the value of this variable."""
     if self._cached_value is not None:
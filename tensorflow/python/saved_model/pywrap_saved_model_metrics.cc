@@ -119,6 +119,26 @@ void DefineMetricsModule(py::module main_module) {
       py::doc("Get serialized HistogramProto of `api_label` cell for "
               "'/tensorflow/core/checkpoint/read/read_durations'."));
 
+  m.def(
+      "AddCheckpointReadThroughput",
+      [](double bytes_per_second) {
+        metrics::CheckpointReadThroughput().Add(bytes_per_second);
+      },
+      py::kw_only(), py::arg("bytes_per_second"),
+      py::doc("Add `bytes_per_second` to "
+              "'/tensorflow/core/checkpoint/read/read_throughput'."));
+
+  m.def(
+      "GetCheckpointReadThroughputs",
+      []() {
+        // This function is called sparingly in unit tests, so protobuf
+        // (de)-serialization round trip is not an issue.
+        return py::bytes(
+            metrics::CheckpointReadThroughput().value().SerializeAsString());
+      },
+      py::doc("Get serialized HistogramProto of "
+              "'/tensorflow/core/checkpoint/read/read_throughput'."));
+
   m.def(
       "AddCheckpointWriteDuration",
       [](const char* api_label, double microseconds) {
@@ -78,6 +78,20 @@ class MetricsTest(test.TestCase):
         self._get_histogram_proto(
             metrics.GetCheckpointReadDurations(api_label="bar")).max, 20000)
 
+  def test_checkpoint_add_read_throughput(self):
+    self.assertEqual(
+        self._get_histogram_proto(metrics.GetCheckpointReadThroughputs()).num,
+        0)
+
+    metrics.AddCheckpointReadThroughput(bytes_per_second=1e6)
+    metrics.AddCheckpointReadThroughput(bytes_per_second=1e9)
+
+    histogram_proto = self._get_histogram_proto(
+        metrics.GetCheckpointReadThroughputs())
+    self.assertEqual(histogram_proto.num, 2)
+    self.assertEqual(histogram_proto.min, 1e6)
+    self.assertEqual(histogram_proto.max, 1e9)
+
   def test_training_time_saved(self):
     self.assertEqual(metrics.GetTrainingTimeSaved(api_label="baz"), 0)
     metrics.AddTrainingTimeSaved(api_label="baz", microseconds=1000)
@@ -369,7 +369,8 @@ class CheckpointPosition(object):
           else:
             shape_and_slice = ""
           value, = io_ops.restore_v2(
-              prefix=self._checkpoint.save_path_tensor,
+              prefix=self._checkpoint.save_path_tensor_for_key(
+                  checkpoint_key),
               tensor_names=[checkpoint_key],
               shape_and_slices=[shape_and_slice],
               dtypes=[base_type],
@@ -929,6 +930,10 @@ class Trackable(object):
     checkpoint_position = max(
         deferred_dependencies_list,
         key=lambda restore: restore.checkpoint.restore_uid)
+    if checkpoint_position.checkpoint.options.experimental_lazy_restore:
+      # The value is read when the variable is first used instead, once the
+      # variable is tracked.
+      return None
     return CheckpointInitialValueCallable(
         checkpoint_position=checkpoint_position)
 
@@ -139,17 +139,9 @@ def wait_for_new_checkpoint(checkpoint_dir,
   Returns:
     a new checkpoint path, or None if the timeout was reached.
   """
-  logging.info("Waiting for new checkpoint at %s", checkpoint_dir)
-  stop_time = time.time() + timeout if timeout is not None else None
-  while True:
-    checkpoint_path = checkpoint_management.latest_checkpoint(checkpoint_dir)
-    if checkpoint_path is None or checkpoint_path == last_checkpoint:
-      if stop_time is not None and time.time() + seconds_to_sleep > stop_time:
-        return None
-      time.sleep(seconds_to_sleep)
-    else:
-      logging.info("Found new checkpoint at %s", checkpoint_path)
-      return checkpoint_path
+  watcher = checkpoint_management.CheckpointStateWatcher(checkpoint_dir)
+  return watcher.wait_for_new_checkpoint(
+      last_checkpoint, seconds_to_sleep=seconds_to_sleep, timeout=timeout)
 
 
 @tf_export("train.checkpoints_iterator")
@@ -196,9 +188,11 @@ def checkpoints_iterator(checkpoint_dir,
     String paths to latest checkpoint files as they arrive.
   """
   checkpoint_path = None
+  # Only reads the state file again when it changes.
+  watcher = checkpoint_management.CheckpointStateWatcher(checkpoint_dir)
   while True:
-    new_checkpoint_path = wait_for_new_checkpoint(
-        checkpoint_dir, checkpoint_path, timeout=timeout)
+    new_checkpoint_path = watcher.wait_for_new_checkpoint(
+        checkpoint_path, timeout=timeout)
     if new_checkpoint_path is None:
       if not timeout_fn:
         # timed out
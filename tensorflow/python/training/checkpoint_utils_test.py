@@ -133,6 +133,59 @@ class CheckpointsTest(test.TestCase):
          ("var3", [100, 100])])
 
 
+  def testGetTensorZeroCopy(self):
+    checkpoint_dir = self.get_temp_dir()
+    with self.cached_session() as session:
+      v1, _, v3, _ = _create_checkpoints(session, checkpoint_dir)
+    reader = checkpoint_utils.load_checkpoint(checkpoint_dir)
+    value = reader.get_tensor("var3", zero_copy=True)
+    self.assertAllEqual(v3, value)
+    self.assertFalse(value.flags.writeable)
+    self.assertFalse(value.flags.owndata)
+    self.assertAllEqual(v1, reader.get_tensor("var1", zero_copy=True))
+    with self.assertRaises(errors_impl.NotFoundError):
+      reader.get_tensor("var5", zero_copy=True)
+
+  def testGetTensorSlice(self):
+    checkpoint_dir = self.get_temp_dir()
+    with self.cached_session() as session:
+      _, _, v3, _ = _create_checkpoints(session, checkpoint_dir)
+    reader = checkpoint_utils.load_checkpoint(checkpoint_dir)
+    self.assertAllEqual(v3[10:20, 5:],
+                        reader.get_tensor_slice("var3", [10, 5], [10, -1]))
+    value = reader.get_tensor_slice(
+        "var3", [10, 5], [10, -1], zero_copy=True)
+    self.assertAllEqual(v3[10:20, 5:], value)
+    self.assertFalse(value.flags.writeable)
+
+  def testGetTensors(self):
+    checkpoint_dir = self.get_temp_dir()
+    with self.cached_session() as session:
+      v1, v2, v3, v4 = _create_checkpoints(session, checkpoint_dir)
+    reader = checkpoint_utils.load_checkpoint(checkpoint_dir)
+    for zero_copy in (False, True):
+      tensors = reader.get_tensors(
+          ["var3", "var1", "useful_scope/var4", "var2"], zero_copy=zero_copy)
+      self.assertCountEqual(["var1", "var2", "var3", "useful_scope/var4"],
+                            tensors.keys())
+      self.assertAllEqual(v1, tensors["var1"])
+      self.assertAllEqual(v2, tensors["var2"])
+      self.assertAllEqual(v3, tensors["var3"])
+      self.assertAllEqual(v4, tensors["useful_scope/var4"])
+      self.assertEqual(not zero_copy, tensors["var1"].flags.writeable)
+
+  def testZeroCopyUnsupported(self):
+    checkpoint_dir = self.get_temp_dir()
+    with self.cached_session() as session:
+      _create_partition_checkpoints(session, checkpoint_dir)
+    reader = checkpoint_utils.load_checkpoint(checkpoint_dir)
+    with self.assertRaises(errors_impl.UnimplementedError):
+      reader.get_tensor("scope/var1", zero_copy=True)
+    # Copies fall back to regular reads.
+    self.assertAllEqual(
+        reader.get_tensor("scope/var1"),
+        reader.get_tensors(["scope/var1"])["scope/var1"])
+
   def testInitFromCheckpoint(self):
     checkpoint_dir = self.get_temp_dir()
     with self.cached_session() as session:
@@ -13,6 +13,10 @@
 # limitations under the License.
 # ==============================================================================
 """Extending CheckpointReader for TensorFlow."""
+import mmap
+
+import numpy as np
+
 from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import errors_impl
 from tensorflow.python.util import compat
@@ -32,7 +36,8 @@ def error_translator(e):
   elif 'Sliced checkpoints are not supported' in error_message or (
       'Data type '
       'not '
-      'supported') in error_message:
+      'supported') in error_message or (
+          'Memory-mapped reads are not supported') in error_message:
     raise errors_impl.UnimplementedError(None, None, error_message)
   elif 'Failed to get matching files on' in error_message:
     raise errors_impl.InvalidArgumentError(None, None, error_message)
@@ -60,8 +65,69 @@ def has_tensor(self, tensor_str):
 CheckpointReader.has_tensor = has_tensor
 
 
-def get_tensor(self, tensor_str):
-  """Get the tensor from the Checkpoint object."""
+def _get_tensor_location(reader, tensor_str):
+  """Returns the file, offset, size, dtype and shape of a tensor's bytes."""
+  try:
+    filename, offset, size, type_enum, shape = (
+        CheckpointReader._GetTensorLocation(  # pylint: disable=protected-access
+            reader, compat.as_bytes(tensor_str)))
+  # TODO(b/143319754): Remove the RuntimeError casting logic once we resolve the
+  # issue with throwing python exceptions from C++.
+  except RuntimeError as e:
+    error_translator(e)
+  filename = compat.as_str(filename)
+  if '://' in filename:
+    raise errors_impl.UnimplementedError(
+        None, None, 'Memory-mapped reads are not supported for the '
+        f'checkpoint file {filename}, which is not on a local file system.')
+  return filename, offset, size, dtypes.DType(type_enum), shape
+
+
+def _map_tensor(location, mapped_files):
+  """Returns a read-only view of a tensor's bytes in a memory-mapped file.
+
+  Args:
+    location: A tuple returned by `_get_tensor_location`.
+    mapped_files: A dict caching the memory maps of the data files by name.
+
+  Returns:
+    A read-only NumPy array.
+  """
+  filename, offset, size, dtype, shape = location
+  if not size:
+    # Empty files can't be mapped.
+    value = np.empty(shape, dtype=dtype.as_numpy_dtype)
+  else:
+    if filename not in mapped_files:
+      with open(filename, 'rb') as f:
+        mapped_files[filename] = mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ)
+    value = np.frombuffer(
+        mapped_files[filename],
+        dtype=dtype.as_numpy_dtype,
+        count=int(np.prod(shape, dtype=np.int64)),
+        offset=offset).reshape(shape)
+  value.flags.writeable = False
+  return value
+
+
+def get_tensor(self, tensor_str, zero_copy=False):
+  """Get the tensor from the Checkpoint object.
+
+  Args:
+    tensor_str: The name of the tensor in the checkpoint.
+    zero_copy: If True, returns a read-only view of the tensor's bytes in the
+      memory-mapped checkpoint file instead of a copy, so that only the pages
+      of the file that are accessed are read. Requires a V2 checkpoint on a
+      local file system and a numeric tensor that is neither partitioned nor
+      compressed, and raises an `UnimplementedError` otherwise. Unlike copies,
+      views are not validated against the checksum of the tensor.
+
+  Returns:
+    A NumPy array holding the value of the tensor.
+  """
+  if zero_copy:
+    return _map_tensor(_get_tensor_location(self, tensor_str), {})
   try:
     return CheckpointReader.CheckpointReader_GetTensor(
         self, compat.as_bytes(tensor_str))
@@ -74,6 +140,78 @@ def get_tensor(self, tensor_str):
 CheckpointReader.get_tensor = get_tensor
 
 
+def get_tensor_slice(self, tensor_str, begin, size, zero_copy=False):
+  """Get a slice of a tensor from the Checkpoint object.
+
+  Where possible, only the bytes of the slice are read, from the
+  memory-mapped checkpoint file. Otherwise, the whole tensor is read.
+
+  Args:
+    tensor_str: The name of the tensor in the checkpoint.
+    begin: The start index of the slice in each dimension, as for `tf.slice`.
+    size: The size of the slice in each dimension, as for `tf.slice`. A size
+      of -1 includes all remaining elements of the dimension.
+    zero_copy: If True, returns a read-only view of the slice instead of a
+      copy, with the same requirements as `get_tensor(..., zero_copy=True)`.
+
+  Returns:
+    A NumPy array holding the values of the slice.
+  """
+  index = tuple(
+      slice(start, None if length == -1 else start + length)
+      for start, length in zip(begin, size))
+  try:
+    value = _map_tensor(_get_tensor_location(self, tensor_str), {})
+  except errors_impl.UnimplementedError:
+    if zero_copy:
+      raise
+    return self.get_tensor(tensor_str)[index]
+  if zero_copy:
+    return value[index]
+  return np.array(value[index])
+
+
+CheckpointReader.get_tensor_slice = get_tensor_slice
+
+
+def get_tensors(self, tensor_strs, zero_copy=False):
+  """Get several tensors from the Checkpoint object in a single pass.
+
+  The tensors are read in the order in which they are stored in the
+  checkpoint files, and each file is mapped into memory once.
+
+  Args:
+    tensor_strs: An iterable of tensor names in the checkpoint.
+    zero_copy: If True, returns read-only views of the tensors instead of
+      copies, with the same requirements as `get_tensor(..., zero_copy=True)`.
+
+  Returns:
+    A dict mapping the names of the tensors to NumPy arrays holding their
+    values.
+  """
+  locations = {}
+  unmapped = []
+  for tensor_str in tensor_strs:
+    try:
+      locations[tensor_str] = _get_tensor_location(self, tensor_str)
+    except errors_impl.UnimplementedError:
+      if zero_copy:
+        raise
+      unmapped.append(tensor_str)
+  tensors = {}
+  mapped_files = {}
+  for tensor_str, location in sorted(
+      locations.items(), key=lambda item: item[1][:2]):
+    value = _map_tensor(location, mapped_files)
+    tensors[tensor_str] = value if zero_copy else np.array(value)
+  for tensor_str in unmapped:
+    tensors[tensor_str] = self.get_tensor(tensor_str)
+  return tensors
+
+
+CheckpointReader.get_tensors = get_tensors
+
+
 # Disable invalid name to keep backwards compatibility with that function.
 # It was previously exported from py_checkpoint_reader.i which did not conform
 # to pylint checks.
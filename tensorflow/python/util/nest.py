@@ -84,6 +84,7 @@ should be recursive. The behavior is undefined if there is a cycle.
 """
 
 import collections as _collections
+import functools as _functools
 
 import six as _six
 import wrapt as _wrapt
@@ -130,17 +131,107 @@ def _get_attrs_items(obj):
   Returns:
     A list of (attr_name, attr_value) pairs, sorted by attr_name.
   """
-  attrs = getattr(obj.__class__, "__attrs_attrs__")
-  attr_names = (a.name for a in attrs)
+  cls = obj.__class__
+  attr_names = _attrs_names_cache.get(cls)
+  if attr_names is None:
+    attrs = getattr(cls, "__attrs_attrs__")
+    attr_names = tuple(a.name for a in attrs)
+    if len(_attrs_names_cache) < _PACK_CACHE_MAX_SIZE:
+      _attrs_names_cache[cls] = attr_names
   return [(attr_name, getattr(obj, attr_name)) for attr_name in attr_names]
 
 
 def _sorted(dict_):
   """Returns a sorted list of the dict keys, with error if keys not sortable."""
+  # Structures of the same type tend to have the same keys, in the same order,
+  # so the sort order is cached by the keys in iteration order. The order is
+  # cached as a permutation so that the keys returned are those of `dict_`,
+  # even if they are only equal to the cached ones (e.g. 1 and 1.0).
+  keys = tuple(dict_)
   try:
-    return sorted(dict_.keys())
+    order = _sorted_keys_cache.get(keys)
+  except TypeError:
+    # Unhashable keys.
+    keys = None
+    order = None
+  if order is not None:
+    _pack_cache_stats.sorted_keys_hits += 1
+    return [keys[i] for i in order]
+
+  _pack_cache_stats.sorted_keys_misses += 1
+  try:
+    sorted_keys = sorted(dict_.keys())
   except TypeError:
     raise TypeError("nest only supports dicts with sortable keys.")
+  if keys is not None and len(_sorted_keys_cache) < _PACK_CACHE_MAX_SIZE:
+    position = {k: i for i, k in enumerate(keys)}
+    _sorted_keys_cache[keys] = tuple(position[k] for k in sorted_keys)
+  return sorted_keys
+
+
+# Caches used by pack_sequence_as and related functions. Each cache stops
+# growing once it holds _PACK_CACHE_MAX_SIZE entries, see clear_pack_caches.
+_PACK_CACHE_MAX_SIZE = 4096
+# Keys in iteration order -> their indices, in sorted order.
+_sorted_keys_cache = {}
+# Type -> function that packs values into an instance of the type.
+_sequence_fn_cache = {}
+# attr.s class -> attribute names.
+_attrs_names_cache = {}
+
+
+class PackCacheInfo(
+    _collections.namedtuple("PackCacheInfo", (
+        "constructor_hits", "constructor_misses", "sorted_keys_hits",
+        "sorted_keys_misses"))):
+  """Hit and miss counts of the caches used to pack structures.
+
+  Attributes:
+    constructor_hits: int, the number of times that the function constructing
+      a structure of a given type was cached.
+    constructor_misses: int, the number of times that it had to be looked up by
+      inspecting the structure.
+    sorted_keys_hits: int, the number of times that the sorted keys of a
+      mapping were cached.
+    sorted_keys_misses: int, the number of times that they had to be sorted.
+  """
+  pass
+
+
+class _PackCacheStats(object):
+  """Mutable counters behind PackCacheInfo."""
+
+  __slots__ = PackCacheInfo._fields
+
+  def __init__(self):
+    for field in self.__slots__:
+      setattr(self, field, 0)
+
+
+_pack_cache_stats = _PackCacheStats()
+
+
+def pack_cache_info():
+  """Returns a `PackCacheInfo` with the current cache counters.
+
+  The counters are updated without locking, so they are approximate when
+  several threads pack structures at the same time.
+  """
+  return PackCacheInfo(*(getattr(_pack_cache_stats, field)
+                         for field in PackCacheInfo._fields))
+
+
+def clear_pack_caches():
+  """Clears the caches used to pack structures, and resets their counters.
+
+  The caches assume that the nest behavior of a type does not change. Call
+  this after changing it, e.g. after registering a type as a
+  `collections.abc.Mapping` that was already packed.
+  """
+  _sorted_keys_cache.clear()
+  _sequence_fn_cache.clear()
+  _attrs_names_cache.clear()
+  _pack_cache_stats.__init__()
 
 
 # TODO(b/225045380): Move to a "leaf" library to use in trace_type.
@@ -195,61 +286,123 @@ def _sequence_like(instance, args):
   Returns:
     `args` with the type of `instance`.
   """
+  instance_type = type(instance)
+  sequence_fn = _sequence_fn_cache.get(instance_type)
+  if sequence_fn is not None:
+    _pack_cache_stats.constructor_hits += 1
+    return sequence_fn(instance, args)
+
+  _pack_cache_stats.constructor_misses += 1
+  sequence_fn = _get_sequence_fn(instance)
+  # How a proxy is packed depends on the type that it wraps.
+  if (not isinstance(instance, _wrapt.ObjectProxy) and
+      len(_sequence_fn_cache) < _PACK_CACHE_MAX_SIZE):
+    _sequence_fn_cache[instance_type] = sequence_fn
+  return sequence_fn(instance, args)
+
+
+def _get_sequence_fn(instance):
+  """Returns the function that `_sequence_like` uses to pack `instance`."""
   if _is_mutable_mapping(instance):
-    # Pack dictionaries in a deterministic order by sorting the keys.
-    # Notice this means that we ignore the original order of `OrderedDict`
-    # instances. This is intentional, to avoid potential bugs caused by mixing
-    # ordered and plain dicts (e.g., flattening a dict but using a
-    # corresponding `OrderedDict` to pack it back).
-    result = dict(zip(_sorted(instance), args))
-    instance_type = type(instance)
-    if instance_type == _collections.defaultdict:
-      d = _collections.defaultdict(instance.default_factory)
-    else:
-      d = instance_type()
-    for key in instance:
-      d[key] = result[key]
-    return d
+    if type(instance) == _collections.defaultdict:
+      return _defaultdict_like
+    return _mutable_mapping_like
   elif _is_mapping(instance):
-    result = dict(zip(_sorted(instance), args))
-    instance_type = type(instance)
-    tf_logging.log_first_n(
-        tf_logging.WARN, "Mapping types may not work well with tf.nest. Prefer"
-        " using MutableMapping for {}".format(instance_type), 1)
-    try:
-      return instance_type((key, result[key]) for key in instance)
-    except TypeError as err:
-      raise TypeError("Error creating an object of type {} like {}. Note that "
-                      "it must accept a single positional argument "
-                      "representing an iterable of key-value pairs, in "
-                      "addition to self. Cause: {}".format(
-                          type(instance), instance, err))
+    return _mapping_like
   elif _is_mapping_view(instance):
     # We can't directly construct mapping views, so we create a list instead
-    return list(args)
+    return _list_like
   elif is_namedtuple(instance) or _is_attrs(instance):
     if isinstance(instance, _wrapt.ObjectProxy):
-      instance_type = type(instance.__wrapped__)
-    else:
-      instance_type = type(instance)
-    return instance_type(*args)
+      return _wrapped_fields_like
+    return _fields_like
   elif _is_composite_tensor(instance):
-    assert len(args) == 1
-    spec = instance._type_spec  # pylint: disable=protected-access
-    return spec._from_components(args[0])  # pylint: disable=protected-access
+    return _composite_tensor_like
   elif _is_type_spec(instance):
-    # Pack a CompositeTensor's components according to a TypeSpec.
-    assert len(args) == 1
-    return instance._from_components(args[0])  # pylint: disable=protected-access
+    return _type_spec_like
   elif isinstance(instance, _six.moves.range):
-    return _sequence_like(list(instance), args)
+    return _range_like
   elif isinstance(instance, _wrapt.ObjectProxy):
-    # For object proxies, first create the underlying type and then re-wrap it
-    # in the proxy type.
-    return type(instance)(_sequence_like(instance.__wrapped__, args))
+    return _object_proxy_like
   else:
     # Not a namedtuple
-    return type(instance)(args)
+    return _generic_sequence_like
+
+
+def _mutable_mapping_like(instance, args):
+  # Pack dictionaries in a deterministic order by sorting the keys.
+  # Notice this means that we ignore the original order of `OrderedDict`
+  # instances. This is intentional, to avoid potential bugs caused by mixing
+  # ordered and plain dicts (e.g., flattening a dict but using a
+  # corresponding `OrderedDict` to pack it back).
+  result = dict(zip(_sorted(instance), args))
+  d = type(instance)()
+  for key in instance:
+    d[key] = result[key]
+  return d
+
+
+def _defaultdict_like(instance, args):
+  result = dict(zip(_sorted(instance), args))
+  d = _collections.defaultdict(instance.default_factory)
+  for key in instance:
+    d[key] = result[key]
+  return d
+
+
+def _mapping_like(instance, args):
+  result = dict(zip(_sorted(instance), args))
+  instance_type = type(instance)
+  tf_logging.log_first_n(
+      tf_logging.WARN, "Mapping types may not work well with tf.nest. Prefer"
+      " using MutableMapping for {}".format(instance_type), 1)
+  try:
+    return instance_type((key, result[key]) for key in instance)
+  except TypeError as err:
+    raise TypeError("Error creating an object of type {} like {}. Note that "
+                    "it must accept a single positional argument "
+                    "representing an iterable of key-value pairs, in "
+                    "addition to self. Cause: {}".format(
+                        type(instance), instance, err))
+
+
+def _list_like(instance, args):
+  del instance
+  return list(args)
+
+
+def _fields_like(instance, args):
+  return type(instance)(*args)
+
+
+def _wrapped_fields_like(instance, args):
+  return type(instance.__wrapped__)(*args)
+
+
+def _composite_tensor_like(instance, args):
+  assert len(args) == 1
+  spec = instance._type_spec  # pylint: disable=protected-access
+  return spec._from_components(args[0])  # pylint: disable=protected-access
+
+
+def _type_spec_like(instance, args):
+  # Pack a CompositeTensor's components according to a TypeSpec.
+  assert len(args) == 1
+  return instance._from_components(args[0])  # pylint: disable=protected-access
+
+
+def _range_like(instance, args):
+  return _sequence_like(list(instance), args)
+
+
+def _object_proxy_like(instance, args):
+  # For object proxies, first create the underlying type and then re-wrap it
+  # in the proxy type.
+  return type(instance)(_sequence_like(instance.__wrapped__, args))
+
+
+def _generic_sequence_like(instance, args):
+  return type(instance)(args)
 
 
 def _yield_value(iterable):
@@ -917,6 +1070,230 @@ def map_structure(func, *structure, **kwargs):
       expand_composites=expand_composites)
 
 
+class StructureTemplate(object):
+  """A structure layout, compiled for flattening and packing many structures.
+
+  `flatten` and `pack_sequence_as` inspect every level of a structure on each
+  call: its type, its sorted keys and how to construct it. When many
+  structures share the same layout, e.g. per-replica values or the elements of
+  a dataset, a template does that inspection once, and generates code that
+  flattens and packs structures of that layout directly.
+
+  For example:
+
+    template = StructureTemplate({"b": (1, 2), "a": 3})
+    template.flatten({"b": (4, 5), "a": 6})  # [6, 4, 5]
+    template.pack([7, 8, 9])  # {"b": (8, 9), "a": 7}
+
+  Lists, tuples, namedtuples, `attr.s` classes, and `dict`, `OrderedDict` and
+  `defaultdict` instances are compiled. Other nested structures, such as
+  composite tensors when `expand_composites` is true, fall back to `flatten`
+  and `pack_sequence_as`.
+
+  Unlike `flatten`, `StructureTemplate.flatten` does not check its input: it
+  must have the same layout as the template, with the same types and keys.
+  Use `assert_same_structure` to check inputs whose layout is not known.
+  """
+
+  def __init__(self, structure, expand_composites=False):
+    """Creates a template with the layout of `structure`.
+
+    Args:
+      structure: A nested structure. Only its layout is retained, not its
+        atoms.
+      expand_composites: If true, then composite tensors such as
+        `tf.sparse.SparseTensor` and `tf.RaggedTensor` are expanded into their
+        component tensors.
+
+    Raises:
+      TypeError: `structure` is or contains a dict with non-sortable keys.
+    """
+    self._expand_composites = expand_composites
+    compiler = _StructureTemplateCompiler(expand_composites)
+    self._flatten, self._pack = compiler.compile(structure)
+    self._num_atoms = compiler.num_atoms
+
+  @property
+  def num_atoms(self):
+    """The number of atoms in a structure with this layout."""
+    return self._num_atoms
+
+  def flatten(self, structure):
+    """Same as `flatten(structure)`, for a structure with this layout."""
+    return self._flatten(structure)
+
+  def pack(self, flat_sequence):
+    """Same as `pack_sequence_as`, packing into this layout.
+
+    Args:
+      flat_sequence: flat sequence to pack.
+
+    Returns:
+      `flat_sequence` converted to have this layout.
+
+    Raises:
+      ValueError: If `flat_sequence` does not have `num_atoms` items.
+    """
+    if not isinstance(flat_sequence, (list, tuple)):
+      flat_sequence = list(flat_sequence)
+    if len(flat_sequence) != self._num_atoms:
+      raise ValueError(
+          "Could not pack sequence. Structure had %d atoms, but "
+          "flat_sequence had %d items.  flat_sequence: %s." %
+          (self._num_atoms, len(flat_sequence), flat_sequence))
+    return self._pack(flat_sequence)
+
+  def map_structure(self, func, *structure):
+    """Same as `map_structure`, for structures with this layout.
+
+    Args:
+      func: A callable that accepts as many arguments as there are structures.
+      *structure: atom or nested structures with this layout.
+
+    Returns:
+      A structure with this layout, with the results of `func` as atoms.
+    """
+    flat_structure = (self._flatten(s) for s in structure)
+    return self._pack([func(*x) for x in zip(*flat_structure)])
+
+  def __repr__(self):
+    return "<StructureTemplate num_atoms=%d expand_composites=%r>" % (
+        self._num_atoms, self._expand_composites)
+
+
+class _StructureTemplateCompiler(object):
+  """Generates the flatten and pack functions of a StructureTemplate.
+
+  Each function consists of a single expression. For example, the layout
+  `{"b": (1, 2), "a": 3}` compiles to:
+
+    def flatten(s):
+      return [s[_c0], s[_c1][0], s[_c1][1]]
+
+    def pack(f):
+      return {_c1: (f[1], f[2], ), _c0: f[0]}
+
+  where `_c0` and `_c1` are bound to the keys "a" and "b". Values other than
+  indices are always bound to names, so they need not have a literal form.
+
+  Substructures nested deeper than _MAX_DEPTH levels fall back to `flatten` and
+  `pack_sequence_as`, to keep the generated expressions within the limits of
+  the Python parser.
+  """
+
+  _MAX_DEPTH = 50
+
+  def __init__(self, expand_composites):
+    self._expand_composites = expand_composites
+    self._is_nested_fn = (
+        _is_nested_or_composite if expand_composites else _is_nested)
+    self._namespace = {}
+    self.num_atoms = 0
+
+  def _bind(self, value):
+    name = "_c%d" % len(self._namespace)
+    self._namespace[name] = value
+    return name
+
+  def compile(self, structure):
+    flat_items, pack_expr = self._compile(structure, "s", 0)
+    source = "\n".join((
+        "def flatten(s):",
+        "  return [%s]" % ", ".join(flat_items),
+        "def pack(f):",
+        "  return %s" % pack_expr,
+    ))
+    code = compile(source, "<nest.StructureTemplate>", "exec")
+    exec(code, self._namespace)  # pylint: disable=exec-used
+    return self._namespace["flatten"], self._namespace["pack"]
+
+  def _compile(self, structure, path, depth):
+    """Compiles the substructure accessed by the expression `path`.
+
+    Args:
+      structure: The substructure.
+      path: Text, a Python expression evaluating to the substructure.
+      depth: Int, the nesting level of the substructure.
+
+    Returns:
+      A tuple (flat_items, pack_expr), where:
+        * flat_items - a list of the expressions that make up the flat list of
+                       the substructure's atoms.
+        * pack_expr - an expression that packs the atoms into the
+                      substructure, reading them from the flat sequence `f`.
+    """
+    if not self._is_nested_fn(structure):
+      index = self.num_atoms
+      self.num_atoms += 1
+      return [path], "f[%d]" % index
+
+    structure_type = type(structure)
+    if (isinstance(structure, _wrapt.ObjectProxy) or
+        depth >= self._MAX_DEPTH):
+      return self._compile_fallback(structure, path)
+
+    if structure_type in (list, tuple) or is_namedtuple(structure):
+      items, packed = self._compile_children(
+          path, depth, (("[%d]" % i, s) for i, s in enumerate(structure)))
+      if structure_type is list:
+        return items, "[%s]" % ", ".join(packed)
+      if structure_type is tuple:
+        return items, "(%s)" % "".join(p + ", " for p in packed)
+      return items, "%s(%s)" % (self._bind(structure_type), ", ".join(packed))
+
+    if structure_type in (dict, _collections.OrderedDict,
+                          _collections.defaultdict):
+      keys = _sorted(structure)
+      key_names = [self._bind(k) for k in keys]
+      items, packed = self._compile_children(
+          path, depth, (("[%s]" % name, structure[k])
+                        for name, k in zip(key_names, keys)))
+      # The flat order follows the sorted keys, but packed mappings preserve
+      # the key order of the template, see _sequence_like.
+      by_key = dict(zip(keys, zip(key_names, packed)))
+      pairs = [by_key[k] for k in structure]
+      if structure_type is dict:
+        return items, "{%s}" % ", ".join("%s: %s" % p for p in pairs)
+      pairs_expr = "[%s]" % ", ".join("(%s, %s)" % p for p in pairs)
+      if structure_type is _collections.defaultdict:
+        return items, "%s(%s, %s)" % (self._bind(structure_type),
+                                      self._bind(structure.default_factory),
+                                      pairs_expr)
+      return items, "%s(%s)" % (self._bind(structure_type), pairs_expr)
+
+    if _is_attrs(structure):
+      names = [name for name, _ in _get_attrs_items(structure)]
+      if all(name.isidentifier() for name in names):
+        items, packed = self._compile_children(
+            path, depth,
+            (("." + name, getattr(structure, name)) for name in names))
+        return items, "%s(%s)" % (self._bind(structure_type), ", ".join(packed))
+
+    return self._compile_fallback(structure, path)
+
+  def _compile_children(self, path, depth, children):
+    items = []
+    packed = []
+    for accessor, child in children:
+      child_items, child_packed = self._compile(child, path + accessor,
+                                                depth + 1)
+      items.extend(child_items)
+      packed.append(child_packed)
+    return items, packed
+
+  def _compile_fallback(self, structure, path):
+    """Compiles a substructure to calls to flatten and pack_sequence_as."""
+    start = self.num_atoms
+    self.num_atoms += len(flatten(structure, self._expand_composites))
+    flatten_fn = self._bind(
+        _functools.partial(flatten, expand_composites=self._expand_composites))
+    pack_fn = self._bind(
+        _functools.partial(_pack_sequence_as, structure,
+                           expand_composites=self._expand_composites))
+    return (["*%s(%s)" % (flatten_fn, path)],
+            "%s(f[%d:%d])" % (pack_fn, start, self.num_atoms))
+
+
 def map_structure_with_paths(func, *structure, **kwargs):
   """Applies `func` to each entry in `structure` and returns a new structure.
 
@@ -16,11 +16,13 @@
 
 import collections
 import collections.abc
+import functools
 import time
 from typing import NamedTuple
 
 from absl.testing import parameterized
 import numpy as np
+import wrapt
 
 from tensorflow.python.framework import constant_op
 from tensorflow.python.framework import dtypes
@@ -1301,6 +1303,115 @@ class NestTest(parameterized.TestCase, test.TestCase):
     self.assertTrue(nest.same_namedtuples(Foo1(1, 2), Foo(3, 4)))
 
 
+  @parameterized.named_parameters(
+      ("Atom", 1),
+      ("EmptyList", []),
+      ("EmptyDict", {}),
+      ("Tuple", (1, (2, 3), [4])),
+      ("Dict", {"b": (1, 2), "a": 3, "c": {}}),
+      ("OrderedDict", collections.OrderedDict([("b", 1), ("a", [2, 3])])),
+      ("DefaultDict", collections.defaultdict(list, {"b": 1, "a": (2,)})),
+      ("Namedtuple", PointXY(1, {"k": 2})),
+      ("CustomList", _CustomList([1, (2, 3)])),
+      ("CustomMapping", _CustomMapping({"b": 1, "a": 2})),
+      ("MappingView", {"b": 1, "a": 2}.values()),
+      ("Deep", functools.reduce(lambda s, _: [s, 1], range(100), 0)),
+  )
+  def testStructureTemplate(self, structure):
+    template = nest.StructureTemplate(structure)
+    flat = nest.flatten(structure)
+    self.assertEqual(template.flatten(structure), flat)
+    self.assertEqual(template.num_atoms, len(flat))
+
+    flat_sequence = [str(i) for i in range(len(flat))]
+    packed = template.pack(flat_sequence)
+    expected = nest.pack_sequence_as(structure, flat_sequence)
+    self.assertIs(type(packed), type(expected))
+    nest.assert_same_structure(packed, expected)
+    self.assertEqual(nest.flatten(packed), flat_sequence)
+    if isinstance(expected, dict):
+      self.assertEqual(list(packed.keys()), list(expected.keys()))
+
+  def testStructureTemplateAttrs(self):
+    if attr is None:
+      self.skipTest("attr module is unavailable.")
+
+    structure = NestTest.UnsortedSampleAttr(1, (2, 3), 4)
+    template = nest.StructureTemplate(structure)
+    self.assertEqual(template.flatten(structure), nest.flatten(structure))
+    self.assertEqual(
+        template.pack(["a", "b", "c", "d"]),
+        NestTest.UnsortedSampleAttr("a", ("b", "c"), "d"))
+
+  def testStructureTemplateCompositeTensor(self):
+    structure = {
+        "a": ragged_tensor.RaggedTensor.from_row_splits(
+            values=[1, 2, 3], row_splits=[0, 1, 3]),
+        "b": constant_op.constant([4]),
+    }
+    template = nest.StructureTemplate(structure, expand_composites=True)
+    flat = template.flatten(structure)
+    self.assertLen(flat, 3)
+    packed = template.pack(flat)
+    self.assertIsInstance(packed["a"], ragged_tensor.RaggedTensor)
+    self.assertAllEqual(packed["a"].to_list(), [[1], [2, 3]])
+
+    template = nest.StructureTemplate(structure)
+    self.assertLen(template.flatten(structure), 2)
+
+  def testStructureTemplatePackWrongLength(self):
+    template = nest.StructureTemplate(["hello", "world"])
+    with self.assertRaisesRegex(
+        ValueError, "Structure had 2 atoms, but flat_sequence had 3 items."):
+      template.pack(["and", "goodbye", "again"])
+
+  def testStructureTemplateMapStructure(self):
+    template = nest.StructureTemplate({"b": (1, 2), "a": 3})
+    self.assertEqual(
+        template.map_structure(lambda x, y: x + y, {"b": (1, 2), "a": 3},
+                               {"b": (10, 20), "a": 30}),
+        {"b": (11, 22), "a": 33})
+
+  def testStructureTemplateNonSortableKeys(self):
+    with self.assertRaisesRegex(TypeError, "nest only supports dicts"):
+      nest.StructureTemplate({1: 1, "a": 2})
+
+
+  def testPackCacheInfo(self):
+    nest.clear_pack_caches()
+    self.assertEqual(nest.pack_cache_info(), nest.PackCacheInfo(0, 0, 0, 0))
+
+    structure = {"b": NestTest.PointXY(1, 2), "a": 3}
+    for _ in range(3):
+      packed = nest.pack_sequence_as(structure, [4, 5, 6])
+    self.assertEqual(packed, {"b": NestTest.PointXY(5, 6), "a": 4})
+
+    info = nest.pack_cache_info()
+    # One dict and one namedtuple type.
+    self.assertEqual(info.constructor_misses, 2)
+    self.assertEqual(info.constructor_hits, 4)
+    self.assertEqual(info.sorted_keys_misses, 1)
+    self.assertGreater(info.sorted_keys_hits, 0)
+
+    nest.clear_pack_caches()
+    self.assertEqual(nest.pack_cache_info(), nest.PackCacheInfo(0, 0, 0, 0))
+
+  def testPackCachedSortedKeysAreOwnKeys(self):
+    nest.clear_pack_caches()
+    self.assertEqual(nest.flatten_with_tuple_paths({1: "a"}), [((1,), "a")])
+    paths = nest.flatten_with_tuple_paths({True: "a"})
+    self.assertEqual(paths, [((True,), "a")])
+    self.assertIs(paths[0][0][0], True)
+
+  def testPackCacheObjectProxy(self):
+    nest.clear_pack_caches()
+    for structure in (wrapt.ObjectProxy([1, 2]),
+                      wrapt.ObjectProxy(NestTest.PointXY(1, 2))):
+      packed = nest.pack_sequence_as(structure, [3, 4])
+      self.assertIsInstance(packed, type(structure.__wrapped__))
+      self.assertEqual(nest.flatten(packed), [3, 4])
+
+
 class NestBenchmark(test.Benchmark):
 
   def run_and_report(self, s1, s2, name):
@@ -1327,5 +1438,31 @@ class NestBenchmark(test.Benchmark):
     self.run_and_report(s1, s2, "assert_same_structure_60_elem")
 
 
+  def run_and_report_template(self, structure, name):
+    test_iter = 30000
+    flat = nest.flatten(structure)
+    template = nest.StructureTemplate(structure)
+
+    for label, fn in (
+        ("flatten", lambda: nest.flatten(structure)),
+        ("template_flatten", lambda: template.flatten(structure)),
+        ("pack_sequence_as", lambda: nest.pack_sequence_as(structure, flat)),
+        ("template_pack", lambda: template.pack(flat))):
+      t0 = time.time()
+      for _ in range(test_iter):
+        fn()
+      t1 = time.time()
+      self.report_benchmark(iters=test_iter, wall_time=(t1 - t0) / test_iter,
+                            name="%s_%s" % (label, name))
+
+  def benchmark_structure_template(self):
+    point = collections.namedtuple("Point", ["x", "y"])
+    s = {"a": (1, 2), "b": [3, {"c": 4, "d": 5}], "e": point(6, 7)}
+    self.run_and_report_template(s, "7_elem")
+
+    s = [s] * 10
+    self.run_and_report_template(s, "70_elem")
+
+
 if __name__ == "__main__":
   test.main()
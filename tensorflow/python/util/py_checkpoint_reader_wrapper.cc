@@ -116,6 +116,21 @@ static py::object CheckpointReader_GetTensor(
       PyArray_Return(reinterpret_cast<PyArrayObject*>(py_obj)));
 }
 
+static py::tuple CheckpointReader_GetTensorLocation(
+    tensorflow::checkpoint::CheckpointReader* reader, const string& name) {
+  Safe_TF_StatusPtr status = make_safe(TF_NewStatus());
+  string filename;
+  int64_t offset = 0;
+  int64_t size = 0;
+  reader->GetTensorLocation(name, &filename, &offset, &size, status.get());
+  tensorflow::MaybeRaiseFromTFStatus(status.get());
+  // Tensors that can be read in place are not partitioned, so the maps have
+  // their full dtype and shape.
+  return py::make_tuple(py::bytes(filename), offset, size,
+                        reader->GetVariableToDataTypeMap().at(name),
+                        reader->GetVariableToShapeMap().at(name));
+}
+
 }  // namespace tensorflow
 
 PYBIND11_MODULE(_pywrap_checkpoint_reader, m) {
@@ -146,5 +161,7 @@ PYBIND11_MODULE(_pywrap_checkpoint_reader, m) {
            &tensorflow::checkpoint::CheckpointReader::GetVariableToDataTypeMap)
       .def("_HasTensor", &tensorflow::checkpoint::CheckpointReader::HasTensor)
       .def_static("CheckpointReader_GetTensor",
-                  &tensorflow::CheckpointReader_GetTensor);
+                  &tensorflow::CheckpointReader_GetTensor)
+      .def_static("_GetTensorLocation",
+                  &tensorflow::CheckpointReader_GetTensorLocation);
 };